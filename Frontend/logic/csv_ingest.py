@@ -0,0 +1,161 @@
+"""
+logic/csv_ingest.py
+-------------------
+Single-pass, chunked CSV ingestion for uploaded files.
+
+WHY THIS FILE EXISTS:
+    render_homepage used to parse an upload up to three times: a full
+    pd.read_csv, a 20-row header sniff, and (when the first row turned out
+    to be data) a second full parse with header=None. Nothing reached the
+    grid until the last of those finished.
+
+    CsvIngest sniffs the header row from the first few lines, then parses
+    the file exactly once in row chunks. While it runs it publishes:
+        - progress      fraction of the input bytes consumed
+        - rows_loaded   rows parsed so far
+        - preview       the first PREVIEW_ROWS rows, as soon as they exist
+    so the homepage can show a progress bar and populate the grid with the
+    preview before the whole file is in.
+
+    Column dtypes are inferred per chunk and unified when the chunks are
+    concatenated (int + float -> float, anything + text -> object), the
+    same result pd.read_csv's own low-memory chunking produces. They are
+    not pinned from the first block, since a column's first NaN or text
+    value may only appear further down the file.
+
+THE RULE FOR THIS FILE:
+    Same as run_manager.py: no Streamlit, no session state.
+
+PUBLIC INTERFACE:
+    detect_has_headers(raw_bytes)   → bool
+    CsvIngest(raw_bytes).run()      → pd.DataFrame  (call on a worker thread)
+"""
+
+import io
+import threading
+
+import pandas as pd
+
+
+# Rows handed to the grid before the full file is parsed.  Matches the
+# homepage's _SAMPLE_DISPLAY_ROWS sample size for large files.
+PREVIEW_ROWS = 10_000
+
+# Rows per parsed chunk — large enough that per-chunk overhead is noise,
+# small enough that progress and the preview update promptly.
+_CHUNK_ROWS = 50_000
+
+# Rows the header heuristic looks at.
+_SNIFF_ROWS = 20
+
+
+class IngestCancelled(Exception):
+    """Raised by CsvIngest.run() when cancel() was called mid-parse."""
+
+
+def detect_has_headers(raw_bytes: bytes) -> bool:
+    """
+    Heuristic: does the CSV's first row look like column headers?
+
+    Returns True if every value in the first row is a non-numeric string
+    and at least one column in subsequent rows contains numeric data.
+    Falls back to True (the pandas default) when uncertain. Only the
+    first _SNIFF_ROWS rows are parsed.
+    """
+    try:
+        df = pd.read_csv(io.BytesIO(raw_bytes), header=None, nrows=_SNIFF_ROWS)
+    except Exception:
+        return True
+
+    if len(df) < 2:
+        return False
+
+    first_row = df.iloc[0]
+
+    # If any first-row value is numeric, it's likely data, not a header
+    for val in first_row:
+        if pd.isna(val):
+            continue
+        try:
+            float(str(val))
+            return False
+        except (ValueError, TypeError):
+            pass
+
+    # Check if rows 2+ have at least some numeric data
+    rest = df.iloc[1:]
+    for col in rest.columns:
+        coerced = pd.to_numeric(rest[col], errors="coerce")
+        if coerced.notna().any():
+            return True
+
+    # All-string data throughout — assume headers (common convention)
+    return True
+
+
+def _name_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Generated names for header-less files, as the homepage always used."""
+    df.columns = [f"Column {i + 1}" for i in range(len(df.columns))]
+    return df
+
+
+class CsvIngest:
+    """
+    Parse one uploaded CSV in chunks, exposing progress and an early preview.
+
+    Attributes are written by the worker thread running run() and may be
+    read from any thread; each is replaced wholesale, never mutated.
+    """
+
+    def __init__(self, raw_bytes: bytes, chunk_rows: int = _CHUNK_ROWS,
+                 preview_rows: int = PREVIEW_ROWS):
+        self.raw_bytes = raw_bytes
+        self.chunk_rows = chunk_rows
+        self.preview_rows = preview_rows
+
+        self.has_headers = None   # set by run() before parsing starts
+        self.progress = 0.0
+        self.rows_loaded = 0
+        self.preview = None       # first preview_rows rows, once available
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop run() at the next chunk boundary (e.g. the file was removed)."""
+        self._cancelled.set()
+
+    def run(self) -> pd.DataFrame:
+        """Sniff headers, parse the whole file once and return the DataFrame."""
+        self.has_headers = detect_has_headers(self.raw_bytes)
+        header = 0 if self.has_headers else None
+        total_bytes = max(len(self.raw_bytes), 1)
+
+        buffer = io.BytesIO(self.raw_bytes)
+        chunks = []
+        with pd.read_csv(buffer, header=header, chunksize=self.chunk_rows) as reader:
+            for chunk in reader:
+                if self._cancelled.is_set():
+                    raise IngestCancelled()
+                chunks.append(chunk)
+                self.rows_loaded += len(chunk)
+                self.progress = min(buffer.tell() / total_bytes, 1.0)
+                if self.preview is None and self.rows_loaded >= self.preview_rows:
+                    self.preview = self._assemble(chunks).iloc[:self.preview_rows].copy()
+
+        if chunks:
+            df = self._assemble(chunks)
+        else:
+            # Header-only file: no chunks, but the columns still matter
+            df = pd.read_csv(io.BytesIO(self.raw_bytes), header=header)
+            if not self.has_headers:
+                _name_columns(df)
+
+        if self.preview is None:
+            self.preview = df
+        self.progress = 1.0
+        return df
+
+    def _assemble(self, chunks: list) -> pd.DataFrame:
+        df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+        if not self.has_headers:
+            df = _name_columns(df.copy() if len(chunks) == 1 else df)
+        return df
@@ -267,5 +267,6 @@ VIZ_NAMES: dict[str, str] = {
     "hor_bar":   "Horizontal Bar Chart",
     "scat_plot": "Scatter Plot",
     "best_fit":  "Line of Best Fit Scatter Plot",
-    "binomial": "Binomial"
+    "binomial": "Binomial",
+    "corr_heatmap": "Correlation Heatmap",
 }
@@ -0,0 +1,80 @@
+"""
+logic/run_progress.py
+---------------------
+Collects the results of an analysis run while it is still computing.
+
+WHY THIS FILE EXISTS:
+    The background run is a single Future, so the results page used to
+    have nothing to show until every method, every chart and the JSON save
+    had finished. BackendHandler.handle_request now reports each method and
+    chart result as it completes through its on_result callback; RunProgress
+    is that callback's receiving end. The results page renders whatever it
+    holds, so mean/median cards appear while LSR and the charts are still
+    rendering.
+
+THE RULE FOR THIS FILE:
+    Same as run_manager.py: no Streamlit, no session state.
+    on_result() is called from backend worker threads; everything else is
+    called from the Streamlit script thread. The lock covers both.
+
+PUBLIC INTERFACE:
+    RunProgress(method_count, chart_count)
+        .on_result(kind, index, result)   pass as handle_request(on_result=...)
+        .snapshot()  → (version, method_results, chart_results)
+        .version     → int, bumped on every new result
+        .done_count / .total_count
+"""
+
+import threading
+
+
+class RunProgress:
+    """Thread-safe collector for results streamed out of handle_request."""
+
+    def __init__(self, method_count: int = 0, chart_count: int = 0):
+        self.method_count = method_count
+        self.chart_count = chart_count
+        self._methods: dict[int, dict] = {}
+        self._charts: dict[int, dict] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def on_result(self, kind: str, index: int, result: dict) -> None:
+        """Record one finished result ("method" or "chart")."""
+        with self._lock:
+            if kind == "method":
+                self._methods[index] = result
+            elif kind == "chart":
+                self._charts[index] = result
+            else:
+                return
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    @property
+    def done_count(self) -> int:
+        with self._lock:
+            return len(self._methods) + len(self._charts)
+
+    @property
+    def total_count(self) -> int:
+        return self.method_count + self.chart_count
+
+    def snapshot(self) -> tuple[int, list[dict], list[dict]]:
+        """
+        The results received so far, each list in request order.
+
+        Returns:
+            (version, method_results, chart_results) — version identifies
+            this snapshot so callers can tell whether anything new arrived.
+        """
+        with self._lock:
+            return (
+                self._version,
+                [self._methods[i] for i in sorted(self._methods)],
+                [self._charts[i] for i in sorted(self._charts)],
+            )
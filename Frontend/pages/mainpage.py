@@ -37,7 +37,8 @@ from styles.theme   import inject_styles
 from views.sidebar  import render_sidebar
 from views.homepage import render_homepage, render_theme_toggle
 from views.homepage import poll_background_computation, error_dialog, _show_success_toast
-from views.results  import render_results
+from views.homepage import cancel_background_computation
+from views.results  import render_results, render_partial_results
 from views.comparison import render_comparison
 from views.help_statistical_methods import render_help_statistical_methods
 from views.load_previous_runs import render_load_previous_runs
@@ -101,7 +102,8 @@ if st.session_state.get("show_error_dialog"):
 # Route based on current state:
 #   1. If help view is active → show statistical methods help page
 #   2. If comparison view is active → show comparison of selected runs
-#   3. If a single run is selected → show its results
+#   3. If a single run is selected → show its results (or, while it is
+#      still computing, the results streamed in so far)
 #   4. If load previous runs view is active → show load previous runs page
 #   5. Otherwise → show homepage
 if st.session_state.get("current_view") == "help":
@@ -118,6 +120,17 @@ elif st.session_state.active_run_id:
     )
     if run:
         render_results(run, BASE_DIR)
+    elif (
+        st.session_state.get("_compute_progress") is not None
+        and (st.session_state.get("_compute_meta") or {}).get("run_id")
+        == st.session_state.active_run_id
+    ):
+        # The run is still computing — show the results that are in so far
+        render_partial_results(
+            st.session_state._compute_meta,
+            st.session_state._compute_progress,
+            on_cancel=cancel_background_computation,
+        )
 else:
     render_homepage(BASE_DIR)
 
@@ -133,8 +146,22 @@ def _computation_watcher():
     if st.session_state.get("_compute_future") is None:
         return
     future = st.session_state.get("_compute_future")
+    # Renew the run's lease so the backend knows this session is still here
+    token = st.session_state.get("_compute_cancel")
+    if token is not None:
+        token.renew()
     if future is not None and future.done():
         st.rerun(scope="app")
+    # While the run's results page is open, also rerun when new method or
+    # chart results have streamed in since it last rendered.
+    progress = st.session_state.get("_compute_progress")
+    meta = st.session_state.get("_compute_meta") or {}
+    if (
+        progress is not None
+        and st.session_state.get("active_run_id") == meta.get("run_id")
+        and progress.version != st.session_state.get("_compute_progress_seen")
+    ):
+        st.rerun(scope="app")
 
 _computation_watcher()
 
@@ -148,9 +175,16 @@ def _csv_loading_watcher():
     if not st.session_state.get("_csv_loading"):
         return
     csv_future = st.session_state.get("_csv_future")
-    if csv_future is None or csv_future.done():
-        # Future not created yet (need a render to kick it off) OR finished
-        # (need a render to pick up the result). Either way: wake the app.
+    ingest = st.session_state.get("_csv_ingest")
+    preview_pending = (
+        ingest is not None
+        and ingest.preview is not None
+        and not st.session_state.get("_csv_preview_shown")
+    )
+    if csv_future is None or csv_future.done() or preview_pending:
+        # Future not created yet (need a render to kick it off), finished
+        # (need a render to pick up the result), or the first rows are
+        # ready for the grid. Either way: wake the app.
         st.rerun(scope="app")
 
 _csv_loading_watcher()
@@ -6,12 +6,14 @@ Direct-URL only: http://<host>:<port>/statistics
 Not linked from anywhere in the UI. Streamlit's auto-generated pages nav is
 hidden globally via theme.css so adding this file doesn't expose it in the
 sidebar. The page reads timing data recorded by backend_handler.handle_request
-and persisted to results_cache/<run>/results_*.json.
+and persisted to results_cache/<run>/results_*.json, read back through the
+SQLite run catalog (results_cache/run_catalog.sqlite3).
 """
 
 import glob
 import json
 import os
+import sqlite3
 import sys
 from datetime import datetime
 
@@ -32,6 +34,7 @@ for p in (_FRONTEND_DIR, _PROJECT_ROOT):
         sys.path.insert(0, p)
 
 from styles.theme import inject_styles  # noqa: E402
+from backend_support.run_catalog import get_catalog  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Page config
@@ -56,9 +59,30 @@ RESULTS_CACHE = os.path.join(_PROJECT_ROOT, "results_cache")
 # ---------------------------------------------------------------------------
 
 def _scan_runs() -> list[dict]:
+    """
+    Return a summary of every run in results_cache/ from the SQLite run
+    catalog (backend_support/run_catalog.py), most recent first. Folders
+    the catalog hasn't indexed yet (runs saved before it existed) are
+    picked up on the way. Runs without timings (older,
+    pre-instrumentation) are included with timings == None so the health
+    panel can count them.
+    """
+    if not os.path.isdir(RESULTS_CACHE):
+        return []
+    catalog = get_catalog(RESULTS_CACHE)
+    try:
+        catalog.sync_from_disk()
+        return catalog.list_runs()
+    except (sqlite3.Error, OSError) as exc:
+        print(f"[statistics] run catalog unavailable, scanning folders: {exc!r}", file=sys.stderr)
+        return _scan_run_files()
+
+
+def _scan_run_files() -> list[dict]:
     """
     Walk results_cache/*/results_*.json and return a list of run summaries.
-    Most recent first. Runs without timings (older, pre-instrumentation) are
+    Fallback for _scan_runs() when the run catalog can't be read. Most
+    recent first. Runs without timings (older, pre-instrumentation) are
     included with timings == None so the health panel can count them.
     """
     if not os.path.isdir(RESULTS_CACHE):
@@ -127,6 +151,17 @@ def _fmt_ms(ms) -> str:
     return f"{ms:.1f} ms"
 
 
+def _fmt_bytes(n) -> str:
+    if n is None:
+        return "—"
+    if n < 1024:
+        return f"{n} B"
+    for unit in ("KB", "MB", "GB"):
+        n /= 1024
+        if n < 1024 or unit == "GB":
+            return f"{n:.1f} {unit}"
+
+
 def _fmt_ts(iso_ts) -> str:
     if not iso_ts:
         return "—"
@@ -203,6 +238,7 @@ for r in runs:
         "Persist": _fmt_ms(t.get("persistence_ms")),
         "# methods": len(r["method_ids"]),
         "# charts": len(r["chart_types"]),
+        "Size": _fmt_bytes(r.get("size_bytes")),
     })
 
 st.dataframe(summary_rows, use_container_width=True, hide_index=True)
@@ -30,45 +30,53 @@ NOTE ON setdefault():
 import json
 import os
 import shutil
+import sqlite3
+import sys
 
 import streamlit as st
 
 
 _PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
+
+from backend_support.run_catalog import NON_RUN_FOLDERS, get_catalog  # noqa: E402
+
 _RESULTS_CACHE = os.path.join(_PROJECT_ROOT, "results_cache")
 _SAVED_RUNS_FILE = os.path.join(_RESULTS_CACHE, "saved_runs.json")
-_PROTECTED_FOLDERS = frozenset({"custom_methods"})
 
 
 @st.cache_resource(show_spinner=False)
 def _prune_orphan_runs() -> int:
     """
     Delete every subfolder of results_cache/ that isn't referenced in
-    saved_runs.json. Runs exactly once per Streamlit server process via
-    @st.cache_resource memoization.
+    saved_runs.json (looked up through the run catalog) and drop the
+    deleted runs from the catalog. Runs exactly once per Streamlit server
+    process via @st.cache_resource memoization.
 
-    Protects custom_methods/ and the saved_runs.json manifest itself.
+    Protects custom_methods/, the method_cache/ result cache and the
+    saved_runs.json manifest itself.
     Returns the number of folders deleted (for telemetry only).
     """
     if not os.path.isdir(_RESULTS_CACHE):
         return 0
 
-    saved_folders: set[str] = set()
-    if os.path.isfile(_SAVED_RUNS_FILE):
-        try:
-            with open(_SAVED_RUNS_FILE, "r") as fh:
-                for entry in json.load(fh):
-                    folder = entry.get("cache_folder")
-                    if folder:
-                        saved_folders.add(os.path.abspath(folder))
-        except (json.JSONDecodeError, OSError):
-            # If the manifest is unreadable, don't prune — safer to keep orphans
-            # than to accidentally delete the user's only copy of something.
+    catalog = get_catalog(_RESULTS_CACHE)
+    try:
+        saved_folders = catalog.saved_folders()
+    except ValueError:
+        # If the manifest is unreadable, don't prune — safer to keep orphans
+        # than to accidentally delete the user's only copy of something.
+        return 0
+    except (sqlite3.Error, OSError):
+        catalog = None
+        saved_folders = _read_saved_folders()
+        if saved_folders is None:
             return 0
 
-    removed = 0
+    removed_paths = []
     for name in os.listdir(_RESULTS_CACHE):
-        if name in _PROTECTED_FOLDERS:
+        if name in NON_RUN_FOLDERS:
             continue
         path = os.path.join(_RESULTS_CACHE, name)
         if not os.path.isdir(path):
@@ -76,9 +84,32 @@ def _prune_orphan_runs() -> int:
         if os.path.abspath(path) in saved_folders:
             continue
         shutil.rmtree(path, ignore_errors=True)
-        removed += 1
+        removed_paths.append(path)
+
+    if catalog is not None and removed_paths:
+        try:
+            catalog.remove_runs(removed_paths)
+        except (sqlite3.Error, OSError):
+            pass  # stale rows are dropped by the next sync_from_disk()
+    return len(removed_paths)
 
-    return removed
+
+def _read_saved_folders() -> set[str] | None:
+    """
+    Folders referenced in saved_runs.json, read straight from the file
+    (used when the run catalog is unavailable). None if unreadable.
+    """
+    saved_folders: set[str] = set()
+    if os.path.isfile(_SAVED_RUNS_FILE):
+        try:
+            with open(_SAVED_RUNS_FILE, "r") as fh:
+                for entry in json.load(fh):
+                    folder = entry.get("cache_folder")
+                    if folder:
+                        saved_folders.add(os.path.abspath(folder))
+        except (json.JSONDecodeError, OSError):
+            return None
+    return saved_folders
 
 
 # Module-level invocation: fires once per process at first import of state.py.
@@ -221,6 +252,16 @@ def initialize_session_state() -> None:
     # into a run dict when the future completes.
     st.session_state.setdefault("_compute_meta", None)
 
+    # logic.run_progress.RunProgress collecting method/chart results as the
+    # backend reports them, so the results page can show them before the
+    # future completes.  None when idle.
+    st.session_state.setdefault("_compute_progress", None)
+
+    # backend_support.cancellation.CancelToken for the in-flight run.  The
+    # Cancel analysis buttons cancel it; the computation watcher renews its
+    # lease.  None when idle.
+    st.session_state.setdefault("_compute_cancel", None)
+
     # ------------------------------------------------------------------
     # Custom Methods State
     # ------------------------------------------------------------------
@@ -4,11 +4,30 @@ import {
     withStreamlitConnection,
 } from "streamlit-component-lib"
 import { AgGridReact } from "ag-grid-react"
+import { tableFromIPC } from "apache-arrow"
 import "ag-grid-enterprise"
 import "ag-grid-community/styles/ag-grid.css"
 import "ag-grid-community/styles/ag-theme-alpine.css"
 import "./styles.css"
 
+// Arrow table → the row-dict shape /rows returns.  64-bit integers arrive as
+// BigInt, which AG Grid formats fine but JSON.stringify (used when edits are
+// sent back to Python) rejects, so they're narrowed to Number.
+const arrowToRows = (table) => {
+    const fields = table.schema.fields.map(f => f.name)
+    const vectors = fields.map(name => table.getChild(name))
+    const rows = new Array(table.numRows)
+    for (let i = 0; i < table.numRows; i++) {
+        const row = {}
+        for (let c = 0; c < fields.length; c++) {
+            const v = vectors[c].get(i)
+            row[fields[c]] = typeof v === "bigint" ? Number(v) : (v ?? null)
+        }
+        rows[i] = row
+    }
+    return rows
+}
+
 const AgGridRange = (props) => {
     const {
         rowData, columnDefs, serverUrl, dataKey, totalRows: totalRowsProp,
@@ -151,17 +170,33 @@ const AgGridRange = (props) => {
         return () => window.removeEventListener("resize", handleResize)
     }, [])
 
-    // Server-mode infinite datasource — recreated only when server params change
+    // Server-mode infinite datasource — recreated only when server params change.
+    // Blocks come from /rows.arrow (Arrow IPC, decoded without JSON parsing);
+    // if the server answers 501 (no pyarrow) we switch to /rows for good.
+    const arrowUnavailableRef = useRef(false)
     const serverDatasource = useMemo(() => {
         if (!isServerMode) return null
         return {
             getRows: async (params) => {
                 try {
                     const end = params.endRow - 1
-                    const url = `${serverUrl}/rows?key=${encodeURIComponent(dataKey)}&start=${params.startRow}&end=${end}`
-                    const resp = await fetch(url)
-                    if (!resp.ok) { params.failCallback(); return }
-                    const rows = await resp.json()
+                    const query = `key=${encodeURIComponent(dataKey)}&start=${params.startRow}&end=${end}`
+                    let rows = null
+                    if (!arrowUnavailableRef.current) {
+                        const resp = await fetch(`${serverUrl}/rows.arrow?${query}`)
+                        if (resp.status === 501) {
+                            arrowUnavailableRef.current = true
+                        } else if (!resp.ok) {
+                            params.failCallback(); return
+                        } else {
+                            rows = arrowToRows(tableFromIPC(new Uint8Array(await resp.arrayBuffer())))
+                        }
+                    }
+                    if (rows === null) {
+                        const resp = await fetch(`${serverUrl}/rows?${query}`)
+                        if (!resp.ok) { params.failCallback(); return }
+                        rows = await resp.json()
+                    }
                     // Passing serverTotalRows tells AG Grid the full row count
                     // so the scroll bar is accurate from the first block load.
                     params.successCallback(rows, serverTotalRows)
@@ -86,8 +86,8 @@ def _values_equal(va, vb) -> bool:
         return all(_values_equal(x, y) for x, y in zip(va, vb))
     if isinstance(va, dict) and isinstance(vb, dict):
         # Drop noisy keys whose equality doesn't reflect a meaningful
-        # numeric difference (LSR's `chart` is a base64 PNG that varies
-        # with rendering env even when the regression itself is identical).
+        # numeric difference (LSR's `chart` points at each run's own PNG
+        # even when the regression itself is identical).
         keys = (set(va) | set(vb)) - {"chart"}
         return all(_values_equal(va.get(k), vb.get(k)) for k in keys)
     try:
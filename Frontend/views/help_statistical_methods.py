@@ -426,6 +426,17 @@ def render_help_statistical_methods() -> None:
             and reports the estimated **slope** and **intercept**.
             """
         )
+        st.markdown(
+            """
+            Set a **Polynomial degree** above 1 to fit Y = b₀ + b₁·X + b₂·X² + … instead.
+            With more than two columns selected, the **Model** option also offers a
+            **multiple** regression of the last column on all the others, a **screen** of the
+            last column against each other column separately, and the **targets** of every
+            other column on the first. These report each coefficient with its **standard
+            error**, plus **R²**, adjusted R² and the design's **condition number** (large
+            values mean nearly collinear predictors and unreliable coefficients).
+            """
+        )
         st.markdown(
             "💡 Stat cards round to **6 significant figures** by default. "
             "Tick **Enhanced Precision** at the top of the run's results page "
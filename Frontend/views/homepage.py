@@ -60,6 +60,8 @@ import streamlit as st
 from streamlit_aggrid_range import aggrid_range
 
 from utils.helpers import apply_grid_selection_to_filters, normalize_grid_selection
+from logic.csv_ingest import CsvIngest
+from logic.run_progress import RunProgress
 from logic.run_manager import (
     validate_numeric,
     build_error_message,
@@ -69,6 +71,7 @@ from logic.run_manager import (
 )
 from class_templates.message_structure import Message
 from backend_handler import BackendHandler
+from backend_support.cancellation import CancelToken, RunCancelled
 from frontend_handler import handle_result
 import data_server as _data_server
 from custom_methods_loader import (
@@ -210,11 +213,17 @@ def _background_run(
     selected_cols: list,
     selected_rows: list,
     handle_request,
+    on_result=None,
+    cancel_token=None,
 ):
     """
     Background job: validate → serialize → run backend.
     Raises _ValidationError on bad data so the UI can show the error dialog.
+    on_result receives each method/chart result as it finishes (see
+    logic/run_progress.py); cancelling cancel_token stops the run.
     """
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
     non_numeric_cells = validate_numeric(parsed_data, method_flags)
     if non_numeric_cells:
         raise _ValidationError(
@@ -231,7 +240,7 @@ def _background_run(
         graphics=graphics,
         data=[parsed_data[col].tolist() for col in parsed_data.columns],
     )
-    return handle_request(request)
+    return handle_request(request, on_result=on_result, cancel_token=cancel_token)
 
 
 if "show_success_dialog" not in st.session_state:
@@ -270,11 +279,28 @@ _LARGE_FILE_ROW_THRESHOLD = 10_000
 # normalize_grid_selection, so computations always run on the full data.
 _SAMPLE_DISPLAY_ROWS = 10_000
 
-# Scatter / best-fit chart caps.  Plotly + kaleido renders every marker
-# via a headless chromium, and throughput degrades sharply past a few
-# thousand points.  Soft cap triggers a confirm dialog; hard cap blocks.
+# Scatter / best-fit selections above this many points are drawn
+# decimated (LTTB) or as a density raster (charts/downsample.py) rather
+# than one marker per row.  Render time no longer grows with the
+# selection, but a confirm dialog tells the user the chart is summarized.
 _SCATTER_SOFT_CAP = 5_000
-_SCATTER_HARD_CAP = 50_000
+
+# An analysis run cancels itself if its session stops renewing its
+# CancelToken for this long (backend_support/cancellation.py).  The
+# 500 ms computation watcher renews it, but browsers throttle timers in
+# background tabs, so the lease is generous: it only needs to catch
+# sessions that are really gone.
+_RUN_LEASE_SECONDS = 120
+
+# Least Squares Regression models offered for more than two columns, by
+# label -> the "model" param of methods/regression.py (None: the simple
+# line, or a polynomial, of the second column on the first)
+_REGRESSION_MODELS = {
+    "Simple (second column on the first)": None,
+    "Multiple (last column on the others)": "multiple",
+    "Screen (last column on each other column)": "screen",
+    "Targets (each other column on the first)": "targets",
+}
 
 
 @st.dialog("Large File Detected", width="small")
@@ -584,43 +610,13 @@ def _show_success_toast() -> None:
 # Header detection helpers
 # ---------------------------------------------------------------------------
 
-def _detect_has_headers(raw_bytes: bytes) -> bool:
+def _record_detected_headers(file_key: str, detected: bool) -> None:
     """
-    Heuristic: does the CSV's first row look like column headers?
-
-    Returns True if every value in the first row is a non-numeric string
-    and at least one column in subsequent rows contains numeric data.
-    Falls back to True (the pandas default) when uncertain.
+    Store the header heuristic's verdict (see logic/csv_ingest.py) for the
+    header toggle. The user's own preference, once set, is never replaced.
     """
-    try:
-        df = pd.read_csv(io.BytesIO(raw_bytes), header=None, nrows=20)
-    except Exception:
-        return True
-
-    if len(df) < 2:
-        return False
-
-    first_row = df.iloc[0]
-
-    # If any first-row value is numeric, it's likely data, not a header
-    for val in first_row:
-        if pd.isna(val):
-            continue
-        try:
-            float(str(val))
-            return False
-        except (ValueError, TypeError):
-            pass
-
-    # Check if rows 2+ have at least some numeric data
-    rest = df.iloc[1:]
-    for col in rest.columns:
-        coerced = pd.to_numeric(rest[col], errors="coerce")
-        if coerced.notna().any():
-            return True
-
-    # All-string data throughout — assume headers (common convention)
-    return True
+    st.session_state[f"_headers_detected_{file_key}"] = detected
+    st.session_state.setdefault(f"_has_headers_pref_{file_key}", detected)
 
 
 def _on_header_toggle(file_key: str) -> None:
@@ -785,6 +781,7 @@ def _render_header_settings(uploaded_file) -> None:
         key=toggle_key,
         on_change=_on_header_toggle,
         args=(file_key,),
+        disabled=st.session_state.get("_csv_loading", False),
     )
 
 
@@ -794,6 +791,37 @@ def _render_header_settings(uploaded_file) -> None:
 # Public interface
 # ---------------------------------------------------------------------------
 
+def _leave_pending_run_view(meta: dict | None) -> None:
+    """
+    The run being shown live on the results page failed and will never be
+    added to analysis_runs — send the user back home if they're still on it.
+    """
+    if meta and st.session_state.get("active_run_id") == meta.get("run_id"):
+        st.session_state.active_run_id = None
+        st.session_state.current_view = "home"
+
+
+def cancel_background_computation() -> None:
+    """
+    Stop the in-flight analysis run (the "Cancel analysis" buttons).
+
+    Cancels the run's CancelToken so the backend abandons it, forgets the
+    future without waiting for it, and sends the user home if they were
+    watching the run's results page. Nothing is added to analysis_runs.
+    """
+    token = st.session_state.get("_compute_cancel")
+    if token is not None:
+        token.cancel("Analysis cancelled.")
+    future = st.session_state.get("_compute_future")
+    if future is not None:
+        future.cancel()  # only succeeds if the executor hadn't started it
+    _leave_pending_run_view(st.session_state.get("_compute_meta"))
+    st.session_state._compute_future = None
+    st.session_state._compute_meta = None
+    st.session_state._compute_progress = None
+    st.session_state._compute_cancel = None
+
+
 def poll_background_computation() -> None:
     """Check whether a background computation is complete and handle the result.
 
@@ -815,6 +843,12 @@ def poll_background_computation() -> None:
         _show_computing_toast("Running analysis\u2026 this won't take long.")
         st.session_state._computing_toast_shown = True
 
+    # Keep the run's lease alive while this session is still around
+    # (see _RUN_LEASE_SECONDS).
+    token = st.session_state.get("_compute_cancel")
+    if token is not None:
+        token.renew()
+
     if not future.done():
         # Still running — return so the rest of the render (view routing,
         # navigation, etc.) can complete normally.  The caller (mainpage.py)
@@ -823,9 +857,20 @@ def poll_background_computation() -> None:
 
     # ── Future completed ──────────────────────────────────────────────────
     meta = st.session_state._compute_meta
+    st.session_state._compute_progress = None
+    st.session_state._compute_cancel = None
     try:
         result_message = future.result()
+    except RunCancelled:
+        # Cancelled runs are dropped quietly — the user asked for it, or
+        # nobody was left watching.
+        _leave_pending_run_view(meta)
+        st.session_state._compute_future = None
+        st.session_state._compute_meta = None
+        st.rerun()
+        return
     except _ValidationError as ve:
+        _leave_pending_run_view(meta)
         st.session_state._compute_future = None
         st.session_state._compute_meta = None
         st.session_state.modal_message = str(ve)
@@ -838,6 +883,7 @@ def poll_background_computation() -> None:
         st.rerun()
         return
     except Exception as exc:
+        _leave_pending_run_view(meta)
         st.session_state._compute_future = None
         st.session_state._compute_meta = None
         st.session_state.modal_message = f"Computation failed: {exc}"
@@ -864,6 +910,7 @@ def poll_background_computation() -> None:
         # A malformed result (most often from a buggy LLM-generated custom
         # method) must not white-screen the app.  Surface a friendly error
         # dialog, drop the future, and let the user continue.
+        _leave_pending_run_view(meta)
         st.session_state._compute_future = None
         st.session_state._compute_meta = None
         st.session_state.modal_message = (
@@ -914,7 +961,13 @@ def render_homepage(base_dir: str) -> None:
     #  poll_background_computation() called from mainpage.py.)
     # ------------------------------------------------------------------
     _was_overlay_active = st.session_state.get("_overlay_active", False)
-    if st.session_state.get("_csv_loading"):
+    _csv_ingest = st.session_state.get("_csv_ingest")
+    _csv_preview_ready = (
+        st.session_state.get("_csv_loading")
+        and _csv_ingest is not None
+        and _csv_ingest.preview is not None
+    )
+    if st.session_state.get("_csv_loading") and not _csv_preview_ready:
         if not _was_overlay_active:
             _show_loading_overlay("Loading CSV data\u2026")
         else:
@@ -947,9 +1000,12 @@ def render_homepage(base_dir: str) -> None:
                 st.rerun()
                 return
             st.session_state._csv_raw_bytes = raw
-            st.session_state._csv_future = _get_executor().submit(
-                lambda data: pd.read_csv(io.BytesIO(data)), raw
-            )
+            # One chunked pass (logic/csv_ingest.py): sniffs the header row,
+            # publishes progress, and exposes the first PREVIEW_ROWS rows
+            # early so the grid fills before the whole file is parsed.
+            ingest = CsvIngest(raw)
+            st.session_state._csv_ingest = ingest
+            st.session_state._csv_future = _get_executor().submit(ingest.run)
         elif csv_future.done():
             try:
                 df = csv_future.result()
@@ -958,24 +1014,16 @@ def render_homepage(base_dir: str) -> None:
                 if "edited_data_cache" not in st.session_state:
                     st.session_state.edited_data_cache = {}
 
-                # Auto-detect whether the first row is headers
-                raw = st.session_state.get("_csv_raw_bytes")
-                if raw is not None:
-                    detected = _detect_has_headers(raw)
-                else:
-                    detected = True
-                st.session_state[f"_headers_detected_{file_key}"] = detected
-                st.session_state.setdefault(f"_has_headers_pref_{file_key}", detected)
-
-                if not detected:
-                    # Re-parse without headers and generate column names
-                    if raw is not None:
-                        df = pd.read_csv(io.BytesIO(raw), header=None)
-                    df.columns = [
-                        f"Column {i + 1}" for i in range(len(df.columns))
-                    ]
+                # Header row was auto-detected (and header-less columns
+                # named) during the parse
+                _record_detected_headers(file_key, _csv_ingest.has_headers)
 
                 st.session_state.edited_data_cache[file_key] = df
+                if st.session_state.get("_csv_preview_shown"):
+                    # The grid is showing the preview rows; remount it with
+                    # the full table.
+                    st.session_state._grid_version = st.session_state.get("_grid_version", 0) + 1
+                    st.session_state._row_data_version = st.session_state.get("_row_data_version", 0) + 1
 
                 # Check size — trigger large-file warning if above threshold
                 if len(df) >= _LARGE_FILE_ROW_THRESHOLD:
@@ -996,16 +1044,34 @@ def render_homepage(base_dir: str) -> None:
                 st.session_state.modal_message = f"Failed to parse CSV: {exc}"
                 st.session_state.modal_error_cells = []
                 st.session_state.show_error_dialog = True
+                if st.session_state.get("_csv_preview_shown"):
+                    # Don't leave a partial table behind for a failed parse
+                    uf = st.session_state.uploaded_file
+                    st.session_state.get("edited_data_cache", {}).pop(f"{uf.name}_{uf.size}", None)
             st.session_state._csv_loading = False
             st.session_state._csv_future = None
+            st.session_state._csv_ingest = None
+            st.session_state._csv_preview_shown = False
             st.rerun()
             return
-        # Still loading (or just kicked off) — the _csv_loading_watcher
-        # fragment in mainpage.py polls _csv_future every 500 ms and triggers
-        # a full-app rerun when it's done, at which point this function's
-        # elif-branch above picks up the result. Do not sleep+rerun here;
-        # that pattern causes full-page jitter (see CLAUDE.md).
-        return
+        elif _csv_preview_ready:
+            # First rows are in: show them in the grid while the rest parses.
+            # Run Analysis and the header toggle stay disabled until done.
+            if not st.session_state.get("_csv_preview_shown"):
+                uf = st.session_state.uploaded_file
+                file_key = f"{uf.name}_{uf.size}"
+                _record_detected_headers(file_key, _csv_ingest.has_headers)
+                st.session_state.setdefault("edited_data_cache", {})
+                st.session_state.edited_data_cache[file_key] = _csv_ingest.preview
+                st.session_state._csv_preview_shown = True
+        else:
+            # Still loading (or just kicked off) — the _csv_loading_watcher
+            # fragment in mainpage.py polls _csv_future every 500 ms and
+            # triggers a full-app rerun when the preview is ready or the
+            # parse is done, at which point the branches above pick it up.
+            # Do not sleep+rerun here; that pattern causes full-page jitter
+            # (see CLAUDE.md).
+            return
 
     st.markdown("<div style='margin-top: 1rem;'></div>", unsafe_allow_html=True)
     st.markdown(
@@ -1133,6 +1199,10 @@ def _render_data_panel(base_dir: str) -> pd.DataFrame | None:
     # --- Header settings (toggle + rename) ---
     _render_header_settings(uploaded_file)
 
+    # --- Parse progress while the grid shows the preview rows ---
+    if st.session_state.get("_csv_loading"):
+        _render_csv_progress()
+
     # --- Grid / table display ---
     edited_table = _render_grid(uploaded_file)
 
@@ -1143,6 +1213,22 @@ def _render_data_panel(base_dir: str) -> pd.DataFrame | None:
     return edited_table
 
 
+@st.fragment(run_every="500ms")
+def _render_csv_progress() -> None:
+    """Progress bar for the background CSV parse (refreshes on its own)."""
+    ingest = st.session_state.get("_csv_ingest")
+    if ingest is None or not st.session_state.get("_csv_loading"):
+        return
+    st.progress(
+        ingest.progress,
+        text=(
+            f"Loading CSV\u2026 {ingest.rows_loaded:,} rows "
+            f"({ingest.progress:.0%}). Showing the first rows; analysis "
+            f"unlocks when the file is fully loaded."
+        ),
+    )
+
+
 def _render_file_action_buttons(uploaded_file) -> None:
     """
     Render the Remove and Download buttons shown after a file is loaded.
@@ -1204,13 +1290,19 @@ def _clear_file_state() -> None:
         effectively forces a checkbox reset without needing to track each
         checkbox's individual state.
     """
+    # Stop a parse that's still running for the file being removed
+    ingest = st.session_state.get("_csv_ingest")
+    if ingest is not None:
+        ingest.cancel()
+
     # Clear the data server entry for the file being removed
     old_key = st.session_state.get("_data_key")
     if old_key:
         _data_server.clear_dataframe(old_key)
 
     for key in ("uploaded_file", "saved_table", "edited_data_cache",
-                 "_csv_loading", "_csv_future", "_raw_grid_selection", "_csv_raw_bytes",
+                 "_csv_loading", "_csv_future", "_csv_ingest", "_csv_preview_shown",
+                 "_raw_grid_selection", "_csv_raw_bytes",
                  "large_file_hide_table", "_large_file_warning_pending",
                  "_large_file_rows", "_large_file_cols",
                  "_data_key", "_total_rows"):
@@ -2595,6 +2687,77 @@ def _render_computation_options(
             with pcol:
                 _param_warning("Values must be valid numbers between 0 and 100.")
 
+    # --- Per-column mode for the univariate methods (only meaningful for >1 column) ---
+    if n_cols > 1 and any((mean, median, mode, variance, std, percentiles, variation)):
+        sel["per_column"] = st.checkbox(
+            "Per-column results",
+            value=sel.get("per_column", False),
+            key=f"per_column_{k2}",
+            help=(
+                "Compute Mean, Median, Mode, Variance, Standard Deviation, "
+                "Percentiles and Coefficient of Variation separately for each "
+                "selected column (one result per column) instead of combining "
+                "all selected columns into one dataset."
+            ),
+        )
+
+    # --- Pairwise correlation matrix for Pearson / Spearman (>2 columns) ---
+    if n_cols > 2 and (pearson or spearman):
+        sel["correlation_matrix"] = st.checkbox(
+            "Correlation matrix",
+            value=sel.get("correlation_matrix", False),
+            key=f"correlation_matrix_{k2}",
+            help=(
+                "Correlate every selected column with every other one (with "
+                "p-values) instead of only the first two, and draw the result "
+                "as a heatmap. Rows with a missing value are left out of each "
+                "pair that includes that column."
+            ),
+        )
+
+    # --- Regression model for Least Squares Regression ---
+    if least_squares_regression:
+        st.markdown("**Regression Parameters**")
+        rcol1, rcol2 = st.columns([2, 1])
+        if n_cols > 2:
+            model_labels = list(_REGRESSION_MODELS)
+            with rcol1:
+                sel["regression_model"] = st.selectbox(
+                    "Model",
+                    model_labels,
+                    index=model_labels.index(sel.get("regression_model", model_labels[0])),
+                    key=f"regression_model_{k2}",
+                    help=(
+                        "Multiple: the last selected column on all the others. "
+                        "Screen: the last column on each other column separately. "
+                        "Targets: each other column on the first. Screen and "
+                        "Targets solve every fit in one batched computation."
+                    ),
+                )
+        with rcol2:
+            sel["regression_degree"] = int(st.number_input(
+                "Polynomial degree",
+                min_value=1,
+                max_value=10,
+                value=int(sel.get("regression_degree", 1)),
+                step=1,
+                key=f"regression_degree_{k2}",
+            ))
+
+    # --- Sketch-based Median / Percentiles ---
+    if median or percentiles:
+        sel["approximate_quantiles"] = st.checkbox(
+            "Approximate quantiles",
+            value=sel.get("approximate_quantiles", False),
+            key=f"approximate_quantiles_{k2}",
+            help=(
+                "Read Median and Percentiles off a stored quantile sketch of each "
+                "column instead of sorting the data. Results are within about "
+                "±1.3% of the true rank; repeat queries on the same columns are "
+                "near-instant."
+            ),
+        )
+
     # --- Custom methods ---
     custom_flags = _render_custom_method_checkboxes(data_ready, col1, data_info)
 
@@ -4157,15 +4320,30 @@ def _handle_run_analysis(
     custom_flags           = method_flags.get("custom_flags", {})
 
     already_computing = st.session_state.get("_compute_future") is not None
+    # The grid may be showing only the first rows of a file still being parsed
+    csv_still_loading = st.session_state.get("_csv_loading", False)
     _invalid = st.session_state.get("_analysis_invalid_params", False) or invalid_params
 
     run_clicked = st.button(
         "Run Analysis",
         key="run_analysis",
         use_container_width=True,
-        disabled=not (data_ready and computation_selected) or already_computing or _invalid
+        disabled=(
+            not (data_ready and computation_selected)
+            or already_computing
+            or csv_still_loading
+            or _invalid
+        )
     )
 
+    if already_computing:
+        st.button(
+            "Cancel analysis",
+            key="cancel_analysis_home",
+            use_container_width=True,
+            on_click=cancel_background_computation,
+        )
+
     if not run_clicked:
         return
 
@@ -4241,10 +4419,55 @@ def _handle_run_analysis(
     if not percentile_values:
         percentile_values = [25, 50, 75]
 
+    # Univariate methods that can report one result per selected column
+    # (methods/descriptive.py computes them along axis=1 in one pass).
+    _PER_COLUMN_METHOD_IDS = {
+        "coefficient_variation", "mean", "median", "mode", "percentile",
+        "standard_deviation", "variance",
+    }
+    per_column = (
+        bool(st.session_state.get("method_selections", {}).get("per_column"))
+        and len(parsed_data.columns) > 1
+    )
+
+    # Pearson / Spearman over every pair of columns (methods/correlation.py)
+    correlation_matrix = (
+        bool(st.session_state.get("method_selections", {}).get("correlation_matrix"))
+        and len(parsed_data.columns) > 2
+    )
+    # Polynomial / multiple / batched Least Squares Regression (methods/regression.py)
+    regression_model = (
+        _REGRESSION_MODELS.get(st.session_state.get("method_selections", {}).get("regression_model"))
+        if len(parsed_data.columns) > 2 else None
+    )
+    regression_degree = int(st.session_state.get("method_selections", {}).get("regression_degree", 1))
+    # Median / Percentile read off quantile sketches (methods/sketches.py)
+    approximate_quantiles = bool(
+        st.session_state.get("method_selections", {}).get("approximate_quantiles")
+    )
+
     methods = []
     for k, v in method_flags.items():
         if v and k in _BACKEND_METHOD_IDS:
             method_params = percentile_values if k == "percentile" else {}
+            options = {}
+            if per_column and k in _PER_COLUMN_METHOD_IDS:
+                options["per_column"] = True
+            if approximate_quantiles and k in ("median", "percentile"):
+                options["approximate"] = True
+            if correlation_matrix and k in ("pearson", "spearman"):
+                options["matrix"] = True
+            if k == "least_squares_regression":
+                if regression_model:
+                    options["model"] = regression_model
+                if regression_model or regression_degree > 1:
+                    options["degree"] = regression_degree
+            if options:
+                method_params = (
+                    {"percentiles": percentile_values, **options}
+                    if k == "percentile"
+                    else options
+                )
             methods.append({"id": k, "params": method_params})
     _LABEL_FRIENDLY_CHARTS = {"pie_chart", "vert_bar", "hor_bar"}
 
@@ -4274,6 +4497,11 @@ def _handle_run_analysis(
                 elif num_cols:
                     req["values"] = parsed_data[num_cols[0]].tolist()
             graphics.append(req)
+    # Each correlation matrix is also drawn as a heatmap
+    if correlation_matrix:
+        for k in ("pearson", "spearman"):
+            if method_flags.get(k):
+                graphics.append({"type": "corr_heatmap", "method": k})
 
     # --- Submit ALL heavy work to background so loading dialog appears immediately ---
     # Validation, data serialization, and computation all run in the background.
@@ -4287,29 +4515,22 @@ def _handle_run_analysis(
         else "unknown"
     )
 
-    # Scatter / Best-Fit point caps.  Rendering 100K markers via plotly+kaleido
-    # freezes the backend (single-threaded chromium render).  The hard cap
-    # blocks outright; the soft cap defers the actual submit into a confirm
-    # dialog so the user acknowledges the wait.
+    # Scatter / Best-Fit point cap.  Past the soft cap the charts are
+    # summarized instead of drawing every marker, so the submit is deferred
+    # into a confirm dialog that says so.
     scatter_like_selected = method_flags.get("scat_plot") or method_flags.get("best_fit")
     point_count = len(parsed_data)
-    if scatter_like_selected and point_count > _SCATTER_HARD_CAP:
-        st.session_state.modal_message = (
-            f"Scatter and Line of Best Fit charts are limited to "
-            f"{_SCATTER_HARD_CAP:,} points. Your selection has "
-            f"{point_count:,} rows — reduce the row selection before running."
-        )
-        st.session_state.modal_error_cells = []
-        st.session_state.show_error_dialog = True
-        st.rerun()
-        return
+
+    visualizations = [VIZ_NAMES[k] for k in _BACKEND_CHART_IDS if method_flags.get(k)]
+    if any(req["type"] == "corr_heatmap" for req in graphics):
+        visualizations.append(VIZ_NAMES["corr_heatmap"])
 
     run_count = len(st.session_state.analysis_runs) + 1
     st.session_state._compute_meta = {
         "run_id":         str(uuid.uuid4()),
         "run_name":       f"Run {run_count}",
         "methods":        methods,
-        "visualizations": [VIZ_NAMES[k] for k in _BACKEND_CHART_IDS if method_flags.get(k)],
+        "visualizations": visualizations,
         "table":          edited_table if edited_table is not None else pd.DataFrame(),
         "data":           parsed_data.reset_index(drop=True),
         "columns":        col1,
@@ -4341,7 +4562,20 @@ def _handle_run_analysis(
 
 def _submit_analysis(parsed_data, method_flags, methods, graphics,
                      dataset_id, selected_cols, selected_rows) -> None:
-    """Kick off the background analysis run and show the loading caption."""
+    """
+    Kick off the background analysis run and show the loading caption.
+
+    Opens the run's results page right away: it renders each card and
+    chart as the backend reports it (views/results.render_partial_results)
+    until the run completes and poll_background_computation hands over.
+    """
+    progress = RunProgress(method_count=len(methods), chart_count=len(graphics))
+    st.session_state._compute_progress = progress
+    cancel_token = CancelToken(lease_seconds=_RUN_LEASE_SECONDS)
+    st.session_state._compute_cancel = cancel_token
+    run_id = st.session_state._compute_meta["run_id"]
+    st.session_state.active_run_id = run_id
+    st.session_state.current_view = f"run:{run_id}"
     st.session_state._compute_future = _get_executor().submit(
         _background_run,
         parsed_data,
@@ -4352,13 +4586,15 @@ def _submit_analysis(parsed_data, method_flags, methods, graphics,
         selected_cols,
         selected_rows,
         _get_backend_handler().handle_request,
+        progress.on_result,
+        cancel_token,
     )
     st.session_state._loading_caption = "Running analysis… this won't take long."
 
 
 @st.dialog("Large scatter plot")
 def _scatter_soft_warn_dialog() -> None:
-    """Confirm before rendering a scatter/best-fit with >5K points."""
+    """Confirm before rendering a summarized scatter/best-fit (>5K points)."""
     payload = st.session_state.get("_scatter_warn_payload")
     points  = st.session_state.get("_scatter_warn_points", 0)
     if not payload:
@@ -4366,9 +4602,9 @@ def _scatter_soft_warn_dialog() -> None:
 
     st.markdown(
         f"You selected **{points:,} points** for a scatter or line-of-best-fit "
-        f"chart.  Rendering more than {_SCATTER_SOFT_CAP:,} points can take a "
-        f"while and may slow the browser.  Hard limit is "
-        f"{_SCATTER_HARD_CAP:,}."
+        f"chart.  Above {_SCATTER_SOFT_CAP:,} points the chart shows a "
+        f"representative subset that keeps outliers, or a density shading "
+        f"for very large selections.  The line of best fit still uses every point."
     )
     st.markdown("Do you want to continue?")
 
@@ -16,6 +16,7 @@ import sys
 import os
 import json
 import glob
+import sqlite3
 
 _PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
 if _PROJECT_ROOT not in sys.path:
@@ -36,6 +37,8 @@ from datetime import timezone
 from class_templates.message_structure import Message
 from frontend_handler import handle_result
 from backend_handler import BackendHandler
+from backend_support.run_catalog import get_catalog
+from backend_support.run_store import load_array, load_table
 
 SAVED_RUNS_FILE = os.path.join(_PROJECT_ROOT, "results_cache", "saved_runs.json")
 
@@ -243,9 +246,10 @@ def _load_run_from_cache(entry: dict) -> None:
 
     Steps:
         1. Find the results JSON in the cache folder.
-        2. Extract the original inputs (data, methods, graphics, metadata).
+        2. Extract the original inputs (data, methods, graphics, metadata);
+           data.npy and the saved table are memory-mapped, not parsed.
         3. Re-execute the computation via BackendHandler.
-        4. Load the table CSV (if saved).
+        4. Load the saved table (binary, or table.csv from older saves).
         5. Build the run dict and add to analysis_runs.
         6. Navigate to the run.
     """
@@ -262,13 +266,20 @@ def _load_run_from_cache(entry: dict) -> None:
         st.rerun()
         return
 
-    # 1. Find the results JSON
-    json_files = glob.glob(os.path.join(cache_folder, "results_*.json"))
-    if not json_files:
-        st.error("No results JSON found in the cache folder.")
-        return
-
-    json_path = sorted(json_files)[-1]  # most recent
+    # 1. Find the results JSON (indexed in the run catalog; globbed for
+    #    runs the catalog hasn't seen)
+    try:
+        indexed = get_catalog(os.path.dirname(SAVED_RUNS_FILE)).get_run(cache_folder)
+    except (sqlite3.Error, OSError):
+        indexed = None
+    if indexed and indexed.get("json_path") and os.path.isfile(indexed["json_path"]):
+        json_path = indexed["json_path"]
+    else:
+        json_files = glob.glob(os.path.join(cache_folder, "results_*.json"))
+        if not json_files:
+            st.error("No results JSON found in the cache folder.")
+            return
+        json_path = sorted(json_files)[-1]  # most recent
 
     try:
         with open(json_path, "r") as f:
@@ -277,18 +288,35 @@ def _load_run_from_cache(entry: dict) -> None:
         st.error(f"Failed to read cached results: {exc}")
         return
 
-    # Load the table CSV first so we can use the DataFrame as data
-    table_path = os.path.join(cache_folder, "table.csv")
-    if os.path.isfile(table_path):
-        replay_data = pd.read_csv(table_path)
-    else:
-        replay_data = pd.DataFrame(data_dict.get("data", []))
+    # The original input array, memory-mapped (runs saved before the
+    # columnar format keep it inline in the JSON instead)
+    replay_array = None
+    data_file = data_dict.get("data_file")
+    if data_file:
+        try:
+            replay_array = load_array(os.path.join(cache_folder, data_file))
+        except (OSError, ValueError) as exc:
+            st.error(f"Failed to read cached run data: {exc}")
+            return
+
+    # Load the saved table first so we can use the DataFrame as data
+    replay_data = load_table(cache_folder)
+    if replay_data is None:
+        table_path = os.path.join(cache_folder, "table.csv")
+        if os.path.isfile(table_path):
+            replay_data = pd.read_csv(table_path)
+        elif replay_array is not None:
+            replay_data = pd.DataFrame(replay_array.T)
+        else:
+            replay_data = pd.DataFrame(data_dict.get("data", []))
 
     # Column-major list of lists matches the format homepage.py sends on a
     # fresh run (see _run_analysis). Using .to_dict() here instead produces a
     # {col_name: [...]} dict, which the backend can't convert to a numpy array
     # and fails every method with "len() of unsized object".
-    if not replay_data.empty:
+    if replay_array is not None:
+        replay_payload = []
+    elif not replay_data.empty:
         replay_payload = [replay_data[c].tolist() for c in replay_data.columns]
     else:
         replay_payload = []
@@ -302,6 +330,8 @@ def _load_run_from_cache(entry: dict) -> None:
         graphics=data_dict.get("graphics", []),
         data=replay_payload,
     )
+    if replay_array is not None:
+        request.data = replay_array
 
     try:
         handler = BackendHandler()
@@ -340,7 +370,18 @@ def _load_run_from_cache(entry: dict) -> None:
 # ---------------------------------------------------------------------------
 
 def _read_saved_runs() -> list:
-    """Read and return the list from saved_runs.json, or [] if missing."""
+    """
+    Return the list from saved_runs.json, or [] if missing. Answered from
+    the run catalog's mirror of the file, which is refreshed only when the
+    file changes; read directly if the catalog is unavailable.
+    """
+    try:
+        return get_catalog(os.path.dirname(SAVED_RUNS_FILE)).saved_runs()
+    except ValueError:
+        return []
+    except (sqlite3.Error, OSError):
+        pass
+
     if not os.path.isfile(SAVED_RUNS_FILE):
         return []
     try:
@@ -374,3 +415,9 @@ def _write_saved_runs(saved_runs: list) -> None:
         except OSError:
             pass
         st.error(f"Failed to save run history: {exc}")
+        return
+
+    try:
+        get_catalog(os.path.dirname(SAVED_RUNS_FILE)).set_saved_runs(saved_runs)
+    except (sqlite3.Error, OSError):
+        pass  # the catalog re-reads saved_runs.json when it sees the change
@@ -13,6 +13,7 @@ WHY THIS FILE EXISTS:
 
 PUBLIC INTERFACE:
     render_results(run, base_dir)
+    render_partial_results(meta, progress, on_cancel)   — run still computing
 
 PRIVATE HELPERS:
     _render_stat_cards(run)
@@ -41,8 +42,10 @@ import sys
 import os
 import json
 import base64
+import sqlite3
 import re
 from pathlib import Path
+from types import SimpleNamespace
 import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
@@ -67,6 +70,10 @@ _PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"
 if _PROJECT_ROOT not in sys.path:
     sys.path.append(_PROJECT_ROOT)
 
+from backend_support.run_catalog import get_catalog
+from backend_support.run_store import save_table
+from backend_support.method_charts import deferred_chart_of, is_deferred, render_method_chart
+
 SAVED_RUNS_FILE = os.path.join(_PROJECT_ROOT, "results_cache", "saved_runs.json")
 
 _HUZZAH_PATH = Path(__file__).parent.parent / "pages" / "assets" / "huzzahAhSquirrel.png"
@@ -189,6 +196,51 @@ def render_results(run: dict, base_dir: str) -> None:
     _render_action_buttons(run)
 
 
+def render_partial_results(meta: dict, progress, on_cancel=None) -> None:
+    """
+    Render the results page for the run that is still computing.
+
+    Shows the stat cards and charts the backend has reported so far
+    (logic/run_progress.py). The _computation_watcher fragment in
+    mainpage.py reruns the app when more arrive, and once the run finishes
+    render_results takes over with the complete run.
+
+    Args:
+        meta:     st.session_state._compute_meta for the in-flight run.
+        progress: The RunProgress receiving the run's results.
+        on_cancel: Callback for the "Cancel analysis" button; the button
+                   is omitted when None.
+    """
+    version, method_results, chart_results = progress.snapshot()
+    # The watcher compares against this to decide whether to rerun
+    st.session_state._compute_progress_seen = version
+
+    st.markdown("<div style='margin-top: 1rem;'></div>", unsafe_allow_html=True)
+    st.markdown(
+        "<hr style='margin: 0; border: none; height: 1px; "
+        "background: linear-gradient(90deg, transparent 0%, "
+        "rgba(228, 120, 29, 0.5) 50%, transparent 100%);' />",
+        unsafe_allow_html=True
+    )
+    st.header(f"Analysis Results — {meta['run_name']}", anchor=False)
+    st.caption(
+        f"Running\u2026 {progress.done_count} of {progress.total_count} "
+        "results ready. The rest appear here as they finish."
+    )
+    if on_cancel is not None:
+        st.button("Cancel analysis", key="cancel_analysis_results", on_click=on_cancel)
+
+    partial_run = {
+        "id": meta["run_id"],
+        "columns": meta.get("columns", []),
+        "result_message": SimpleNamespace(results=method_results, graphics=chart_results),
+    }
+    if method_results:
+        handle_result(partial_run)
+        _render_stat_cards(partial_run)
+    _render_visualizations(partial_run, show_divider=False)
+
+
 # ---------------------------------------------------------------------------
 # Section renderers
 # ---------------------------------------------------------------------------
@@ -482,8 +534,8 @@ def _render_multi_column_notice(run: dict) -> None:
         f"{subject} {verb} a single column of data. With {col_count} columns "
         f"selected, all values were combined into one dataset before computing, "
         f"so the result reflects every selected column together — not each column "
-        f"individually. To get per-column results, run the analysis separately on "
-        f"each column."
+        f"individually. To get per-column results, check **Per-column results** "
+        f"under Computation Options and run the analysis again."
     )
     st.markdown("<div style='margin-bottom: 1rem;'></div>", unsafe_allow_html=True)
 
@@ -605,6 +657,17 @@ def _render_performance_metrics(run: dict, show_divider: bool = True) -> None:
                 for key, ms in per_method.items():
                     st.markdown(f"- `{key}`: `{_format_elapsed_ms(ms)}`")
 
+            per_method_usage = timings.get("per_method_usage") or {}
+            if per_method_usage:
+                st.markdown("**Sandboxed custom methods (CPU time, peak memory)**")
+                for key, usage in per_method_usage.items():
+                    peak = usage.get("peak_rss_mb")
+                    peak_text = f"{peak:g} MB" if peak is not None else "—"
+                    st.markdown(
+                        f"- `{key}`: `{_format_elapsed_ms(usage.get('cpu_ms'))}` CPU, "
+                        f"`{peak_text}` peak RSS"
+                    )
+
             if per_chart:
                 st.markdown("**Per-chart (wall clock)**")
                 for key, ms in per_chart.items():
@@ -622,13 +685,23 @@ def _render_visualizations(run: dict, show_divider: bool = True) -> None:
     Render the visualizations section using chart images saved by the backend.
 
     Reads result_message.graphics, which is populated by BackendHandler after
-    chart PNGs are generated into the results_cache run folder.
+    chart PNGs are generated into the results_cache run folder, followed by
+    the deferred charts of method results, drawn on first view.
 
     Args:
         run: The run dict containing "result_message" (a Message object).
     """
-    graphics = getattr(run.get("result_message"), "graphics", None)
-    if not graphics:
+    message = run.get("result_message")
+    graphics = getattr(message, "graphics", None) or []
+    # Method results with a deferred chart (Least Squares Regression); the
+    # PNG is drawn below the first time this section shows it
+    method_charts = []
+    if getattr(message, "data", None) is not None:
+        method_charts = [
+            result for result in getattr(message, "results", None) or []
+            if (deferred_chart_of(result) or {}).get("path")
+        ]
+    if not graphics and not method_charts:
         return
 
     st.subheader("Visualizations", anchor=False)
@@ -663,6 +736,17 @@ def _render_visualizations(run: dict, show_divider: bool = True) -> None:
             friendly = VIZ_NAMES.get(chart_type, chart_type.replace('_', ' ').title())
             st.error(f"**{friendly}:** {chart.get('error', 'Failed to generate')}.")
 
+    for idx, result in enumerate(method_charts, start=len(graphics)):
+        try:
+            path = render_method_chart(result, message.data, message.metadata)
+        except Exception as exc:
+            from frontend_handler import _ID_TO_DISPLAY
+            friendly = _ID_TO_DISPLAY.get(result.get("id"), result.get("id"))
+            st.error(f"**{friendly} chart:** {exc}.")
+            continue
+        with cols[idx % len(cols)]:
+            st.image(Image.open(path))
+
 
 def _render_data_table(run: dict, show_divider: bool = True) -> None:
     """
@@ -847,7 +931,8 @@ def _save_run(run: dict) -> None:
 
     Steps:
         1. Locate the run's cache folder (from result_message.run_folder).
-        2. Save the selected DataFrame as table.csv in that folder.
+        2. Save the selected DataFrame as a columnar binary table in that
+           folder (backend_support/run_store.py).
         3. Add / update an entry in saved_runs.json at the project root.
     """
     result_message = run.get("result_message")
@@ -857,10 +942,9 @@ def _save_run(run: dict) -> None:
         st.error("Cannot save: no cache folder found for this run.")
         return
 
-    # 1. Save the table as CSV so it can be reconstructed on load
-    table_path = os.path.join(cache_folder, "table.csv")
+    # 1. Save the table (one .npy per column) so it can be reconstructed on load
     if isinstance(run.get("data"), pd.DataFrame):
-        run["data"].to_csv(table_path, index=False)
+        save_table(cache_folder, run["data"])
 
     # 2. Read existing saved_runs.json (or start fresh)
     saved_runs = _read_saved_runs()
@@ -887,7 +971,18 @@ def _save_run(run: dict) -> None:
     st.rerun()
 
 def _read_saved_runs() -> list:
-    """Read and return the list from saved_runs.json, or [] if missing."""
+    """
+    Return the list from saved_runs.json, or [] if missing. Answered from
+    the run catalog's mirror of the file, which is refreshed only when the
+    file changes; read directly if the catalog is unavailable.
+    """
+    try:
+        return get_catalog(os.path.dirname(SAVED_RUNS_FILE)).saved_runs()
+    except ValueError:
+        return []
+    except (sqlite3.Error, OSError):
+        pass
+
     if not os.path.isfile(SAVED_RUNS_FILE):
         return []
     try:
@@ -921,6 +1016,12 @@ def _write_saved_runs(saved_runs: list) -> None:
         except OSError:
             pass
         st.error(f"Failed to save run history: {exc}")
+        return
+
+    try:
+        get_catalog(os.path.dirname(SAVED_RUNS_FILE)).set_saved_runs(saved_runs)
+    except (sqlite3.Error, OSError):
+        pass  # the catalog re-reads saved_runs.json when it sees the change
 
 
 # ---------------------------------------------------------------------------
@@ -952,8 +1053,22 @@ def _explode_result_value(value, params_used):
                 pairs.append((label, v))
             return pairs
         return [(f"value[{i}]", v) for i, v in enumerate(value)]
+    if isinstance(value, dict) and "matrix" in value:
+        # Correlation matrix: one row per pair of columns and statistic
+        names = value["columns"]
+        pairs = []
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                pair = f"{names[i]} ~ {names[j]}"
+                pairs.append((f"{pair} / r", value["matrix"][i][j]))
+                pairs.append((f"{pair} / p", value["p_values"][i][j]))
+                pairs.append((f"{pair} / n", value["n_obs"][i][j]))
+        return pairs
     if isinstance(value, dict):
-        return [(str(k), v) for k, v in value.items()]
+        # A deferred method chart (LSR) exports as its file path
+        return [
+            (str(k), v["path"] if is_deferred(v) else v) for k, v in value.items()
+        ]
     try:
         if isinstance(value, pd.DataFrame):
             pairs = []
@@ -966,16 +1081,30 @@ def _explode_result_value(value, params_used):
     return [("value", str(value) if value is not None else "")]
 
 
+def _explode_per_column_value(res: dict, params_used):
+    """(field_label, cell_value) pairs for a per-column result, prefixed by column."""
+    # Percentile's per-column params carry the percentages under "percentiles"
+    if isinstance(params_used, dict):
+        params_used = params_used.get("percentiles")
+    pairs = []
+    for column, value in zip(res["columns"], res["value"]):
+        for field, cell_value in _explode_result_value(value, params_used):
+            label = column if field == "value" else f"{column} / {field}"
+            pairs.append((label, cell_value))
+    return pairs
+
+
 def _build_results_dataframe(run: dict, run_name: str | None = None) -> pd.DataFrame:
     """
     Build a long-format DataFrame of the run's computed results (Req 3.8).
 
     One row per (statistic, field) pair. Multi-valued outputs (percentile
-    lists, LSR slope/intercept/equation, binomial tables) are exploded
+    lists, per-column results, LSR slope/intercept/equation, binomial
+    tables) are exploded
     into multiple rows so downstream tools can consume them directly.
     Row/column selection is repeated on every row (Req 3.9).
     """
-    from frontend_handler import _ID_TO_DISPLAY  # local import avoids cycle at module load
+    from frontend_handler import _ID_TO_DISPLAY, _is_per_column  # local import avoids cycle at module load
 
     sel_cols = ", ".join(str(c) for c in (run.get("columns") or []))
     sel_rows_list = run.get("rows") or []
@@ -993,7 +1122,9 @@ def _build_results_dataframe(run: dict, run_name: str | None = None) -> pd.DataF
         params = res.get("params_used")
         params_str = "" if params in (None, "", [], {}) else str(params)
 
-        if res.get("ok"):
+        if res.get("ok") and _is_per_column(res):
+            exploded = _explode_per_column_value(res, params)
+        elif res.get("ok"):
             exploded = _explode_result_value(res.get("value"), params)
         else:
             exploded = [("value", "")]
@@ -1,4 +1,5 @@
 
+import copy
 from datetime import datetime
 import os
 import re
@@ -7,17 +8,59 @@ import json
 
 
 import queue
+import shutil
+import sqlite3
 import sys
 import threading
 import time
 import uuid
 
-
-# Per-worker timeout in _threads_compute.join() — prevents a hung statistical
-# method from blocking the UI thread indefinitely. Missing results are filled
-# with error entries so the run still persists.
+from backend_support.cancellation import (
+    POLL_SECONDS,
+    CancelToken,
+    RunCancelled,
+    bind_token,
+    check_cancelled,
+)
+from backend_support.executors import EXECUTOR_MODES, KillableProcessPool, init_process_worker
+from backend_support.method_charts import place_method_charts
+from backend_support.run_catalog import get_catalog
+from backend_support.run_store import DATA_FILE, save_array
+from backend_support.sandbox import capture_usage, summarize_usage
+from backend_support.toolbox import RunToolbox, bind_toolbox, current_toolbox
+
+
+# Deadline for the compute phase and for the chart phase — prevents a hung
+# statistical method or chart from blocking the run indefinitely. Work still
+# running then is told to stop (process workers are killed) and missing
+# results are filled with error entries so the run still persists.
 _WORKER_JOIN_TIMEOUT_SECONDS = 60.0
 
+# Default method-execution backend and worker count. "thread" keeps the
+# original in-process thread pool; "process" runs methods in a pool of
+# worker processes that read Message.data from shared memory; "inline"
+# runs methods one after another on the calling thread. Only "process"
+# can hard-stop a running built-in on cancel or timeout: threads can't be
+# killed, and built-ins don't poll their CancelToken, so under "thread" a
+# hung built-in keeps its (daemon) thread until it returns. Stored custom
+# methods run in the killable sandbox (backend_support/sandbox.py) unless
+# the handler is created with sandbox=False.
+_DEFAULT_EXECUTOR = "thread"
+_DEFAULT_MAX_WORKERS = 4
+
+# Long-lived Kaleido renderer processes shared by every handler in the
+# process; chart threads are capped at the same number.
+_DEFAULT_RENDER_WORKERS = 2
+
+# Custom methods loaded from the custom methods store run in sandboxed
+# worker processes with CPU and memory limits (backend_support/sandbox.py).
+# The pool is shared by every handler in the process.
+_DEFAULT_SANDBOX_WORKERS = 2
+
+# Content-addressed cache of built-in method results (see
+# backend_support/result_cache.py). Pass cache_dir=None to disable.
+_RESULT_CACHE_DIR = os.path.join("results_cache", "method_cache")
+
 
 class BackendHandler:
     """
@@ -26,17 +69,42 @@ class BackendHandler:
     The BackendHandler class processes incoming requests encapsulated in Message objects,
     extracts the requested statistical methods along with the associated data and metadata,
     and computes the results using the appropriate statistical classes. Each computation
-    is performed in its own thread to optimize performance, with a limit on the maximum
-    number of concurrent threads. Finally, the results are packaged back into the Message
-    structure and returned to the caller.
+    is dispatched to the configured executor backend ("thread", "process" or "inline")
+    with a limit on the number of concurrent workers. Finally, the results are packaged
+    back into the Message structure and returned to the caller.
     """
 
-    def __init__(self):
+    def __init__(self, executor=_DEFAULT_EXECUTOR, max_workers=_DEFAULT_MAX_WORKERS,
+                 cache_dir=_RESULT_CACHE_DIR, render_workers=_DEFAULT_RENDER_WORKERS,
+                 sandbox=True, sandbox_workers=_DEFAULT_SANDBOX_WORKERS):
+        if executor not in EXECUTOR_MODES:
+            raise ValueError(
+                f"Unknown executor {executor!r}; expected one of {', '.join(EXECUTOR_MODES)}"
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if render_workers < 1:
+            raise ValueError("render_workers must be at least 1")
+        if sandbox_workers < 1:
+            raise ValueError("sandbox_workers must be at least 1")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.render_workers = render_workers
+        self.cache_dir = cache_dir
+        self._result_cache = None
+        self.sandbox = sandbox
+        self.sandbox_workers = sandbox_workers
+        self._sandbox_pool = None
+
         # Defer heavy imports (matplotlib, plotly, numpy, sklearn) until
         # first use so they don't slow down app boot.
         self._statistical_methods = None
         self._chart_generation_methods = None
 
+        # Worker processes for the "process" executor, created on first use.
+        self._process_pool = None
+        self._process_pool_lock = threading.Lock()
+
     @property
     def statistical_methods(self):
         if self._statistical_methods is None:
@@ -48,29 +116,81 @@ class BackendHandler:
         return self._statistical_methods
 
     def reload_methods(self):
-        """Clear cached methods so custom methods are re-loaded on next request."""
+        """
+        Clear cached methods so custom methods are re-loaded on next request.
+        Only custom method files that changed are re-imported
+        (custom_method_support/store.py).
+        """
         self._statistical_methods = None
+        # Worker processes hold their own method tables; recycle them too.
+        self.shutdown()
+
+    def shutdown(self):
+        """Stop the worker processes of the "process" executor, if any."""
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _discard_process_pool(self, pool):
+        """Forget *pool* (if it's still current) so the next use starts a fresh one."""
+        with self._process_pool_lock:
+            if self._process_pool is not pool:
+                return
+            self._process_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _kill_process_pool(self):
+        """
+        Hard-stop the "process" executor. ProcessPoolExecutor can't cancel a
+        task once it is running, so its worker processes are killed; the
+        next run starts a fresh pool.
+        """
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.kill_workers()
+
+    @property
+    def sandbox_pool(self):
+        if self._sandbox_pool is None:
+            from backend_support.sandbox import get_or_start_sandbox
+            self._sandbox_pool = get_or_start_sandbox(self.sandbox_workers, self.cache_dir)
+        return self._sandbox_pool
+
+    @property
+    def result_cache(self):
+        if self._result_cache is None and self.cache_dir:
+            from backend_support.result_cache import ResultCache
+            self._result_cache = ResultCache(self.cache_dir)
+        return self._result_cache
+
+    def _get_process_pool(self):
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                import multiprocessing
+
+                # "spawn" rather than fork: the Streamlit server is heavily
+                # threaded and forking it can deadlock on inherited locks.
+                self._process_pool = KillableProcessPool(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_process_worker,
+                    initargs=(self.cache_dir,),
+                )
+            return self._process_pool
 
     @property
     def chart_generation_methods(self):
         if self._chart_generation_methods is None:
             from charts.charts import charts_list
             self._chart_generation_methods = charts_list
-            # Pre-warm Kaleido on the main thread so that concurrent chart threads
-            # never race to initialize its subprocess under Python's import lock,
-            # which causes the "_ModuleLock('plotly.offline.offline') deadlock" error.
-            try:
-                import plotly.graph_objects as _go
-                import plotly.io as _pio
-                from io import BytesIO as _BytesIO
-                _pio.write_image(_go.Figure(), _BytesIO(), format="png", width=10, height=10)
-            except Exception as _prewarm_exc:
-                # Don't kill boot if Kaleido is unavailable, but surface the
-                # failure so chart generation issues aren't silently masked.
-                print(
-                    f"[backend_handler] Kaleido pre-warm failed: {_prewarm_exc!r}",
-                    file=sys.stderr,
-                )
+            # Start the shared Kaleido renderer processes (charts/renderer_pool.py)
+            # here, on the calling thread, so chart threads never race to
+            # initialize Kaleido or plotly's lazy imports. If Kaleido can't
+            # start, charts fall back to rendering in-process.
+            from charts.renderer_pool import get_or_start_pool
+            get_or_start_pool(self.render_workers)
         return self._chart_generation_methods
 
     def _package_results(self, message, results):
@@ -118,72 +238,313 @@ class BackendHandler:
         
         return method_requests
     
-    def _threads_compute(self, method_requests, data, metadata, max_threads):
+    def _threads_compute(self, method_requests, inputs, max_threads, on_result=None,
+                         cancel_token=None, run_tools=None, usage=None):
         """
         Compute each method via a task queue, dispatching work to up to
         max_threads concurrent worker threads. Results are returned in the
-        same order as method_requests, alongside a per-method wall-clock
-        timing dict (ms).
+        same order as method_requests, alongside the per-method wall-clock
+        time (ms) keyed by index.
+
+        Waiting stops as soon as cancel_token is cancelled, or after
+        _WORKER_JOIN_TIMEOUT_SECONDS; methods still running then are told
+        to stop through the token bound to their thread (see
+        backend_support/cancellation.py) and get error entries. Only code
+        that checks the token (toolbox calls, sandboxed custom methods)
+        actually stops; a built-in runs to completion in the background.
+        Use the "process" executor when running built-ins must be killable.
 
         :param self: self
         :param method_requests: List of (method_id, method_params) tuples
-        :param data: Data for computations
-        :param metadata: Metadata for computations
+        :param inputs: (method_data, method_metadata) for each request
         :param max_threads: Maximum number of concurrent threads
-        :return: (ordered_results, per_method_ms) where per_method_ms is
-                 {method_id: elapsed_ms}. If the same method appears twice,
-                 the key is suffixed with the index (e.g. "mean#1").
+        :param on_result: Optional callback, see handle_request
+        :param cancel_token: Optional CancelToken for the run
+        :param run_tools: The run's RunToolbox, bound to every worker thread
+        :param usage: Optional dict filled with {request_index: {"cpu_ms",
+                      "peak_rss_mb"}} for methods that ran in the sandbox
+        :return: (ordered_results, elapsed_ms) where elapsed_ms is
+                 {request_index: elapsed_ms} for the methods that finished.
         """
+        token = self._phase_token(cancel_token)
         task_queue = queue.Queue()
         results_lock = threading.Lock()
         results = {}
-        per_method_ms = {}
+        elapsed = {}
 
         # Enqueue all tasks with their original index so order can be restored
-        for idx, (method_id, method_params) in enumerate(method_requests):
-            method_data = data[method_id] if isinstance(data, dict) and method_id in data else data
-            method_metadata = metadata[method_id] if isinstance(metadata, dict) and method_id in metadata else metadata
+        for idx, ((method_id, method_params), (method_data, method_metadata)) in enumerate(
+            zip(method_requests, inputs)
+        ):
             task_queue.put((idx, method_id, method_params, method_data, method_metadata))
 
-        # Add one sentinel (None) per thread to signal shutdown
-        num_threads = min(max_threads, len(method_requests)) if method_requests else 0
-        for _ in range(num_threads):
-            task_queue.put(None)
-
         def thread_worker():
-            while True:
-                task = task_queue.get()
-                if task is None:          # sentinel: no more work for this thread
-                    task_queue.task_done()
-                    break
-                idx, method_id, method_params, method_data, method_metadata = task
-                t0 = time.perf_counter()
-                try:
-                    result = self.worker(method_id, method_data, method_metadata, method_params)
-                except Exception as exc:
-                    result = self._generate_error_result(method_id, str(exc), method_params)
-                elapsed_ms = (time.perf_counter() - t0) * 1000.0
-                with results_lock:
-                    results[idx] = result
-                    # Disambiguate duplicate method ids by appending #<idx>
-                    key = method_id if method_id not in per_method_ms else f"{method_id}#{idx}"
-                    per_method_ms[key] = round(elapsed_ms, 3)
-                task_queue.task_done()
+            with bind_token(token), bind_toolbox(run_tools):
+                while not token.cancelled:
+                    try:
+                        task = task_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    idx, method_id, method_params, method_data, method_metadata = task
+                    t0 = time.perf_counter()
+                    with capture_usage() as task_usage:
+                        try:
+                            result = self.worker(method_id, method_data, method_metadata, method_params)
+                        except Exception as exc:
+                            result = self._generate_error_result(method_id, str(exc), method_params)
+                    elapsed_ms = (time.perf_counter() - t0) * 1000.0
+                    with results_lock:
+                        results[idx] = result
+                        elapsed[idx] = elapsed_ms
+                        if usage is not None and task_usage:
+                            usage[idx] = summarize_usage(task_usage)
+                    self._notify(on_result, "method", idx, result)
 
+        num_threads = min(max_threads, len(method_requests)) if method_requests else 0
         threads = [threading.Thread(target=thread_worker, daemon=True) for _ in range(num_threads)]
         for t in threads:
             t.start()
 
-        # Block until every task (including sentinels) has been marked done
-        task_queue.join()
+        # Bounded, cancellable wait so a hung worker can't block the run forever.
+        self._wait_threads(threads, token, _WORKER_JOIN_TIMEOUT_SECONDS)
 
-        # Bounded join so a hung worker can't block the UI thread forever.
-        for t in threads:
-            t.join(timeout=_WORKER_JOIN_TIMEOUT_SECONDS)
+        with results_lock:
+            finished, timings = dict(results), dict(elapsed)
+        return self._order_results(method_requests, finished), timings
+
+    def _inline_compute(self, method_requests, inputs, on_result=None, cancel_token=None,
+                        run_tools=None, usage=None):
+        """
+        Compute each method sequentially on the calling thread. Same return
+        shape as _threads_compute; useful for debugging and inside worker
+        processes, where a nested pool would only add overhead. Methods not
+        yet started when cancel_token is cancelled are skipped.
+        """
+        token = self._phase_token(cancel_token)
+        results = {}
+        elapsed = {}
+        with bind_token(token), bind_toolbox(run_tools):
+            for idx, ((method_id, method_params), (method_data, method_metadata)) in enumerate(
+                zip(method_requests, inputs)
+            ):
+                if token.cancelled:
+                    break
+                t0 = time.perf_counter()
+                with capture_usage() as task_usage:
+                    try:
+                        result = self.worker(method_id, method_data, method_metadata, method_params)
+                    except Exception as exc:
+                        result = self._generate_error_result(method_id, str(exc), method_params)
+                results[idx] = result
+                elapsed[idx] = (time.perf_counter() - t0) * 1000.0
+                if usage is not None and task_usage:
+                    usage[idx] = summarize_usage(task_usage)
+                self._notify(on_result, "method", idx, result)
+        return self._order_results(method_requests, results), elapsed
+
+    def _process_compute(self, method_requests, inputs, on_result=None, cancel_token=None):
+        """
+        Compute each method in the worker-process pool. Each distinct input
+        array is published once to shared memory and mapped by every worker
+        rather than pickled per task. Per-method timings are measured inside
+        the worker around the method itself, like the thread backend.
+
+        Results are collected (and reported to on_result) as they complete.
+        If cancel_token is cancelled, or methods are still running after
+        _WORKER_JOIN_TIMEOUT_SECONDS, the worker processes are killed (a
+        running task can't be stopped any other way) and the unfinished
+        methods get error entries. Killing a worker breaks the whole pool,
+        so a task that fails with BrokenProcessPool (another run's kill,
+        or the OS) is resubmitted once to a fresh pool.
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+        from concurrent.futures.process import BrokenProcessPool
+        from contextlib import ExitStack
+        from backend_support.executors import share_array, run_method_in_process
+
+        token = self._phase_token(cancel_token)
+        results = {}
+        elapsed = {}
+        if not method_requests:
+            return [], elapsed
+
+        with ExitStack() as stack:
+            shared = {}
+            task_args = {}
+            for idx, ((method_id, method_params), (method_data, method_metadata)) in enumerate(
+                zip(method_requests, inputs)
+            ):
+                if id(method_data) not in shared:
+                    shared[id(method_data)] = stack.enter_context(share_array(method_data))
+                task_args[idx] = (method_id, shared[id(method_data)], method_metadata, method_params)
+
+            pool = self._get_process_pool()
+            futures = {
+                pool.submit(run_method_in_process, *args): (idx, pool)
+                for idx, args in task_args.items()
+            }
+            retried = set()
+            deadline = time.monotonic() + _WORKER_JOIN_TIMEOUT_SECONDS
+
+            while futures:
+                if token.cancelled or time.monotonic() >= deadline:
+                    self._kill_process_pool()
+                    break
+                done, _ = wait(futures, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx, submitted_to = futures.pop(future)
+                    if isinstance(future.exception(), BrokenProcessPool):
+                        # A worker died (e.g. killed by the OS); start a fresh pool next time.
+                        self._discard_process_pool(submitted_to)
+                        if idx not in retried and not token.cancelled:
+                            retried.add(idx)
+                            pool = self._get_process_pool()
+                            futures[pool.submit(run_method_in_process, *task_args[idx])] = (idx, pool)
+                            continue
+                    self._collect_process_result(
+                        future, idx, method_requests, results, elapsed, on_result
+                    )
+
+        return self._order_results(method_requests, results), elapsed
+
+    def _collect_process_result(self, future, idx, method_requests, results, elapsed, on_result):
+        """Store one finished process-pool future's result (see _process_compute)."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        method_id, method_params = method_requests[idx]
+        try:
+            result, elapsed_ms = future.result()
+        except BrokenProcessPool as exc:
+            result, elapsed_ms = self._generate_error_result(
+                method_id, f"Worker process failed: {exc}", method_params
+            ), 0.0
+        except Exception as exc:
+            result, elapsed_ms = self._generate_error_result(
+                method_id, str(exc), method_params
+            ), 0.0
+        results[idx] = result
+        elapsed[idx] = elapsed_ms
+        self._notify(on_result, "method", idx, result)
+
+    def _compute_inputs(self, method_requests, inputs, on_result=None, cancel_token=None,
+                        usage=None):
+        """
+        Dispatch method_requests, each with its own (data, metadata) from
+        *inputs*, to the configured executor backend. Returns the ordered
+        results and {request_index: elapsed_ms}; *usage*, if given, is
+        filled with the sandboxed methods' {request_index: usage}.
+
+        In-process backends share one RunToolbox for the whole dispatch
+        (backend_support/toolbox.py), so custom methods' toolbox calls reuse
+        built-in results computed by this run. Worker processes can't share
+        it and build one per method.
+        """
+        if self.executor == "process":
+            return self._process_compute(method_requests, inputs, on_result, cancel_token)
+        with RunToolbox(self) as run_tools:
+            if self.executor == "inline":
+                return self._inline_compute(
+                    method_requests, inputs, on_result, cancel_token, run_tools, usage
+                )
+            return self._threads_compute(
+                method_requests, inputs, self.max_workers, on_result, cancel_token, run_tools,
+                usage,
+            )
+
+    def _compute(self, method_requests, data, metadata, on_result=None, cancel_token=None,
+                 usage=None):
+        """
+        Run one request's methods on the configured executor backend.
+        Returns (ordered_results, per_method_ms) where per_method_ms is
+        {method_id: elapsed_ms}. If the same method appears twice, the key
+        is suffixed with the index (e.g. "mean#1"). *usage*, if given, is
+        filled the same way with each sandboxed method's CPU time and peak
+        RSS.
+        """
+        inputs = [self._method_inputs(method_id, data, metadata) for method_id, _ in method_requests]
+        usage_by_idx = {}
+        results, elapsed = self._compute_inputs(
+            method_requests, inputs, on_result, cancel_token, usage_by_idx
+        )
+        if usage is not None:
+            usage.update(self._method_usage(method_requests, usage_by_idx))
+        return results, self._method_timings(method_requests, elapsed)
+
+    def _method_timings(self, method_requests, elapsed):
+        """{method_id: ms} for the finished methods, in request order."""
+        per_method_ms = {}
+        for idx, (method_id, _) in enumerate(method_requests):
+            if idx in elapsed:
+                self._record_method_timing(per_method_ms, method_id, idx, elapsed[idx])
+        return per_method_ms
+
+    @staticmethod
+    def _method_usage(method_requests, usage_by_idx):
+        """{method_id: usage} keyed like _method_timings."""
+        per_method_usage = {}
+        for idx, (method_id, _) in enumerate(method_requests):
+            if idx in usage_by_idx:
+                key = method_id if method_id not in per_method_usage else f"{method_id}#{idx}"
+                per_method_usage[key] = usage_by_idx[idx]
+        return per_method_usage
+
+    @staticmethod
+    def _phase_token(cancel_token):
+        """
+        Token for one phase of a run: cancelled with the run's token, and on
+        its own when the phase times out (stopping hung cooperative work
+        without cancelling the rest of the run).
+        """
+        return cancel_token.child() if cancel_token is not None else CancelToken()
 
-        # Fill any missing results with an error entry. Missing indices can
-        # occur if a worker thread was interrupted before writing its result,
-        # or if join() timed out on a hung worker.
+    @staticmethod
+    def _wait_threads(threads, token, timeout):
+        """
+        Wait up to *timeout* seconds for *threads*, returning early once
+        *token* is cancelled. On timeout the token is cancelled so
+        cooperative work still running stops; threads that ignore it are
+        daemons and are abandoned.
+        """
+        deadline = time.monotonic() + timeout
+        for t in threads:
+            while t.is_alive():
+                if token.cancelled:
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    token.cancel("Timed out.")
+                    return
+                t.join(min(POLL_SECONDS, remaining))
+
+    def _method_inputs(self, method_id, data, metadata):
+        """Per-method data/metadata: dicts keyed by method id select an entry."""
+        method_data = data[method_id] if isinstance(data, dict) and method_id in data else data
+        method_metadata = metadata[method_id] if isinstance(metadata, dict) and method_id in metadata else metadata
+        return method_data, method_metadata
+
+    @staticmethod
+    def _notify(on_result, kind, idx, result):
+        """Report one finished method/chart result to handle_request's on_result."""
+        if on_result is None:
+            return
+        try:
+            on_result(kind, idx, result)
+        except Exception as exc:
+            # A broken progress consumer must not fail the run itself
+            print(f"[backend_handler] on_result callback failed: {exc!r}", file=sys.stderr)
+
+    @staticmethod
+    def _record_method_timing(per_method_ms, method_id, idx, elapsed_ms):
+        # Disambiguate duplicate method ids by appending #<idx>
+        key = method_id if method_id not in per_method_ms else f"{method_id}#{idx}"
+        per_method_ms[key] = round(elapsed_ms, 3)
+
+    def _order_results(self, method_requests, results):
+        """
+        Restore request order and fill any missing results with an error
+        entry. Missing indices can occur if a worker was interrupted before
+        writing its result, or if the bounded wait timed out on a hung worker.
+        """
         ordered_results = []
         for i, (method_id, method_params) in enumerate(method_requests):
             if i in results:
@@ -196,7 +557,7 @@ class BackendHandler:
                         method_params,
                     )
                 )
-        return ordered_results, per_method_ms
+        return ordered_results
 
     def _generate_error_result(self, method_name, error_message, params):
         return {
@@ -267,13 +628,20 @@ class BackendHandler:
     def _save_run_json(self, message, run_folder):
         """
         Serialize the completed message (including results and chart paths)
-        to a JSON file inside the run folder.
+        to a JSON file inside the run folder. The input data goes to a
+        memory-mappable data.npy next to it (backend_support/run_store.py)
+        and the JSON records its file name; data that can't be stored
+        that way stays inline as a list.
 
         :param message: Fully populated Message object
         :param run_folder: Path to the persistence folder for this run
         :return: Path to the saved JSON file
         """
-        results_dict = message.to_dict()
+        if save_array(os.path.join(run_folder, DATA_FILE), message.data):
+            results_dict = message.to_dict(include_data=False)
+            results_dict["data_file"] = DATA_FILE
+        else:
+            results_dict = message.to_dict()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         json_filename = f"results_{timestamp}.json"
         json_filepath = os.path.join(run_folder, json_filename)
@@ -283,31 +651,74 @@ class BackendHandler:
         return json_filepath
 
 
-    def _generate_charts(self, graphics_requests, data, metadata, results_folder):
-        # Generate charts in parallel threads — each chart writes to its own file
-        # so there are no shared-state conflicts. Also records per-chart wall-clock
-        # timings for the /statistics debug page.
+    def _record_run(self, message, run_folder, json_path):
+        """
+        Add the completed run to the SQLite run catalog next to its folder
+        (backend_support/run_catalog.py). The catalog is only an index, so
+        a failure here is reported but never fails the run.
+        """
+        payload = message.to_dict(include_data=False)
+        if os.path.isfile(os.path.join(run_folder, DATA_FILE)):
+            payload["data_file"] = DATA_FILE
+        try:
+            get_catalog(os.path.dirname(os.path.abspath(run_folder))).record_run(
+                run_folder, json_path, payload
+            )
+        except (sqlite3.Error, OSError) as exc:
+            print(f"[backend_handler] run catalog update failed: {exc!r}", file=sys.stderr)
+
+
+    @staticmethod
+    def _chart_params(graphic_request, idx, results_folder):
+        """Chart params for one graphic request, with its PNG path inside *results_folder*."""
+        chart_type = graphic_request.get("type")
+        # Strip result-only keys that leak in when replaying saved runs
+        _result_keys = {"type", "ok", "error", "params_used"}
+        chart_params = {k: v for k, v in graphic_request.items() if k not in _result_keys}
+
+        if "path" in chart_params:
+            original_filename = os.path.basename(chart_params["path"])
+            chart_params["path"] = os.path.join(results_folder, original_filename)
+        else:
+            chart_params["path"] = os.path.join(results_folder, f"{chart_type}_{idx}.png")
+        return chart_params
+
+    def _generate_charts(self, graphics_requests, data, metadata, results_folder, on_result=None,
+                         cancel_token=None):
+        # Generate one request's charts into results_folder; see _render_charts.
+        # Also records per-chart wall-clock timings for the /statistics debug page.
+        jobs = [
+            (graphic_request, self._chart_params(graphic_request, idx, results_folder), data, metadata)
+            for idx, graphic_request in enumerate(graphics_requests)
+        ]
+        ordered, elapsed = self._render_charts(jobs, on_result, cancel_token)
+        per_chart_ms = {
+            f"{graphics_requests[idx].get('type')}_{idx}": round(ms, 3)
+            for idx, ms in sorted(elapsed.items())
+        }
+        return ordered, per_chart_ms
 
+    def _render_charts(self, jobs, on_result=None, cancel_token=None):
+        # Generate charts in parallel threads — each chart writes to its own file
+        # so there are no shared-state conflicts. PNG export is handed to the
+        # shared renderer pool, so the thread count follows its size.
+        # jobs holds (graphic_request, chart_params, data, metadata) tuples;
+        # returns the ordered chart results and {job_index: elapsed_ms}.
+        # The token is bound to each chart thread: charts not yet started
+        # are skipped once it's cancelled, and a render in progress is killed
+        # (charts/renderer_pool.py).
+
+        token = self._phase_token(cancel_token)
         results_lock = threading.Lock()
         results_dict = {}
-        per_chart_ms = {}
-
-        def _gen_one(idx, graphic_request):
-            chart_type = graphic_request.get("type")
-            # Strip result-only keys that leak in when replaying saved runs
-            _result_keys = {"type", "ok", "error", "params_used"}
-            chart_params = {k: v for k, v in graphic_request.items() if k not in _result_keys}
-
-            if "path" in chart_params:
-                original_filename = os.path.basename(chart_params["path"])
-                chart_params["path"] = os.path.join(results_folder, original_filename)
-            else:
-                chart_params["path"] = os.path.join(results_folder, f"{chart_type}_{idx}.png")
+        elapsed = {}
 
+        def _gen_one(idx, chart_type, chart_params, data, metadata):
+            check_cancelled()
             t0 = time.perf_counter()
             chart_class = self.chart_generation_methods.get(chart_type)
             if chart_class:
-                chart_instance = chart_class(data, metadata, chart_params)
+                chart_instance = chart_class(data, metadata, dict(chart_params))
                 chart_result = chart_instance.create_graphic()
             else:
                 chart_result = {
@@ -315,27 +726,47 @@ class BackendHandler:
                     "ok": False,
                     "path": None,
                     "error": f"Chart type {chart_type} not found.",
-                    "params_used": chart_params,
+                    "params_used": dict(chart_params),
                 }
             elapsed_ms = (time.perf_counter() - t0) * 1000.0
             with results_lock:
                 results_dict[idx] = chart_result
-                per_chart_ms[f"{chart_type}_{idx}"] = round(elapsed_ms, 3)
+                elapsed[idx] = elapsed_ms
+            self._notify(on_result, "chart", idx, chart_result)
+
+        # At most one chart thread per renderer process; extra charts queue.
+        task_queue = queue.Queue()
+        for idx, (graphic_request, chart_params, data, metadata) in enumerate(jobs):
+            task_queue.put((idx, graphic_request.get("type"), chart_params, data, metadata))
+
+        def thread_worker():
+            with bind_token(token):
+                while not token.cancelled:
+                    try:
+                        task = task_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        _gen_one(*task)
+                    except Exception:
+                        # Left out of results_dict; reported as an error entry below
+                        pass
 
         threads = []
-        for idx, graphic_request in enumerate(graphics_requests):
-            t = threading.Thread(target=_gen_one, args=(idx, graphic_request), daemon=True)
+        for _ in range(min(self.render_workers, len(jobs))):
+            t = threading.Thread(target=thread_worker, daemon=True)
             threads.append(t)
             t.start()
 
-        for t in threads:
-            t.join(timeout=_WORKER_JOIN_TIMEOUT_SECONDS)
+        self._wait_threads(threads, token, _WORKER_JOIN_TIMEOUT_SECONDS)
 
         # Fill any missing chart results (e.g. timed-out thread)
+        with results_lock:
+            finished, timings = dict(results_dict), dict(elapsed)
         ordered = []
-        for i, graphic_request in enumerate(graphics_requests):
-            if i in results_dict:
-                ordered.append(results_dict[i])
+        for i, (graphic_request, _, _, _) in enumerate(jobs):
+            if i in finished:
+                ordered.append(finished[i])
             else:
                 ordered.append({
                     "type": graphic_request.get("type"),
@@ -344,18 +775,23 @@ class BackendHandler:
                     "error": "Chart generation timed out or was interrupted.",
                     "params_used": graphic_request,
                 })
-        return ordered, per_chart_ms
+        return ordered, timings
 
 
     def _save_embedded_charts(self, results, run_folder):
         """
-        Some methods (e.g. LeastSquaresRegression) produce a PNG chart and embed
-        it as a base64 string under result["value"]["chart"].  This step saves
-        those PNGs into the run folder and replaces the base64 payload with the
-        file path, matching the behaviour of the charts pipeline.
+        Some methods embed a PNG chart as a base64 string under
+        result["value"]["chart"].  This step saves those PNGs into the run
+        folder and replaces the base64 payload with the file path, matching
+        the behaviour of the charts pipeline.
+
+        LeastSquaresRegression's chart is deferred instead: it only gets its
+        path in the run folder here and is drawn when the results page first
+        shows it (backend_support/method_charts.py).
         """
         import base64
         import binascii
+        place_method_charts(results, run_folder)
         for result in results:
             if not isinstance(result, dict):
                 continue
@@ -376,19 +812,36 @@ class BackendHandler:
                 f.write(decoded_chart)
             value["chart"] = filepath
 
-    def handle_request(self, request):
+    def handle_request(self, request, on_result=None, cancel_token=None):
         """
         Persistence flow
         ----------------
-        1. Perform computations (threaded)
+        1. Perform computations (on the configured executor backend)
         2. Create a unique persistence folder for this run
-        2.5 Save any charts embedded in method results as image files
+        2.5 Save any charts embedded in method results as image files (and
+            give deferred ones their path)
         3. Generate charts, saving images into the persistence folder
-        4. Save the complete message (results + chart paths) as JSON
+        4. Save the complete message (results + chart paths) as JSON and
+           index it in the run catalog
         5. Return the message
 
         Wall-clock timings for each phase are captured on request.timings
         so the /statistics debug page can display them.
+
+        :param on_result: Optional callable(kind, index, result), called as
+                          each result finishes so a caller can show it before
+                          the whole run is done. kind is "method" (index is
+                          the result's position in message.results) or
+                          "chart" (index into request.graphics; the chart's
+                          PNG is already written when it is reported).
+                          Called from worker threads; exceptions it raises
+                          are logged and ignored.
+        :param cancel_token: Optional backend_support.cancellation.CancelToken.
+                             Once it is cancelled, running work is stopped
+                             (see _threads_compute / _process_compute), nothing
+                             is persisted, and RunCancelled is raised. Running
+                             built-ins are only killed under the "process"
+                             executor; under "thread" they finish unobserved.
         """
 
         # Timing bookkeeping — drives the /statistics debug page.
@@ -401,31 +854,50 @@ class BackendHandler:
         method_requests = self._get_method_requests(methods)
         dispatch_ms = (time.perf_counter() - t_dispatch_start) * 1000.0
 
-        max_threads = 4  # arbitrary limit, can be changed to a user configurable value later
         t_compute_start = time.perf_counter()
-        results, per_method_ms = self._threads_compute(method_requests, data, metadata, max_threads)
-        compute_ms = (time.perf_counter() - t_compute_start) * 1000.0
-        final_result_message = self._package_results(request, results)
+        # Univariate methods on the same array share one conversion, sort,
+        # moment pass and diagnostics pass (see methods/descriptive.py). The
+        # block stays open through the charts, so the best-fit and heatmap
+        # charts reuse the co-moments and ranks the methods computed.
+        from methods.descriptive import shared_descriptive_stats
+        per_method_usage = {}
+        with shared_descriptive_stats(data):
+            results, per_method_ms = self._compute(
+                method_requests, data, metadata, on_result, cancel_token, per_method_usage
+            )
+            compute_ms = (time.perf_counter() - t_compute_start) * 1000.0
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            final_result_message = self._package_results(request, results)
+
+            # --- 2. Create unique persistence folder ---
+            t_folder_start = time.perf_counter()
+            run_folder = self._create_run_folder(final_result_message)
+            final_result_message.run_folder = run_folder
 
-        # --- 2. Create unique persistence folder ---
-        t_folder_start = time.perf_counter()
-        run_folder = self._create_run_folder(final_result_message)
-        final_result_message.run_folder = run_folder
-
-        # --- 2.5. Save embedded method charts (e.g. LSR) into the persistence folder ---
-        self._save_embedded_charts(final_result_message.results, run_folder)
-        folder_and_embedded_ms = (time.perf_counter() - t_folder_start) * 1000.0
-
-        # --- 3. Generate charts into the persistence folder ---
-        t_charts_start = time.perf_counter()
-        chart_results, per_chart_ms = self._generate_charts(
-            final_result_message.graphics,
-            final_result_message.data,
-            final_result_message.metadata,
-            run_folder,
-        )
-        final_result_message.graphics = chart_results
-        charts_ms = (time.perf_counter() - t_charts_start) * 1000.0
+            try:
+                # --- 2.5. Save embedded method charts into the persistence folder ---
+                self._save_embedded_charts(final_result_message.results, run_folder)
+                folder_and_embedded_ms = (time.perf_counter() - t_folder_start) * 1000.0
+
+                # --- 3. Generate charts into the persistence folder ---
+                t_charts_start = time.perf_counter()
+                chart_results, per_chart_ms = self._generate_charts(
+                    final_result_message.graphics,
+                    final_result_message.data,
+                    final_result_message.metadata,
+                    run_folder,
+                    on_result,
+                    cancel_token,
+                )
+                final_result_message.graphics = chart_results
+                charts_ms = (time.perf_counter() - t_charts_start) * 1000.0
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+            except RunCancelled:
+                # A cancelled run leaves nothing behind in results_cache/
+                shutil.rmtree(run_folder, ignore_errors=True)
+                raise
 
         # --- 4. Save complete message as JSON ---
         # Populate timings first so the saved JSON captures the final numbers.
@@ -437,68 +909,291 @@ class BackendHandler:
             "dispatch_ms": round(dispatch_ms, 3),
             "compute_ms": round(compute_ms, 3),
             "per_method_ms": per_method_ms,
+            "per_method_usage": per_method_usage,
             "charts_ms": round(charts_ms, 3),
             "per_chart_ms": per_chart_ms,
             "persistence_ms": round(folder_and_embedded_ms, 3),
             "total_ms": round((time.perf_counter() - t_total_start) * 1000.0, 3),
             "finished_at": datetime.now().isoformat(timespec="milliseconds"),
         }
-        self._save_run_json(final_result_message, run_folder)
+        json_path = self._save_run_json(final_result_message, run_folder)
+
+        # --- 4.5. Index the finished run for the statistics / load pages ---
+        self._record_run(final_result_message, run_folder, json_path)
 
         # --- 5. Return the message ---
         return final_result_message
 
 
-    def _build_toolbox(self, exclude_id, metadata):
+    def handle_requests(self, messages, on_result=None, cancel_token=None):
+        """
+        Handle several requests as one batch, e.g. replaying saved runs or
+        running one method set over several column selections.
+
+        Every message comes back exactly as handle_request would leave it
+        (its own results, run folder, charts, JSON and catalog entry), but
+        the batch shares the work (see backend_support/batch.py):
+
+        - messages with identical data share one converted array, and so
+          one shared_descriptive_stats engine;
+        - identical (data, method, params, metadata) work is computed once
+          and its result copied to each message that asked for it;
+          identical charts are rendered once and the PNG copied;
+        - all method jobs go out in one executor dispatch and all charts
+          in one renderer dispatch, instead of one pass per message.
+
+        Custom methods are never merged (they may be non-deterministic, see
+        worker). Timings on each message are for the batch phases they
+        shared; timings["batch_size"] records how many runs that was.
+
+        :param messages: Iterable of Message objects
+        :param on_result: Optional callable(message_index, kind, index, result);
+                          handle_request's on_result, prefixed with the
+                          message's position in *messages*.
+        :param cancel_token: As for handle_request. A cancelled batch
+                             persists none of its runs.
+        :return: List of the completed messages, in order.
         """
-        Build a toolbox dict of callable wrappers for all statistical methods,
-        excluding *exclude_id* to prevent direct self-recursion.
+        import functools
+        from contextlib import ExitStack
+        from backend_support.batch import BatchPlan, intern_data, job_key
+        from methods.descriptive import shared_descriptive_stats
 
-        Each toolbox entry is a callable:
-            toolbox["custom_summation"](data)            → returns the computed value
-            toolbox["custom_summation"](data, params={}) → with custom params
+        messages = list(messages)
+        started_at = datetime.now().isoformat(timespec="milliseconds")
+        t_total_start = time.perf_counter()
 
-        A shared call-stack set detects circular dependencies at runtime.
-        """
-        _call_stack: set[str] = set()
-        toolbox: dict = {}
+        def fan_out(plan, kind, copy_result):
+            # Hand each finished job's result to all of its targets, reporting
+            # each one to on_result. Returns (callback for the phase, deliver).
+            lock = threading.Lock()
+            delivered = {}
+
+            def deliver(job, result):
+                with lock:
+                    if job not in delivered:
+                        targets = plan.targets[job]
+                        delivered[job] = [result] + [
+                            copy_result(result, target) for target in targets[1:]
+                        ]
+                    return delivered[job]
+
+            def callback(_kind, job, result):
+                for (m_idx, idx), target_result in zip(plan.targets[job], deliver(job, result)):
+                    if on_result is not None:
+                        self._notify(functools.partial(on_result, m_idx), kind, idx, target_result)
+
+            return callback, deliver
+
+        # --- 1. Computations, merged across the batch ---
+        t_dispatch_start = time.perf_counter()
+        digests = intern_data(messages)
+        method_plan = BatchPlan()
+        requests_per_message = []
+        for m_idx, message in enumerate(messages):
+            methods, data, metadata = self._get_methods(message)
+            method_requests = self._get_method_requests(methods)
+            requests_per_message.append(method_requests)
+            for idx, (method_id, method_params) in enumerate(method_requests):
+                method_data, method_metadata = self._method_inputs(method_id, data, metadata)
+                key = None if method_id.startswith("custom_") else job_key(
+                    digests.get(id(method_data)), method_id, method_params, method_metadata
+                )
+                method_plan.add(
+                    key, ((method_id, method_params), (method_data, method_metadata)), (m_idx, idx)
+                )
+        dispatch_ms = (time.perf_counter() - t_dispatch_start) * 1000.0
 
-        for method_id, method_class in self.statistical_methods.items():
-            def _make_tool(cls=method_class, mid=method_id):
-                def tool_fn(tool_data, tool_params=None):
-                    if mid in _call_stack:
-                        raise RuntimeError(
-                            f"Circular dependency detected: '{mid}' "
-                            "is already being computed in the current chain."
-                        )
-                    _call_stack.add(mid)
-                    try:
-                        if mid.startswith("custom_"):
-                            instance = cls(tool_data, metadata, tool_params, toolbox=toolbox)
-                        else:
-                            instance = cls(tool_data, metadata, tool_params)
-                        result = instance.compute()
-                        if result.get("ok"):
-                            return result["value"]
-                        raise RuntimeError(result.get("error", f"Tool '{mid}' failed"))
-                    finally:
-                        _call_stack.discard(mid)
-                return tool_fn
-
-            toolbox[method_id] = _make_tool()
-
-        # Remove the calling method so it can't invoke itself directly
-        toolbox.pop(exclude_id, None)
-        return toolbox
+        t_compute_start = time.perf_counter()
+        callback, deliver = fan_out(method_plan, "method", lambda result, target: copy.deepcopy(result))
+        job_usage = {}
+        with ExitStack() as stack:
+            for array in {id(m.data): m.data for m in messages}.values():
+                stack.enter_context(shared_descriptive_stats(array))
+            job_results, job_ms = self._compute_inputs(
+                [request for request, _ in method_plan.jobs],
+                [inputs for _, inputs in method_plan.jobs],
+                callback,
+                cancel_token,
+                job_usage,
+            )
+        compute_ms = (time.perf_counter() - t_compute_start) * 1000.0
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
+        results_per_message = [[None] * len(requests) for requests in requests_per_message]
+        elapsed_per_message = [{} for _ in messages]
+        usage_per_message = [{} for _ in messages]
+        for job, result in enumerate(job_results):
+            for (m_idx, idx), target_result in zip(method_plan.targets[job], deliver(job, result)):
+                results_per_message[m_idx][idx] = target_result
+                if job in job_ms:
+                    elapsed_per_message[m_idx][idx] = job_ms[job]
+                if job in job_usage:
+                    usage_per_message[m_idx][idx] = job_usage[job]
+        for message, results in zip(messages, results_per_message):
+            self._package_results(message, results)
+
+        # --- 2. Persistence folders and embedded method charts ---
+        t_folder_start = time.perf_counter()
+        run_folders = []
+        try:
+            for message in messages:
+                run_folder = self._create_run_folder(message)
+                run_folders.append(run_folder)
+                message.run_folder = run_folder
+                self._save_embedded_charts(message.results, run_folder)
+            folder_and_embedded_ms = (time.perf_counter() - t_folder_start) * 1000.0
+
+            # --- 3. Charts, merged across the batch ---
+            t_charts_start = time.perf_counter()
+            chart_plan = BatchPlan()
+            chart_paths = {}
+            for m_idx, message in enumerate(messages):
+                for idx, graphic_request in enumerate(message.graphics):
+                    chart_params = self._chart_params(graphic_request, idx, run_folders[m_idx])
+                    chart_paths[(m_idx, idx)] = chart_params["path"]
+                    key = job_key(
+                        digests.get(id(message.data)),
+                        graphic_request.get("type"),
+                        {k: v for k, v in chart_params.items() if k != "path"},
+                        message.metadata,
+                    )
+                    chart_plan.add(
+                        key, (graphic_request, chart_params, message.data, message.metadata),
+                        (m_idx, idx),
+                    )
+            callback, deliver = fan_out(
+                chart_plan, "chart",
+                lambda result, target: self._copy_chart_result(result, chart_paths[target]),
+            )
+            chart_results, chart_ms = self._render_charts(chart_plan.jobs, callback, cancel_token)
+            charts_ms = (time.perf_counter() - t_charts_start) * 1000.0
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+        except RunCancelled:
+            # A cancelled batch leaves nothing behind in results_cache/
+            for run_folder in run_folders:
+                shutil.rmtree(run_folder, ignore_errors=True)
+            raise
+
+        graphics_per_message = [[None] * len(message.graphics) for message in messages]
+        per_chart_ms = [{} for _ in messages]
+        for job, result in enumerate(chart_results):
+            for (m_idx, idx), target_result in zip(chart_plan.targets[job], deliver(job, result)):
+                graphics_per_message[m_idx][idx] = target_result
+                if job in chart_ms:
+                    chart_type = messages[m_idx].graphics[idx].get("type")
+                    per_chart_ms[m_idx][f"{chart_type}_{idx}"] = round(chart_ms[job], 3)
+
+        # --- 4. Save each run's JSON and index it ---
+        for m_idx, message in enumerate(messages):
+            message.graphics = graphics_per_message[m_idx]
+            message.timings = {
+                "started_at": started_at,
+                "dispatch_ms": round(dispatch_ms, 3),
+                "compute_ms": round(compute_ms, 3),
+                "per_method_ms": self._method_timings(
+                    requests_per_message[m_idx], elapsed_per_message[m_idx]
+                ),
+                "per_method_usage": self._method_usage(
+                    requests_per_message[m_idx], usage_per_message[m_idx]
+                ),
+                "charts_ms": round(charts_ms, 3),
+                "per_chart_ms": dict(sorted(per_chart_ms[m_idx].items())),
+                "persistence_ms": round(folder_and_embedded_ms, 3),
+                "total_ms": round((time.perf_counter() - t_total_start) * 1000.0, 3),
+                "finished_at": datetime.now().isoformat(timespec="milliseconds"),
+                "batch_size": len(messages),
+            }
+            json_path = self._save_run_json(message, message.run_folder)
+            self._record_run(message, message.run_folder, json_path)
+
+        # --- 5. Return the messages ---
+        return messages
+
+    @staticmethod
+    def _copy_chart_result(result, path):
+        """
+        A merged chart's result for another run of the batch: the same
+        image, copied to that run's own chart path.
+        """
+        result = copy.deepcopy(result)
+        source = result.get("path")
+        if result.get("ok") and source and source != path:
+            try:
+                shutil.copyfile(source, path)
+            except OSError as exc:
+                result.update(ok=False, path=None, error=f"Could not copy chart image: {exc}")
+                return result
+            result["path"] = path
+            if isinstance(result.get("params_used"), dict):
+                result["params_used"]["path"] = path
+        return result
 
     def worker(self, method_name, data, metadata, params):
         method_class = self.statistical_methods.get(method_name)
-        if method_class:
-            if method_name.startswith("custom_"):
-                toolbox = self._build_toolbox(method_name, metadata)
-                method_instance = method_class(data, metadata, params, toolbox=toolbox)
-            else:
-                method_instance = method_class(data, metadata, params)
-            return method_instance.compute()
+        if not method_class:
+            return self._generate_error_result(method_name, f"Method {method_name} not found.", params)
+
+        # The run's toolbox and memo (bound in _compute_inputs); calls
+        # outside a run get their own.
+        run_tools = current_toolbox()
+        if run_tools is None:
+            with RunToolbox(self) as run_tools, bind_toolbox(run_tools):
+                return self.worker(method_name, data, metadata, params)
+
+        if method_name.startswith("custom_"):
+            # Custom methods aren't cached or memoized: user code may be
+            # non-deterministic and depends on other methods via the toolbox.
+            if self.sandbox and self._from_custom_store(method_class):
+                return self._run_sandboxed(run_tools, method_name, data, metadata, params)
+            with run_tools.calling(method_name, metadata):
+                method_instance = method_class(
+                    data, metadata, params, toolbox=run_tools.for_method(method_name)
+                )
+                return method_instance.compute()
+
+        result, computed = run_tools.builtin(method_name, method_class, data, metadata, params)
+        # A memo hit shares its dict with another result of this run; copy it
+        # so per-result edits afterwards (e.g. _save_embedded_charts) stay apart.
+        return result if computed else copy.deepcopy(result)
+
+    @staticmethod
+    def _from_custom_store(method_class):
+        """True for classes loaded from the custom methods store's generated files."""
+        return getattr(method_class, "__module__", "").startswith("custom_methods.")
+
+    def _run_sandboxed(self, run_tools, method_name, data, metadata, params):
+        """Run a stored custom method in the sandbox pool (backend_support/sandbox.py)."""
+        from custom_methods_loader import get_custom_methods_paths
+
+        result, _usage = self.sandbox_pool.run(
+            method_name,
+            run_tools.shared_data(data),
+            metadata,
+            params,
+            get_custom_methods_paths(),
+        )
+        return result
+
+    def _compute_builtin(self, method_name, method_class, data, metadata, params):
+        """Compute a built-in method, through the on-disk result cache if enabled."""
+        cache = self.result_cache
+        cache_key = None
+        if cache is not None:
+            try:
+                cache_key = cache.key(data, method_name, params, method_class, metadata)
+            except Exception:
+                cache_key = None  # unhashable input; compute without caching
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        method_instance = method_class(data, metadata, params)
+        result = method_instance.compute()
+        if cache_key is not None and isinstance(result, dict) and result.get("ok"):
+            cache.put(cache_key, result)
+        return result
 
-        return self._generate_error_result(method_name, f"Method {method_name} not found.", params)
@@ -0,0 +1 @@
+"""Support modules for the backend request handler."""
@@ -0,0 +1,83 @@
+"""Work planning for BackendHandler.handle_requests.
+
+A batch of messages often repeats itself: replaying several saved runs of
+one dataset, or running one method set over overlapping column
+selections. Before anything is computed the batch is planned so that
+
+    - messages whose data is identical share one converted numpy array
+      (intern_data), so shared_descriptive_stats gives them one engine and
+      the process executor publishes it to shared memory once;
+    - identical work, i.e. the same data, method/chart, params and
+      metadata, becomes a single job (BatchPlan) whose result is handed
+      to every message that asked for it.
+
+Work whose inputs can't be keyed (non-JSON params, unhashable data) is
+never merged; it simply runs once per message.
+"""
+
+from __future__ import annotations
+
+import json
+
+from backend_support.result_cache import hash_data
+
+
+def intern_data(messages) -> dict:
+    """
+    Point messages with identical data at one array.
+
+    :return: {id(array): content digest} for each distinct array, used to
+             build job keys.
+    """
+    by_digest = {}
+    digests = {}
+    for message in messages:
+        data = message.data
+        try:
+            digest = hash_data(data)
+        except (TypeError, ValueError):
+            continue
+        shared = by_digest.setdefault(digest, data)
+        if shared is not data:
+            message.data = shared
+        digests[id(shared)] = digest
+    return digests
+
+
+def job_key(data_digest, *parts):
+    """
+    Key identifying one unit of work, or None if it can't be merged with
+    other work (no data digest, or parts that aren't plain JSON).
+    """
+    if data_digest is None:
+        return None
+    try:
+        return data_digest + json.dumps(parts, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+class BatchPlan:
+    """
+    Unique jobs of a batch and the (message_index, index) targets each
+    job's result goes to. Jobs added with the same non-None key are merged.
+    """
+
+    def __init__(self):
+        self.jobs = []
+        self.targets = []
+        self._by_key = {}
+
+    def add(self, key, job, target) -> int:
+        index = self._by_key.get(key) if key is not None else None
+        if index is None:
+            index = len(self.jobs)
+            self.jobs.append(job)
+            self.targets.append([])
+            if key is not None:
+                self._by_key[key] = index
+        self.targets[index].append(target)
+        return index
+
+    def __len__(self):
+        return len(self.jobs)
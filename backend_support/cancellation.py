@@ -0,0 +1,118 @@
+"""Cancellation tokens for analysis runs.
+
+BackendHandler.handle_request accepts a CancelToken. Cancelling it (the
+"Cancel analysis" button, or the token's lease running out because the
+browser session that started the run stopped checking in) stops the run:
+
+    - in-process work is stopped cooperatively. The handler binds the
+      token to every method and chart thread, and code running there
+      calls check_cancelled() at safe points (between toolbox calls,
+      before each chart render) to bail out with RunCancelled;
+    - out-of-process work is killed: the "process" executor's worker
+      processes and a Kaleido renderer mid-render are terminated and
+      replaced;
+    - the handler stops waiting right away instead of joining the
+      workers, and handle_request raises RunCancelled without persisting
+      the run.
+
+Child tokens (token.child()) are cancelled with their parent and can also
+be cancelled on their own. The handler uses one per phase so a phase
+deadline can stop hung methods without cancelling the whole run.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+
+# How often blocking waits in the handler re-check their token.
+POLL_SECONDS = 0.1
+
+
+class RunCancelled(Exception):
+    """Raised when work is abandoned because its CancelToken was cancelled."""
+
+
+class CancelToken:
+    """
+    Thread-safe cancellation flag, optionally leased.
+
+    With lease_seconds set, the token cancels itself unless renew() is
+    called at least that often. The frontend renews it from its
+    computation watcher, so a run whose browser session has gone away
+    stops instead of running to completion for nobody.
+    """
+
+    def __init__(self, parent: CancelToken | None = None, lease_seconds: float | None = None):
+        self._parent = parent
+        self._event = threading.Event()
+        self._reason = None
+        self.lease_seconds = lease_seconds
+        self._renewed_at = time.monotonic()
+
+    def cancel(self, reason: str = "Analysis cancelled.") -> None:
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    def renew(self) -> None:
+        """Extend the lease (no-op for unleased tokens)."""
+        self._renewed_at = time.monotonic()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if (
+            self.lease_seconds is not None
+            and time.monotonic() - self._renewed_at > self.lease_seconds
+        ):
+            self.cancel("Analysis abandoned: the session that started it went away.")
+            return True
+        return self._parent is not None and self._parent.cancelled
+
+    @property
+    def reason(self) -> str | None:
+        if self._event.is_set():
+            return self._reason
+        return self._parent.reason if self._parent is not None else None
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise RunCancelled(self.reason)
+
+    def child(self) -> CancelToken:
+        """A token cancelled along with this one, or on its own."""
+        return CancelToken(parent=self)
+
+
+_bound = threading.local()
+
+
+@contextmanager
+def bind_token(token: CancelToken | None):
+    """Make *token* the current thread's token for the duration of the block."""
+    previous = getattr(_bound, "token", None)
+    _bound.token = token
+    try:
+        yield token
+    finally:
+        _bound.token = previous
+
+
+def current_token() -> CancelToken | None:
+    """The token bound to the calling thread, if any."""
+    return getattr(_bound, "token", None)
+
+
+def check_cancelled() -> None:
+    """
+    Raise RunCancelled if the calling thread's run was cancelled.
+
+    Safe to call from any method or chart: without a bound token it does
+    nothing.
+    """
+    token = current_token()
+    if token is not None:
+        token.raise_if_cancelled()
@@ -0,0 +1,172 @@
+"""Process-pool helpers for BackendHandler's ``process`` executor mode.
+
+Method classes run in worker processes so the pure-Python parts of a
+method (and custom methods) are not serialized by the GIL. The request's
+``Message.data`` array is published once into ``multiprocessing``
+shared memory and every worker maps it read-only, instead of pickling a
+fresh copy of the data into each task.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+EXECUTOR_MODES = ("thread", "process", "inline")
+
+# Numeric dtype kinds that can be mapped from a raw shared buffer. Object /
+# string arrays (categorical mode data) fall back to regular pickling.
+_SHAREABLE_KINDS = frozenset("biuf")
+
+
+@dataclass(frozen=True)
+class SharedArrayRef:
+    """Picklable handle to an ndarray living in a shared memory block."""
+
+    name: str
+    shape: tuple
+    dtype: str
+
+
+@contextmanager
+def share_array(data):
+    """Publish *data* to shared memory for the duration of the block.
+
+    Yields a SharedArrayRef for numeric numpy arrays and the data itself
+    for anything else. The block is unlinked on exit; workers that are
+    still attached keep their mapping until they close it.
+    """
+    import numpy as np
+
+    if (
+        not isinstance(data, np.ndarray)
+        or data.dtype.kind not in _SHAREABLE_KINDS
+        or data.nbytes == 0
+    ):
+        yield data
+        return
+
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    try:
+        view = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        view[...] = data
+        del view
+        yield SharedArrayRef(name=shm.name, shape=tuple(data.shape), dtype=data.dtype.str)
+    finally:
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+@contextmanager
+def attach_array(data_ref):
+    """Map a SharedArrayRef back to a read-only ndarray inside a worker."""
+    if not isinstance(data_ref, SharedArrayRef):
+        yield data_ref
+        return
+
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=data_ref.name)
+    array = np.ndarray(data_ref.shape, dtype=np.dtype(data_ref.dtype), buffer=shm.buf)
+    array.flags.writeable = False
+    try:
+        yield array
+    finally:
+        del array
+        try:
+            shm.close()
+        except BufferError:
+            # A method kept a view of the shared buffer alive; the mapping
+            # is released when this worker process exits instead.
+            pass
+
+
+class _TrackingContext:
+    """Multiprocessing context that remembers every Process it creates."""
+
+    def __init__(self, context):
+        self._context = context
+        self.processes = weakref.WeakSet()
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+    def Process(self, *args, **kwargs):
+        process = self._context.Process(*args, **kwargs)
+        self.processes.add(process)
+        return process
+
+
+class KillableProcessPool(ProcessPoolExecutor):
+    """
+    ProcessPoolExecutor that can hard-stop its workers. A running task
+    can't be cancelled, and the executor has no public handle on its
+    processes, so the pool launches them through a context that records
+    each one.
+    """
+
+    def __init__(self, max_workers=None, mp_context=None, **kwargs):
+        self._tracking = _TrackingContext(mp_context or multiprocessing.get_context())
+        super().__init__(max_workers, mp_context=self._tracking, **kwargs)
+
+    def worker_processes(self) -> list:
+        """Worker processes this pool has started that are still alive."""
+        return [process for process in list(self._tracking.processes) if process.is_alive()]
+
+    def kill_workers(self) -> None:
+        """Kill every worker (running tasks included) and shut the pool down."""
+        for process in self.worker_processes():
+            try:
+                process.kill()
+            except Exception:
+                pass
+        self.shutdown(wait=False, cancel_futures=True)
+
+
+_worker_handler = None
+_worker_cache_dir = None
+
+
+def init_process_worker(cache_dir):
+    """Pool initializer: carry the parent handler's settings into the worker."""
+    global _worker_cache_dir
+    _worker_cache_dir = cache_dir
+
+
+def _get_worker_handler():
+    """One inline BackendHandler per worker process, reused across tasks."""
+    global _worker_handler
+    if _worker_handler is None:
+        from backend_handler import BackendHandler
+        # Already out of the server process: custom methods run here directly
+        _worker_handler = BackendHandler(
+            executor="inline", cache_dir=_worker_cache_dir, sandbox=False
+        )
+    return _worker_handler
+
+
+def run_method_in_process(method_id, data_ref, metadata, params):
+    """Worker-process entry point: compute one method on shared data.
+
+    :return: (result_dict, elapsed_ms) — elapsed_ms is measured around the
+             method itself, matching the thread backend's per-method timings.
+    """
+    handler = _get_worker_handler()
+    with attach_array(data_ref) as data:
+        t0 = time.perf_counter()
+        try:
+            result = handler.worker(method_id, data, metadata, params)
+        except Exception as exc:
+            result = handler._generate_error_result(method_id, str(exc), params)
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    return result, elapsed_ms
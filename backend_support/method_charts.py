@@ -0,0 +1,86 @@
+"""Deferred charts attached to method results.
+
+LeastSquaresRegression used to draw its scatter + fit PNG inside compute(),
+base64-encode it into ``result["value"]["chart"]`` and have BackendHandler
+decode it again into the run folder: a matplotlib render on the compute
+path of every run, whether or not the chart was ever looked at. Its result
+now carries a small descriptor instead:
+
+    value["chart"] = {"deferred": True, "path": None}
+
+BackendHandler fills in the path the PNG will have inside the run folder
+(``place_method_charts``), and the results page calls
+``render_method_chart`` when it first shows the chart. That draws it with
+the method's own ``create_graphic(results)`` and writes it to the path;
+later views (and reloads of a saved run) just read the file.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+
+# One lock per chart path, dropped once nobody waits on it: renders of the
+# same PNG happen once, different charts draw concurrently.
+_locks_guard = threading.Lock()
+_path_locks: dict = {}
+
+
+def is_deferred(chart) -> bool:
+    return isinstance(chart, dict) and chart.get("deferred") is True
+
+
+def deferred_chart_of(result):
+    """The deferred chart descriptor of a method result, or None."""
+    if not isinstance(result, dict) or not result.get("ok"):
+        return None
+    value = result.get("value")
+    chart = value.get("chart") if isinstance(value, dict) else None
+    return chart if is_deferred(chart) else None
+
+
+def place_method_charts(results, run_folder) -> None:
+    """Give each deferred chart its PNG path in *run_folder* (nothing is drawn)."""
+    for result in results:
+        chart = deferred_chart_of(result)
+        if chart is not None:
+            chart["path"] = os.path.join(run_folder, f"{result.get('id', 'method')}_chart.png")
+
+
+@contextmanager
+def _path_lock(path):
+    with _locks_guard:
+        entry = _path_locks.setdefault(path, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _path_locks[path]
+
+
+def render_method_chart(result, data, metadata, methods=None) -> str:
+    """Draw *result*'s deferred chart if it isn't on disk yet and return its path.
+
+    *data* / *metadata* are the run's inputs (Message.data / .metadata);
+    *methods* maps method ids to classes (the built-in methods by default).
+    Raises ValueError when the result has no placed deferred chart.
+    """
+    chart = deferred_chart_of(result)
+    if chart is None or not chart.get("path"):
+        raise ValueError("This result has no chart to draw")
+    path = chart["path"]
+    # One render per file, however many reruns of the page ask for it
+    with _path_lock(path):
+        if not os.path.isfile(path):
+            if methods is None:
+                from methods.methods import methods_list as methods
+            method_class = methods.get(result.get("id"))
+            if method_class is None:
+                raise ValueError(f"Method {result.get('id')} not found.")
+            method_class(data, metadata, result.get("params_used")).create_graphic(result)
+    return path
@@ -0,0 +1,235 @@
+"""Content-addressed on-disk cache of built-in method results.
+
+A result is keyed on a hash of (data bytes, method id, params, metadata,
+method source version), so replaying a saved run or re-running an identical
+selection returns the stored result instead of recomputing it. The
+metadata is part of the key because results label themselves from it
+(per-column results, correlation matrices and regression equations name
+the columns in metadata["columns"]), so renamed columns never replay
+another run's labels. Entries are small JSON files under
+``results_cache/method_cache/``; the directory is size-bounded and evicts
+least-recently-used entries (access time is tracked through each file's
+mtime, which is bumped on every hit).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+import weakref
+
+# Bump to invalidate every stored entry when the entry format changes.
+_CACHE_FORMAT_VERSION = 1
+
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# After an eviction sweep the cache is trimmed to this fraction of the
+# limit so that a burst of writes doesn't trigger a sweep per write.
+_EVICT_TO_FRACTION = 0.8
+
+
+def hash_data(data) -> str:
+    """Digest of the raw data bytes plus dtype/shape (numpy) or a canonical dump."""
+    import numpy as np
+
+    digest = hashlib.blake2b(digest_size=20)
+    if isinstance(data, np.ndarray) and data.dtype.kind in "biufc":
+        digest.update(f"{data.dtype.str}|{data.shape}|".encode())
+        digest.update(memoryview(np.ascontiguousarray(data)).cast("B"))
+    else:
+        if isinstance(data, np.ndarray):
+            digest.update(f"{data.dtype.str}|{data.shape}|".encode())
+            data = data.tolist()
+        digest.update(json.dumps(data, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+_version_cache: dict = {}
+_version_lock = threading.Lock()
+
+
+def method_source_version(method_class) -> str:
+    """
+    Hash of the source files a method class is built from: its own module
+    plus any sibling module it imports from, directly or through another
+    sibling (e.g. methods/descriptive.py and methods/sketches.py), so
+    editing any of them invalidates that method's cached results.
+    """
+    with _version_lock:
+        cached = _version_cache.get(method_class)
+        if cached is not None:
+            return cached
+
+    module = sys.modules.get(method_class.__module__)
+    module_file = getattr(module, "__file__", None)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_CACHE_FORMAT_VERSION}|{method_class.__qualname__}|".encode())
+    if module_file:
+        base_dir = os.path.dirname(os.path.abspath(module_file))
+        files = {os.path.abspath(module_file)}
+        # Followed transitively: descriptive.py in turn builds on sketches.py
+        pending = [module]
+        while pending:
+            for value in vars(pending.pop()).values():
+                dep = inspect.getmodule(value)
+                dep_file = getattr(dep, "__file__", None)
+                if not dep_file or os.path.dirname(os.path.abspath(dep_file)) != base_dir:
+                    continue
+                if os.path.abspath(dep_file) not in files:
+                    files.add(os.path.abspath(dep_file))
+                    pending.append(dep)
+        for path in sorted(files):
+            try:
+                with open(path, "rb") as handle:
+                    digest.update(handle.read())
+            except OSError:
+                digest.update(path.encode())
+    version = digest.hexdigest()
+
+    with _version_lock:
+        _version_cache[method_class] = version
+    return version
+
+
+class ResultCache:
+    """Size-bounded LRU cache of method result dicts, one JSON file per key."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None  # computed on first write
+        # id(data) -> (weakref, digest): hash each request array once, not per method
+        self._digests: dict = {}
+
+    def data_digest(self, data) -> str:
+        key = id(data)
+        with self._lock:
+            entry = self._digests.get(key)
+            if entry is not None and entry[0]() is data:
+                return entry[1]
+        digest = hash_data(data)
+
+        def _forget(dead_ref, k=key):
+            with self._lock:
+                if self._digests.get(k, (None,))[0] is dead_ref:
+                    self._digests.pop(k, None)
+
+        try:
+            ref = weakref.ref(data, _forget)
+        except TypeError:
+            # Plain lists can't be weak-referenced; they are hashed per call.
+            return digest
+        with self._lock:
+            self._digests[key] = (ref, digest)
+        return digest
+
+    def key(self, data, method_id, params, method_class, metadata=None) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(self.data_digest(data).encode())
+        digest.update(f"|{method_id}|".encode())
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        digest.update(b"|")
+        digest.update(json.dumps(metadata, sort_keys=True, default=str).encode())
+        digest.update(f"|{method_source_version(method_class)}".encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str):
+        """Return the cached result dict, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                result = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: dict) -> bool:
+        """
+        Store *result* under *key*. Results that aren't plain JSON (e.g.
+        numpy integers or DataFrames) are skipped rather than stringified,
+        so a cache hit always returns exactly what the method produced.
+        """
+        try:
+            payload = json.dumps(result).encode("utf-8")
+        except (TypeError, ValueError):
+            return False
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(payload)
+            over_limit = self._total_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+        return True
+
+    def _entries(self) -> list:
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_total_bytes(self) -> int:
+        return sum(size for _mtime, size, _path in self._entries())
+
+    def evict(self) -> int:
+        """Delete least-recently-used entries until under the size target."""
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _mtime, size, _path in entries)
+            target = int(self.max_bytes * _EVICT_TO_FRACTION)
+            removed = 0
+            for _mtime, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self._total_bytes = total
+        return removed
+
+    def clear(self) -> None:
+        import shutil
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self._total_bytes = 0
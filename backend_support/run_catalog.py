@@ -0,0 +1,333 @@
+"""SQLite index of the runs persisted under ``results_cache/``.
+
+The statistics page used to walk every run folder and ``json.load`` each
+``results_*.json`` on every render, and the load / prune paths re-read
+``saved_runs.json`` each time. The catalog keeps one row per run folder
+(dataset, method ids, chart types, timings, paths and sizes) plus a
+mirror of the saved-runs manifest in ``results_cache/run_catalog.sqlite3``
+so those pages answer from an index.
+
+    - BackendHandler.handle_request calls record_run() once the run folder
+      is complete, so the index is maintained incrementally;
+    - sync_from_disk() backfills folders the catalog hasn't seen (runs from
+      before the catalog existed) and drops rows whose folder is gone,
+      parsing only the new folders;
+    - saved_runs.json stays the file of record for saved runs; the mirror
+      is refreshed whenever that file's mtime/size changes.
+
+Catalog errors never fail a run: callers treat the index as a cache and
+fall back to the files on disk.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+
+CATALOG_FILE = "run_catalog.sqlite3"
+SAVED_RUNS_FILE = "saved_runs.json"
+
+# Bump when the schema changes; an old catalog file is rebuilt from disk.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    folder_path     TEXT PRIMARY KEY,
+    folder_name     TEXT NOT NULL,
+    json_path       TEXT,
+    dataset_id      TEXT,
+    dataset_version TEXT,
+    method_ids      TEXT NOT NULL DEFAULT '[]',
+    chart_types     TEXT NOT NULL DEFAULT '[]',
+    timings         TEXT,
+    data_bytes      INTEGER NOT NULL DEFAULT 0,
+    size_bytes      INTEGER NOT NULL DEFAULT 0,
+    mtime           REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_by_mtime ON runs (mtime DESC);
+CREATE INDEX IF NOT EXISTS runs_by_dataset ON runs (dataset_id);
+
+CREATE TABLE IF NOT EXISTS saved_runs (
+    id           TEXT PRIMARY KEY,
+    position     INTEGER NOT NULL,
+    cache_folder TEXT,
+    entry        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS saved_runs_by_folder ON saved_runs (cache_folder);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Top-level folders of results_cache/ that are not runs (and must never be
+# pruned as orphaned ones).
+NON_RUN_FOLDERS = frozenset({"custom_methods", "method_cache"})
+
+
+def _folder_size(folder: str) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(folder):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _summarize(payload: dict) -> tuple[list, list]:
+    """Method ids and chart types from a run payload (results_*.json shape)."""
+    method_ids = []
+    for m in payload.get("methods") or []:
+        if isinstance(m, dict) and m.get("id"):
+            method_ids.append(m["id"])
+        elif isinstance(m, str):
+            method_ids.append(m)
+
+    chart_types = []
+    for g in payload.get("graphics") or []:
+        if isinstance(g, dict) and g.get("type"):
+            chart_types.append(g["type"])
+    return method_ids, chart_types
+
+
+class RunCatalog:
+    """Run index stored in <results_cache_dir>/run_catalog.sqlite3."""
+
+    def __init__(self, results_cache_dir: str):
+        self.results_cache_dir = os.path.abspath(results_cache_dir)
+        self.path = os.path.join(self.results_cache_dir, CATALOG_FILE)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(self.results_cache_dir, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self._init_schema(conn)
+                    self._initialized = True
+        return conn
+
+    def _init_schema(self, conn) -> None:
+        conn.execute("PRAGMA journal_mode=WAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _SCHEMA_VERSION):
+            # Rows are derived from files on disk; rebuild instead of migrating.
+            conn.executescript(
+                "DROP TABLE IF EXISTS runs; DROP TABLE IF EXISTS saved_runs; DROP TABLE IF EXISTS meta;"
+            )
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # Runs
+    # ------------------------------------------------------------------
+
+    def record_run(self, run_folder: str, json_path: str, payload: dict) -> None:
+        """Insert or refresh the row for one completed run folder."""
+        folder_path = os.path.abspath(run_folder)
+        method_ids, chart_types = _summarize(payload)
+        timings = payload.get("timings") or None
+        data_file = payload.get("data_file")
+        data_bytes = 0
+        if data_file:
+            try:
+                data_bytes = os.path.getsize(os.path.join(folder_path, data_file))
+            except OSError:
+                pass
+        try:
+            mtime = os.path.getmtime(json_path)
+        except OSError:
+            mtime = 0
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs (folder_path, folder_name, json_path, dataset_id,"
+                " dataset_version, method_ids, chart_types, timings, data_bytes, size_bytes, mtime)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    folder_path,
+                    os.path.basename(folder_path),
+                    os.path.abspath(json_path),
+                    None if payload.get("dataset_id") is None else str(payload.get("dataset_id")),
+                    json.dumps(payload.get("dataset_version"), default=str),
+                    json.dumps(method_ids),
+                    json.dumps(chart_types),
+                    json.dumps(timings, default=str) if timings else None,
+                    data_bytes,
+                    _folder_size(folder_path),
+                    mtime,
+                ),
+            )
+
+    def remove_runs(self, folder_paths) -> None:
+        rows = [(os.path.abspath(p),) for p in folder_paths]
+        if not rows:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM runs WHERE folder_path = ?", rows)
+
+    def _index_folder(self, folder_path: str) -> bool:
+        json_files = sorted(glob.glob(os.path.join(folder_path, "results_*.json")))
+        if not json_files:
+            return False
+        json_path = json_files[-1]  # most recent save for this run
+        try:
+            with open(json_path, "r") as f:
+                payload = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return False
+        self.record_run(folder_path, json_path, payload)
+        return True
+
+    def sync_from_disk(self) -> int:
+        """
+        Reconcile the index with results_cache/: index run folders it
+        hasn't seen and forget rows whose folder was deleted. Only the
+        top-level directory is listed; known folders aren't re-read.
+
+        :return: Number of folders newly indexed.
+        """
+        if not os.path.isdir(self.results_cache_dir):
+            return 0
+        on_disk = set()
+        for name in os.listdir(self.results_cache_dir):
+            if name in NON_RUN_FOLDERS:
+                continue
+            path = os.path.join(self.results_cache_dir, name)
+            if os.path.isdir(path):
+                on_disk.add(path)
+
+        with closing(self._connect()) as conn:
+            known = {row[0] for row in conn.execute("SELECT folder_path FROM runs")}
+
+        self.remove_runs(known - on_disk)
+        return sum(self._index_folder(path) for path in sorted(on_disk - known))
+
+    def list_runs(self, limit: int | None = None) -> list[dict]:
+        """Run summaries, most recent first."""
+        query = "SELECT * FROM runs ORDER BY mtime DESC"
+        params = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (int(limit),)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._row_to_run(row) for row in rows]
+
+    def get_run(self, folder_path: str) -> dict | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM runs WHERE folder_path = ?", (os.path.abspath(folder_path),)
+            ).fetchone()
+        return self._row_to_run(row) if row is not None else None
+
+    @staticmethod
+    def _row_to_run(row) -> dict:
+        return {
+            "folder_name": row["folder_name"],
+            "folder_path": row["folder_path"],
+            "json_path": row["json_path"],
+            "mtime": row["mtime"],
+            "dataset_id": row["dataset_id"],
+            "dataset_version": json.loads(row["dataset_version"]),
+            "method_ids": json.loads(row["method_ids"]),
+            "chart_types": json.loads(row["chart_types"]),
+            "timings": json.loads(row["timings"]) if row["timings"] else None,
+            "data_bytes": row["data_bytes"],
+            "size_bytes": row["size_bytes"],
+        }
+
+    # ------------------------------------------------------------------
+    # Saved runs (mirror of saved_runs.json)
+    # ------------------------------------------------------------------
+
+    def _saved_runs_stamp(self) -> str | None:
+        try:
+            stat = os.stat(os.path.join(self.results_cache_dir, SAVED_RUNS_FILE))
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def set_saved_runs(self, saved_runs: list) -> None:
+        """Replace the mirror with *saved_runs* (call after writing the JSON)."""
+        rows = [
+            (str(entry.get("id")), i, entry.get("cache_folder"), json.dumps(entry, default=str))
+            for i, entry in enumerate(saved_runs)
+            if isinstance(entry, dict) and entry.get("id") is not None
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM saved_runs")
+            conn.executemany(
+                "INSERT OR REPLACE INTO saved_runs (id, position, cache_folder, entry) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('saved_runs_stamp', ?)",
+                (self._saved_runs_stamp(),),
+            )
+
+    def _refresh_saved_runs(self) -> bool:
+        """
+        Re-mirror saved_runs.json if it changed since the last sync.
+
+        :return: False if the file exists but can't be parsed (the mirror
+                 is then left as is).
+        """
+        stamp = self._saved_runs_stamp()
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'saved_runs_stamp'").fetchone()
+        if row is not None and row[0] == stamp:
+            return True
+        if stamp is None:
+            self.set_saved_runs([])
+            return True
+        try:
+            with open(os.path.join(self.results_cache_dir, SAVED_RUNS_FILE), "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return False
+        self.set_saved_runs(data if isinstance(data, list) else [])
+        return True
+
+    def saved_runs(self) -> list:
+        """The saved-runs manifest entries, in file order."""
+        if not self._refresh_saved_runs():
+            raise ValueError(f"{SAVED_RUNS_FILE} is unreadable")
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT entry FROM saved_runs ORDER BY position").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def saved_folders(self) -> set:
+        """Absolute paths of every run folder referenced by a saved run."""
+        if not self._refresh_saved_runs():
+            raise ValueError(f"{SAVED_RUNS_FILE} is unreadable")
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT cache_folder FROM saved_runs WHERE cache_folder IS NOT NULL"
+            ).fetchall()
+        return {os.path.abspath(row[0]) for row in rows}
+
+
+_catalogs: dict = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(results_cache_dir: str) -> RunCatalog:
+    """Shared RunCatalog for *results_cache_dir* (one per directory per process)."""
+    key = os.path.abspath(results_cache_dir)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = RunCatalog(key)
+        return catalog
@@ -0,0 +1,181 @@
+"""Columnar binary storage for the inputs of a persisted run.
+
+A run folder used to hold its input data twice as text: ``Message.data``
+as nested lists inside ``results_*.json`` and the selected DataFrame as
+``table.csv``. Both are now written as ``.npy`` files that load
+memory-mapped, so saving and replaying a large run is I/O-bound instead
+of parser-bound:
+
+    <run folder>/
+        results_<ts>.json   small metadata (methods, results, timings);
+                            ``"data_file"`` points at data.npy
+        data.npy            Message.data, shape (n_cols, n_rows)
+        table/
+            table.json      column names, dtypes and file names
+            col_0000.npy    one file per DataFrame column
+            col_0000.offsets.npy  text columns: cell boundaries in the
+                            UTF-8 bytes stored in col_0000.npy
+            col_0000.nulls.npy  missing-value mask (text columns only)
+
+Arrays that ``np.save`` can only store by pickling (object dtype) are not
+written here; callers keep the old JSON / CSV format for those.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+DATA_FILE = "data.npy"
+TABLE_DIR = "table"
+TABLE_MANIFEST = "table.json"
+
+# Bump if the table manifest layout changes. Version 1 stored text columns
+# as fixed-width "<U" arrays; load_table() still reads those.
+_TABLE_FORMAT_VERSION = 2
+
+# dtype kinds np.save writes without pickling (and np.load can memory-map):
+# bool, ints, floats, complex, datetimes/timedeltas and fixed-width text.
+_BINARY_KINDS = frozenset("biufcmMUS")
+
+
+def _atomic_save(path: str, array) -> None:
+    import numpy as np
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as handle:
+            np.save(handle, array, allow_pickle=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_array(path: str, data) -> bool:
+    """
+    Write *data* to *path* as ``.npy``.
+
+    :return: False (nothing written) if *data* isn't an ndarray of a
+             binary-storable dtype.
+    """
+    import numpy as np
+
+    if not isinstance(data, np.ndarray) or data.dtype.kind not in _BINARY_KINDS:
+        return False
+    _atomic_save(path, data)
+    return True
+
+
+def load_array(path: str, mmap: bool = True):
+    """Load a ``.npy`` file, memory-mapped read-only by default."""
+    import numpy as np
+
+    return np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+
+
+def _save_text(table_dir: str, entry: dict, values, mask) -> None:
+    """Store *values* as str() of each cell: one UTF-8 blob plus its offsets."""
+    import numpy as np
+
+    encoded = [b"" if missing else str(value).encode("utf-8")
+               for value, missing in zip(values, mask)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(cell) for cell in encoded], out=offsets[1:])
+    entry["dtype"] = "utf-8"
+    entry["offsets"] = entry["file"].replace(".npy", ".offsets.npy")
+    _atomic_save(os.path.join(table_dir, entry["file"]),
+                 np.frombuffer(b"".join(encoded), dtype=np.uint8))
+    _atomic_save(os.path.join(table_dir, entry["offsets"]), offsets)
+
+
+def _load_text(table_dir: str, entry: dict):
+    import numpy as np
+
+    blob = load_array(os.path.join(table_dir, entry["file"])).tobytes()
+    bounds = load_array(os.path.join(table_dir, entry["offsets"])).tolist()
+    cells = np.empty(len(bounds) - 1, dtype=object)
+    cells[:] = [blob[start:end].decode("utf-8") for start, end in zip(bounds, bounds[1:])]
+    return cells
+
+
+def save_table(run_folder: str, df) -> str:
+    """
+    Write a DataFrame as one ``.npy`` file per column under run_folder/table/.
+
+    Text and mixed-type columns are stored as the UTF-8 bytes of every
+    cell with an offsets array and a separate missing-value mask, the same
+    values a CSV round trip yields. Unlike a fixed-width string array, one
+    long cell doesn't pad every other cell to its length.
+
+    :return: Path to the table directory.
+    """
+    import pandas as pd
+
+    table_dir = os.path.join(run_folder, TABLE_DIR)
+    os.makedirs(table_dir, exist_ok=True)
+
+    columns = []
+    for i, name in enumerate(df.columns):
+        series = df.iloc[:, i]
+        values = series.to_numpy()
+        entry = {"name": str(name), "file": f"col_{i:04d}.npy", "nulls": None}
+        if values.dtype.kind not in _BINARY_KINDS:
+            mask = pd.isna(series).to_numpy()
+            if mask.any():
+                entry["nulls"] = f"col_{i:04d}.nulls.npy"
+                _atomic_save(os.path.join(table_dir, entry["nulls"]), mask)
+            _save_text(table_dir, entry, values, mask)
+        else:
+            entry["dtype"] = values.dtype.str
+            _atomic_save(os.path.join(table_dir, entry["file"]), values)
+        columns.append(entry)
+
+    manifest = {
+        "format": _TABLE_FORMAT_VERSION,
+        "n_rows": int(len(df)),
+        "columns": columns,
+    }
+    manifest_path = os.path.join(table_dir, TABLE_MANIFEST)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(tmp_path, manifest_path)
+    return table_dir
+
+
+def load_table(run_folder: str):
+    """
+    Rebuild the DataFrame written by save_table().
+
+    :return: DataFrame, or None if the folder has no (readable) table.
+    """
+    import numpy as np
+    import pandas as pd
+
+    table_dir = os.path.join(run_folder, TABLE_DIR)
+    try:
+        with open(os.path.join(table_dir, TABLE_MANIFEST), "r") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    try:
+        arrays = {}
+        for i, entry in enumerate(manifest["columns"]):
+            if entry.get("offsets"):
+                values = _load_text(table_dir, entry)
+            else:
+                values = load_array(os.path.join(table_dir, entry["file"]))
+            if entry.get("nulls"):
+                mask = load_array(os.path.join(table_dir, entry["nulls"]))
+                values = np.where(mask, None, values.astype(object))
+            arrays[i] = values
+        df = pd.DataFrame(arrays, index=pd.RangeIndex(manifest["n_rows"]))
+        df.columns = [entry["name"] for entry in manifest["columns"]]
+    except (OSError, ValueError, KeyError):
+        return None
+    return df
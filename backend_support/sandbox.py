@@ -0,0 +1,421 @@
+"""Sandboxed worker processes for custom methods.
+
+Custom methods (including LLM-generated code) would otherwise run on the
+Streamlit server's backend threads, where one runaway loop or giant
+allocation stalls every session. BackendHandler instead sends each custom
+method to a SandboxPool:
+
+    - workers are forked from a forkserver that has numpy and the method
+      tables preloaded (plain spawn where forkserver isn't available), so
+      starting or replacing one is cheap;
+    - each worker is an independent process with its own pipe, so killing
+      one never disturbs tasks running on the others (unlike a
+      ProcessPoolExecutor, which breaks as a whole);
+    - on POSIX each task runs under resource limits: RLIMIT_CPU of the
+      worker's CPU time so far plus SANDBOX_CPU_SECONDS (the kernel kills
+      it with SIGXCPU past that) and RLIMIT_AS of its address space once
+      the task's data is attached plus SANDBOX_MEMORY_MB (allocations past
+      that fail with MemoryError inside the method; the limit is lifted
+      again between tasks);
+    - the task's data is passed through shared memory
+      (backend_support/executors.py); the run's toolbox shares one block
+      per array for all its custom methods;
+    - a cancelled run, or a phase deadline, kills the worker running its
+      method (backend_support/cancellation.py);
+    - each task reports its CPU time and peak RSS, which the handler adds
+      to the run's timings (capture_usage).
+
+Inside a worker the method's toolbox is backed by that worker's own
+inline handler, so toolbox calls can't reuse results from the parent
+run's memo.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from backend_support.cancellation import POLL_SECONDS, RunCancelled, current_token
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, the pool still isolates crashes
+    resource = None
+
+SANDBOX_CPU_SECONDS = 30
+SANDBOX_MEMORY_MB = 2048
+_DEFAULT_WORKERS = 2
+_START_TIMEOUT_SECONDS = 60.0
+
+# Modules the forkserver imports once so every forked worker starts warm.
+_PRELOAD = ["numpy", "backend_handler", "methods.methods"]
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+
+def _address_space_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm", "r") as handle:
+            return int(handle.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _reset_peak_rss() -> bool:
+    """Reset this process's VmHWM (Linux 4.0+); False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as handle:
+            handle.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb(reset_ok: bool) -> float | None:
+    if reset_ok:
+        try:
+            with open("/proc/self/status", "r") as handle:
+                for line in handle:
+                    if line.startswith("VmHWM:"):
+                        return round(int(line.split()[1]) / 1024.0, 1)
+        except (OSError, ValueError, IndexError):
+            pass
+    if resource is None:
+        return None
+    # Lifetime peak of the worker: kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0), 1)
+
+
+def _limit_cpu(cpu_seconds: float) -> None:
+    if resource is None or not cpu_seconds:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    _soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = int(usage.ru_utime + usage.ru_stime + cpu_seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+@contextmanager
+def _limit_memory(memory_mb: float):
+    """
+    Cap the address space at its current size plus *memory_mb* for the
+    block, then restore the previous limit. Set per task, after the data
+    is attached, so neither the attached block nor whatever the worker
+    kept from earlier tasks eats into the method's allowance.
+    """
+    baseline = _address_space_bytes() if resource is not None and memory_mb else None
+    if baseline is None:
+        yield
+        return
+    previous = resource.getrlimit(resource.RLIMIT_AS)
+    hard = previous[1]
+    soft = baseline + int(memory_mb * 1024 * 1024)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, previous)
+
+
+def _run_task(handler, method_id, data_ref, metadata, params, custom_paths, memory_mb):
+    from backend_support.executors import attach_array
+    import custom_methods_loader
+
+    # Pick up methods added or edited since the last task; unchanged
+    # modules are reused (custom_method_support/store.py).
+    if custom_methods_loader.get_custom_methods_paths() != custom_paths:
+        custom_methods_loader.set_custom_methods_paths(*custom_paths)
+    handler.reload_methods()
+    with attach_array(data_ref) as data:
+        try:
+            with _limit_memory(memory_mb):
+                return handler.worker(method_id, data, metadata, params)
+        except MemoryError:
+            return handler._generate_error_result(
+                method_id,
+                f"Custom method exceeded its memory limit ({memory_mb:g} MB).",
+                params,
+            )
+        except Exception as exc:
+            return handler._generate_error_result(method_id, str(exc), params)
+
+
+def _sandbox_worker_main(conn, cache_dir, cpu_seconds, memory_mb) -> None:
+    """Worker-process loop: apply limits, then run custom methods until told to stop."""
+    from backend_handler import BackendHandler
+
+    handler = BackendHandler(executor="inline", cache_dir=cache_dir, sandbox=False)
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        kind = message[0]
+        if kind == "stop":
+            return
+        if kind == "ping":
+            conn.send(("pong", None))
+            continue
+        _kind, method_id, data_ref, metadata, params, custom_paths = message
+        _limit_cpu(cpu_seconds)
+        reset_ok = _reset_peak_rss()
+        cpu_start = time.process_time()
+        result = _run_task(handler, method_id, data_ref, metadata, params, custom_paths, memory_mb)
+        usage = {
+            "cpu_ms": round((time.process_time() - cpu_start) * 1000.0, 3),
+            "peak_rss_mb": _peak_rss_mb(reset_ok),
+        }
+        try:
+            conn.send(("ok", result, usage))
+        except Exception as exc:
+            # e.g. a result that can't be pickled
+            conn.send(("ok", handler._generate_error_result(
+                method_id, f"Result could not be returned: {exc}", params
+            ), usage))
+
+
+# ---------------------------------------------------------------------------
+# Usage capture
+# ---------------------------------------------------------------------------
+
+_captures = threading.local()
+
+
+@contextmanager
+def capture_usage():
+    """
+    Collect the resource usage of sandboxed tasks run on this thread inside
+    the block. Yields a list of {"cpu_ms", "peak_rss_mb"} dicts.
+    """
+    previous = getattr(_captures, "usage", None)
+    _captures.usage = collected = []
+    try:
+        yield collected
+    finally:
+        _captures.usage = previous
+
+
+def summarize_usage(entries):
+    """Combined usage of several tasks: total CPU time, highest peak RSS."""
+    if not entries:
+        return None
+    peaks = [e["peak_rss_mb"] for e in entries if e.get("peak_rss_mb") is not None]
+    return {
+        "cpu_ms": round(sum(e.get("cpu_ms") or 0.0 for e in entries), 3),
+        "peak_rss_mb": max(peaks) if peaks else None,
+    }
+
+
+def _record_usage(usage) -> None:
+    collected = getattr(_captures, "usage", None)
+    if collected is not None:
+        collected.append(usage)
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+def _mp_context():
+    import multiprocessing
+
+    # Never plain fork: forking the threaded Streamlit server can deadlock.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(_PRELOAD)
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+class _SandboxWorker:
+    """One sandbox process and the parent end of its pipe."""
+
+    def __init__(self, pool, index: int):
+        self.pool = pool
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.restarts = 0
+
+    def start(self) -> None:
+        pool = self.pool
+        parent_conn, child_conn = pool._ctx.Pipe()
+        process = pool._ctx.Process(
+            target=_sandbox_worker_main,
+            args=(child_conn, pool.cache_dir, pool.cpu_seconds, pool.memory_mb),
+            daemon=True,
+            name=f"PSSandbox-{self.index}",
+        )
+        process.start()
+        child_conn.close()
+        self.process, self.conn = process, parent_conn
+        if not parent_conn.poll(_START_TIMEOUT_SECONDS):
+            self.kill()
+            raise TimeoutError("Sandbox process did not start in time.")
+        kind, payload = parent_conn.recv()
+        if kind != "ready":
+            self.kill()
+            raise RuntimeError(payload)
+
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def kill(self) -> int | None:
+        """Kill the process; returns its exit code if it had already died."""
+        exitcode = None
+        if self.process is not None:
+            exitcode = self.process.exitcode
+            self.process.kill()
+            self.process.join(timeout=5)
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+        return exitcode
+
+    def stop(self) -> None:
+        try:
+            if self.conn is not None:
+                self.conn.send(("stop",))
+            if self.process is not None:
+                self.process.join(timeout=2)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+
+class SandboxPool:
+    """
+    Fixed set of sandbox workers. run() checks out an idle worker, so at
+    most num_workers custom methods run at once and the rest wait.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = _DEFAULT_WORKERS,
+        cache_dir=None,
+        cpu_seconds: float = SANDBOX_CPU_SECONDS,
+        memory_mb: float = SANDBOX_MEMORY_MB,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self._ctx = _mp_context()
+        self.num_workers = num_workers
+        self.cache_dir = cache_dir
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self._workers = [_SandboxWorker(self, i) for i in range(num_workers)]
+        self._idle: queue.Queue = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._stopping = threading.Event()
+
+    def _checkout(self, token) -> _SandboxWorker:
+        while True:
+            if self._stopping.is_set():
+                raise RuntimeError("Sandbox pool is shut down.")
+            if token is not None and token.cancelled:
+                raise RunCancelled(token.reason)
+            try:
+                return self._idle.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def run(self, method_id, data_ref, metadata, params, custom_paths):
+        """
+        Run one custom method in a sandbox worker; returns (result, usage).
+
+        Raises RunCancelled if the calling thread's CancelToken is cancelled
+        while waiting or running (the running worker is killed). A worker
+        that dies (CPU limit, crash) is replaced and its task gets an error
+        result instead.
+        """
+        token = current_token()
+        worker = self._checkout(token)
+        try:
+            if not worker.alive():
+                worker.start()
+            worker.conn.send(("run", method_id, data_ref, metadata, params, custom_paths))
+            while not worker.conn.poll(POLL_SECONDS):
+                if token is not None and token.cancelled:
+                    # Replaced on its next checkout
+                    worker.kill()
+                    worker.restarts += 1
+                    raise RunCancelled(token.reason)
+                if not worker.alive():
+                    break
+            try:
+                kind, result, usage = worker.conn.recv()
+            except (EOFError, OSError):
+                return self._died(worker, method_id, params), None
+            _record_usage(usage)
+            return result, usage
+        finally:
+            self._idle.put(worker)
+
+    def _died(self, worker, method_id, params):
+        # The pipe closes a moment before the process can be reaped
+        worker.process.join(timeout=5)
+        exitcode = worker.kill()
+        worker.restarts += 1
+        xcpu = getattr(signal, "SIGXCPU", None)
+        if xcpu is not None and exitcode == -xcpu:
+            error = f"Custom method exceeded its CPU time limit ({self.cpu_seconds:g}s) and was stopped."
+        else:
+            error = f"Custom method's sandbox process crashed (exit code {exitcode})."
+        return {
+            "id": method_id,
+            "ok": False,
+            "value": None,
+            "error": error,
+            "loss_of_precision": False,
+            "params_used": params or {},
+        }
+
+    def health(self) -> list[dict]:
+        """Snapshot of each worker's state for debugging."""
+        return [
+            {"worker": w.index, "alive": w.alive(), "restarts": w.restarts}
+            for w in self._workers
+        ]
+
+    def shutdown(self) -> None:
+        self._stopping.set()
+        for worker in self._workers:
+            worker.stop()
+
+
+_pool: SandboxPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_or_start_sandbox(num_workers: int = _DEFAULT_WORKERS, cache_dir=None) -> SandboxPool:
+    """The shared per-process SandboxPool, created on first use (workers start lazily)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxPool(num_workers=num_workers, cache_dir=cache_dir)
+        return _pool
+
+
+def shutdown_sandbox() -> None:
+    """Stop the shared sandbox pool (a later get_or_start_sandbox starts a new one)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
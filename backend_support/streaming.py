@@ -0,0 +1,374 @@
+"""Out-of-core statistics for CSV files too large to load.
+
+The normal analysis path holds a dataset several times over (the
+DataFrame, the column lists sent in the Message, the numpy array built
+from them), so it is bounded by memory. analyze_csv instead reads the
+file in chunk_rows-row chunks, parsing only the selected columns, and
+folds each chunk into the mergeable summaries of methods/sketches.py.
+Memory stays at one chunk plus fixed-size summaries however large the
+file is.
+
+Supported methods are STREAMING_METHOD_IDS. Results have the same shape
+as the methods' own, including their loss_of_precision notes and the
+per-column mode ({"per_column": True}, see methods/descriptive.py),
+except that:
+
+    - blank and non-numeric cells are skipped (and counted in the note),
+      where the in-memory methods would return NaN;
+    - median and percentiles are read off a KLL sketch. They are exact
+      until a column outgrows it, then within the rank error stated in
+      the note and in the result's "rank_error" (as in the in-memory
+      methods' approximate mode);
+    - mode is exact while a column has at most FREQUENCY_CAPACITY
+      distinct values;
+    - Least Squares Regression has no embedded chart, and only fits the
+      simple line (not the models of methods/regression.py).
+
+StreamSummary.merge combines the summaries of two parts of a file, so
+shards can be summarized separately (or in parallel) and combined.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from backend_support.cancellation import check_cancelled
+from methods.coefficentVariation import CoefficientVariation
+from methods.descriptive import per_column_requested, per_column_result
+from methods.mean import Mean
+from methods.median import Median
+from methods.mode import MAX_REPORTED_MODES, Mode
+from methods.percentile import Percentile
+from methods.regression import regression_requested
+from methods.sketches import (
+    CoMoments,
+    FrequencySketch,
+    Moments,
+    QuantileSketch,
+    approximate_note,
+)
+from methods.standardDeviation import StandardDeviation
+from methods.variance import Variance
+
+CHUNK_ROWS = 100_000
+QUANTILE_K = 200
+FREQUENCY_CAPACITY = 10_000
+
+_MOMENT_METHODS = {
+    "mean": (Mean, "mean"),
+    "variance": (Variance, "variance"),
+    "standard_deviation": (StandardDeviation, "std"),
+    "coefficient_variation": (CoefficientVariation, "cv"),
+}
+_QUANTILE_METHODS = {"median", "percentile"}
+_FREQUENCY_METHODS = {"mode"}
+_PAIR_METHODS = {"pearson", "least_squares_regression"}
+
+STREAMING_METHOD_IDS = frozenset(
+    set(_MOMENT_METHODS) | _QUANTILE_METHODS | _FREQUENCY_METHODS | _PAIR_METHODS
+)
+
+
+class StreamSummary:
+    """Per-column summaries of a stream of rows, plus the first two columns' co-moments."""
+
+    def __init__(self, columns, quantiles=False, frequencies=False, pair=False,
+                 quantile_k=QUANTILE_K, frequency_capacity=FREQUENCY_CAPACITY):
+        self.columns = [str(c) for c in columns]
+        self.rows = 0
+        self.moments = [Moments() for _ in self.columns]
+        self.quantiles = [QuantileSketch(quantile_k) for _ in self.columns] if quantiles else None
+        self.frequencies = (
+            [FrequencySketch(frequency_capacity) for _ in self.columns] if frequencies else None
+        )
+        self.pair = CoMoments() if pair and len(self.columns) >= 2 else None
+
+    @classmethod
+    def for_methods(cls, columns, method_ids, **options) -> StreamSummary:
+        """A summary keeping just what *method_ids* need."""
+        method_ids = set(method_ids)
+        return cls(
+            columns,
+            quantiles=bool(method_ids & _QUANTILE_METHODS),
+            frequencies=bool(method_ids & _FREQUENCY_METHODS),
+            pair=bool(method_ids & _PAIR_METHODS),
+            **options,
+        )
+
+    def update(self, block) -> None:
+        """Fold in a (n_rows, n_columns) block of float values."""
+        block = np.asarray(block, dtype=float)
+        self.rows += int(block.shape[0])
+        for i in range(len(self.columns)):
+            column = block[:, i]
+            self.moments[i].update(column)
+            if self.quantiles is not None:
+                self.quantiles[i].update(column)
+            if self.frequencies is not None:
+                self.frequencies[i].update(column)
+        if self.pair is not None:
+            self.pair.update(block[:, 0], block[:, 1])
+
+    def merge(self, other: StreamSummary) -> None:
+        """Fold in the summary of another part of the same columns."""
+        if other.columns != self.columns:
+            raise ValueError("Can only merge summaries of the same columns")
+        self.rows += other.rows
+        for mine, theirs in (
+            (self.moments, other.moments),
+            (self.quantiles, other.quantiles),
+            (self.frequencies, other.frequencies),
+        ):
+            if mine is not None and theirs is not None:
+                for a, b in zip(mine, theirs):
+                    a.merge(b)
+        if self.pair is not None and other.pair is not None:
+            self.pair.merge(other.pair)
+
+
+def _pooled(parts, factory):
+    """One summary of every column together (merged into a fresh copy)."""
+    pooled = factory()
+    for part in parts:
+        pooled.merge(part)
+    return pooled
+
+
+def _result(method_id, params, value=None, error=None, note=False) -> dict:
+    return {
+        "id": method_id,
+        "ok": error is None,
+        "value": value if error is None else None,
+        "error": error,
+        "loss_of_precision": note if error is None else False,
+        "params_used": params,
+    }
+
+
+def _join_notes(*notes):
+    notes = [n for n in notes if n]
+    return " ".join(notes) if notes else False
+
+
+def _skipped_note(missing: int):
+    if not missing:
+        return False
+    return f"{missing:,} blank or non-numeric cell(s) were skipped."
+
+
+def _univariate(method_id, params, moments, quantiles, frequencies):
+    """(value, note) of one univariate method over one column's (or the pooled) summaries."""
+    diagnostics = moments.diagnostics()
+    if method_id in _MOMENT_METHODS:
+        method_class, key = _MOMENT_METHODS[method_id]
+        values = moments.moments()
+        value = values[key]
+        method = method_class(None, None)
+        if method_id == "mean":
+            note = method._precision_note(value, diagnostics, moments.magnitude_ratio)
+        elif method_id == "coefficient_variation":
+            note = method._precision_note(value, values)
+        else:
+            note = method._precision_note(value, values, diagnostics)
+        return value, _join_notes(note, _skipped_note(moments.missing))
+    if method_id == "median":
+        value = quantiles.quantiles([0.5])[0]
+        note = Median(None, None)._precision_note(value, diagnostics)
+        return value, _join_notes(note, approximate_note([quantiles]), _skipped_note(moments.missing))
+    if method_id == "percentile":
+        percents = Percentile(None, None, params).percents
+        if not len(percents):
+            raise ValueError("No percentile values specified")
+        for p in percents:
+            if p < 0 or p > 100:
+                raise ValueError(f"Percentile {p} is out of range [0, 100]")
+        value = quantiles.quantiles(np.asarray(percents, dtype=float) / 100.0)
+        note = Percentile(None, None)._precision_note(value, diagnostics)
+        return value, _join_notes(note, approximate_note([quantiles]), _skipped_note(moments.missing))
+    # mode
+    value = frequencies.mode()
+    note = Mode(None, None)._precision_note(diagnostics["all_finite"])
+    if not frequencies.exact:
+        note = _join_notes(note, (
+            f"Approximate: the column has more than {frequencies.capacity:,} distinct "
+            f"values, so counts may be low by up to {frequencies.error:,}."
+        ))
+    return value, _join_notes(note, _skipped_note(moments.missing))
+
+
+def _pair_result(method_id, params, pair: CoMoments) -> dict:
+    if pair is None:
+        label = "Pearson correlation" if method_id == "pearson" else "Least Squares Regression"
+        return _result(method_id, params, error=f"{label} requires exactly 2 columns of equal length")
+    if pair.n < 2:
+        return _result(method_id, params, error="Not enough rows with both values present")
+    skipped = _skipped_note(pair.missing)
+    large = (
+        "Large-magnitude values detected (>1e12); the co-moments may lose precision."
+        if pair.max_abs > 1e12 else False
+    )
+    if method_id == "pearson":
+        value = pair.pearson()
+        note = False
+        if math.isnan(value):
+            note = (
+                "Pearson is undefined when one variable has zero variance "
+                "(all values identical). Select a column with at least two distinct values."
+            )
+        return _result(method_id, params, value, note=_join_notes(note, large, skipped))
+    fit = pair.regression()
+    value = dict(fit, equation=f"y = {fit['slope']:.3f}x + {fit['intercept']:.3f}")
+    note = False
+    if pair.m2_x == 0:
+        note = (
+            "Degenerate x: all x values are identical, so the regression "
+            "has no defined slope."
+        )
+    return _result(method_id, params, value, note=_join_notes(note, large, skipped))
+
+
+def results_from_summary(summary: StreamSummary, method_requests) -> list[dict]:
+    """Result dicts for [(method_id, params), ...] from a finished summary."""
+    results = []
+    metadata = {"columns": summary.columns}
+    for method_id, params in method_requests:
+        if method_id not in STREAMING_METHOD_IDS:
+            results.append(_result(
+                method_id, params, error=f"'{method_id}' can't be computed on a streamed file."
+            ))
+            continue
+        if method_id == "least_squares_regression" and regression_requested(params):
+            results.append(_result(
+                method_id, params,
+                error="Polynomial, multiple and batched regressions can't be computed on a streamed file.",
+            ))
+            continue
+        if method_id in _PAIR_METHODS:
+            results.append(_pair_result(method_id, params, summary.pair))
+            continue
+        try:
+            n_columns = len(summary.columns)
+            quantiles = summary.quantiles or [None] * n_columns
+            frequencies = summary.frequencies or [None] * n_columns
+            if per_column_requested(params):
+                values, notes = [], []
+                for i in range(n_columns):
+                    value, note = _univariate(
+                        method_id, params, summary.moments[i], quantiles[i], frequencies[i]
+                    )
+                    values.append(value)
+                    notes.append(note)
+                result = per_column_result(_result(method_id, params), values, notes, metadata)
+                used_quantiles, used_frequencies = quantiles, frequencies
+            else:
+                pooled_quantiles = (
+                    _pooled(summary.quantiles, lambda: QuantileSketch(quantiles[0].k))
+                    if summary.quantiles else None
+                )
+                pooled_frequencies = (
+                    _pooled(summary.frequencies, lambda: FrequencySketch(frequencies[0].capacity))
+                    if summary.frequencies else None
+                )
+                value, note = _univariate(
+                    method_id,
+                    params,
+                    _pooled(summary.moments, Moments),
+                    pooled_quantiles,
+                    pooled_frequencies,
+                )
+                result = _result(method_id, params, value, note=note)
+                used_quantiles, used_frequencies = [pooled_quantiles], [pooled_frequencies]
+            if method_id in _QUANTILE_METHODS:
+                # Same key the in-memory approximate mode reports
+                result["rank_error"] = max(sketch.rank_error() for sketch in used_quantiles)
+            if method_id in _FREQUENCY_METHODS:
+                # Every tied mode and its count, as Mode reports them
+                counted = [sketch.modes() for sketch in used_frequencies]
+                reported = [(modes[:MAX_REPORTED_MODES], count, len(modes)) for modes, count in counted]
+                if per_column_requested(params):
+                    result["modes"] = [modes for modes, _, _ in reported]
+                    result["count"] = [count for _, count, _ in reported]
+                    result["n_modes"] = [n_modes for _, _, n_modes in reported]
+                else:
+                    result["modes"], result["count"], result["n_modes"] = reported[0]
+            results.append(result)
+        except Exception as exc:
+            results.append(_result(method_id, params, error=str(exc)))
+    return results
+
+
+def _method_requests(methods):
+    """[(method_id, params)] from Message-style method entries."""
+    requests = []
+    for entry in methods:
+        if isinstance(entry, dict):
+            method_id, params = entry.get("id"), entry.get("params", {})
+        else:
+            method_id, params = entry, {}
+        if method_id:
+            requests.append((method_id, params))
+    return requests
+
+
+def _in_caller_order(chunk, columns):
+    """usecols returns columns in file order; put them back in the order asked for."""
+    if all(c in chunk.columns for c in columns):
+        return chunk[list(columns)]
+    # Positions: the chunk holds them in ascending order
+    ascending = sorted(columns)
+    return chunk.iloc[:, [ascending.index(c) for c in columns]]
+
+
+def summarize_csv(path, columns=None, method_ids=STREAMING_METHOD_IDS, header=0,
+                  chunk_rows=CHUNK_ROWS, cancel_token=None, on_progress=None,
+                  **options) -> StreamSummary:
+    """
+    Summarize *columns* (names or positions; default all) of the CSV at
+    *path* in one chunked pass. on_progress(rows_read) is called after
+    each chunk; cancelling *cancel_token* (or the thread's bound token)
+    stops at the next chunk with RunCancelled.
+    """
+    summary = None
+    with pd.read_csv(path, usecols=columns, header=header, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            check_cancelled()
+            if columns is not None:
+                chunk = _in_caller_order(chunk, columns)
+            if summary is None:
+                summary = StreamSummary.for_methods(chunk.columns, method_ids, **options)
+            block = chunk.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+            summary.update(block)
+            if on_progress is not None:
+                on_progress(summary.rows)
+    if summary is None:
+        names = pd.read_csv(path, usecols=columns, header=header, nrows=0).columns
+        summary = StreamSummary.for_methods(names, method_ids, **options)
+    return summary
+
+
+def analyze_csv(path, methods, columns=None, header=0, chunk_rows=CHUNK_ROWS,
+                cancel_token=None, on_progress=None, **options) -> list[dict]:
+    """
+    Run *methods* (Message-style entries, e.g. {"id": "mean", "params": {}})
+    over *columns* of the CSV at *path* without loading it.
+
+    :return: One result dict per method, in order, shaped like the
+             methods' own results.
+    """
+    method_requests = _method_requests(methods)
+    summary = summarize_csv(
+        path,
+        columns=columns,
+        method_ids={method_id for method_id, _ in method_requests},
+        header=header,
+        chunk_rows=chunk_rows,
+        cancel_token=cancel_token,
+        on_progress=on_progress,
+        **options,
+    )
+    return results_from_summary(summary, method_requests)
@@ -0,0 +1,228 @@
+"""Run-scoped toolbox and result memo for custom methods.
+
+Custom methods compose other methods through a ``toolbox`` dict
+(``toolbox["mean"](data)``). A RunToolbox is created once per request:
+its tool callables are built once, and every built-in it runs goes
+through a memo table keyed by (method id, data identity, metadata, params).
+The handler's own built-in work goes through the same memo, so a custom
+method asking for ``mean`` of the data the run already computed ``mean``
+on gets that result instead of recomputing it. Concurrent requests for
+the same key wait for the one computation already in progress.
+
+Only built-ins are memoized. Custom methods may be non-deterministic
+(they are not result-cached either), and memoizing them could deadlock
+two custom methods that call each other from different threads.
+
+Data identity is the object itself (for numpy arrays, the memory it
+views), not its contents. The memo keeps every keyed object alive until
+the run ends, so an identity can't be reused by different data
+mid-run.
+
+Like cancellation tokens, the toolbox is bound to the handler's worker
+threads (bind_toolbox); code outside a run gets a fresh one per call.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import ExitStack, contextmanager
+
+import numpy as np
+
+from backend_support.cancellation import POLL_SECONDS, check_cancelled
+
+
+def _data_identity(data):
+    if isinstance(data, np.ndarray):
+        # Views re-sliced the same way (e.g. data[0] on each call) share a key
+        address = data.__array_interface__["data"][0]
+        return ("ndarray", address, data.shape, data.strides, data.dtype.str)
+    return ("object", id(data))
+
+
+def memo_key(method_id, data, metadata, params):
+    """Memo key for one built-in call, or None if params aren't plain JSON."""
+    try:
+        params_key = json.dumps(params or {}, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return (method_id, _data_identity(data), id(metadata), params_key)
+
+
+class ResultMemo:
+    """Thread-safe, single-flight memo table of method results."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+
+    def get_or_compute(self, key, keep_alive, compute):
+        """
+        Return (result, computed). *compute* runs at most once per key;
+        callers arriving while it runs wait for its result. *keep_alive*
+        (the data and metadata the key refers to) is held until the memo is
+        dropped. Exceptions are not memoized.
+        """
+        if key is None:
+            return compute(), True
+        with self._lock:
+            entry = self._entries.get(key)
+            owner = entry is None
+            if owner:
+                entry = self._entries[key] = (Future(), keep_alive)
+            else:
+                self.hits += 1
+        future = entry[0]
+        if not owner:
+            while True:
+                try:
+                    return future.result(timeout=POLL_SECONDS), False
+                except FuturesTimeoutError:
+                    check_cancelled()
+        try:
+            result = compute()
+        except BaseException as exc:
+            with self._lock:
+                self._entries.pop(key, None)
+            future.set_exception(exc)
+            raise
+        future.set_result(result)
+        return result, True
+
+
+class RunToolbox:
+    """
+    The toolbox for one run: built-in calls are memoized for the run, and
+    the tool callables are built once rather than per custom method call.
+
+    A shared call stack per thread detects circular dependencies between
+    custom methods at runtime. Arrays handed to sandboxed custom methods
+    are published to shared memory once per run (shared_data) and released
+    by close().
+    """
+
+    def __init__(self, handler):
+        self._handler = handler
+        self.memo = ResultMemo()
+        self._local = threading.local()
+        self._tools = None
+        self._tools_lock = threading.Lock()
+        self._shared = {}
+        self._shared_blocks = ExitStack()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Release the run's shared-memory blocks."""
+        with self._tools_lock:
+            self._shared.clear()
+            self._shared_blocks.close()
+
+    def shared_data(self, data):
+        """SharedArrayRef for *data* (published once per run), or *data* if not shareable."""
+        from backend_support.executors import share_array
+
+        with self._tools_lock:
+            entry = self._shared.get(id(data))
+            if entry is None:
+                # The entry keeps *data* alive so its id can't be reused
+                entry = self._shared[id(data)] = (
+                    self._shared_blocks.enter_context(share_array(data)), data
+                )
+            return entry[0]
+
+    def for_method(self, method_id) -> dict:
+        """Toolbox handed to *method_id*: every tool except itself."""
+        if self._tools is None:
+            # Built on the first custom method call, then shared by the run
+            with self._tools_lock:
+                if self._tools is None:
+                    self._tools = {
+                        mid: self._make_tool(mid) for mid in self._handler.statistical_methods
+                    }
+        toolbox = dict(self._tools)
+        toolbox.pop(method_id, None)
+        return toolbox
+
+    @property
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def calling(self, method_id, metadata):
+        """Mark *method_id* (run with *metadata*) as in progress on this thread."""
+        stack = self._stack
+        if any(mid == method_id for mid, _ in stack):
+            raise RuntimeError(
+                f"Circular dependency detected: '{method_id}' "
+                "is already being computed in the current chain."
+            )
+        stack.append((method_id, metadata))
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    def builtin(self, method_id, method_class, data, metadata, params):
+        """Result dict of a built-in method, memoized for the run."""
+        return self.memo.get_or_compute(
+            memo_key(method_id, data, metadata, params),
+            (data, metadata),
+            lambda: self._handler._compute_builtin(method_id, method_class, data, metadata, params),
+        )
+
+    def _make_tool(self, method_id):
+        def tool_fn(tool_data, tool_params=None):
+            # Each tool call is a safe point to stop a cancelled run
+            check_cancelled()
+            method_class = self._handler.statistical_methods[method_id]
+            stack = self._stack
+            # Tools run with the metadata of the method that called them
+            metadata = stack[-1][1] if stack else None
+            if method_id.startswith("custom_"):
+                with self.calling(method_id, metadata):
+                    instance = method_class(
+                        tool_data, metadata, tool_params, toolbox=self.for_method(method_id)
+                    )
+                    result = instance.compute()
+            else:
+                result, _ = self.builtin(method_id, method_class, tool_data, metadata, tool_params)
+                # The memo's result may be the run's own; the caller gets a private copy
+                result = {**result, "value": copy.deepcopy(result.get("value"))}
+            if result.get("ok"):
+                return result["value"]
+            raise RuntimeError(result.get("error", f"Tool '{method_id}' failed"))
+
+        tool_fn.__name__ = f"toolbox_{method_id}"
+        return tool_fn
+
+
+_bound = threading.local()
+
+
+@contextmanager
+def bind_toolbox(toolbox: RunToolbox | None):
+    """Make *toolbox* the current thread's run toolbox for the duration of the block."""
+    previous = getattr(_bound, "toolbox", None)
+    _bound.toolbox = toolbox
+    try:
+        yield toolbox
+    finally:
+        _bound.toolbox = previous
+
+
+def current_toolbox() -> RunToolbox | None:
+    """The run toolbox bound to the calling thread, if any."""
+    return getattr(_bound, "toolbox", None)
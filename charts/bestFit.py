@@ -1,7 +1,9 @@
 import os
 import numpy as np
 import plotly.graph_objects as go
-from io import BytesIO
+from .renderer_pool import render_png
+from .downsample import scatter_traces
+from methods.descriptive import pair_columns
 
 """
     "graphics": [ #3.6
@@ -55,14 +57,18 @@ class BestFit:
         }
 
     def _create_chart(self):
-        x = np.array(self.data[0], dtype = float)
-        y = np.array(self.data[1], dtype = float)
-
-        slope, intercept = np.polyfit(x, y, 1)
-
-        padding = (x.max() - x.min()) * 0.2
-
-        xFit = np.linspace(x.min() - padding, x.max() + padding, 100, endpoint = False)
+        # The line is the one Least Squares Regression reports: both read the
+        # pair's shared co-moments (methods/descriptive.py), which leave out
+        # rows missing either value
+        columns = pair_columns(self.data)
+        x, y = columns.rows[0], columns.rows[1]
+        fit = columns.co_moments(0, 1).regression()
+        slope, intercept = fit["slope"], fit["intercept"]
+
+        x_min, x_max = np.nanmin(x), np.nanmax(x)
+        padding = (x_max - x_min) * 0.2
+
+        xFit = np.linspace(x_min - padding, x_max + padding, 100, endpoint = False)
         yFit = slope * xFit + intercept
 
         fig = go.Figure()
@@ -76,13 +82,17 @@ class BestFit:
             name = "Line of Best Fit"
         ))
 
-        fig.add_trace(go.Scatter(
-            x = self.data[0],
-            y = self.data[1],
-            mode = "markers",
+        # The fit uses every point; only the drawn markers are reduced
+        # (see charts/downsample.py).
+        traces, _mode = scatter_traces(
+            x,
+            y,
             marker = dict(color = "#e4781d", size = 7),
-            name = "Data Markers"
-        ))
+            name = "Data Markers",
+            render_mode = self.params.get("render_mode", "auto")
+        )
+        for trace in traces:
+            fig.add_trace(trace)
 
 
 
@@ -97,9 +107,7 @@ class BestFit:
         fig.update_xaxes(gridcolor = "#222222")
         fig.update_yaxes(gridcolor = "#222222")
 
-        buffer = BytesIO()
-        fig.write_image(buffer, format = "png")
-        buffer.seek(0)
+        buffer = render_png(fig)
 
         return buffer
 
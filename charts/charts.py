@@ -1,4 +1,5 @@
 from .bestFit import BestFit
+from .corrHeatmap import CorrHeatmap
 from .horBar import HorBar
 from .pieChart import PieChart
 from .scatPlot import ScatPlot
@@ -8,6 +9,7 @@ from methods.binomial import Binomial
 charts_list = {
     "binomial": Binomial,
     "best_fit": BestFit,
+    "corr_heatmap": CorrHeatmap,
     "hor_bar": HorBar,
     "pie_chart": PieChart,
     "scat_plot": ScatPlot,
@@ -0,0 +1,113 @@
+import os
+import numpy as np
+import plotly.graph_objects as go
+from .renderer_pool import render_png
+from methods.correlation import correlation_matrix, matrix_rows
+from methods.descriptive import column_names, descriptive_stats
+
+"""
+    "graphics": [
+        {
+            "type": "corr_heatmap",
+            "method": "pearson",            # or "spearman"
+            "path": "exports/corr_heatmap.png"
+        }
+    ],
+"""
+
+# Up to this many columns each cell is labelled with its r
+_ANNOTATE_MAX_COLUMNS = 15
+
+
+class CorrHeatmap:
+    def __init__(self, data, metadata, params=None):
+        # Initialize the chart with a type and optional parameters
+        self.type = "corr_heatmap"
+        self.data = data
+        self.metadata = metadata
+        self.params = params or {}
+
+    def _applicable(self):
+        # Check whether this chart is valid for the given data selection
+        if "path" not in self.params or not self.params["path"]:
+            return "No output path provided"
+        if self.params.get("method", "pearson") not in ("pearson", "spearman"):
+            return "Correlation heatmap method must be 'pearson' or 'spearman'"
+        if self.data is None or len(self.data) < 2:
+            return "Correlation heatmap requires at least 2 numeric columns."
+        return None
+
+    def _generate_return_structure(self):
+        return {
+            "type": self.type,
+            "ok": True,
+            "path": self.params.get("path"),
+            "error": None,
+            "params_used": self.params,
+        }
+
+    def _generate_return_structure_error(self, error_message):
+        return {
+            "type": self.type,
+            "ok": False,
+            "path": self.params.get("path"),
+            "error": error_message,
+            "params_used": self.params,
+        }
+
+    def _create_chart(self):
+        # Same engine (and, within a run, the same ranks) as the methods'
+        # matrix mode (methods/correlation.py)
+        columns = descriptive_stats(matrix_rows(self.data)).columns()
+        method = self.params.get("method", "pearson")
+        r = correlation_matrix(columns, method)["r"]
+        names = column_names(self.metadata, columns.n_columns)
+
+        heatmap = dict(
+            z = r,
+            x = names,
+            y = names,
+            zmin = -1,
+            zmax = 1,
+            colorscale = "RdBu",
+            reversescale = True,
+            colorbar = dict(title = "Pearson r" if method == "pearson" else "Spearman ρ"),
+            hovertemplate = "%{y} ~ %{x}: %{z:.3f}<extra></extra>",
+        )
+        if columns.n_columns <= _ANNOTATE_MAX_COLUMNS:
+            heatmap["text"] = np.where(np.isnan(r), "", np.char.mod("%.2f", np.nan_to_num(r)))
+            heatmap["texttemplate"] = "%{text}"
+
+        fig = go.Figure(go.Heatmap(**heatmap))
+        fig.update_layout(
+            plot_bgcolor = "black",
+            paper_bgcolor = "black",
+            font = dict(color = "white"),
+            title = "",
+        )
+        # First column at the top, as in a printed matrix
+        fig.update_yaxes(autorange = "reversed")
+
+        buffer = render_png(fig)
+
+        return buffer
+
+    def create_graphic(self):
+        # Perform the chart computation and return a standardized result dictionary
+        reason = self._applicable()
+        if reason is not None:
+            return self._generate_return_structure_error(reason)
+
+        try:
+            chart = self._create_chart()
+            output_path = self.params["path"]
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+
+            with open(output_path, "wb") as f:
+                f.write(chart.getvalue())
+        except Exception as exc:
+            return self._generate_return_structure_error(str(exc))
+
+        return self._generate_return_structure()
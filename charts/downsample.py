@@ -0,0 +1,177 @@
+"""
+charts/downsample.py
+--------------------
+Point reduction for the scatter-style charts (scatPlot, bestFit).
+
+Kaleido draws every marker, so render time grows with the selection.
+Before building the figure the charts pass their x/y columns through
+scatter_traces(), which picks one of three render modes:
+
+    - "points":  the selection is small enough to draw every marker;
+    - "lttb":    Largest-Triangle-Three-Buckets decimation down to
+                 _MAX_MARKERS points. LTTB keeps the point of each x-bucket
+                 that deviates most from its neighbours, so spikes and
+                 outliers survive the reduction;
+    - "density": a 2-D histogram raster of the whole cloud, with the points
+                 that fall in near-empty bins (outliers) drawn on top.
+
+Either way the figure holds at most _MAX_MARKERS markers plus a fixed
+_DENSITY_BINS x _DENSITY_BINS grid, so rendering time no longer depends on
+the number of rows selected.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+RENDER_MODES = ("auto", "points", "lttb", "density")
+
+# Most markers a chart will hand to Kaleido.
+_MAX_MARKERS = 5_000
+
+# "auto" switches from LTTB decimation to the density raster above this.
+_DENSITY_POINT_THRESHOLD = 100_000
+
+# Raster resolution and the bin population at or below which a bin's
+# points are drawn individually on top of the raster.
+_DENSITY_BINS = 200
+_SPARSE_BIN_COUNT = 2
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Indices of the *threshold* points picked by Largest-Triangle-Three-Buckets.
+
+    Points are ordered by x; the first and last are always kept and each of
+    the threshold - 2 buckets in between contributes the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    mean. Returned indices refer to the original (unsorted) arrays.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = x.size
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    order = np.argsort(x, kind="stable")
+    xs = x[order]
+    ys = y[order]
+
+    # threshold - 2 buckets over the interior points 1 .. n-2
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < edges.size:
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        xc = xs[next_start:next_end].mean()
+        yc = ys[next_start:next_end].mean()
+
+        xa, ya = xs[a], ys[a]
+        bx = xs[start:end]
+        by = ys[start:end]
+        area = np.abs((xa - xc) * (by - ya) - (xa - bx) * (yc - ya))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+
+    return order[keep]
+
+
+def density_grid(x, y, bins=_DENSITY_BINS):
+    """
+    2-D histogram of the cloud.
+
+    :return: (counts, x_edges, y_edges, bin_index) — counts has shape
+             (bins, bins) indexed [x_bin, y_bin]; bin_index gives each
+             point's flat bin so callers can look up its population.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    def _edges(values):
+        lo, hi = float(values.min()), float(values.max())
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        return np.linspace(lo, hi, bins + 1)
+
+    x_edges = _edges(x)
+    y_edges = _edges(y)
+    ix = np.clip(np.searchsorted(x_edges, x, side="right") - 1, 0, bins - 1)
+    iy = np.clip(np.searchsorted(y_edges, y, side="right") - 1, 0, bins - 1)
+    bin_index = ix * bins + iy
+    counts = np.bincount(bin_index, minlength=bins * bins).reshape(bins, bins)
+    return counts, x_edges, y_edges, bin_index
+
+
+def choose_render_mode(point_count, requested="auto"):
+    """Resolve "auto" to the concrete mode used for *point_count* points."""
+    if requested not in RENDER_MODES:
+        raise ValueError(
+            f"Unknown render mode {requested!r}; expected one of {', '.join(RENDER_MODES)}"
+        )
+    if requested != "auto":
+        return requested
+    if point_count <= _MAX_MARKERS:
+        return "points"
+    if point_count <= _DENSITY_POINT_THRESHOLD:
+        return "lttb"
+    return "density"
+
+
+def scatter_traces(x, y, marker, name, render_mode="auto"):
+    """
+    Build the plotly traces that draw the (x, y) cloud.
+
+    Non-finite pairs are dropped first (plotly skips them anyway).
+
+    :return: (traces, mode) — mode is the concrete render mode used.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.all():
+        x = x[finite]
+        y = y[finite]
+
+    mode = choose_render_mode(x.size, render_mode)
+    if x.size == 0:
+        mode = "points"
+
+    if mode == "points":
+        return [go.Scatter(x=x, y=y, mode="markers", marker=marker, name=name)], mode
+
+    if mode == "lttb":
+        keep = lttb_indices(x, y, _MAX_MARKERS)
+        return [go.Scatter(x=x[keep], y=y[keep], mode="markers", marker=marker, name=name)], mode
+
+    counts, x_edges, y_edges, bin_index = density_grid(x, y)
+    z = counts.T.astype(float)
+    z[z == 0] = np.nan  # empty bins stay transparent
+    raster = go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        z=np.log10(z),
+        colorscale=[[0.0, "#3a1c05"], [1.0, marker.get("color", "#e4781d")]],
+        showscale=False,
+        hoverinfo="skip",
+        name=name,
+    )
+
+    sparse = counts.ravel()[bin_index] <= _SPARSE_BIN_COUNT
+    sx, sy = x[sparse], y[sparse]
+    if sx.size > _MAX_MARKERS:
+        keep = lttb_indices(sx, sy, _MAX_MARKERS)
+        sx, sy = sx[keep], sy[keep]
+    outliers = go.Scatter(
+        x=sx,
+        y=sy,
+        mode="markers",
+        marker=dict(marker, size=min(marker.get("size", 7), 4)),
+        name=name,
+    )
+    return [raster, outliers], mode
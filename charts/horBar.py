@@ -1,7 +1,7 @@
 import os
 import numpy as np
 import matplotlib.pyplot as plt
-from io import BytesIO
+from .renderer_pool import render_png
 import plotly.graph_objects as go
 import plotly.io as pio
 from collections import Counter
@@ -209,9 +209,7 @@ class HorBar:
             margin = dict(l = 100, r = 100, t = 10, b = 10)
         )
 
-        buffer = BytesIO()
-
-        figure.write_image(buffer, format = "png", scale = 2)
+        buffer = render_png(figure, scale = 2)
 
         return buffer
 
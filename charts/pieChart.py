@@ -2,7 +2,7 @@ import os
 import numpy as np
 import plotly.graph_objects as go
 import plotly.colors as pc
-from io import BytesIO
+from .renderer_pool import render_png
 from collections import Counter
 """
     "graphics": [ #3.6
@@ -219,9 +219,7 @@ class PieChart:
             margin = dict(l = 40, r = 40, t = 30, b = 30),
         )
 
-        buffer = BytesIO()
-        fig.write_image(buffer, format = "png")
-        buffer.seek(0)
+        buffer = render_png(fig)
 
         return buffer
     
@@ -0,0 +1,348 @@
+"""
+charts/renderer_pool.py
+-----------------------
+Pool of long-lived Kaleido renderer processes for the plotly chart classes.
+
+Kaleido drives a single headless Chromium per Python process, so charts
+rendered from several threads still export one after another. The pool
+keeps N worker processes, each with its own warmed-up Kaleido, and feeds
+them from a bounded job queue:
+
+    - one dispatcher thread per worker sends jobs over a pipe and waits
+      up to _RENDER_TIMEOUT_SECONDS for the PNG bytes;
+    - a worker that hangs past that deadline, or dies, is killed and
+      restarted and the job fails with an error instead of blocking;
+    - idle workers are pinged every _HEALTH_CHECK_INTERVAL_SECONDS and
+      restarted if they stop answering;
+    - a job carries the cancellation token bound to the thread that
+      submitted it (backend_support/cancellation.py). Cancelled jobs are
+      dropped before they start, and a render in progress is killed by
+      restarting its worker.
+
+The pool is a per-process singleton started by get_or_start_pool() (the
+BackendHandler does this when chart generation is first used). Chart
+classes call render_png(); with no pool running it falls back to a
+plain in-process fig.write_image().
+"""
+
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from io import BytesIO
+
+from backend_support.cancellation import POLL_SECONDS, RunCancelled, current_token
+
+_RENDER_TIMEOUT_SECONDS = 30.0
+_START_TIMEOUT_SECONDS = 60.0
+_PING_TIMEOUT_SECONDS = 5.0
+_HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+_DEFAULT_WORKERS = 2
+_DEFAULT_QUEUE_SIZE = 32
+
+
+def _render_worker_main(conn) -> None:
+    """Worker-process loop: warm Kaleido once, then render jobs until told to stop."""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    try:
+        pio.to_image(go.Figure(), format="png", width=10, height=10)
+    except Exception as exc:
+        conn.send(("error", f"Kaleido failed to start: {exc!r}"))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        kind = message[0]
+        if kind == "stop":
+            return
+        if kind == "ping":
+            conn.send(("pong", None))
+            continue
+        _kind, figure_json, options = message
+        try:
+            figure = pio.from_json(figure_json, skip_invalid=True)
+            conn.send(("ok", pio.to_image(figure, **options)))
+        except Exception as exc:
+            conn.send(("error", str(exc)))
+
+
+class _Worker:
+    """One renderer process and the parent end of its pipe."""
+
+    def __init__(self, ctx, index: int):
+        self.ctx = ctx
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.restarts = 0
+
+    def start(self, timeout: float) -> None:
+        parent_conn, child_conn = self.ctx.Pipe()
+        process = self.ctx.Process(
+            target=_render_worker_main,
+            args=(child_conn,),
+            daemon=True,
+            name=f"PSRenderer-{self.index}",
+        )
+        process.start()
+        child_conn.close()
+        self.process, self.conn = process, parent_conn
+        if not parent_conn.poll(timeout):
+            self.kill()
+            raise TimeoutError("Renderer process did not start in time.")
+        kind, payload = parent_conn.recv()
+        if kind != "ready":
+            self.kill()
+            raise RuntimeError(payload)
+
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def kill(self) -> None:
+        if self.process is not None:
+            self.process.kill()
+            self.process.join(timeout=5)
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def restart(self, timeout: float) -> None:
+        self.kill()
+        self.restarts += 1
+        self.start(timeout)
+
+    def stop(self) -> None:
+        try:
+            if self.conn is not None:
+                self.conn.send(("stop",))
+            if self.process is not None:
+                self.process.join(timeout=2)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+
+class RendererPool:
+    def __init__(
+        self,
+        num_workers: int = _DEFAULT_WORKERS,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+        render_timeout: float = _RENDER_TIMEOUT_SECONDS,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        import multiprocessing
+
+        # "spawn": forking the threaded Streamlit server can deadlock.
+        self._ctx = multiprocessing.get_context("spawn")
+        self.num_workers = num_workers
+        self.render_timeout = render_timeout
+        self._jobs: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._workers = [_Worker(self._ctx, i) for i in range(num_workers)]
+        self._threads: list[threading.Thread] = []
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        """Start and warm every worker; raises if Kaleido can't start."""
+        # Import plotly's JSON serializer on this thread so chart threads
+        # never race each other through the import lock on first use.
+        import plotly.graph_objects as go
+        go.Figure().to_json()
+
+        starters = []
+        errors = []
+
+        def _start(worker):
+            try:
+                worker.start(_START_TIMEOUT_SECONDS)
+            except Exception as exc:
+                errors.append(exc)
+
+        for worker in self._workers:
+            t = threading.Thread(target=_start, args=(worker,), daemon=True)
+            starters.append(t)
+            t.start()
+        for t in starters:
+            t.join()
+        if errors:
+            self.shutdown()
+            raise errors[0]
+
+        for worker in self._workers:
+            t = threading.Thread(
+                target=self._dispatch_loop,
+                args=(worker,),
+                daemon=True,
+                name=f"PSRendererDispatch-{worker.index}",
+            )
+            self._threads.append(t)
+            t.start()
+
+    def _dispatch_loop(self, worker: _Worker) -> None:
+        while not self._stopping.is_set():
+            try:
+                job = self._jobs.get(timeout=_HEALTH_CHECK_INTERVAL_SECONDS)
+            except queue.Empty:
+                self._health_check(worker)
+                continue
+            if job is None:
+                break
+            figure_json, options, future, token = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            if token is not None and token.cancelled:
+                future.set_exception(RunCancelled(token.reason))
+                continue
+            try:
+                future.set_result(self._render_on(worker, figure_json, options, token))
+            except Exception as exc:
+                future.set_exception(exc)
+
+    def _render_on(self, worker: _Worker, figure_json: str, options: dict, token=None) -> bytes:
+        if not worker.alive():
+            worker.restart(_START_TIMEOUT_SECONDS)
+        try:
+            worker.conn.send(("render", figure_json, options))
+            deadline = time.monotonic() + self.render_timeout
+            while not worker.conn.poll(POLL_SECONDS):
+                if token is not None and token.cancelled:
+                    # Kill the render in progress; the replacement is warm for the next job
+                    worker.restart(_START_TIMEOUT_SECONDS)
+                    raise RunCancelled(token.reason)
+                if time.monotonic() >= deadline:
+                    worker.restart(_START_TIMEOUT_SECONDS)
+                    raise TimeoutError(
+                        f"Chart rendering exceeded {self.render_timeout:.0f}s; renderer restarted."
+                    )
+            kind, payload = worker.conn.recv()
+        except (EOFError, OSError, BrokenPipeError) as exc:
+            worker.restart(_START_TIMEOUT_SECONDS)
+            raise RuntimeError(f"Renderer process crashed: {exc!r}") from exc
+        if kind != "ok":
+            raise RuntimeError(payload)
+        return payload
+
+    def _health_check(self, worker: _Worker) -> None:
+        try:
+            if worker.alive():
+                worker.conn.send(("ping",))
+                if worker.conn.poll(_PING_TIMEOUT_SECONDS) and worker.conn.recv()[0] == "pong":
+                    return
+            worker.restart(_START_TIMEOUT_SECONDS)
+        except Exception as exc:
+            print(f"[renderer_pool] restart of worker {worker.index} failed: {exc!r}", file=sys.stderr)
+
+    def health(self) -> list[dict]:
+        """Snapshot of each worker's state for debugging."""
+        return [
+            {"worker": w.index, "alive": w.alive(), "restarts": w.restarts}
+            for w in self._workers
+        ]
+
+    def submit(self, figure, **options) -> Future:
+        """
+        Queue a figure for rendering; blocks while the bounded queue is full.
+        The job is cancelled with the calling thread's bound CancelToken.
+        """
+        if self._stopping.is_set():
+            raise RuntimeError("Renderer pool is shut down.")
+        options.setdefault("format", "png")
+        future: Future = Future()
+        try:
+            self._jobs.put(
+                (figure.to_json(), options, future, current_token()), timeout=self.render_timeout
+            )
+        except queue.Full:
+            raise RuntimeError("Chart renderer queue is full; try again shortly.") from None
+        return future
+
+    def render(self, figure, **options) -> bytes:
+        """Render *figure* to image bytes on the next free worker."""
+        token = current_token()
+        future = self.submit(figure, **options)
+        # A queued job may wait behind a full round of renders before its
+        # own render_timeout starts; leave room for that.
+        deadline = time.monotonic() + self.render_timeout * 2 + _START_TIMEOUT_SECONDS
+        while True:
+            try:
+                return future.result(timeout=POLL_SECONDS)
+            except FuturesTimeoutError:
+                pass
+            if token is not None and token.cancelled:
+                # Still queued: drop it. Running: the dispatcher kills it.
+                future.cancel()
+                raise RunCancelled(token.reason)
+            if time.monotonic() >= deadline:
+                raise TimeoutError("Timed out waiting for a chart renderer.")
+
+    def shutdown(self) -> None:
+        self._stopping.set()
+        for _ in self._threads:
+            try:
+                self._jobs.put_nowait(None)
+            except queue.Full:
+                break
+        for t in self._threads:
+            t.join(timeout=self.render_timeout)
+        for worker in self._workers:
+            worker.stop()
+
+
+_pool: RendererPool | None = None
+_pool_lock = threading.Lock()
+_pool_failed = False
+
+
+def get_or_start_pool(num_workers: int = _DEFAULT_WORKERS) -> RendererPool | None:
+    """
+    Start the shared renderer pool if not already running and return it.
+    Returns None (and charts render in-process) if Kaleido can't start.
+    Thread-safe.
+    """
+    global _pool, _pool_failed
+    with _pool_lock:
+        if _pool is not None or _pool_failed:
+            return _pool
+        pool = RendererPool(num_workers=num_workers)
+        try:
+            pool.start()
+        except Exception as exc:
+            _pool_failed = True
+            # Don't kill boot if Kaleido is unavailable, but surface the
+            # failure so chart generation issues aren't silently masked.
+            print(f"[renderer_pool] Kaleido renderer pool failed to start: {exc!r}", file=sys.stderr)
+            return None
+        _pool = pool
+        return pool
+
+
+def shutdown_pool() -> None:
+    """Stop the shared renderer pool (a later get_or_start_pool starts a new one)."""
+    global _pool, _pool_failed
+    with _pool_lock:
+        pool, _pool = _pool, None
+        _pool_failed = False
+    if pool is not None:
+        pool.shutdown()
+
+
+def render_png(figure, **options) -> BytesIO:
+    """Render a plotly figure to a PNG buffer via the shared pool, if running."""
+    options["format"] = "png"
+    pool = _pool
+    if pool is not None:
+        return BytesIO(pool.render(figure, **options))
+    buffer = BytesIO()
+    figure.write_image(buffer, **options)
+    buffer.seek(0)
+    return buffer
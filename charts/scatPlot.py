@@ -1,7 +1,8 @@
 import os
 import numpy as np
 import plotly.graph_objects as go
-from io import BytesIO
+from .renderer_pool import render_png
+from .downsample import scatter_traces
 
 """
     "graphics": [ #3.6
@@ -80,16 +81,20 @@ class ScatPlot:
 
         fig = go.Figure()
 
-        fig.add_trace(go.Scatter(
-            x = x,
-            y = y,
-            mode = "markers",
+        # Large selections are decimated or drawn as a density raster
+        # (see charts/downsample.py) so render time stays flat.
+        traces, _mode = scatter_traces(
+            x,
+            y,
             marker = dict(
                 color = "#e4781d",
                 size = 7
             ),
-            name = "Data Markers"
-        ))
+            name = "Data Markers",
+            render_mode = self.params.get("render_mode", "auto")
+        )
+        for trace in traces:
+            fig.add_trace(trace)
 
         fig.update_layout(
             plot_bgcolor = "black",
@@ -101,9 +106,7 @@ class ScatPlot:
         fig.update_xaxes(gridcolor = "#4F4D4D")
         fig.update_yaxes(gridcolor = "#4f4d4d")
 
-        buffer = BytesIO()
-        fig.write_image(buffer, format = "png")
-        buffer.seek(0)
+        buffer = render_png(fig)
         
         return buffer
 
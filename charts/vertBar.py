@@ -1,7 +1,7 @@
 import os
 import numpy as np
 import matplotlib.pyplot as plt
-from io import BytesIO
+from .renderer_pool import render_png
 import plotly.graph_objects as go
 import plotly.io as pio
 from collections import Counter
@@ -198,9 +198,7 @@ class VertBar:
             margin = dict(l = 60, r = 40, t = 10, b = 10)
         )
 
-        buffer = BytesIO()
-
-        figure.write_image(buffer, format = "png", scale = 2)
+        buffer = render_png(figure, scale = 2)
 
         return buffer
 
@@ -45,11 +45,13 @@ class Message:
             self._data_np = None
 
 
-    def to_dict(self) -> dict:
+    def to_dict(self, include_data=True) -> dict:
         # Serialize data as a plain list so json.dump doesn't fall back to
         # default=str and persist a stringified numpy array. Replay reads
-        # this key when table.csv is missing.
-        data = self.data
+        # this key when the run has no binary table or data.npy.
+        # include_data=False leaves "data" as None for callers that store
+        # the array separately (see backend_support/run_store.py).
+        data = self.data if include_data else None
         if isinstance(data, np.ndarray):
             data = data.tolist()
         return {
@@ -1,11 +1,60 @@
-"""Filesystem and registry helpers for custom methods."""
+"""Filesystem and registry helpers for custom methods.
+
+The registry JSON and the generated method modules are cached in-process
+so the many facade calls per render don't re-read or re-import them:
+
+    - load_registry re-reads custom_methods.json only when its stat
+      (mtime, size, inode) changes; write_registry replaces the file
+      atomically and drops the cached copy;
+    - load_method_classes keeps each loaded module keyed by file path. A
+      file whose stat changed is re-hashed and re-executed only if its
+      bytes changed, so editing one method re-imports that module alone.
+      Compiled code for a file's current and previous contents is kept in
+      memory rather than in __pycache__: generated files are rewritten in
+      place, often within the one-second mtime granularity .pyc files are
+      validated against.
+"""
 
 from __future__ import annotations
 
+import hashlib
 import importlib.util
 import json
 import os
 import re
+import threading
+
+
+_cache_lock = threading.Lock()
+# abs registry path -> (stat key, parsed registry)
+_registry_cache: dict[str, tuple[tuple, list[dict]]] = {}
+# abs module path -> _CachedModule
+_module_cache: dict[str, "_CachedModule"] = {}
+# (abs module path, content hash) -> compiled code object
+_code_cache: dict[tuple[str, str], object] = {}
+
+
+class _CachedModule:
+    __slots__ = ("module_name", "stat_key", "digest", "module")
+
+    def __init__(self, module_name, stat_key, digest, module):
+        self.module_name = module_name
+        self.stat_key = stat_key
+        self.digest = digest
+        self.module = module
+
+
+def _stat_key(path: str) -> tuple:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def clear_caches() -> None:
+    """Forget every cached registry, module and compiled code object."""
+    with _cache_lock:
+        _registry_cache.clear()
+        _module_cache.clear()
+        _code_cache.clear()
 
 
 def ensure_dir(custom_dir: str, custom_json_path: str) -> None:
@@ -19,22 +68,81 @@ def ensure_dir(custom_dir: str, custom_json_path: str) -> None:
 def load_registry(custom_dir: str, custom_json_path: str) -> list[dict]:
     """Load the registry JSON, returning an empty list on corruption."""
     ensure_dir(custom_dir, custom_json_path)
+    path = os.path.abspath(custom_json_path)
     try:
-        with open(custom_json_path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except (json.JSONDecodeError, FileNotFoundError):
+        # Stat before reading: a write in between only causes a re-read later
+        key = _stat_key(path)
+    except OSError:
         return []
+    with _cache_lock:
+        cached = _registry_cache.get(path)
+    if cached is not None and cached[0] == key:
+        registry = cached[1]
+    else:
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                registry = json.load(handle)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return []
+        with _cache_lock:
+            _registry_cache[path] = (key, registry)
+    # Callers build updated registries from this; keep the cached one intact
+    return [dict(entry) for entry in registry]
 
 
 def write_registry(custom_json_path: str, registry: list[dict]) -> None:
     """Persist the current registry to disk."""
-    with open(custom_json_path, "w", encoding="utf-8") as handle:
+    path = os.path.abspath(custom_json_path)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
         json.dump(registry, handle, indent=2)
+    # Atomic, so concurrent readers never see a half-written registry
+    os.replace(tmp_path, path)
+    with _cache_lock:
+        _registry_cache.pop(path, None)
+
+
+def _load_module(abs_filepath: str, module_name: str):
+    """The module for *abs_filepath*, re-executed only if its contents changed."""
+    key = _stat_key(abs_filepath)
+    with _cache_lock:
+        cached = _module_cache.get(abs_filepath)
+    if cached is not None and cached.module_name == module_name and cached.stat_key == key:
+        return cached.module
+
+    with open(abs_filepath, "rb") as handle:
+        source = handle.read()
+    digest = hashlib.blake2b(source, digest_size=16).hexdigest()
+    if cached is not None and cached.module_name == module_name and cached.digest == digest:
+        # Touched but not changed (e.g. rewritten with the same code)
+        with _cache_lock:
+            cached.stat_key = key
+        return cached.module
+
+    with _cache_lock:
+        code = _code_cache.get((abs_filepath, digest))
+    if code is None:
+        code = compile(source, abs_filepath, "exec", dont_inherit=True)
+    spec = importlib.util.spec_from_file_location(module_name, abs_filepath)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    exec(code, module.__dict__)
+    with _cache_lock:
+        # Keep this version's code and the one before it (an edit that's reverted)
+        keep = {digest, cached.digest if cached is not None else None}
+        for code_key in [k for k in _code_cache if k[0] == abs_filepath and k[1] not in keep]:
+            _code_cache.pop(code_key, None)
+        _code_cache[(abs_filepath, digest)] = code
+        _module_cache[abs_filepath] = _CachedModule(module_name, key, digest, module)
+    return module
 
 
 def load_method_classes(custom_dir: str, registry: list[dict]) -> dict:
     """Load all valid custom method classes from their generated files."""
     classes = {}
+    abs_dir = os.path.realpath(custom_dir)
+    live = set()
     for entry in registry:
         method_id = entry["id"]
         filename = entry["filename"]
@@ -48,23 +156,27 @@ def load_method_classes(custom_dir: str, registry: list[dict]) -> dict:
             continue
 
         abs_filepath = os.path.realpath(filepath)
-        abs_dir = os.path.realpath(custom_dir)
         if not abs_filepath.startswith(abs_dir + os.sep):
             continue
 
+        live.add(abs_filepath)
         try:
-            module_name = f"custom_methods.{method_id}"
-            spec = importlib.util.spec_from_file_location(module_name, abs_filepath)
-            if spec is None or spec.loader is None:
+            module = _load_module(abs_filepath, f"custom_methods.{method_id}")
+            if module is None:
                 continue
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
             cls = getattr(module, class_name, None)
             if cls is not None:
                 classes[method_id] = cls
         except Exception:
             continue
 
+    # Drop modules of methods deleted from this directory's registry
+    with _cache_lock:
+        for path in [p for p in _module_cache if p.startswith(abs_dir + os.sep) and p not in live]:
+            _module_cache.pop(path, None)
+        for code_key in [k for k in _code_cache if k[0].startswith(abs_dir + os.sep) and k[0] not in live]:
+            _code_cache.pop(code_key, None)
+
     return classes
 
 
@@ -59,6 +59,17 @@ def _saved_runs_path() -> str:
     )
 
 
+def get_custom_methods_paths() -> tuple[str, str]:
+    """(custom methods directory, registry JSON path) currently in use."""
+    return _CUSTOM_METHODS_DIR, _CUSTOM_METHODS_JSON
+
+
+def set_custom_methods_paths(custom_dir: str, custom_json_path: str) -> None:
+    """Point this process at another custom methods store (sandbox workers)."""
+    global _CUSTOM_METHODS_DIR, _CUSTOM_METHODS_JSON
+    _CUSTOM_METHODS_DIR, _CUSTOM_METHODS_JSON = custom_dir, custom_json_path
+
+
 def _ensure_dir() -> None:
     _ensure_dir_impl(_CUSTOM_METHODS_DIR, _CUSTOM_METHODS_JSON)
 
@@ -16,57 +16,342 @@ GET /meta?key=K
 GET /rows?key=K&start=0&end=499
     JSON array of N row-dicts for the inclusive range [start, end].
 
+GET /rows.arrow?key=K&start=0&end=499
+    The same rows as one Arrow IPC stream (a schema plus one record batch),
+    Content-Type application/vnd.apache.arrow.stream.  Encoding a block is
+    a buffer copy instead of per-cell JSON formatting.  Needs pyarrow (a
+    Streamlit dependency); answers 501 without it so the grid can fall
+    back to /rows.
+
+CONCURRENCY
+-----------
+Requests are served by a ThreadingHTTPServer, one thread per connection.
+store_dataframe() publishes an immutable _Snapshot (a private copy of the
+frame plus its metadata) by swapping a dict entry, so readers never take
+a lock: a request works on whichever snapshot it looked up, even if the
+frame is replaced mid-request.
+
+COMPRESSION
+-----------
+/rows and /rows.arrow bodies are compressed according to the request's
+Accept-Encoding: br (when the optional ``brotli`` module is installed),
+then gzip, else identity.
+
+BLOCK CACHE AND PREFETCH
+------------------------
+Each snapshot keeps an LRU of encoded (and compressed) blocks, so
+scrolling back over a block doesn't re-serialize it.  Blocks carry an
+ETag naming the snapshot version, format, range and encoding, with
+Cache-Control: no-cache; the browser revalidates with If-None-Match and
+gets a bodiless 304 while the frame is unchanged.  After serving a block
+the server encodes the next _PREFETCH_BLOCKS blocks in the scroll
+direction on a background thread.  Replacing a frame (store_dataframe
+after an edit or rename) publishes a new snapshot with a new version, so
+its cache and ETags start fresh and nothing stale is ever served.
+
 CORS
 ----
 All responses include Access-Control-Allow-Origin: * so the Streamlit
 component iframe (on port 8501) can fetch from this server's port.
 """
 
+import functools
+import gzip
 import http.server
+import io
+import itertools
 import json
 import socket
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
 
 import pandas as pd
 
+try:
+    import brotli
+except ImportError:  # optional — gzip covers every browser
+    brotli = None
+
+
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+# Bodies smaller than this go out uncompressed; the headers would cost more.
+_MIN_COMPRESS_BYTES = 1024
+_GZIP_LEVEL = 5
+_BROTLI_QUALITY = 4
+
+# Encoded bytes kept per stored frame (about a hundred 500-row blocks of a
+# wide table), and how many blocks ahead of the scroll to encode.
+_BLOCK_CACHE_BYTES = 32 * 1024 * 1024
+_PREFETCH_BLOCKS = 2
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pyarrow():
+    """pyarrow, or None if it isn't installed (only /rows.arrow needs it)."""
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _arrow_table(df: "pd.DataFrame"):
+    """
+    Convert *df* to a pyarrow Table for IPC encoding.
+
+    Column names become strings (Arrow field names must be). Object columns
+    holding mixed types, e.g. numbers and text in one column, can't be
+    typed by Arrow, so they are sent as strings with nulls preserved.
+    """
+    pa = _load_pyarrow()
+    df = df.rename(columns=str)
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].map(lambda v: None if pd.isna(v) else str(v))
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+class _BlockCache:
+    """LRU of encoded blocks, bounded by total body size."""
+
+    def __init__(self, max_bytes: int = _BLOCK_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, block_key):
+        with self._lock:
+            entry = self._entries.get(block_key)
+            if entry is not None:
+                self._entries.move_to_end(block_key)
+            return entry
+
+    def put(self, block_key, body: bytes, encoding: str | None) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(block_key, None)
+            if old is not None:
+                self._bytes -= len(old[0])
+            self._entries[block_key] = (body, encoding)
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def __contains__(self, block_key) -> bool:
+        with self._lock:
+            return block_key in self._entries
+
+
+class _Snapshot:
+    """
+    An immutable view of one stored DataFrame.
+
+    ``df`` is a private copy, so cell edits the app makes to its own frame
+    later can't change rows a request is in the middle of encoding.  The
+    Arrow table is built on the first /rows.arrow request and then reused;
+    two threads racing to build it both produce the same table.  Encoded
+    blocks live in ``blocks`` for as long as the snapshot does.
+    """
+
+    __slots__ = (
+        "df", "columns", "total_rows", "version", "_arrow",
+        "blocks", "_last_start", "_prefetching", "_prefetch_lock",
+    )
+
+    def __init__(self, df: "pd.DataFrame", version: int):
+        self.df = df.copy()
+        self.columns = list(df.columns)
+        self.total_rows = len(df)
+        self.version = version
+        self._arrow = None
+        self.blocks = _BlockCache()
+        self._last_start = None
+        self._prefetching = set()
+        self._prefetch_lock = threading.Lock()
+
+    def rows_json(self, start: int, end: int) -> str:
+        # pandas to_json handles NaN→null and numpy types natively
+        return self.df.iloc[start : end + 1].to_json(orient="records")
+
+    def rows_arrow(self, start: int, end: int) -> bytes:
+        pa = _load_pyarrow()
+        if self._arrow is None:
+            self._arrow = _arrow_table(self.df)
+        table = self._arrow
+        start = max(start, 0)
+        block = table.slice(start, max(min(end + 1, table.num_rows) - start, 0))
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, block.schema) as writer:
+            writer.write_table(block, max_chunksize=max(block.num_rows, 1))
+        return sink.getvalue()
+
+    def etag(self, fmt: str, start: int, end: int, encoding: str | None) -> str:
+        return f'"v{self.version}-{fmt}-{start}-{end}-{encoding or "identity"}"'
+
+    def block(self, fmt: str, start: int, end: int,
+              encoding: str | None) -> tuple[bytes, str | None]:
+        """
+        Encoded rows [start, end] as (body, content encoding), from the
+        cache when possible.  Bodies under _MIN_COMPRESS_BYTES are stored
+        uncompressed.
+        """
+        block_key = (fmt, start, end, encoding)
+        cached = self.blocks.get(block_key)
+        if cached is not None:
+            return cached
+        if fmt == "arrow":
+            body = self.rows_arrow(start, end)
+        else:
+            body = self.rows_json(start, end).encode()
+        used = encoding if len(body) >= _MIN_COMPRESS_BYTES else None
+        body = _compress(body, used)
+        self.blocks.put(block_key, body, used)
+        return body, used
+
+    def prefetch_ranges(self, start: int, end: int) -> list:
+        """
+        The next _PREFETCH_BLOCKS same-sized ranges in the scroll direction
+        (down unless this request started above the previous one).
+        """
+        size = end - start + 1
+        if size <= 0:
+            return []
+        direction = -1 if self._last_start is not None and start < self._last_start else 1
+        self._last_start = start
+        ranges = []
+        for i in range(1, _PREFETCH_BLOCKS + 1):
+            s = start + direction * i * size
+            if s < 0 or s >= self.total_rows:
+                break
+            ranges.append((s, s + size - 1))
+        return ranges
+
+    def prefetch(self, key: str, fmt: str, start: int, end: int,
+                 encoding: str | None) -> None:
+        """Encode one block into the cache (runs on the prefetch thread)."""
+        block_key = (fmt, start, end, encoding)
+        try:
+            # Skip work for a frame that has since been replaced or removed
+            if _store.get(key) is self and block_key not in self.blocks:
+                self.block(fmt, start, end, encoding)
+        except Exception:
+            pass  # speculative; the real request will surface any error
+        finally:
+            with self._prefetch_lock:
+                self._prefetching.discard(block_key)
+
+    def claim_prefetch(self, block_key) -> bool:
+        """True if *block_key* isn't cached or already being prefetched."""
+        if block_key in self.blocks:
+            return False
+        with self._prefetch_lock:
+            if block_key in self._prefetching:
+                return False
+            self._prefetching.add(block_key)
+            return True
+
+
+_prefetch_executor: ThreadPoolExecutor | None = None
+_prefetch_lock = threading.Lock()
+
+
+def _schedule_prefetch(key: str, snapshot: _Snapshot, fmt: str, start: int,
+                       end: int, encoding: str | None) -> None:
+    global _prefetch_executor
+    ranges = snapshot.prefetch_ranges(start, end)
+    if not ranges:
+        return
+    with _prefetch_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="PSDataPrefetch"
+            )
+    for s, e in ranges:
+        if snapshot.claim_prefetch((fmt, s, e, encoding)):
+            _prefetch_executor.submit(snapshot.prefetch, key, fmt, s, e, encoding)
+
 
 class _DataStore:
-    """Thread-safe store for DataFrames keyed by an arbitrary string."""
+    """
+    Thread-safe store for DataFrames keyed by an arbitrary string.
+
+    Writers serialize on a lock; readers only do a dict lookup and then
+    work on the immutable snapshot they got.
+    """
 
     def __init__(self):
-        self._frames: dict = {}
-        self._lock = threading.RLock()
+        self._snapshots: dict = {}
+        self._lock = threading.Lock()
+        self._versions = itertools.count(1)
 
     def store(self, key: str, df: "pd.DataFrame") -> None:
         with self._lock:
-            self._frames[key] = df
+            self._snapshots[key] = _Snapshot(df, next(self._versions))
 
-    def get_meta(self, key: str) -> dict | None:
-        with self._lock:
-            df = self._frames.get(key)
-            if df is None:
-                return None
-            return {"totalRows": len(df), "columns": list(df.columns)}
+    def get(self, key: str) -> "_Snapshot | None":
+        return self._snapshots.get(key)
 
-    def get_rows_json(self, key: str, start: int, end: int) -> str | None:
-        with self._lock:
-            df = self._frames.get(key)
-            if df is None:
-                return None
-            # pandas to_json handles NaN→null and numpy types natively
-            return df.iloc[start : end + 1].to_json(orient="records")
+    def get_meta(self, key: str) -> dict | None:
+        snapshot = self.get(key)
+        if snapshot is None:
+            return None
+        return {"totalRows": snapshot.total_rows, "columns": snapshot.columns}
 
     def clear(self, key: str) -> None:
         with self._lock:
-            self._frames.pop(key, None)
+            self._snapshots.pop(key, None)
 
 
 _store = _DataStore()
 
 
+def _negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick "br", "gzip" or None (identity) from an Accept-Encoding header."""
+    offered = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        offered[name] = q
+    if brotli is not None and offered.get("br", 0) > 0:
+        return "br"
+    if offered.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str | None) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=_BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=_GZIP_LEVEL)
+    return body
+
+
 class _Handler(http.server.BaseHTTPRequestHandler):
-    """Minimal HTTP request handler for /meta and /rows."""
+    """Minimal HTTP request handler for /meta, /rows and /rows.arrow."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive across a scroll's block fetches
 
     def log_message(self, *args):
         pass  # suppress access logs
@@ -86,22 +371,55 @@ class _Handler(http.server.BaseHTTPRequestHandler):
             else:
                 self._send(200, json.dumps(meta).encode(), "application/json")
 
-        elif parsed.path == "/rows":
-            start = int(params.get("start", ["0"])[0])
-            end = int(params.get("end", ["99"])[0])
-            body = _store.get_rows_json(key, start, end)
-            if body is None:
+        elif parsed.path in ("/rows", "/rows.arrow"):
+            try:
+                start = int(params.get("start", ["0"])[0])
+                end = int(params.get("end", ["99"])[0])
+            except ValueError:
+                self._send(400, b'{"error":"bad range"}', "application/json")
+                return
+
+            if parsed.path == "/rows":
+                fmt, content_type = "json", "application/json"
+            elif _load_pyarrow() is None:
+                self._send(501, b'{"error":"pyarrow not installed"}', "application/json")
+                return
+            else:
+                fmt, content_type = "arrow", ARROW_CONTENT_TYPE
+
+            snapshot = _store.get(key)
+            if snapshot is None:
                 self._send(404, b'{"error":"not found"}', "application/json")
+                return
+
+            encoding = _negotiate_encoding(self.headers.get("Accept-Encoding", ""))
+            etag = snapshot.etag(fmt, start, end, encoding)
+            if etag in self._if_none_match():
+                self._send(304, b"", content_type, etag=etag)
             else:
-                self._send(200, body.encode(), "application/json")
+                body, used = snapshot.block(fmt, start, end, encoding)
+                self._send(200, body, content_type, encoding=used, etag=etag)
+            _schedule_prefetch(key, snapshot, fmt, start, end, encoding)
 
         else:
             self._send(404, b'{"error":"not found"}', "application/json")
 
-    def _send(self, status: int, body: bytes, content_type: str) -> None:
+    def _if_none_match(self) -> set:
+        header = self.headers.get("If-None-Match", "")
+        return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+    def _send(self, status: int, body: bytes, content_type: str,
+              encoding: str | None = None, etag: str | None = None) -> None:
         self.send_response(status)
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if etag:
+            # Row blocks: cacheable, but revalidated since the frame can change
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
         self.end_headers()
@@ -128,7 +446,8 @@ def get_or_start_server() -> int:
         if _server_port is not None:
             return _server_port
         port = _find_free_port()
-        httpd = http.server.HTTPServer(("127.0.0.1", port), _Handler)
+        # One thread per connection (daemon threads, so they never block exit)
+        httpd = http.server.ThreadingHTTPServer(("127.0.0.1", port), _Handler)
         t = threading.Thread(
             target=httpd.serve_forever,
             daemon=True,
@@ -145,7 +464,7 @@ def server_url() -> str:
 
 
 def store_dataframe(key: str, df: "pd.DataFrame") -> None:
-    """Register a DataFrame for serving under the given key."""
+    """Register a snapshot of a DataFrame for serving under the given key."""
     _store.store(key, df)
 
 
@@ -7,6 +7,10 @@ each result into stat card tuples ready for results.py to render.
 PUBLIC INTERFACE:
     handle_result(run) -> run
 """
+import html
+
+import numpy as np
+
 _ID_TO_DISPLAY: dict[str, str] = {
     "mean":                     "Mean",
     "median":                   "Median",
@@ -24,10 +28,12 @@ _ID_TO_DISPLAY: dict[str, str] = {
 
 # Methods that expect a single 1-D dataset. Message.data converts the
 # column-major list-of-lists into a numpy ndarray of shape (n_cols, n_rows),
-# and each of these methods then either calls np.<fn>(array) with no axis
-# or an explicit .flatten() — both of which combine all selected columns
-# into one flat set of values before computing. We surface a notice on
-# the results page so the user isn't surprised by a combined result.
+# and by default each of these methods combines all selected columns into
+# one flat set of values before computing. We surface a notice on the
+# results page so the user isn't surprised by a combined result. With
+# {"per_column": True} in their params they instead compute along axis=1
+# in one vectorized pass and return one value per column (result["columns"]
+# names them; see methods/descriptive.py), so no notice is needed.
 # Custom methods are intentionally excluded — we can't know their shape
 # contract.
 _UNIVARIATE_METHOD_IDS: set[str] = {
@@ -94,6 +100,29 @@ def _format_scalar(value, precision: int = DEFAULT_PRECISION) -> str:
     return f"{v:.{precision}g}"
 
 
+# Strongest pairs spelled out on a correlation-matrix card (the full
+# matrix is in the export and the heatmap)
+_MATRIX_PAIRS_SHOWN = 3
+
+
+def _format_correlation_matrix(value: dict, precision: int = DEFAULT_PRECISION) -> str:
+    """Size of a Pearson / Spearman matrix result and its strongest pairs."""
+    names = value["columns"]
+    r = np.asarray(value["matrix"], dtype=float)
+    p = np.asarray(value["p_values"], dtype=float)
+    upper = np.triu_indices(len(names), k=1)
+    strength = np.abs(r[upper])
+    order = np.argsort(-np.where(np.isnan(strength), -1.0, strength), kind="stable")
+    pairs = [
+        f"{names[upper[0][i]]} ~ {names[upper[1][i]]}: r = {_format_scalar(r[upper][i], precision)}"
+        f" (p = {_format_scalar(p[upper][i], precision)})"
+        for i in order[:_MATRIX_PAIRS_SHOWN]
+        if not np.isnan(strength[i])
+    ]
+    summary = f"{len(names)}×{len(names)} matrix"
+    return f"{summary}; strongest: " + "; ".join(pairs) if pairs else summary
+
+
 def _format_value(value, params_used=None, precision: int = DEFAULT_PRECISION) -> str:
     """Convert a result value to a human-readable string.
 
@@ -132,6 +161,8 @@ def _format_value(value, params_used=None, precision: int = DEFAULT_PRECISION) -
                 for v in value
             ]
             return ", ".join(formatted)
+        if isinstance(value, dict) and "matrix" in value:
+            return _format_correlation_matrix(value, precision)
         if isinstance(value, dict):
             # Structured result (e.g. Least Squares Regression). The methods'
             # baked-in equation string is fixed at 3 decimals; rebuild from
@@ -183,6 +214,43 @@ def _format_value(value, params_used=None, precision: int = DEFAULT_PRECISION) -
             return "<unprintable result>"
 
 
+def _is_per_column(result: dict) -> bool:
+    """True for a univariate result computed per column (one value per column)."""
+    columns = result.get("columns")
+    value = result.get("value")
+    return isinstance(columns, list) and isinstance(value, list) and len(columns) == len(value)
+
+
+# Tied modes spelled out on a Mode card (the result lists up to 100)
+_MODES_SHOWN = 10
+
+
+def _format_modes(modes, count, n_modes, precision: int = DEFAULT_PRECISION) -> str:
+    """The tied modes of a multimodal Mode result and how often each occurs."""
+    if count == 1:
+        return f"No repeated values (each of {n_modes:,} values occurs once)"
+    shown = ", ".join(_format_value(mode, precision=precision) for mode in modes[:_MODES_SHOWN])
+    if n_modes > _MODES_SHOWN:
+        shown += f", … ({n_modes:,} modes)"
+    return f"{shown} (each ×{count:,})"
+
+
+def _per_column_cards(result: dict, display_name: str, precision: int) -> list:
+    """One stat card per column of a per-column result."""
+    params_used = result.get("params_used")
+    # Percentile's per-column params carry the percentages under "percentiles"
+    if isinstance(params_used, dict):
+        params_used = params_used.get("percentiles")
+    cards = []
+    for i, (column, value) in enumerate(zip(result["columns"], result["value"])):
+        value_str = _format_value(value, params_used=params_used, precision=precision)
+        n_modes = result.get("n_modes")
+        if isinstance(n_modes, list) and n_modes[i] > 1:
+            value_str = _format_modes(result["modes"][i], result["count"][i], n_modes[i], precision)
+        cards.append(("stat", f"<b>{display_name}</b> · {html.escape(column)}", value_str))
+    return cards
+
+
 def _build_card_tuples(results, precision: int = DEFAULT_PRECISION) -> list:
     """Return the list of (kind, title_html, value_or_error_str) tuples for
     the given list of result dicts at the chosen significant-figures precision.
@@ -195,13 +263,19 @@ def _build_card_tuples(results, precision: int = DEFAULT_PRECISION) -> list:
     cards = []
     for result in results:
         display_name = _ID_TO_DISPLAY.get(result['id'], result['id'])
-        if result.get("ok"):
+        if result.get("ok") and _is_per_column(result):
+            cards.extend(_per_column_cards(result, display_name, precision))
+        elif result.get("ok"):
             value = result.get("value")
             value_str = _format_value(
                 value,
                 params_used=result.get("params_used"),
                 precision=precision,
             )
+            if isinstance(result.get("n_modes"), int) and result["n_modes"] > 1:
+                value_str = _format_modes(
+                    result["modes"], result["count"], result["n_modes"], precision
+                )
             cards.append(("stat", f"<b>{display_name}</b>", value_str))
         else:
             error_msg = result.get("error") or "Computation failed"
@@ -236,7 +310,8 @@ def handle_result(run: dict) -> dict:
         run["precision_warnings"] is a list of {"name": str, "note": str} dicts,
         one entry per result where loss_of_precision is a non-False truthy value.
         run["multi_column_univariate_names"] lists the display names of the
-        univariate methods that ran against >1 selected column; empty if none.
+        univariate methods that pooled >1 selected column into one result
+        (per-column results aren't listed); empty if none.
     """
     results = run["result_message"].results
     multi_column = len(run.get("columns") or []) > 1
@@ -250,7 +325,11 @@ def handle_result(run: dict) -> dict:
         lop = result.get("loss_of_precision")
         if lop:
             precision_warnings.append({"name": display_name, "note": str(lop)})
-        if multi_column and result.get("id") in _UNIVARIATE_METHOD_IDS:
+        if (
+            multi_column
+            and result.get("id") in _UNIVARIATE_METHOD_IDS
+            and not _is_per_column(result)
+        ):
             multi_column_univariate_names.append(display_name)
 
     run["cards"] = cards
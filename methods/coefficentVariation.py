@@ -1,5 +1,11 @@
 import numpy as np
-from scipy.stats import variation
+
+try:
+    from .descriptive import descriptive_stats, per_column_requested, per_column_result
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import descriptive_stats, per_column_requested, per_column_result
+
 
 class CoefficientVariation:
     def __init__(self, data, metadata, params=None):
@@ -14,8 +20,8 @@ class CoefficientVariation:
         if self.data is None or len(self.data) == 0:
             return "Coefficient of variation is undefined for empty data or data with a mean of zero"
         try:
-            flat = np.asarray(self.data, dtype=float).flatten()
-            if len(flat) == 0 or np.mean(flat) == 0:
+            stats = descriptive_stats(self.data)
+            if stats.size == 0 or stats.moments()["mean"] == 0:
                 return "Coefficient of variation is undefined for empty data or data with a mean of zero"
         except (ValueError, TypeError):
             return "Coefficient of variation is undefined for empty data or data with a mean of zero"
@@ -45,49 +51,65 @@ class CoefficientVariation:
         }
         return results
 
-    def compute(self):
-        # Perform the statistical computation and return a standardized result dictionary
-        reason = self._applicable()
-        if reason is not None:
-            return self._generate_return_structure_error(reason)
-
-        # Main Computation Logic
-        try:
-            data_array = np.asarray(self.data, dtype = float).flatten()
-            cv_value = float(variation(data_array, ddof=1))
-            mean_val = float(np.mean(data_array))
-            std_val = float(np.std(data_array, ddof=1))
-        except Exception as e:
-            return self._generate_return_structure_error(str(e))
-
-        precision_note = False
+    def _precision_note(self, cv_value, moments):
+        # Loss-of-precision note for one coefficient of variation
+        mean_val = moments["mean"]
+        std_val = moments["std"]
         if np.isnan(cv_value):
-            precision_note = (
+            return (
                 "NaN result: the coefficient of variation is undefined. Inputs likely "
                 "contained NaN, or both std and mean evaluated to zero. Clean the data "
                 "before re-running."
             )
-        elif np.isinf(cv_value):
-            precision_note = (
+        if np.isinf(cv_value):
+            return (
                 "Overflow detected: the coefficient of variation is infinite. "
                 "The mean is effectively zero, making CV undefined."
             )
-        elif cv_value != 0 and abs(cv_value) < 2.2250738585072014e-308:
-            precision_note = (
+        if cv_value != 0 and abs(cv_value) < 2.2250738585072014e-308:
+            return (
                 f"Subnormal result (|CV| ≈ {abs(cv_value):.3g}, below ~2.2e-308). "
                 "Float64 loses bits of precision in the subnormal range; treat "
                 "low-order digits as noise."
             )
-        elif std_val > 0 and abs(mean_val) < std_val * 1e-6:
-            precision_note = (
+        if std_val > 0 and abs(mean_val) < std_val * 1e-6:
+            return (
                 f"Near-zero mean detected (mean ≈ {mean_val:.3g}). The coefficient of "
                 "variation (std/mean) is highly sensitive to small changes in the mean "
                 "at this scale; the result may not be meaningful — Enhanced Precision "
                 "will expose how unstable the divisor is."
             )
+        return False
+
+    def _compute_per_column(self):
+        # One vectorized moment pass over every column (axis=1 of the data matrix)
+        try:
+            columns = descriptive_stats(self.data).columns()
+            cvs = columns.moments()["cv"]
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+
+        notes = [self._precision_note(cv_value, columns.moments_at(i)) for i, cv_value in enumerate(cvs)]
+        result = self._generate_return_structure(None)
+        return per_column_result(result, cvs.tolist(), notes, self.metadata)
+
+    def compute(self):
+        # Perform the statistical computation and return a standardized result dictionary
+        reason = self._applicable()
+        if reason is not None:
+            return self._generate_return_structure_error(reason)
+        if per_column_requested(self.params):
+            return self._compute_per_column()
+
+        # Main Computation Logic
+        try:
+            moments = descriptive_stats(self.data).moments()
+            cv_value = moments["cv"]
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
 
         result = self._generate_return_structure(cv_value)
-        result["loss_of_precision"] = precision_note
+        result["loss_of_precision"] = self._precision_note(cv_value, moments)
         return result
 
 
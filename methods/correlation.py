@@ -0,0 +1,189 @@
+"""Pairwise correlation matrices for Pearson and Spearman.
+
+With ``{"matrix": True}`` in their params, PearsonCoefficient and
+SpearmanCoefficient correlate every selected column with every other one
+in a single call, instead of only ``data[0]`` with ``data[1]``:
+
+    Pearson   columns centered and scaled to unit length, then one BLAS
+              matmul ``Z @ Z.T``
+    Spearman  the same over the rank matrix (ColumnStats.ranks, so each
+              column is sorted once per run, however many pairs it is in)
+
+Missing values (NaN) are handled pairwise-complete: each pair uses the
+rows where both of its columns are present, and ``n_obs`` records how
+many that was. With NaNs present Pearson runs four masked matmuls instead
+of the standardized one. Spearman re-ranks each pair involving a column
+with missing values on that pair's complete rows, since ranks depend on
+which rows take part.
+
+p-values are two-sided, from Student's t with n - 2 degrees of freedom,
+as scipy.stats.pearsonr and spearmanr report them.
+"""
+
+import numpy as np
+from scipy import stats
+
+try:
+    from .descriptive import average_ranks, column_names
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import average_ranks, column_names
+
+
+def matrix_requested(params) -> bool:
+    """True if Pearson / Spearman params ask for the pairwise matrix."""
+    return isinstance(params, dict) and bool(params.get("matrix"))
+
+
+def matrix_rows(data) -> np.ndarray:
+    """The (n_cols, n_rows) float matrix of *data*, checked for the matrix mode."""
+    rows = data if isinstance(data, np.ndarray) and data.ndim == 2 else np.array(data, dtype=float)
+    if rows.ndim != 2 or rows.shape[0] < 2:
+        raise ValueError("A correlation matrix requires at least 2 columns of equal length")
+    if rows.shape[1] == 0:
+        raise ValueError("No numerical data provided")
+    return rows
+
+
+def _standardized_correlation(rows) -> np.ndarray:
+    # NaN-free: Pearson's r of every pair from one matmul of unit-length,
+    # zero-mean columns (a constant column has no length and gives NaN)
+    centered = rows - rows.mean(axis=1, keepdims=True)
+    lengths = np.sqrt(np.einsum("ij,ij->i", centered, centered))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        unit = centered / lengths[:, None]
+    return unit @ unit.T
+
+
+def _pairwise_correlation(rows, present) -> np.ndarray:
+    # Sums over each pair's complete rows, from matmuls against the 0/1
+    # presence mask. Centering on each column's own mean first keeps the
+    # sum-of-squares differences from cancelling catastrophically.
+    mask = present.astype(float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centered = np.where(present, rows - np.nanmean(rows, axis=1, keepdims=True), 0.0)
+        n = mask @ mask.T
+        # sums[i, j]: column i summed over the rows where column j is present too
+        sums = centered @ mask.T
+        squares = (centered * centered) @ mask.T
+        products = centered @ centered.T
+        covariance = products - sums * sums.T / n
+        variance = squares - sums * sums / n
+        return covariance / np.sqrt(variance * variance.T)
+
+
+def _pearson_1d(x, y) -> float:
+    x = x - x.mean()
+    y = y - y.mean()
+    denominator = np.sqrt(np.dot(x, x) * np.dot(y, y))
+    return float(np.dot(x, y) / denominator) if denominator else float("nan")
+
+
+def p_values(r, n) -> np.ndarray:
+    """Two-sided p-values of correlations *r* over *n* observations each."""
+    r = np.asarray(r, dtype=float)
+    df = np.asarray(n, dtype=float) - 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.abs(r) * np.sqrt(df / ((1.0 - r) * (1.0 + r)))
+        p = 2.0 * stats.t.sf(t, df)
+    p = np.where(np.abs(r) >= 1.0, 0.0, p)
+    return np.where((df > 0) & ~np.isnan(r), p, np.nan)
+
+
+def correlation_matrix(columns, method: str = "pearson") -> dict:
+    """Pairwise r, p-values and observation counts of every pair of columns.
+
+    *columns* is the data's ColumnStats; Spearman reads its shared ranks.
+    Returns k x k arrays under "r", "p_values" and "n_obs", plus the indices
+    of columns that are constant (no correlation is defined) under
+    "constant".
+    """
+    rows = columns.rows
+    present = ~np.isnan(rows)
+    complete = bool(present.all())
+    k = columns.n_columns
+    if complete:
+        n_obs = np.full((k, k), columns.n_rows)
+    else:
+        counts = present.astype(np.int64)
+        n_obs = counts @ counts.T
+    # One distinct present value (an all-missing column has none)
+    constant = (
+        np.where(present, rows, np.inf).min(axis=1) == np.where(present, rows, -np.inf).max(axis=1)
+    )
+    if method == "spearman":
+        if complete:
+            r = _standardized_correlation(columns.ranks())
+        else:
+            r = np.empty((k, k))
+            full = present.all(axis=1)
+            shared = np.flatnonzero(full)
+            if shared.size:
+                # Columns without gaps share their whole-column ranks
+                ranks = np.stack([columns.ranks_at(i) for i in shared])
+                r[np.ix_(shared, shared)] = _standardized_correlation(ranks)
+            for i in range(k):
+                for j in range(i, k):
+                    if full[i] and full[j]:
+                        continue
+                    both = present[i] & present[j]
+                    r[i, j] = r[j, i] = _pearson_1d(
+                        average_ranks(rows[i][both]), average_ranks(rows[j][both])
+                    )
+    elif complete:
+        r = _standardized_correlation(rows)
+    else:
+        r = _pairwise_correlation(rows, present)
+
+    r = np.clip(r, -1.0, 1.0)
+    r[constant, :] = np.nan
+    r[:, constant] = np.nan
+    r[n_obs < 2] = np.nan
+    diagonal = np.arange(k)
+    r[diagonal, diagonal] = np.where(constant | (n_obs[diagonal, diagonal] < 2), np.nan, 1.0)
+    return {
+        "r": r,
+        "p_values": p_values(r, n_obs),
+        "n_obs": n_obs,
+        "constant": np.flatnonzero(constant).tolist(),
+        "complete": complete,
+    }
+
+
+def matrix_result(result: dict, matrix: dict, columns, metadata, magnitude_limit=None) -> dict:
+    """Turn a Pearson / Spearman result dict into its matrix form.
+
+    ``value`` becomes {"columns", "matrix", "p_values", "n_obs"} (nested
+    lists, row i / column j for the pair of columns i and j), and the
+    loss_of_precision note names constant columns, says when pairs were
+    computed on fewer rows because of missing values and, given
+    *magnitude_limit*, flags values beyond it.
+    """
+    names = column_names(metadata, columns.n_columns)
+    result["value"] = {
+        "columns": names,
+        "matrix": matrix["r"].tolist(),
+        "p_values": matrix["p_values"].tolist(),
+        "n_obs": matrix["n_obs"].tolist(),
+    }
+    notes = []
+    if matrix["constant"]:
+        notes.append(
+            "Correlation is undefined for columns with no variance (all values "
+            "identical): " + ", ".join(names[i] for i in matrix["constant"]) + "."
+        )
+    if not matrix["complete"]:
+        notes.append(
+            "Missing values: each pair was computed on the rows where both of its "
+            "columns are present (the count per pair is in n_obs)."
+        )
+    if magnitude_limit is not None:
+        magnitudes = np.abs(columns.rows)
+        if np.where(np.isnan(magnitudes), 0.0, magnitudes).max() > magnitude_limit:
+            notes.append(
+                f"Large-magnitude values detected (>{magnitude_limit:.0e}). Correlations "
+                "involve sums of squared values; intermediate products may lose "
+                "precision near float64 limits."
+            )
+    result["loss_of_precision"] = "\n".join(notes) if notes else False
+    return result
@@ -0,0 +1,611 @@
+"""Shared single-pass univariate summaries for the descriptive methods.
+
+Mean, Median, Variance, StandardDeviation, Percentile, CoefficientVariation
+and Mode all used to convert ``self.data`` to float64 and run their own
+NaN / inf / magnitude checks. When several of them run on the same
+``Message.data`` array, that is one conversion and one scan per method.
+
+``descriptive_stats(data)`` returns a :class:`DescriptiveStats` shared by
+every caller holding the same numpy array inside a
+``shared_descriptive_stats`` block, so a run pays for one float64
+conversion, one sort (median + percentiles), one moment pass (mean,
+variance, std, CV) and one diagnostics pass regardless of how many
+univariate methods were selected. Each piece is computed lazily on first
+use and is safe to read from the backend's worker threads concurrently.
+
+With ``{"per_column": True}`` in their params the univariate methods
+report one value per selected column instead of pooling them.
+``DescriptiveStats.columns()`` is the :class:`ColumnStats` engine behind
+that mode: the same pieces, computed along ``axis=1`` of the
+``(n_cols, n_rows)`` data matrix in one vectorized pass for all columns.
+
+``ColumnStats.ranks_at`` / ``ranks`` are the rank engine behind Spearman
+(and any rank-based method): average-tie ranks of a column from one
+argsort, computed once per column per run, so correlating N columns
+against each other costs N sorts rather than one per pair.
+
+``ColumnStats.co_moments`` is the bivariate kernel behind Pearson, Least
+Squares Regression and the best-fit chart: the means, sums of squared
+deviations and co-moment of a pair of columns from one chunked pass
+(``methods/sketches.co_moments``), kept per pair for the run. r, the
+least-squares line and R² are all read off it, so the two columns are
+converted and summed once however many of those run. ``pair_columns``
+gives a two-column method the run's ColumnStats for its ``data[0]`` /
+``data[1]``.
+
+``mode_counts`` is Mode's counting engine: every most frequent value and
+its count from one hashed (or, for compact integers, bincounted) pass.
+
+With ``{"approximate": True}`` (and optionally a ``"rank_error"`` target)
+Median and Percentile read their values off per-column KLL sketches from
+``methods/sketches.sketch_store`` instead of sorting the data, and report
+the sketch's rank error bound in the result's ``"rank_error"``. Sketches
+outlive the run, so asking for other percentiles of the same column later
+costs a lookup rather than a sort.
+"""
+
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .sketches import (
+        CoMoments,
+        DEFAULT_K,
+        QuantileSketch,
+        approximate_note,
+        co_moments,
+        k_for_rank_error,
+        sketch_store,
+    )
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from sketches import (
+        CoMoments,
+        DEFAULT_K,
+        QuantileSketch,
+        approximate_note,
+        co_moments,
+        k_for_rank_error,
+        sketch_store,
+    )
+
+
+class DescriptiveStats:
+    def __init__(self, data):
+        self._data = data
+        self._lock = threading.RLock()
+        self._values = None
+        self._sorted = None
+        self._moments = None
+        self._diagnostics = None
+        self._magnitude_ratio = None
+        self._magnitude_ratio_done = False
+        self._columns = None
+        self._sketches = {}
+
+    @property
+    def values(self) -> np.ndarray:
+        """Flattened float64 view of the data (the single conversion)."""
+        if self._values is None:
+            with self._lock:
+                if self._values is None:
+                    self._values = np.asarray(self._data, dtype=float).reshape(-1)
+        return self._values
+
+    @property
+    def size(self) -> int:
+        return int(self.values.size)
+
+    @property
+    def sorted_values(self) -> np.ndarray:
+        """Sorted copy of the values; NaNs sort to the end."""
+        if self._sorted is None:
+            with self._lock:
+                if self._sorted is None:
+                    self._sorted = np.sort(self.values)
+        return self._sorted
+
+    def moments(self) -> dict:
+        """Mean, sample variance (ddof=1), sample std and CV from one pass.
+
+        Matches np.mean / np.var(ddof=1) / np.std(ddof=1) bit-for-bit:
+        the mean is a pairwise sum and the variance is the two-pass sum
+        of squared deviations numpy itself uses.
+        """
+        if self._moments is None:
+            with self._lock:
+                if self._moments is None:
+                    values = self.values
+                    n = values.size
+                    if n == 0:
+                        raise ValueError("No numerical data provided")
+                    with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+                        mean = float(np.mean(values))
+                        if n > 1:
+                            deviations = values - mean
+                            variance = float(np.sum(deviations * deviations) / (n - 1))
+                        else:
+                            variance = float("nan")
+                        std = float(np.sqrt(variance))
+                        cv = std / mean if mean != 0 else float("nan")
+                    self._moments = {
+                        "n": int(n),
+                        "mean": mean,
+                        "variance": variance,
+                        "std": std,
+                        "cv": float(cv),
+                    }
+        return self._moments
+
+    def diagnostics(self) -> dict:
+        """Precision diagnostics shared by every method's loss_of_precision note.
+
+        ``max_abs``, ``min`` and ``max`` keep numpy's NaN-propagating
+        semantics so the per-method checks behave exactly as before.
+        """
+        if self._diagnostics is None:
+            with self._lock:
+                if self._diagnostics is None:
+                    values = self.values
+                    if values.size == 0:
+                        raise ValueError("No numerical data provided")
+                    abs_values = np.abs(values)
+                    nan_mask = np.isnan(values)
+                    has_nan = bool(nan_mask.any())
+                    has_inf = bool(np.isinf(abs_values).any())
+                    self._diagnostics = {
+                        "has_nan": has_nan,
+                        "has_inf": has_inf,
+                        "all_finite": not (has_nan or has_inf),
+                        "max_abs": float(abs_values.max()),
+                        "min": float(values.min()),
+                        "max": float(values.max()),
+                    }
+        return self._diagnostics
+
+    def magnitude_ratio(self) -> float | None:
+        """Largest / smallest non-zero finite magnitude, or None if < 2 such values."""
+        if not self._magnitude_ratio_done:
+            with self._lock:
+                if not self._magnitude_ratio_done:
+                    values = self.values
+                    finite = values[np.isfinite(values)]
+                    nonzero = np.abs(finite[finite != 0])
+                    if nonzero.size > 1:
+                        self._magnitude_ratio = float(nonzero.max() / nonzero.min())
+                    self._magnitude_ratio_done = True
+        return self._magnitude_ratio
+
+    def columns(self) -> "ColumnStats":
+        """Per-column engine over the same data (shares its float conversion)."""
+        if self._columns is None:
+            with self._lock:
+                if self._columns is None:
+                    values = self.values
+                    shape = np.shape(self._data)
+                    rows = values.reshape(shape[0], -1) if len(shape) == 2 else values.reshape(1, -1)
+                    self._columns = ColumnStats(rows)
+        return self._columns
+
+    def quantile_sketch(self, k: int) -> QuantileSketch:
+        """Sketch of all the values: the merge of the stored per-column sketches."""
+        sketch = self._sketches.get(k)
+        if sketch is None:
+            with self._lock:
+                sketch = self._sketches.get(k)
+                if sketch is None:
+                    sketch = QuantileSketch(k)
+                    for column_sketch in self.columns().quantile_sketches(k):
+                        sketch.merge(column_sketch)
+                    self._sketches[k] = sketch
+        return sketch
+
+    def median(self) -> float:
+        """Median read off the shared sorted array (matches np.median)."""
+        n = self.size
+        if n == 0:
+            raise ValueError("No numerical data provided")
+        if self.diagnostics()["has_nan"]:
+            return float("nan")
+        ordered = self.sorted_values
+        mid = n // 2
+        if n % 2:
+            return float(ordered[mid])
+        with np.errstate(invalid="ignore", over="ignore"):
+            return float(np.mean(ordered[mid - 1:mid + 1]))
+
+    def percentiles(self, percents) -> list[float]:
+        """Linear-interpolated percentiles read off the shared sorted array.
+
+        Uses numpy's "linear" method and lerp formula so results match
+        np.percentile exactly, without a fresh partition per request.
+        """
+        n = self.size
+        if n == 0:
+            raise IndexError("cannot compute percentiles of an empty array")
+        if self.diagnostics()["has_nan"]:
+            return [float("nan")] * np.asarray(percents).size
+        return [float(v) for v in _lerp_percentiles(self.sorted_values, n, percents)]
+
+
+def _lerp_percentiles(ordered, n, percents) -> np.ndarray:
+    """np.percentile's "linear" method over the last axis of sorted *ordered*."""
+    quantiles = np.true_divide(np.asarray(percents, dtype=float).reshape(-1), 100)
+    virtual = (n - 1) * quantiles
+    previous = np.clip(np.floor(virtual).astype(np.intp), 0, n - 1)
+    following = np.clip(previous + 1, 0, n - 1)
+    gamma = virtual - previous
+    lower = ordered[..., previous]
+    upper = ordered[..., following]
+    with np.errstate(invalid="ignore", over="ignore"):
+        diff = upper - lower
+        result = lower + diff * gamma
+        high = np.broadcast_to(gamma >= 0.5, result.shape)
+        result[high] = (upper - diff * (1 - gamma))[high]
+    return result
+
+
+def average_ranks(values) -> np.ndarray:
+    """Ranks 1..n along the last axis, ties sharing their average rank.
+
+    Matches scipy.stats.rankdata(method="average") on NaN-free data, from
+    one argsort per row (ties are averaged, so the sort needn't be stable).
+    NaNs (which rankdata propagates) rank last and are never tied; callers
+    check for them separately.
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.shape[-1]
+    ranks = np.empty(values.shape)
+    if n == 0:
+        return ranks
+    order = np.argsort(values, axis=-1)
+    ordered = np.take_along_axis(values, order, axis=-1)
+    # True at the first position of each run of equal values (and of each row)
+    starts = np.ones(values.shape, dtype=bool)
+    starts[..., 1:] = ordered[..., 1:] != ordered[..., :-1]
+    starts = starts.reshape(-1)
+    first = np.flatnonzero(starts)
+    last = np.append(first[1:], starts.size) - 1
+    # Runs never cross rows, so positions within a row are flat positions mod n
+    average = (first % n + last % n) / 2.0 + 1.0
+    ranked = average[np.cumsum(starts) - 1].reshape(values.shape)
+    np.put_along_axis(ranks, order, ranked, axis=-1)
+    return ranks
+
+
+class ColumnStats:
+    """DescriptiveStats' pieces per column, vectorized along axis=1.
+
+    ``rows`` is the float64 ``(n_cols, n_rows)`` matrix; every summary is an
+    array with one entry per column, matching what DescriptiveStats would
+    report for that column alone. ``moments_at`` / ``diagnostics_at`` give
+    one column's entries as the scalar dicts the methods' precision checks
+    already read.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self._lock = threading.RLock()
+        self._sorted = None
+        self._moments = None
+        self._diagnostics = None
+        self._magnitude_ratio = None
+        self._sketches = {}
+        self._ranks = {}
+        self._co_moments = {}
+
+    @property
+    def n_columns(self) -> int:
+        return int(self.rows.shape[0])
+
+    @property
+    def n_rows(self) -> int:
+        return int(self.rows.shape[1])
+
+    @property
+    def sorted_rows(self) -> np.ndarray:
+        """Each column sorted; NaNs sort to the end."""
+        if self._sorted is None:
+            with self._lock:
+                if self._sorted is None:
+                    self._sorted = np.sort(self.rows, axis=1)
+        return self._sorted
+
+    def moments(self) -> dict:
+        """Per-column mean, sample variance (ddof=1), sample std and CV."""
+        if self._moments is None:
+            with self._lock:
+                if self._moments is None:
+                    rows = self.rows
+                    n = self.n_rows
+                    if n == 0:
+                        raise ValueError("No numerical data provided")
+                    with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+                        mean = np.mean(rows, axis=1)
+                        if n > 1:
+                            deviations = rows - mean[:, None]
+                            variance = np.sum(deviations * deviations, axis=1) / (n - 1)
+                        else:
+                            variance = np.full(self.n_columns, np.nan)
+                        std = np.sqrt(variance)
+                        cv = np.where(mean != 0, std / np.where(mean != 0, mean, 1.0), np.nan)
+                    self._moments = {
+                        "n": n,
+                        "mean": mean,
+                        "variance": variance,
+                        "std": std,
+                        "cv": cv,
+                    }
+        return self._moments
+
+    def diagnostics(self) -> dict:
+        """Per-column precision diagnostics (same keys as DescriptiveStats)."""
+        if self._diagnostics is None:
+            with self._lock:
+                if self._diagnostics is None:
+                    rows = self.rows
+                    if self.n_rows == 0:
+                        raise ValueError("No numerical data provided")
+                    abs_rows = np.abs(rows)
+                    has_nan = np.isnan(rows).any(axis=1)
+                    has_inf = np.isinf(abs_rows).any(axis=1)
+                    self._diagnostics = {
+                        "has_nan": has_nan,
+                        "has_inf": has_inf,
+                        "all_finite": ~(has_nan | has_inf),
+                        "max_abs": abs_rows.max(axis=1),
+                        "min": rows.min(axis=1),
+                        "max": rows.max(axis=1),
+                    }
+        return self._diagnostics
+
+    def magnitude_ratio(self) -> np.ndarray:
+        """Per-column largest / smallest non-zero finite magnitude; NaN if < 2 such values."""
+        if self._magnitude_ratio is None:
+            with self._lock:
+                if self._magnitude_ratio is None:
+                    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+                        magnitudes = np.abs(self.rows)
+                        usable = np.isfinite(magnitudes) & (magnitudes != 0)
+                        largest = np.where(usable, magnitudes, -np.inf).max(axis=1)
+                        smallest = np.where(usable, magnitudes, np.inf).min(axis=1)
+                        self._magnitude_ratio = np.where(
+                            usable.sum(axis=1) > 1, largest / smallest, np.nan)
+        return self._magnitude_ratio
+
+    def magnitude_ratio_at(self, column: int) -> float | None:
+        ratio = float(self.magnitude_ratio()[column])
+        return None if np.isnan(ratio) else ratio
+
+    def moments_at(self, column: int) -> dict:
+        return {k: v if k == "n" else float(v[column]) for k, v in self.moments().items()}
+
+    def diagnostics_at(self, column: int) -> dict:
+        return {k: v[column].item() for k, v in self.diagnostics().items()}
+
+    def median(self) -> np.ndarray:
+        """Per-column median (matches np.median(rows, axis=1))."""
+        n = self.n_rows
+        if n == 0:
+            raise ValueError("No numerical data provided")
+        ordered = self.sorted_rows
+        mid = n // 2
+        if n % 2:
+            medians = ordered[:, mid].copy()
+        else:
+            with np.errstate(invalid="ignore", over="ignore"):
+                medians = np.mean(ordered[:, mid - 1:mid + 1], axis=1)
+        medians[self.diagnostics()["has_nan"]] = np.nan
+        return medians
+
+    def percentiles(self, percents) -> np.ndarray:
+        """(n_cols, n_percents) linear-interpolated percentiles per column."""
+        n = self.n_rows
+        if n == 0:
+            raise IndexError("cannot compute percentiles of an empty array")
+        result = _lerp_percentiles(self.sorted_rows, n, percents)
+        result[self.diagnostics()["has_nan"]] = np.nan
+        return result
+
+
+    def ranks_at(self, column: int) -> np.ndarray:
+        """Average-tie ranks of one column, ranked once and then reused."""
+        ranks = self._ranks.get(column)
+        if ranks is None:
+            with self._lock:
+                ranks = self._ranks.get(column)
+                if ranks is None:
+                    ranks = self._ranks[column] = average_ranks(self.rows[column])
+        return ranks
+
+    def ranks(self) -> np.ndarray:
+        """(n_cols, n_rows) average-tie ranks; columns not yet ranked are ranked together."""
+        with self._lock:
+            missing = [i for i in range(self.n_columns) if i not in self._ranks]
+            if missing:
+                for i, ranks in zip(missing, average_ranks(self.rows[missing])):
+                    self._ranks[i] = ranks
+            return np.stack([self._ranks[i] for i in range(self.n_columns)])
+
+    def co_moments(self, x: int = 0, y: int = 1) -> CoMoments:
+        """Co-moments of columns x and y, accumulated once and then reused.
+
+        Rows missing either value are left out and counted in ``missing``.
+        """
+        pair = self._co_moments.get((x, y))
+        if pair is None:
+            with self._lock:
+                pair = self._co_moments.get((x, y))
+                if pair is None:
+                    pair = self._co_moments[(x, y)] = co_moments(self.rows[x], self.rows[y])
+        return pair
+
+    def quantile_sketches(self, k: int) -> list:
+        """One QuantileSketch per column, shared through sketch_store."""
+        sketches = self._sketches.get(k)
+        if sketches is None:
+            with self._lock:
+                sketches = self._sketches.get(k)
+                if sketches is None:
+                    sketches = [sketch_store.get_or_build(row, k) for row in self.rows]
+                    self._sketches[k] = sketches
+        return sketches
+
+
+def mode_counts(values, limit: int | None = None) -> tuple[list, int, int]:
+    """(modes, count, n_modes): the most frequent values of *values*, how often
+    each occurs and how many values tie for most frequent.
+
+    Ties are returned in order of first appearance (the first *limit* of
+    them), so ``modes[0]`` is what statistics.mode would pick. Integers
+    (and booleans, counted as 0/1) with a compact range are counted with
+    np.bincount; floats, strings and mixed objects are hashed once with
+    pd.factorize. NaN never equals itself, so it is not counted: an all-NaN
+    input has the single mode NaN, occurring once.
+    """
+    values = np.asarray(values).reshape(-1)
+    if values.size == 0:
+        raise ValueError("no mode for empty data")
+    if values.dtype.kind == "b":
+        values = values.astype(np.uint8)
+    if values.dtype.kind in "iu":
+        low, high = int(values.min()), int(values.max())
+        span = high - low + 1
+        if span <= max(1024, 2 * values.size):
+            codes = (values - values.dtype.type(low)).astype(np.intp)
+            counts = np.bincount(codes, minlength=span)
+            best = int(counts.max())
+            tied = np.flatnonzero(counts == best)
+            if tied.size > 1:
+                # Reversed assignment leaves each code's first position
+                first = np.empty(span, dtype=np.intp)
+                first[codes[::-1]] = np.arange(codes.size - 1, -1, -1)
+                tied = tied[np.argsort(first[tied], kind="stable")]
+            return [low + int(code) for code in tied[:limit]], best, int(tied.size)
+    codes, uniques = pd.factorize(values)
+    present = codes[codes >= 0]
+    if present.size == 0:
+        return [values[0]], 1, 1
+    counts = np.bincount(present, minlength=len(uniques))
+    best = int(counts.max())
+    # factorize numbers values in order of first appearance
+    tied = np.flatnonzero(counts == best)
+    return [uniques[code] for code in tied[:limit]], best, int(tied.size)
+
+
+def pair_columns(data) -> ColumnStats:
+    """ColumnStats for a two-column method's ``data[0]`` and ``data[1]``.
+
+    The run's shared engine when *data* is the (n_cols, n_rows) data
+    matrix, so its cached co-moments and ranks are reused; otherwise a
+    fresh one over just the two columns.
+    """
+    if isinstance(data, np.ndarray) and data.ndim == 2:
+        return descriptive_stats(data).columns()
+    return ColumnStats(np.array([data[0], data[1]], dtype=float))
+
+
+def per_column_requested(params) -> bool:
+    """True if a univariate method's params ask for per-column results."""
+    return isinstance(params, dict) and bool(params.get("per_column"))
+
+
+def approximate_requested(params) -> bool:
+    """True if Median / Percentile params ask for sketch-based quantiles."""
+    return isinstance(params, dict) and bool(params.get("approximate"))
+
+
+def sketch_k(params) -> int:
+    """KLL k meeting the params' "rank_error" target (DEFAULT_K if none is given)."""
+    rank_error = params.get("rank_error") if isinstance(params, dict) else None
+    if rank_error is None:
+        return DEFAULT_K
+    return k_for_rank_error(float(rank_error))
+
+
+def approximate_result(result: dict, sketches: list) -> dict:
+    """Record on *result* the rank error bound of the sketches it was read from.
+
+    ``rank_error`` is the largest bound of *sketches* (0.0 while they are all
+    still exact); once any of them has compacted, its loss_of_precision note
+    says the values are approximate.
+    """
+    note = approximate_note(sketches)
+    if note:
+        previous = result["loss_of_precision"]
+        result["loss_of_precision"] = f"{previous}\n{note}" if previous else note
+    result["rank_error"] = max(sketch.rank_error() for sketch in sketches)
+    return result
+
+
+def column_names(metadata, count: int) -> list[str]:
+    """Display names of the data's columns, from metadata["columns"] when it fits."""
+    names = metadata.get("columns") if isinstance(metadata, dict) else None
+    if isinstance(names, (list, tuple)) and len(names) == count:
+        return [str(name) for name in names]
+    return [f"Column {i + 1}" for i in range(count)]
+
+
+def per_column_result(result: dict, values: list, notes: list, metadata) -> dict:
+    """Turn a method's result dict into its per-column form.
+
+    ``value`` becomes the list of per-column values and ``columns`` the
+    matching column names; per-column precision notes are combined into
+    one ``loss_of_precision`` note prefixed by column name.
+    """
+    names = column_names(metadata, len(values))
+    result["value"] = values
+    result["columns"] = names
+    flagged = [f"{name}: {note}" for name, note in zip(names, notes) if note]
+    result["loss_of_precision"] = "\n".join(flagged) if flagged else False
+    return result
+
+
+_registry: dict = {}
+_registry_lock = threading.Lock()
+
+
+@contextmanager
+def shared_descriptive_stats(data):
+    """Share one DescriptiveStats for *data* with every method run inside the block.
+
+    BackendHandler wraps a request's method dispatch in this so that all
+    univariate methods computing on the same ``Message.data`` array reuse
+    one conversion / sort / moment pass. The engine (and its sorted copy)
+    is released as soon as the last overlapping block for that array exits.
+    """
+    if not isinstance(data, np.ndarray):
+        yield None
+        return
+
+    key = id(data)
+    with _registry_lock:
+        entry = _registry.get(key)
+        if entry is None or entry[0] is not data:
+            entry = [data, DescriptiveStats(data), 0]
+            _registry[key] = entry
+        entry[2] += 1
+        stats = entry[1]
+    try:
+        yield stats
+    finally:
+        with _registry_lock:
+            entry[2] -= 1
+            if entry[2] <= 0 and _registry.get(key) is entry:
+                _registry.pop(key, None)
+
+
+def descriptive_stats(data) -> DescriptiveStats:
+    """Return the DescriptiveStats for *data*.
+
+    Inside a ``shared_descriptive_stats(data)`` block this is the shared
+    engine; anywhere else (unit tests, ad-hoc calls) it is a fresh one.
+    """
+    with _registry_lock:
+        entry = _registry.get(id(data))
+        if entry is not None and entry[0] is data:
+            return entry[1]
+    return DescriptiveStats(data)
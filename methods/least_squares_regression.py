@@ -1,8 +1,19 @@
-import base64
-from io import BytesIO
+import os
 
 import numpy as np
 
+try:
+    from .descriptive import descriptive_stats, pair_columns
+    from .regression import regression_requested, regression_result
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import descriptive_stats, pair_columns
+    from regression import regression_requested, regression_result
+
+# Most points the deferred chart scatters; larger selections are reduced
+# with LTTB (charts/downsample.py) first.
+_CHART_POINTS = 5_000
+
 
 class LeastSquaresRegression:
     def __init__(self, data, metadata, params=None):
@@ -39,88 +50,67 @@ class LeastSquaresRegression:
             "params_used": self.params
         }
 
+    def _compute_model(self):
+        # {"degree": k} / {"model": ...}: polynomial, multiple and batched
+        # fits through the QR engine (methods/regression.py)
+        try:
+            rows = descriptive_stats(self.data).columns().rows
+            result = regression_result(
+                self._generate_return_structure(None), rows, self.metadata, self.params
+            )
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+        return result
+
     def compute(self):
         # Perform the statistical computation and return a standardized result dictionary
+        if regression_requested(self.params):
+            return self._compute_model()
         reason = self._applicable()
         if reason is not None:
             return self._generate_return_structure_error(reason)
         
         try:
-            import matplotlib
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
-
-            # Turn the xs and ys into np arrays
-            x = np.array(self.data[0], dtype=float)
-            y = np.array(self.data[1], dtype=float)
-
-            # Calculate the slope and intercept with np
-            slope, intercept = np.polyfit(x, y, 1)
-
-            # R-squared
-            y_pred = slope * x + intercept
-            ss_res = float(np.sum((y - y_pred) ** 2))
-            ss_tot = float(np.sum((y - np.mean(y)) ** 2))
-            r_squared = 1 - ss_res / ss_tot if ss_tot != 0 else 0.0
+            # Slope, intercept and R² from the run's shared co-moments of the
+            # pair (the kernel Pearson and the best-fit chart read too)
+            columns = pair_columns(self.data)
+            x, y = columns.rows[0], columns.rows[1]
+            pair = columns.co_moments(0, 1)
+            if pair.missing:
+                # A missing value propagates, as it does through Pearson
+                fit = dict.fromkeys(("slope", "intercept", "r_squared"), float("nan"))
+            else:
+                fit = pair.regression()
+            slope, intercept, r_squared = fit["slope"], fit["intercept"], fit["r_squared"]
 
             equation = f"y = {slope:.3f}x + {intercept:.3f}"
 
-            # Generate scatter + regression line chart
-            fig, ax = plt.subplots(figsize=(5, 4))
-            fig.patch.set_facecolor("#1e2530")
-            ax.set_facecolor("#1e2530")
-            ax.scatter(x, y, color="steelblue", alpha=0.7, s=20, label="Data")
-            x_line = np.linspace(x.min(), x.max(), 300)
-            ax.plot(x_line, slope * x_line + intercept,
-                    color="#e4781d", linewidth=2, label="Fit")
-            ax.set_xlabel("x", color="white")
-            ax.set_ylabel("y", color="white")
-            ax.tick_params(colors="white")
-            for spine in ax.spines.values():
-                spine.set_edgecolor((1, 1, 1, 0.3))
-            ax.legend(facecolor="#1e2530", labelcolor="white", framealpha=0.6)
-            plt.tight_layout()
-
-            buf = BytesIO()
-            fig.savefig(buf, format="png", bbox_inches="tight", dpi=100,
-                        facecolor=fig.get_facecolor(), edgecolor="none")
-            plt.close(fig)
-            buf.seek(0)
-            chart_b64 = base64.b64encode(buf.read()).decode("utf-8")
-
             value = {
                 "slope":     float(slope),
                 "intercept": float(intercept),
                 "r_squared": float(r_squared),
                 "equation":  equation,
-                "chart":     chart_b64,
+                # Drawn on demand by create_graphic() once the handler has
+                # given it a path (backend_support/method_charts.py)
+                "chart":     {"deferred": True, "path": None},
             }
 
             # Precision / conditioning check
             precision_note = False
-            x_std = float(np.std(x))
-            if (
+            if pair.m2_x == 0 and not pair.missing:
+                precision_note = (
+                    "Degenerate x: all x values are identical, so the regression "
+                    "has no defined slope. Provide x values that vary."
+                )
+            elif (
                 np.isnan(slope) or np.isnan(intercept) or np.isnan(r_squared)
                 or np.isinf(slope) or np.isinf(intercept)
             ):
                 precision_note = (
                     "NaN/Inf in regression coefficients. The fit failed numerically "
-                    "— inputs likely contained NaN/Inf, or the design matrix was "
-                    "singular (e.g. all x values identical). Clean the data or "
-                    "vary the x column before re-running."
-                )
-            elif x_std == 0:
-                # polyfit silently returns finite-but-meaningless coefficients when
-                # x has no variation. Without this guard, Enhanced Precision would
-                # display ~17 digits of pure floating-point noise as if they were
-                # signal — exactly the failure mode the toggle's notice warns about.
-                precision_note = (
-                    "Degenerate x: all x values are identical, so the regression "
-                    "has no defined slope. The numerical solver returned finite "
-                    "coefficients but they are floating-point noise rather than a "
-                    "real fit. Provide x values that vary."
+                    "— inputs likely contained NaN/Inf. Clean the data before re-running."
                 )
-            elif np.abs(x).max() > 1e12 or np.abs(y).max() > 1e12:
+            elif pair.max_abs > 1e12:
                 precision_note = (
                     "Large-magnitude values detected (>1e12). Least squares regression "
                     "solves a normal-equations system whose condition number grows with "
@@ -129,7 +119,7 @@ class LeastSquaresRegression:
                 )
             else:
                 x_range = float(x.max() - x.min())
-                x_mean_abs = abs(float(x.mean()))
+                x_mean_abs = abs(pair.mean_x)
                 if x_mean_abs > 1e6 and x_range > 0 and x_range < x_mean_abs * 1e-4:
                     precision_note = (
                         "Ill-conditioned x values: the x range is very small relative to "
@@ -145,6 +135,43 @@ class LeastSquaresRegression:
         return results
 
     def create_graphic(self, results):
-        # No standalone graphic for least squares regression
-        # (the best_fit chart class handles the visualization)
-        pass
+        # Draw the scatter + regression line PNG of a computed result to
+        # results["value"]["chart"]["path"]; only called when the results
+        # page first shows it, so matplotlib stays off the compute path
+        from matplotlib.figure import Figure
+        from charts.downsample import lttb_indices
+
+        value = results["value"]
+        path = value["chart"]["path"]
+        slope, intercept = value["slope"], value["intercept"]
+        columns = pair_columns(self.data)
+        x, y = columns.rows[0], columns.rows[1]
+        finite = np.isfinite(x) & np.isfinite(y)
+        x, y = x[finite], y[finite]
+        shown = lttb_indices(x, y, _CHART_POINTS)
+
+        fig = Figure(figsize=(5, 4))
+        ax = fig.subplots()
+        fig.patch.set_facecolor("#1e2530")
+        ax.set_facecolor("#1e2530")
+        ax.scatter(x[shown], y[shown], color="steelblue", alpha=0.7, s=20, label="Data")
+        x_line = np.linspace(np.min(x), np.max(x), 300)
+        ax.plot(x_line, slope * x_line + intercept,
+                color="#e4781d", linewidth=2, label="Fit")
+        ax.set_xlabel("x", color="white")
+        ax.set_ylabel("y", color="white")
+        ax.tick_params(colors="white")
+        for spine in ax.spines.values():
+            spine.set_edgecolor((1, 1, 1, 0.3))
+        ax.legend(facecolor="#1e2530", labelcolor="white", framealpha=0.6)
+        fig.tight_layout()
+
+        output_dir = os.path.dirname(path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        # Written under a temporary name so a half-written file is never shown
+        partial = f"{path}.partial"
+        fig.savefig(partial, format="png", bbox_inches="tight", dpi=100,
+                    facecolor=fig.get_facecolor(), edgecolor="none")
+        os.replace(partial, path)
+        return path
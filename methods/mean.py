@@ -1,5 +1,12 @@
 import numpy as np
 
+try:
+    from .descriptive import descriptive_stats, per_column_requested, per_column_result
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import descriptive_stats, per_column_requested, per_column_result
+
+
 class Mean:
     def __init__(self, data, metadata, params=None):
         # Initialize the statistic with an ID and optional parameters
@@ -38,58 +45,79 @@ class Mean:
         }
         return results
 
-    def compute(self):
-        # Perform the statistical computation and return a standardized result dictionary
-        reason = self._applicable()
-        if reason is not None:
-            return self._generate_return_structure_error(reason)
-
-        # Placeholder for the main computation logic
-        try:
-            data_array = np.asarray(self.data, dtype = float)
-            mean_value = float(np.mean(data_array))
-        except Exception as e:
-            return self._generate_return_structure_error(str(e))
-
-        precision_note = False
+    def _precision_note(self, mean_value, diagnostics, magnitude_ratio):
+        # Loss-of-precision note for one mean; magnitude_ratio() is only
+        # evaluated when the cheaper checks come up clean
         if np.isnan(mean_value):
-            precision_note = (
+            return (
                 "NaN result: the mean is undefined. Inputs likely contained NaN, "
                 "or an undefined operation (0/0, inf-inf) occurred during summation. "
                 "Clean the data before re-running."
             )
-        elif np.isinf(mean_value):
-            precision_note = (
+        if np.isinf(mean_value):
+            return (
                 "Overflow detected: the mean is infinite. Values exceed the float64 "
                 "range (~1.8e308) or the running sum overflowed mid-computation."
             )
-        elif np.abs(data_array).max() > 1e15:
-            precision_note = (
+        if diagnostics["max_abs"] > 1e15:
+            return (
                 "Large-magnitude values detected (>1e15). Floating-point summation "
                 "may lose precision beyond 15-16 significant digits — Enhanced "
                 "Precision will display digits past that point but they reflect "
                 "rounding error rather than computed signal."
             )
-        elif mean_value != 0 and abs(mean_value) < 2.2250738585072014e-308:
-            precision_note = (
+        if mean_value != 0 and abs(mean_value) < 2.2250738585072014e-308:
+            return (
                 f"Subnormal result (|mean| ≈ {abs(mean_value):.3g}, below ~2.2e-308). "
                 "Float64 loses bits of precision in the subnormal range; treat "
                 "low-order digits as noise."
             )
-        else:
-            finite = data_array[np.isfinite(data_array)]
-            nonzero = np.abs(finite[finite != 0])
-            if nonzero.size > 1:
-                ratio = float(nonzero.max() / nonzero.min())
-                if ratio > 1e15:
-                    precision_note = (
-                        f"Mixed-magnitude inputs (largest/smallest ≈ {ratio:.2g}). "
-                        "Float64 summation order materially affects the result when "
-                        "terms span this many orders of magnitude."
-                    )
+        ratio = magnitude_ratio()
+        if ratio is not None and ratio > 1e15:
+            return (
+                f"Mixed-magnitude inputs (largest/smallest ≈ {ratio:.2g}). "
+                "Float64 summation order materially affects the result when "
+                "terms span this many orders of magnitude."
+            )
+        return False
+
+    def _compute_per_column(self):
+        # One vectorized pass over every column (axis=1 of the data matrix)
+        try:
+            columns = descriptive_stats(self.data).columns()
+            means = columns.moments()["mean"]
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+
+        notes = [
+            self._precision_note(
+                mean_value, columns.diagnostics_at(i), lambda i=i: columns.magnitude_ratio_at(i)
+            )
+            for i, mean_value in enumerate(means)
+        ]
+        result = self._generate_return_structure(None)
+        return per_column_result(result, means.tolist(), notes, self.metadata)
+
+    def compute(self):
+        # Perform the statistical computation and return a standardized result dictionary
+        reason = self._applicable()
+        if reason is not None:
+            return self._generate_return_structure_error(reason)
+        if per_column_requested(self.params):
+            return self._compute_per_column()
+
+        # Placeholder for the main computation logic
+        try:
+            stats = descriptive_stats(self.data)
+            mean_value = stats.moments()["mean"]
+            diagnostics = stats.diagnostics()
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
 
         result = self._generate_return_structure(mean_value)
-        result["loss_of_precision"] = precision_note
+        result["loss_of_precision"] = self._precision_note(
+            mean_value, diagnostics, stats.magnitude_ratio
+        )
         return result
 
 
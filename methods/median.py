@@ -1,5 +1,26 @@
 import numpy as np
 
+try:
+    from .descriptive import (
+        approximate_requested,
+        approximate_result,
+        descriptive_stats,
+        per_column_requested,
+        per_column_result,
+        sketch_k,
+    )
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import (
+        approximate_requested,
+        approximate_result,
+        descriptive_stats,
+        per_column_requested,
+        per_column_result,
+        sketch_k,
+    )
+
+
 class Median:
     def __init__(self, data, metadata, params=None):
         # Initialize the statistic with an ID and optional parameters
@@ -38,39 +59,89 @@ class Median:
         }
         return results
 
-    def compute(self):
-        # Perform the statistical computation and return a standardized result dictionary
-        reason = self._applicable()
-        if reason is not None:
-            return self._generate_return_structure_error(reason)
-        
-        # Main Computation Logic
-        try:
-            data_array = np.asarray(self.data, dtype = float)
-            median_value = float(np.median(data_array))
-        except Exception as e:
-            return self._generate_return_structure_error(str(e))
-
-        precision_note = False
+    def _precision_note(self, median_value, diagnostics):
+        # Loss-of-precision note for one median
         if np.isinf(median_value):
-            precision_note = (
+            return (
                 "Overflow detected: the median is infinite. The selected data "
                 "contains values outside the float64 range (~1.8e308)."
             )
-        elif np.isnan(median_value):
-            precision_note = (
+        if np.isnan(median_value):
+            return (
                 "NaN result: the input contains NaN values that propagated through "
                 "the median computation. Clean the data before re-running."
             )
-        elif np.abs(data_array).max() > 1e15:
-            precision_note = (
+        if diagnostics["max_abs"] > 1e15:
+            return (
                 "Large-magnitude values detected (>1e15). Median is sort-based and "
                 "robust, but the underlying values may already exceed the 15-16 "
                 "significant-digit precision of float64."
             )
+        return False
+
+    def _compute_per_column(self):
+        # One sort of every column (axis=1 of the data matrix)
+        try:
+            columns = descriptive_stats(self.data).columns()
+            medians = columns.median()
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+
+        notes = [
+            self._precision_note(median_value, columns.diagnostics_at(i))
+            for i, median_value in enumerate(medians)
+        ]
+        result = self._generate_return_structure(None)
+        return per_column_result(result, medians.tolist(), notes, self.metadata)
+
+    def _compute_approximate(self):
+        # {"approximate": True}: medians read off the stored quantile
+        # sketches (pooled: their merge) instead of a sort of the data
+        try:
+            k = sketch_k(self.params)
+            stats = descriptive_stats(self.data)
+            if per_column_requested(self.params):
+                sketches = stats.columns().quantile_sketches(k)
+            else:
+                sketches = [stats.quantile_sketch(k)]
+            # The sketches track what the precision checks need, so a
+            # repeat query never scans the data beyond finding its sketches
+            diagnostics = [sketch.diagnostics() for sketch in sketches]
+            # NaN propagates as in the exact median
+            medians = [
+                float("nan") if diag["has_nan"] else sketch.quantiles([0.5])[0]
+                for sketch, diag in zip(sketches, diagnostics)
+            ]
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+
+        notes = [self._precision_note(m, diag) for m, diag in zip(medians, diagnostics)]
+        if per_column_requested(self.params):
+            result = per_column_result(self._generate_return_structure(None), medians, notes, self.metadata)
+        else:
+            result = self._generate_return_structure(medians[0])
+            result["loss_of_precision"] = notes[0]
+        return approximate_result(result, sketches)
+
+    def compute(self):
+        # Perform the statistical computation and return a standardized result dictionary
+        reason = self._applicable()
+        if reason is not None:
+            return self._generate_return_structure_error(reason)
+        if approximate_requested(self.params):
+            return self._compute_approximate()
+        if per_column_requested(self.params):
+            return self._compute_per_column()
+
+        # Main Computation Logic
+        try:
+            stats = descriptive_stats(self.data)
+            median_value = stats.median()
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
 
         result = self._generate_return_structure(median_value)
-        result["loss_of_precision"] = precision_note
+        result["loss_of_precision"] = self._precision_note(median_value, stats.diagnostics())
         return result
 
 
@@ -1,5 +1,15 @@
-import math
-import statistics
+import numpy as np
+
+try:
+    from .descriptive import descriptive_stats, mode_counts, per_column_requested, per_column_result
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import descriptive_stats, mode_counts, per_column_requested, per_column_result
+
+# Tied modes listed in a result; "n_modes" still counts them all (data
+# with no repeated value would otherwise list every value)
+MAX_REPORTED_MODES = 100
+
 
 class Mode:
     def __init__(self, data, metadata, params=None):
@@ -39,43 +49,89 @@ class Mode:
         }
         return results
 
+    @staticmethod
+    def _mode_value(value):
+        # Keep numeric values as float; leave strings as-is
+        value = value.item() if isinstance(value, np.generic) else value
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return value
+
+    def _modes_of(self, values):
+        # Tied modes (first seen first) as display values, their count and
+        # how many values tie
+        modes, count, n_modes = mode_counts(values, limit=MAX_REPORTED_MODES)
+        return [self._mode_value(m) for m in modes], count, n_modes
+
+    def _finite_flags(self, per_column=False):
+        # all_finite of the data (a list per column) from the diagnostics pass
+        # shared with the other univariate methods; None when it can't apply
+        if np.asarray(self.data).dtype.kind in "biu":
+            # Integers are finite by construction; skip the float copy
+            return None
+        try:
+            stats = descriptive_stats(self.data)
+            if per_column:
+                return stats.columns().diagnostics()["all_finite"].tolist()
+            return stats.diagnostics()["all_finite"]
+        except (ValueError, TypeError):
+            # Categorical (string) data has no notion of finiteness
+            return None
+
+    def _compute_per_column(self):
+        # One counting pass per column (axis=1 of the data matrix)
+        try:
+            rows = np.asarray(self.data)
+            rows = rows.reshape(rows.shape[0], -1) if rows.ndim == 2 else rows.reshape(1, -1)
+            counted = [self._modes_of(row) for row in rows]
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+
+        all_finite = self._finite_flags(per_column=True) or [True] * len(counted)
+        notes = [self._precision_note(finite) for finite in all_finite]
+        result = self._generate_return_structure(None)
+        result = per_column_result(result, [modes[0] for modes, _, _ in counted], notes, self.metadata)
+        result["modes"] = [modes for modes, _, _ in counted]
+        result["count"] = [count for _, count, _ in counted]
+        result["n_modes"] = [n_modes for _, _, n_modes in counted]
+        return result
+
+    def _precision_note(self, all_finite):
+        # Mode is selection-based (no float arithmetic), so the only real
+        # precision concern is whether the raw inputs already carry Inf/NaN
+        # — which means the dataset itself overflowed before reaching us.
+        if all_finite:
+            return False
+        return (
+            "Non-finite values detected in input (Inf or NaN). The mode "
+            "itself is well-defined, but the underlying data has already "
+            "overflowed or carries undefined entries — downstream "
+            "statistics on this column will be unreliable."
+        )
+
     def compute(self):
         # Perform the statistical computation and return a standardized result dictionary
         reason = self._applicable()
         if reason is not None:
             return self._generate_return_structure_error(reason)
+        if per_column_requested(self.params):
+            return self._compute_per_column()
         
-        # Placeholder for the main computation logic
+        # value is the first mode seen (statistics.mode's choice); "modes"
+        # lists the tied modes, "count" how often each occurs and "n_modes"
+        # how many there are
         try:
-            flat = self.data.flatten() if hasattr(self.data, 'flatten') else self.data
-            raw_mode = statistics.mode(flat)
-            # Keep numeric values as float; leave strings as-is
-            try:
-                mode_value = float(raw_mode)
-            except (ValueError, TypeError):
-                mode_value = raw_mode
+            modes, count, n_modes = self._modes_of(self.data)
         except Exception as e:
             return self._generate_return_structure_error(str(e))
 
-        # Mode is selection-based (no float arithmetic), so the only real
-        # precision concern is whether the raw inputs already carry Inf/NaN
-        # — which means the dataset itself overflowed before reaching us.
-        precision_note = False
-        try:
-            for v in flat:
-                if isinstance(v, (int, float)) and not math.isfinite(v):
-                    precision_note = (
-                        "Non-finite values detected in input (Inf or NaN). The mode "
-                        "itself is well-defined, but the underlying data has already "
-                        "overflowed or carries undefined entries — downstream "
-                        "statistics on this column will be unreliable."
-                    )
-                    break
-        except TypeError:
-            pass
-
-        result = self._generate_return_structure(mode_value)
-        result["loss_of_precision"] = precision_note
+        result = self._generate_return_structure(modes[0])
+        all_finite = self._finite_flags()
+        result["loss_of_precision"] = self._precision_note(all_finite is None or all_finite)
+        result["modes"] = modes
+        result["count"] = count
+        result["n_modes"] = n_modes
         return result
 
 
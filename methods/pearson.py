@@ -1,5 +1,12 @@
 import numpy as np
-from scipy.stats import pearsonr
+
+try:
+    from .correlation import correlation_matrix, matrix_requested, matrix_result, matrix_rows
+    from .descriptive import descriptive_stats, pair_columns
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from correlation import correlation_matrix, matrix_requested, matrix_result, matrix_rows
+    from descriptive import descriptive_stats, pair_columns
 
 class PearsonCoefficient:
     def __init__(self, data, metadata, params=None):
@@ -38,30 +45,44 @@ class PearsonCoefficient:
             "params_used": self.params
         }
 
+    def _compute_matrix(self):
+        # {"matrix": True}: every pair of the selected columns at once
+        try:
+            columns = descriptive_stats(matrix_rows(self.data)).columns()
+            matrix = correlation_matrix(columns, "pearson")
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+        result = self._generate_return_structure(None)
+        return matrix_result(result, matrix, columns, self.metadata, magnitude_limit=1e12)
+
     def compute(self):
         # Perform the statistical computation and return a standardized result dictionary
+        if matrix_requested(self.params):
+            return self._compute_matrix()
         reason = self._applicable()
         if reason is not None:
             return self._generate_return_structure_error(reason)
 
         try:
-            data1 = np.array(self.data[0], dtype=float)
-            data2 = np.array(self.data[1], dtype=float)
-            pearson_corr, p_value = pearsonr(data1, data2)
+            # r comes from the run's shared co-moments of the pair, the same
+            # kernel Least Squares Regression and the best-fit chart read
+            columns = pair_columns(self.data)
+            if columns.n_rows < 2:
+                raise ValueError("Pearson correlation requires at least 2 rows")
+            pair = columns.co_moments(0, 1)
         except Exception as e:
             return self._generate_return_structure_error(str(e))
 
         precision_note = False
-        pearson_corr_f = float(pearson_corr)
-        all_vals = np.concatenate([data1, data2])
+        # A missing value propagates, as it does through Spearman
+        pearson_corr_f = float("nan") if pair.missing else pair.pearson()
         if np.isnan(pearson_corr_f):
-            has_nan_input = np.isnan(data1).any() or np.isnan(data2).any()
-            if has_nan_input:
+            if pair.missing:
                 precision_note = (
                     "NaN result: the input contains NaN values that propagated through "
                     "the Pearson computation. Clean the data before re-running."
                 )
-            elif np.std(data1) == 0 or np.std(data2) == 0:
+            elif pair.m2_x == 0 or pair.m2_y == 0:
                 precision_note = (
                     "Pearson is undefined when one variable has zero variance "
                     "(all values identical). Select a column with at least two distinct values."
@@ -71,13 +92,13 @@ class PearsonCoefficient:
                     "Pearson returned NaN. The input may be degenerate or contain "
                     "non-finite values; inspect the selected columns."
                 )
-        elif np.abs(all_vals).max() > 1e12:
+        elif pair.max_abs > 1e12:
             precision_note = (
                 "Large-magnitude values detected (>1e12). Pearson correlation involves "
                 "sums of squared values; intermediate products may lose precision near "
                 "float64 limits — Enhanced Precision digits past the ~12th will be unreliable."
             )
-        elif float(np.std(data1)) < abs(float(np.mean(data1))) * 1e-8 and abs(float(np.mean(data1))) > 1:
+        elif np.sqrt(pair.m2_x / pair.n) < abs(pair.mean_x) * 1e-8 and abs(pair.mean_x) > 1:
             precision_note = (
                 "Near-constant x values detected. Pearson correlation is ill-conditioned "
                 "when one variable has very low variance relative to its mean — the result "
@@ -1,5 +1,25 @@
 import numpy as np
 
+try:
+    from .descriptive import (
+        approximate_requested,
+        approximate_result,
+        descriptive_stats,
+        per_column_requested,
+        per_column_result,
+        sketch_k,
+    )
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import (
+        approximate_requested,
+        approximate_result,
+        descriptive_stats,
+        per_column_requested,
+        per_column_result,
+        sketch_k,
+    )
+
 
 class Percentile:
     def __init__(self, data, metadata, params=None):
@@ -8,6 +28,13 @@ class Percentile:
         self.data = data
         self.metadata = metadata
         self.params = params or {}
+        # Percentages arrive as a plain list, or as {"percentiles": [...]}
+        # with "per_column": True for one result per column and/or
+        # "approximate": True (optional "rank_error") for sketch-based values
+        if isinstance(self.params, dict):
+            self.percents = self.params.get("percentiles") or []
+        else:
+            self.percents = self.params
 
     def _applicable(self):
         # Check whether this statistic is valid for the given data selection
@@ -36,50 +63,94 @@ class Percentile:
             "params_used": self.params
         }
 
+    def _precision_note(self, percentile_results, diagnostics):
+        # Loss-of-precision note for one set of percentiles
+        if any(np.isinf(r) for r in percentile_results):
+            return (
+                "Overflow detected: at least one percentile is infinite. The selected "
+                "data contains values outside the float64 range (~1.8e308)."
+            )
+        if any(np.isnan(r) for r in percentile_results):
+            return (
+                "NaN result: the input contains NaN values that propagated through "
+                "the percentile computation. Clean the data before re-running."
+            )
+        if diagnostics["max_abs"] > 1e15:
+            return (
+                "Large-magnitude values detected (>1e15). Percentile interpolation "
+                "between two values of this scale can lose precision beyond 15-16 "
+                "significant digits."
+            )
+        return False
+
+    def _compute_per_column(self, param_array):
+        # One sort of every column (axis=1), then every percentile of every
+        # column read off it at once
+        try:
+            columns = descriptive_stats(self.data).columns()
+            table = columns.percentiles(param_array)
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+
+        values = table.tolist()
+        notes = [
+            self._precision_note(row, columns.diagnostics_at(i))
+            for i, row in enumerate(values)
+        ]
+        result = self._generate_return_structure(None)
+        return per_column_result(result, values, notes, self.metadata)
+
+    def _compute_approximate(self, param_array):
+        # Percentiles read off the stored quantile sketches (pooled: their
+        # merge), so repeat queries on the same columns skip the sort
+        fractions = param_array / 100.0
+        stats = descriptive_stats(self.data)
+        k = sketch_k(self.params)
+        if per_column_requested(self.params):
+            sketches = stats.columns().quantile_sketches(k)
+        else:
+            sketches = [stats.quantile_sketch(k)]
+        diagnostics = [sketch.diagnostics() for sketch in sketches]
+        # NaN propagates as in the exact percentiles
+        values = [
+            [float("nan")] * fractions.size if diag["has_nan"] else sketch.quantiles(fractions)
+            for sketch, diag in zip(sketches, diagnostics)
+        ]
+        notes = [self._precision_note(row, diag) for row, diag in zip(values, diagnostics)]
+        if per_column_requested(self.params):
+            result = per_column_result(self._generate_return_structure(None), values, notes, self.metadata)
+        else:
+            result = self._generate_return_structure(values[0])
+            result["loss_of_precision"] = notes[0]
+        return approximate_result(result, sketches)
+
     def compute(self):
         # Perform the statistical computation and return a standardized result dictionary
         reason = self._applicable()
         if reason is not None:
             return self._generate_return_structure_error(reason)
         
-        for p in self.params:
+        for p in self.percents:
             if p < 0 or p > 100:
                 return self._generate_return_structure_error(f"Percentile {p} is out of range [0, 100]")
             
         try:
-            param_array = np.asarray(self.params)
+            param_array = np.asarray(self.percents)
             if param_array.size == 0:
                 return self._generate_return_structure_error("No percentile values specified")
+            if approximate_requested(self.params):
+                return self._compute_approximate(param_array.flatten())
+            if per_column_requested(self.params):
+                return self._compute_per_column(param_array.flatten())
 
-            flat_data = np.asarray(self.data, dtype=float).flatten()
-
-            percentile_results = []
-            for p in param_array.flatten():
-                computed = float(np.percentile(flat_data, p))
-                percentile_results.append(computed)
+            # One shared sort serves every requested percentile (and Median)
+            stats = descriptive_stats(self.data)
+            percentile_results = stats.percentiles(param_array.flatten())
         except Exception as e:
             return self._generate_return_structure_error(str(e))
 
-        precision_note = False
-        if any(np.isinf(r) for r in percentile_results):
-            precision_note = (
-                "Overflow detected: at least one percentile is infinite. The selected "
-                "data contains values outside the float64 range (~1.8e308)."
-            )
-        elif any(np.isnan(r) for r in percentile_results):
-            precision_note = (
-                "NaN result: the input contains NaN values that propagated through "
-                "the percentile computation. Clean the data before re-running."
-            )
-        elif np.abs(flat_data).max() > 1e15:
-            precision_note = (
-                "Large-magnitude values detected (>1e15). Percentile interpolation "
-                "between two values of this scale can lose precision beyond 15-16 "
-                "significant digits."
-            )
-
         results = self._generate_return_structure(percentile_results)
-        results["loss_of_precision"] = precision_note
+        results["loss_of_precision"] = self._precision_note(percentile_results, stats.diagnostics())
         return results
 
     def create_graphic(self, results):
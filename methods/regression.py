@@ -0,0 +1,326 @@
+"""Multiple, polynomial and batched least-squares regression.
+
+LeastSquaresRegression's default is the line of ``data[1]`` on ``data[0]``,
+read off the shared co-moments (methods/descriptive.py). Its params select
+the models here instead, all solved by Householder QR of the design matrix
+rather than the normal equations:
+
+    {"degree": k}           polynomial of degree k of data[1] on data[0]
+    {"model": "multiple"}   the last selected column on all the others jointly
+    {"model": "screen"}     the last selected column on each other column
+                            separately (one target, many predictors)
+    {"model": "targets"}    every other column on the first one
+                            (many targets, one predictor)
+
+``"degree"`` also applies to each predictor of the other models. The
+batched models run as one stacked linear-algebra call rather than one fit
+per column: "targets" factors its single design matrix once and solves for
+every target as a column of one right-hand side, and "screen" stacks the
+per-predictor design matrices into one (k, n, p) array for numpy's
+batched QR (in blocks, so the stack stays within a fixed memory budget).
+
+Every fit reports its coefficients, their standard errors (the diagonal of
+σ²(XᵀX)⁻¹ = σ²R⁻¹R⁻ᵀ, from the same factorization), R², adjusted R² and
+the condition number of the design matrix. The design's columns are scaled
+to unit length before factoring (as numpy.polyfit does), and the condition
+number is that of the scaled matrix: the one that bounds the coefficients'
+accuracy.
+
+Missing values (NaN) are left out per fit: a row missing any of a fit's
+columns is zeroed in its design matrix and target, which removes it from
+the least-squares problem exactly, and ``n_obs`` records how many rows
+took part.
+"""
+
+import numpy as np
+
+try:
+    from .descriptive import column_names
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import column_names
+
+MODELS = ("multiple", "screen", "targets")
+
+# Condition numbers past this are flagged as ill-conditioned
+ILL_CONDITIONED = 1e10
+
+# Upper bound on the float64 elements of one stacked design-matrix block
+_BLOCK_ELEMENTS = 1 << 22
+
+
+def regression_requested(params) -> bool:
+    """True if LeastSquaresRegression params ask for a model beyond the simple line."""
+    return isinstance(params, dict) and ("model" in params or "degree" in params)
+
+
+def regression_options(params) -> tuple[str | None, int]:
+    """The (model, degree) the params ask for; model is None for a single polynomial."""
+    model = params.get("model")
+    if model is not None and model not in MODELS:
+        raise ValueError(f"Unknown regression model {model!r}; expected one of {', '.join(MODELS)}")
+    degree = params.get("degree", 1)
+    if isinstance(degree, bool) or not isinstance(degree, (int, np.integer)) or degree < 1:
+        raise ValueError("Regression degree must be a whole number of at least 1")
+    return model, int(degree)
+
+
+def _powers(predictors, degree) -> np.ndarray:
+    # (..., n, q) predictors -> (..., n, q * degree) columns x, x², ... per predictor
+    return np.concatenate([predictors ** power for power in range(1, degree + 1)], axis=-1)
+
+
+def design_matrix(predictors, degree: int = 1) -> np.ndarray:
+    """The (..., n, 1 + q * degree) design matrix of (..., n, q) predictors.
+
+    Column 0 is the intercept; then every predictor's first power, then
+    every second power, and so on.
+    """
+    predictors = np.asarray(predictors, dtype=float)
+    intercept = np.ones(predictors.shape[:-1] + (1,))
+    return np.concatenate([intercept, _powers(predictors, degree)], axis=-1)
+
+
+def term_names(names, degree: int = 1) -> list[str]:
+    """Display names of design_matrix's columns for predictors called *names*."""
+    terms = ["intercept"]
+    for power in range(1, degree + 1):
+        terms += [name if power == 1 else f"{name}^{power}" for name in names]
+    return terms
+
+
+def fit_stack(X, Y, present=None) -> dict:
+    """Least-squares fits of a stack of problems in one batched factorization.
+
+    *X* is (b, n, p) and *Y* (b, n, m): b design matrices, each with m
+    targets sharing it. *present* is an optional (b, n) mask of the rows
+    each problem uses; the others must already be zero in X and Y.
+    Returns (b, p, m) "coefficients" and "std_errors", (b, m) "r_squared",
+    "adj_r_squared" and "residual_ss", (b,) "condition_number",
+    "singular" and "n_obs".
+    """
+    b, n, p = X.shape
+    if n < p:
+        raise ValueError(f"Regression with {p} coefficients requires at least {p} rows")
+    if present is None:
+        present = np.ones((b, n), dtype=bool)
+    n_obs = present.sum(axis=1)
+
+    # Unit-length columns; an all-zero column stays zero (and makes R singular)
+    scale = np.sqrt(np.einsum("bnp,bnp->bp", X, X))
+    scale[scale == 0] = 1.0
+    Q, R = np.linalg.qr(X / scale[:, None, :])
+    QtY = np.swapaxes(Q, 1, 2) @ Y
+
+    # R's SVD gives the condition number and, as its pseudo-inverse, both
+    # the solution and the coefficient covariance
+    U, s, Vt = np.linalg.svd(R)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        condition = s[:, 0] / s[:, -1]
+    singular = (s[:, -1] <= s[:, 0] * max(n, p) * np.finfo(float).eps) | (n_obs < p)
+    with np.errstate(divide="ignore"):
+        inverse_s = np.where(s > 0, 1.0 / s, 0.0)
+    R_inverse = np.swapaxes(Vt, 1, 2) @ (inverse_s[:, :, None] * np.swapaxes(U, 1, 2))
+
+    coefficients = (R_inverse @ QtY) / scale[:, :, None]
+    residuals = Y - X @ coefficients
+    residual_ss = np.einsum("bnm,bnm->bm", residuals, residuals)
+
+    weights = present[:, :, None]
+    counts = np.maximum(n_obs, 1)[:, None]
+    means = (Y * weights).sum(axis=1) / counts
+    total_ss = (((Y - means[:, None, :]) * weights) ** 2).sum(axis=1)
+
+    dof = (n_obs - p)[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # A constant target is fit exactly by the intercept; report R² = 0,
+        # as the simple line does
+        r_squared = np.where(total_ss > 0, 1.0 - residual_ss / total_ss, 0.0)
+        adj_r_squared = np.where(dof > 0, 1.0 - (1.0 - r_squared) * (n_obs[:, None] - 1) / dof, np.nan)
+        sigma_squared = np.where(dof > 0, residual_ss / dof, np.nan)
+        unscaled = np.sqrt(np.einsum("bpq,bpq->bp", R_inverse, R_inverse)) / scale
+        std_errors = unscaled[:, :, None] * np.sqrt(sigma_squared)[:, None, :]
+
+    coefficients[singular] = np.nan
+    std_errors[singular] = np.nan
+    r_squared[singular] = np.nan
+    adj_r_squared[singular] = np.nan
+    return {
+        "coefficients": coefficients,
+        "std_errors": std_errors,
+        "r_squared": r_squared,
+        "adj_r_squared": adj_r_squared,
+        "residual_ss": residual_ss,
+        "condition_number": condition,
+        "singular": singular,
+        "n_obs": n_obs,
+    }
+
+
+def _masked(X, Y, present):
+    # Zero the rows a problem leaves out, in its design matrix and target
+    return np.where(present[..., None], X, 0.0), np.where(present[..., None], Y, 0.0)
+
+
+def _check_finite(rows):
+    if np.isinf(rows).any():
+        raise ValueError("Regression requires finite values (the data contains ±inf)")
+
+
+def fit_multiple(predictors, target, degree: int = 1) -> dict:
+    """One fit of *target* (n,) on the (q, n) *predictors* jointly; fit_stack's arrays for b = 1."""
+    predictors = np.atleast_2d(np.asarray(predictors, dtype=float))
+    target = np.asarray(target, dtype=float)
+    _check_finite(predictors)
+    _check_finite(target)
+    present = ~(np.isnan(predictors).any(axis=0) | np.isnan(target))
+    X, Y = _masked(design_matrix(predictors.T, degree)[None], target[None, :, None], present[None])
+    return fit_stack(X, Y, present[None])
+
+
+def fit_screen(predictors, target, degree: int = 1) -> dict:
+    """*target* (n,) on each of the (k, n) *predictors* separately, stacked.
+
+    fit_stack's arrays with b = k (one problem per predictor) and m = 1.
+    """
+    predictors = np.atleast_2d(np.asarray(predictors, dtype=float))
+    target = np.asarray(target, dtype=float)
+    _check_finite(predictors)
+    _check_finite(target)
+    k, n = predictors.shape
+    block = max(1, _BLOCK_ELEMENTS // max(1, n * (degree + 1)))
+    fits = []
+    for start in range(0, k, block):
+        chunk = predictors[start:start + block]
+        present = ~(np.isnan(chunk) | np.isnan(target))
+        X = design_matrix(chunk[:, :, None], degree)
+        Y = np.broadcast_to(target[None, :, None], (chunk.shape[0], n, 1))
+        X, Y = _masked(X, Y, present)
+        fits.append(fit_stack(X, Y, present))
+    return {key: np.concatenate([fit[key] for fit in fits]) for key in fits[0]}
+
+
+def fit_targets(predictor, targets, degree: int = 1) -> dict:
+    """Each of the (k, n) *targets* on *predictor* (n,).
+
+    NaN-free, that is one factorization with the targets as the k columns
+    of one right-hand side (b = 1, m = k). With missing values each target
+    keeps its own complete rows, so the fits are stacked instead
+    (b = k, m = 1). The arrays are reshaped to b = k, m = 1 either way.
+    """
+    predictor = np.asarray(predictor, dtype=float)
+    targets = np.atleast_2d(np.asarray(targets, dtype=float))
+    _check_finite(predictor)
+    _check_finite(targets)
+    k, n = targets.shape
+    X = design_matrix(predictor[:, None], degree)
+    if not (np.isnan(predictor).any() or np.isnan(targets).any()):
+        fit = fit_stack(X[None], targets.T[None])
+        per_target = {
+            "coefficients": fit["coefficients"][0].T[:, :, None],
+            "std_errors": fit["std_errors"][0].T[:, :, None],
+        }
+        for key in ("r_squared", "adj_r_squared", "residual_ss"):
+            per_target[key] = fit[key].reshape(k, 1)
+        for key in ("condition_number", "singular", "n_obs"):
+            per_target[key] = np.repeat(fit[key], k)
+        return per_target
+    present = ~(np.isnan(predictor)[None, :] | np.isnan(targets))
+    X, Y = _masked(np.broadcast_to(X, (k,) + X.shape), targets[:, :, None], present)
+    return fit_stack(X, Y, present)
+
+
+def equation(target: str, terms: list[str], coefficients) -> str:
+    """``target = b0 + b1·x + …`` at 3 decimals, as the simple line's equation."""
+    parts = [f"{coefficients[0]:.3f}"]
+    for term, coefficient in zip(terms[1:], coefficients[1:]):
+        sign = "-" if coefficient < 0 else "+"
+        parts.append(f"{sign} {abs(coefficient):.3f}·{term}")
+    return f"{target} = " + " ".join(parts)
+
+
+def fit_value(fit: dict, i: int, target: str, terms: list[str]) -> dict:
+    """The result value of problem *i* of a fit_stack output (first target)."""
+    coefficients = fit["coefficients"][i, :, 0]
+    return {
+        "terms": terms,
+        "coefficients": coefficients.tolist(),
+        "std_errors": fit["std_errors"][i, :, 0].tolist(),
+        "r_squared": float(fit["r_squared"][i, 0]),
+        "adj_r_squared": float(fit["adj_r_squared"][i, 0]),
+        "condition_number": float(fit["condition_number"][i]),
+        "n_obs": int(fit["n_obs"][i]),
+        "equation": equation(target, terms, coefficients),
+    }
+
+
+def fit_note(fit: dict, i: int, n_rows: int, degree: int) -> str | bool:
+    """The loss_of_precision note of problem *i* of a fit_stack output."""
+    notes = []
+    p = fit["coefficients"].shape[1]
+    if fit["n_obs"][i] < p:
+        notes.append(
+            f"Not enough rows: {p} coefficients need at least {p} complete rows "
+            f"(found {int(fit['n_obs'][i])})."
+        )
+    elif fit["singular"][i]:
+        notes.append(
+            "Singular design: a predictor is constant or the predictors are "
+            "collinear, so the coefficients are not identifiable."
+        )
+    elif fit["condition_number"][i] > ILL_CONDITIONED:
+        notes.append(
+            f"Ill-conditioned design (condition number {fit['condition_number'][i]:.1e})"
+            + (": high polynomial degrees make powers of x nearly collinear" if degree > 1 else "")
+            + ". The coefficients and their standard errors may be inaccurate."
+        )
+    skipped = n_rows - int(fit["n_obs"][i])
+    if skipped:
+        notes.append(
+            f"Missing values: {skipped:,} of {n_rows:,} rows had a missing value in "
+            "this fit's columns and were left out."
+        )
+    return " ".join(notes) if notes else False
+
+
+def regression_result(result: dict, rows, metadata, params) -> dict:
+    """Fill a LeastSquaresRegression result dict for the model *params* ask for.
+
+    A single fit (polynomial or "multiple") makes ``value`` one fit dict;
+    the batched models make it the per-column list of fit dicts, with
+    ``columns`` naming each fit's predictor ("screen") or target
+    ("targets"), and the notes prefixed by that name.
+    """
+    model, degree = regression_options(params)
+    n_cols, n_rows = rows.shape
+    if n_cols < 2:
+        raise ValueError("Regression requires at least 2 columns of equal length")
+    names = column_names(metadata, n_cols)
+
+    if model is None:
+        fit = fit_multiple(rows[:1], rows[1], degree)
+        result["value"] = fit_value(fit, 0, names[1], term_names(names[:1], degree))
+        result["loss_of_precision"] = fit_note(fit, 0, n_rows, degree)
+    elif model == "multiple":
+        fit = fit_multiple(rows[:-1], rows[-1], degree)
+        result["value"] = fit_value(fit, 0, names[-1], term_names(names[:-1], degree))
+        result["loss_of_precision"] = fit_note(fit, 0, n_rows, degree)
+    else:
+        if model == "screen":
+            fit = fit_screen(rows[:-1], rows[-1], degree)
+            labels = names[:-1]
+            values = [
+                fit_value(fit, i, names[-1], term_names([label], degree))
+                for i, label in enumerate(labels)
+            ]
+        else:
+            fit = fit_targets(rows[0], rows[1:], degree)
+            labels = names[1:]
+            terms = term_names(names[:1], degree)
+            values = [fit_value(fit, i, label, terms) for i, label in enumerate(labels)]
+        notes = [fit_note(fit, i, n_rows, degree) for i in range(len(labels))]
+        result["value"] = values
+        result["columns"] = labels
+        flagged = [f"{label}: {note}" for label, note in zip(labels, notes) if note]
+        result["loss_of_precision"] = "\n".join(flagged) if flagged else False
+    return result
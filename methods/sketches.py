@@ -0,0 +1,507 @@
+"""Mergeable summaries for statistics over data that never sits in memory.
+
+Each summary is fed a chunk of values at a time (``update``) and two
+summaries of different chunks combine into the summary of both
+(``merge``), so a file can be summarized in one pass, in any chunk size,
+or in parallel shards, in a memory budget that doesn't grow with the row
+count:
+
+    Moments          count, mean and sum of squared deviations (Welford,
+                     combined per chunk with Chan et al.'s pairwise
+                     update) -> mean, variance, std, CV
+    CoMoments        the same for a pair of columns plus their co-moment
+                     -> Pearson's r and the least-squares line
+    FrequencySketch  Misra-Gries heavy hitters -> mode; exact while the
+                     column has at most ``capacity`` distinct values
+    QuantileSketch   KLL compactors -> median and percentiles within a
+                     bounded rank error; exact until the first compaction
+
+``sketch_store`` keeps the quantile sketches built for in-memory columns
+(the approximate mode of Median and Percentile), keyed by the column's
+contents and k, so later percentile queries on the same column read an
+existing sketch instead of sorting the data again.
+
+``co_moments`` runs two in-memory columns through one CoMoments. It is the
+bivariate kernel behind Pearson, Least Squares Regression and the best-fit
+chart, which read r, the line and R² off the same five numbers (see
+``ColumnStats.co_moments``, which keeps one per pair of columns per run).
+
+NaN values are missing data here: they are counted in ``missing`` and
+otherwise skipped.
+"""
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def _chunk(values) -> tuple[np.ndarray, int]:
+    """Float64 values of one chunk with NaNs removed, and how many there were."""
+    values = np.asarray(values, dtype=float).reshape(-1)
+    present = ~np.isnan(values)
+    return values[present], int(values.size - np.count_nonzero(present))
+
+
+class Moments:
+    """Streaming mean / variance of one column."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.missing = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.max_abs = 0.0
+        # Smallest non-zero finite magnitude, for the mixed-magnitude check
+        self.min_abs_nonzero = math.inf
+        self.max_abs_finite = 0.0
+        self.nonzero_finite = 0
+
+    def update(self, values) -> None:
+        values, missing = _chunk(values)
+        self.missing += missing
+        if values.size == 0:
+            return
+        with np.errstate(invalid="ignore", over="ignore"):
+            mean = float(np.mean(values))
+            deviations = values - mean
+            m2 = float(np.sum(deviations * deviations))
+        magnitudes = np.abs(values)
+        usable = magnitudes[np.isfinite(magnitudes) & (magnitudes != 0)]
+        self._combine(
+            int(values.size), mean, m2,
+            float(values.min()), float(values.max()), float(magnitudes.max()),
+            float(usable.min()) if usable.size else math.inf,
+            float(usable.max()) if usable.size else 0.0,
+            int(usable.size),
+        )
+
+    def merge(self, other: "Moments") -> None:
+        self.missing += other.missing
+        if other.n:
+            self._combine(
+                other.n, other.mean, other.m2, other.min, other.max, other.max_abs,
+                other.min_abs_nonzero, other.max_abs_finite, other.nonzero_finite,
+            )
+
+    def _combine(self, n, mean, m2, lo, hi, max_abs, min_nz, max_finite, nonzero) -> None:
+        total = self.n + n
+        with np.errstate(invalid="ignore", over="ignore"):
+            delta = mean - self.mean
+            self.mean = self.mean + delta * (n / total)
+            self.m2 = self.m2 + m2 + delta * delta * (self.n * n / total)
+        self.n = total
+        self.min = min(self.min, lo)
+        self.max = max(self.max, hi)
+        self.max_abs = max(self.max_abs, max_abs)
+        self.min_abs_nonzero = min(self.min_abs_nonzero, min_nz)
+        self.max_abs_finite = max(self.max_abs_finite, max_finite)
+        self.nonzero_finite += nonzero
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.variance >= 0 else math.nan
+
+    @property
+    def cv(self) -> float:
+        return self.std / self.mean if self.mean != 0 else math.nan
+
+    def moments(self) -> dict:
+        """Same keys as DescriptiveStats.moments()."""
+        if self.n == 0:
+            raise ValueError("No numerical data provided")
+        return {
+            "n": self.n,
+            "mean": float(self.mean),
+            "variance": float(self.variance),
+            "std": float(self.std),
+            "cv": float(self.cv),
+        }
+
+    def diagnostics(self) -> dict:
+        """Same keys as DescriptiveStats.diagnostics(), over the non-missing values."""
+        if self.n == 0:
+            raise ValueError("No numerical data provided")
+        has_inf = math.isinf(self.max_abs)
+        return {
+            "has_nan": False,
+            "has_inf": has_inf,
+            "all_finite": not has_inf,
+            "max_abs": self.max_abs,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    def magnitude_ratio(self) -> float | None:
+        if self.nonzero_finite < 2:
+            return None
+        return self.max_abs_finite / self.min_abs_nonzero
+
+
+class CoMoments:
+    """Streaming means, variances and co-moment of a pair of columns.
+
+    Only rows where both values are present count.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+        self.missing = 0
+        self.max_abs = 0.0
+
+    def update(self, x, y) -> None:
+        x = np.asarray(x, dtype=float).reshape(-1)
+        y = np.asarray(y, dtype=float).reshape(-1)
+        present = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[present], y[present]
+        self.missing += int(present.size - x.size)
+        if x.size == 0:
+            return
+        with np.errstate(invalid="ignore", over="ignore"):
+            mean_x, mean_y = float(np.mean(x)), float(np.mean(y))
+            dx, dy = x - mean_x, y - mean_y
+            self._combine(
+                int(x.size), mean_x, mean_y,
+                float(np.sum(dx * dx)), float(np.sum(dy * dy)), float(np.sum(dx * dy)),
+                float(max(np.abs(x).max(), np.abs(y).max())),
+            )
+
+    def merge(self, other: "CoMoments") -> None:
+        self.missing += other.missing
+        if other.n:
+            self._combine(
+                other.n, other.mean_x, other.mean_y, other.m2_x, other.m2_y, other.c_xy,
+                other.max_abs,
+            )
+
+    def _combine(self, n, mean_x, mean_y, m2_x, m2_y, c_xy, max_abs) -> None:
+        total = self.n + n
+        with np.errstate(invalid="ignore", over="ignore"):
+            dx = mean_x - self.mean_x
+            dy = mean_y - self.mean_y
+            weight = self.n * n / total
+            self.mean_x += dx * (n / total)
+            self.mean_y += dy * (n / total)
+            self.m2_x += m2_x + dx * dx * weight
+            self.m2_y += m2_y + dy * dy * weight
+            self.c_xy += c_xy + dx * dy * weight
+        self.n = total
+        self.max_abs = max(self.max_abs, max_abs)
+
+    def pearson(self) -> float:
+        denominator = math.sqrt(self.m2_x * self.m2_y) if self.m2_x > 0 and self.m2_y > 0 else 0.0
+        if self.n < 2 or denominator == 0:
+            return math.nan
+        # Round-off can push |r| a hair past 1
+        return max(-1.0, min(1.0, self.c_xy / denominator))
+
+    def regression(self) -> dict:
+        """Least-squares line y = slope * x + intercept and its R²."""
+        if self.n < 2:
+            raise ValueError("Least Squares Regression requires at least 2 rows")
+        slope = self.c_xy / self.m2_x if self.m2_x != 0 else math.nan
+        intercept = self.mean_y - slope * self.mean_x
+        if self.m2_y == 0:
+            r_squared = 0.0
+        else:
+            r_squared = (self.c_xy * self.c_xy) / (self.m2_x * self.m2_y) if self.m2_x != 0 else math.nan
+        return {"slope": float(slope), "intercept": float(intercept), "r_squared": float(r_squared)}
+
+
+def co_moments(x, y, chunk_rows: int = 65_536) -> CoMoments:
+    """CoMoments of two whole columns, fed in chunks of *chunk_rows* rows.
+
+    One pass over the pair; each chunk's deviations stay cache-sized, and
+    the per-chunk sums combine with the same stable update as merge().
+    """
+    x = np.asarray(x, dtype=float).reshape(-1)
+    y = np.asarray(y, dtype=float).reshape(-1)
+    if x.size != y.size:
+        raise ValueError("Both columns must have the same length")
+    pair = CoMoments()
+    for start in range(0, x.size, chunk_rows):
+        pair.update(x[start:start + chunk_rows], y[start:start + chunk_rows])
+    return pair
+
+
+class FrequencySketch:
+    """Misra-Gries frequency sketch holding at most ``capacity`` counters.
+
+    Counts are exact while the data has at most ``capacity`` distinct
+    values; past that, each count may be low by at most ``error``, and any
+    value occurring more than n / (capacity + 1) times is still tracked.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        # Insertion order is first-seen order, so ties resolve like statistics.mode
+        self.counters: dict = {}
+        self.error = 0
+        self.n = 0
+        self.missing = 0
+
+    def update(self, values) -> None:
+        values, missing = _chunk(values)
+        self.missing += missing
+        if values.size == 0:
+            return
+        unique, first, counts = np.unique(values, return_index=True, return_counts=True)
+        order = np.argsort(first, kind="stable")
+        self._add(zip(unique[order].tolist(), counts[order].tolist()))
+
+    def merge(self, other: "FrequencySketch") -> None:
+        self.missing += other.missing
+        self.error += other.error
+        self._add(other.counters.items())
+
+    def _add(self, items) -> None:
+        counters = self.counters
+        for value, count in items:
+            counters[value] = counters.get(value, 0) + count
+            self.n += count
+        if len(counters) > self.capacity:
+            # Subtract the (capacity + 1)-th largest count from every counter
+            cut = sorted(counters.values(), reverse=True)[self.capacity]
+            self.counters = {v: c - cut for v, c in counters.items() if c > cut}
+            self.error += cut
+
+    @property
+    def exact(self) -> bool:
+        return self.error == 0
+
+    def modes(self) -> tuple[list, int]:
+        """Every most frequent value (first seen first) and its count.
+
+        Past capacity the count is a lower bound, low by at most ``error``.
+        """
+        if not self.counters:
+            raise ValueError("no mode for empty data")
+        best = max(self.counters.values())
+        return [v for v, c in self.counters.items() if c == best], int(best)
+
+    def mode(self):
+        """Most frequent value (first seen among ties)."""
+        return self.modes()[0][0]
+
+
+# Normalized rank error of a KLL sketch with parameter k, at 99% confidence
+# (the fit published with the Apache DataSketches KLL implementation).
+# k used when no accuracy is asked for (a rank error bound of about 1.3%)
+DEFAULT_K = 200
+
+
+def kll_rank_error(k: int) -> float:
+    return 2.296 / k ** 0.9723
+
+
+def k_for_rank_error(rank_error: float) -> int:
+    """Smallest KLL k whose rank error bound is at most *rank_error*."""
+    if not 0 < rank_error < 1:
+        raise ValueError("rank_error must be between 0 and 1")
+    k = max(8, int(math.ceil((2.296 / rank_error) ** (1 / 0.9723))))
+    while kll_rank_error(k) > rank_error:
+        k += 1
+    return k
+
+
+class QuantileSketch:
+    """KLL quantile sketch.
+
+    Level h holds items standing for 2**h input values each; a full level
+    is sorted and every other item (at a random offset) is promoted to the
+    next level. Memory stays around 3 * k items however many values are
+    added, and any quantile is within ``rank_error()`` of its true rank.
+    Until the first compaction every value is kept and quantiles are exact
+    (matching np.percentile's linear interpolation).
+    """
+
+    _SHRINK = 2.0 / 3.0
+
+    def __init__(self, k: int = DEFAULT_K, seed: int = 0):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.n = 0
+        self.missing = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values) -> None:
+        values, missing = _chunk(values)
+        self.missing += missing
+        if values.size == 0:
+            return
+        self.n += int(values.size)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        self.missing += other.missing
+        if not other.n:
+            return
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._compress()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * self._SHRINK ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if items.size > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so total weight is preserved
+                keep = items[-1:] if items.size % 2 else items[:0]
+                pairs = items[:items.size - keep.size]
+                promoted = pairs[int(self._rng.integers(2))::2]
+                self._levels[level] = keep
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+    @property
+    def exact(self) -> bool:
+        return len(self._levels) == 1
+
+    def rank_error(self) -> float:
+        """Normalized rank error bound of quantile() (0 while exact)."""
+        return 0.0 if self.exact else kll_rank_error(self.k)
+
+    def diagnostics(self) -> dict:
+        """Same keys as DescriptiveStats.diagnostics(); any missing (NaN) value sets has_nan."""
+        if self.n == 0 and self.missing == 0:
+            raise ValueError("No numerical data provided")
+        has_nan = self.missing > 0
+        if self.n == 0:
+            return {
+                "has_nan": True, "has_inf": False, "all_finite": False,
+                "max_abs": math.nan, "min": math.nan, "max": math.nan,
+            }
+        max_abs = max(abs(self.min), abs(self.max))
+        has_inf = math.isinf(max_abs)
+        return {
+            "has_nan": has_nan,
+            "has_inf": has_inf,
+            "all_finite": not (has_nan or has_inf),
+            "max_abs": math.nan if has_nan else max_abs,
+            "min": math.nan if has_nan else self.min,
+            "max": math.nan if has_nan else self.max,
+        }
+
+    def size(self) -> int:
+        """Items retained (the sketch's memory footprint)."""
+        return int(sum(items.size for items in self._levels))
+
+    def quantiles(self, fractions) -> list[float]:
+        """Values at the given quantile fractions (0..1)."""
+        if self.n == 0:
+            raise IndexError("cannot compute percentiles of an empty array")
+        fractions = np.asarray(fractions, dtype=float).reshape(-1)
+        if self.exact:
+            return [float(v) for v in np.quantile(self._levels[0], fractions)]
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(level_items.size, 2.0 ** level) for level, level_items in enumerate(self._levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, fractions * cumulative[-1], side="left")
+        values = items[np.clip(positions, 0, items.size - 1)]
+        # The extremes are tracked exactly
+        values = np.where(fractions <= 0, self.min, np.where(fractions >= 1, self.max, values))
+        return [float(v) for v in values]
+
+
+def approximate_note(sketches):
+    """Loss-of-precision note for quantiles read off *sketches* (False while all are exact)."""
+    inexact = [sketch for sketch in sketches if not sketch.exact]
+    if not inexact:
+        return False
+    n = max(sketch.n for sketch in inexact)
+    bound = max(sketch.rank_error() for sketch in inexact)
+    return (
+        f"Approximate: computed from a quantile sketch of {n:,} values; "
+        f"each value is within ±{bound:.2%} of its true rank."
+    )
+
+
+class SketchStore:
+    """Bounded LRU of quantile sketches built over in-memory columns.
+
+    Entries are keyed by a digest of the column's bytes and k, so the same
+    column selected again (in this run or a later one) reuses its sketch.
+    Sketches handed out are shared: callers read them or merge them into
+    a sketch of their own, never update them.
+    """
+
+    def __init__(self, max_entries: int = 256, chunk_rows: int = 65_536):
+        self.max_entries = max_entries
+        self.chunk_rows = chunk_rows
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+
+    @staticmethod
+    def _key(column: np.ndarray, k: int) -> tuple:
+        column = np.ascontiguousarray(column)
+        # sha256 rather than blake2b: hardware-accelerated on current CPUs,
+        # and the digest is most of what a repeat query costs
+        digest = hashlib.sha256()
+        digest.update(f"{column.dtype.str}|{column.size}|".encode())
+        digest.update(memoryview(column).cast("B"))
+        return digest.hexdigest(), k
+
+    def get_or_build(self, column, k: int) -> QuantileSketch:
+        """The sketch of *column* (1-D float64) at *k*, built on first request."""
+        key = self._key(column, k)
+        with self._lock:
+            sketch = self._entries.get(key)
+            if sketch is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return sketch
+        # Fed in chunks so no sorted copy of the whole column is ever made
+        sketch = QuantileSketch(k)
+        for start in range(0, column.size, self.chunk_rows):
+            sketch.update(column[start:start + self.chunk_rows])
+        with self._lock:
+            self._entries[key] = sketch
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return sketch
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+
+
+sketch_store = SketchStore()
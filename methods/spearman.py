@@ -1,5 +1,12 @@
 import numpy as np
-from scipy.stats import spearmanr
+
+try:
+    from .correlation import correlation_matrix, matrix_requested, matrix_result, matrix_rows
+    from .descriptive import descriptive_stats, pair_columns
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from correlation import correlation_matrix, matrix_requested, matrix_result, matrix_rows
+    from descriptive import descriptive_stats, pair_columns
 
 class SpearmanCoefficient:
     def __init__(self, data, metadata, params=None):
@@ -38,21 +45,48 @@ class SpearmanCoefficient:
             "params_used": self.params
         }
 
+    @staticmethod
+    def _rank_correlation(ranks1, ranks2, has_nan):
+        # Pearson's r of the average-tie ranks (what scipy.stats.spearmanr
+        # computes); NaN propagates, and a constant column has no correlation
+        if has_nan or ranks1.size == 0:
+            return float("nan")
+        deviations1 = ranks1 - ranks1.mean()
+        deviations2 = ranks2 - ranks2.mean()
+        denominator = np.sqrt(np.dot(deviations1, deviations1) * np.dot(deviations2, deviations2))
+        if denominator == 0:
+            return float("nan")
+        return float(np.clip(np.dot(deviations1, deviations2) / denominator, -1.0, 1.0))
+
+    def _compute_matrix(self):
+        # {"matrix": True}: every pair of the selected columns at once
+        try:
+            columns = descriptive_stats(matrix_rows(self.data)).columns()
+            matrix = correlation_matrix(columns, "spearman")
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+        result = self._generate_return_structure(None)
+        return matrix_result(result, matrix, columns, self.metadata)
+
     def compute(self):
         # Perform the statistical computation and return a standardized result dictionary
+        if matrix_requested(self.params):
+            return self._compute_matrix()
         reason = self._applicable()
         if reason is not None:
             return self._generate_return_structure_error(reason)
         
         try:
-            data1 = np.array(self.data[0], dtype=float)
-            data2 = np.array(self.data[1], dtype=float)
-            spearman_corr, p_value = spearmanr(data1, data2)
+            # Ranks come from the run's shared per-column rank cache, so each
+            # column is sorted once however many methods correlate it
+            columns = pair_columns(self.data)
+            data1, data2 = columns.rows[0], columns.rows[1]
+            spearman_corr = self._rank_correlation(
+                columns.ranks_at(0), columns.ranks_at(1), columns.diagnostics()["has_nan"][:2].any()
+            )
         except Exception as e:
             return self._generate_return_structure_error(str(e))
 
-        spearman_corr = float(spearman_corr)
-
         precision_note = False
         if np.isnan(spearman_corr):
             # spearmanr returns NaN when a column is constant (all tied ranks)
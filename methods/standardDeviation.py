@@ -1,5 +1,12 @@
 import numpy as np
 
+try:
+    from .descriptive import descriptive_stats, per_column_requested, per_column_result
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import descriptive_stats, per_column_requested, per_column_result
+
+
 class StandardDeviation:
     def __init__(self, data, metadata, params=None):
         # Initialize the statistic with an ID and optional parameters
@@ -38,55 +45,74 @@ class StandardDeviation:
         }
         return results
 
-    def compute(self):
-        # Perform the statistical computation and return a standardized result dictionary
-        reason = self._applicable()
-        if reason is not None:
-            return self._generate_return_structure_error(reason)
-
-        # Main Computation Logic
-        try:
-            data_array = np.asarray(self.data, dtype = float)
-            flat = data_array.flatten()
-            std_value = float(np.std(data_array, ddof=1))
-        except Exception as e:
-            return self._generate_return_structure_error(str(e))
-
-        precision_note = False
+    def _precision_note(self, std_value, moments, diagnostics):
+        # Loss-of-precision note for one standard deviation
         if np.isnan(std_value):
-            precision_note = (
+            return (
                 "NaN result: the standard deviation is undefined. Inputs likely contained "
                 "NaN or the squared-deviation sum produced an undefined operation. Clean "
                 "the data before re-running."
             )
-        elif np.isinf(std_value):
-            precision_note = (
+        if np.isinf(std_value):
+            return (
                 "Overflow detected: the standard deviation is infinite. Squared "
                 "deviations exceeded the float64 range (~1.8e308)."
             )
-        elif np.abs(flat).max() > 1e15:
-            precision_note = (
+        if diagnostics["max_abs"] > 1e15:
+            return (
                 "Large-magnitude values detected (>1e15). Standard deviation is computed "
                 "from squared deviations, which can lose precision at this scale — "
                 "Enhanced Precision digits past the ~15th are unreliable."
             )
-        elif std_value != 0 and std_value < 2.2250738585072014e-308:
-            precision_note = (
+        if std_value != 0 and std_value < 2.2250738585072014e-308:
+            return (
                 f"Subnormal result (std ≈ {std_value:.3g}, below ~2.2e-308). Float64 "
                 "loses bits of precision in the subnormal range; treat low-order digits as noise."
             )
-        else:
-            mean_abs = abs(float(np.mean(flat)))
-            spread = float(flat.max() - flat.min())
-            if mean_abs > 1e8 and spread > 0 and spread < mean_abs * 1e-6:
-                precision_note = (
-                    "Catastrophic cancellation risk: values are nearly identical relative to "
-                    "their magnitude. The computed standard deviation may have fewer significant "
-                    "digits than expected — Enhanced Precision will expose the noisy bits."
-                )
+        mean_abs = abs(moments["mean"])
+        spread = diagnostics["max"] - diagnostics["min"]
+        if mean_abs > 1e8 and spread > 0 and spread < mean_abs * 1e-6:
+            return (
+                "Catastrophic cancellation risk: values are nearly identical relative to "
+                "their magnitude. The computed standard deviation may have fewer significant "
+                "digits than expected — Enhanced Precision will expose the noisy bits."
+            )
+        return False
+
+    def _compute_per_column(self):
+        # One vectorized moment pass over every column (axis=1 of the data matrix)
+        try:
+            columns = descriptive_stats(self.data).columns()
+            values = columns.moments()["std"]
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+
+        notes = [
+            self._precision_note(value, columns.moments_at(i), columns.diagnostics_at(i))
+            for i, value in enumerate(values)
+        ]
+        result = self._generate_return_structure(None)
+        return per_column_result(result, values.tolist(), notes, self.metadata)
+
+    def compute(self):
+        # Perform the statistical computation and return a standardized result dictionary
+        reason = self._applicable()
+        if reason is not None:
+            return self._generate_return_structure_error(reason)
+        if per_column_requested(self.params):
+            return self._compute_per_column()
+
+        # Main Computation Logic
+        try:
+            stats = descriptive_stats(self.data)
+            moments = stats.moments()
+            std_value = moments["std"]
+            diagnostics = stats.diagnostics()
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
 
         result = self._generate_return_structure(std_value)
-        result["loss_of_precision"] = precision_note
+        result["loss_of_precision"] = self._precision_note(std_value, moments, diagnostics)
         return result
 
 
@@ -1,4 +1,10 @@
 import numpy as np
+
+try:
+    from .descriptive import descriptive_stats, per_column_requested, per_column_result
+except ImportError:
+    # Imported as a top-level module (the testsuite puts methods/ on sys.path)
+    from descriptive import descriptive_stats, per_column_requested, per_column_result
     
 class Variance:
     def __init__(self, data, metadata, params=None):
@@ -39,55 +45,75 @@ class Variance:
             "params_used": self.params
         }
 
-    def compute(self):
-        # Perform the statistical computation and return a standardized result dictionary
-        reason = self._applicable()
-        if reason is not None:
-            return self._generate_return_structure_error(reason)
-
-        try:
-            # Flatten 2D data (one column arrives as shape (1, N))
-            array = np.asarray(self.data, dtype = float).flatten()
-            variance = float(np.var(array, ddof = 1))
-        except Exception as e:
-            return self._generate_return_structure_error(str(e))
-
-        precision_note = False
+    def _precision_note(self, variance, moments, diagnostics):
+        # Loss-of-precision note for one variance
         if np.isnan(variance):
-            precision_note = (
+            return (
                 "NaN result: the variance is undefined. Inputs likely contained NaN "
                 "or the squared-deviation sum produced an undefined operation. Clean "
                 "the data before re-running."
             )
-        elif np.isinf(variance):
-            precision_note = (
+        if np.isinf(variance):
+            return (
                 "Overflow detected: the variance is infinite. The sum of squared "
                 "deviations exceeded the float64 range (~1.8e308)."
             )
-        elif np.abs(array).max() > 1e15:
-            precision_note = (
+        if diagnostics["max_abs"] > 1e15:
+            return (
                 "Large-magnitude values detected (>1e15). Sample variance uses the "
                 "sum of squared deviations, which can overflow or lose precision at "
                 "this scale — Enhanced Precision digits past the ~15th are unreliable."
             )
-        elif variance != 0 and variance < 2.2250738585072014e-308:
-            precision_note = (
+        if variance != 0 and variance < 2.2250738585072014e-308:
+            return (
                 f"Subnormal result (variance ≈ {variance:.3g}, below ~2.2e-308). "
                 "Float64 loses bits of precision in the subnormal range; treat "
                 "low-order digits as noise."
             )
-        else:
-            mean_abs = abs(float(np.mean(array)))
-            spread = float(array.max() - array.min())
-            if mean_abs > 1e8 and spread > 0 and spread < mean_abs * 1e-6:
-                precision_note = (
-                    "Catastrophic cancellation risk: values are nearly identical relative to "
-                    "their magnitude. The computed variance may have fewer significant digits "
-                    "than expected — Enhanced Precision will expose the noisy bits."
-                )
+        mean_abs = abs(moments["mean"])
+        spread = diagnostics["max"] - diagnostics["min"]
+        if mean_abs > 1e8 and spread > 0 and spread < mean_abs * 1e-6:
+            return (
+                "Catastrophic cancellation risk: values are nearly identical relative to "
+                "their magnitude. The computed variance may have fewer significant digits "
+                "than expected — Enhanced Precision will expose the noisy bits."
+            )
+        return False
+
+    def _compute_per_column(self):
+        # One vectorized moment pass over every column (axis=1 of the data matrix)
+        try:
+            columns = descriptive_stats(self.data).columns()
+            values = columns.moments()["variance"]
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
+
+        notes = [
+            self._precision_note(value, columns.moments_at(i), columns.diagnostics_at(i))
+            for i, value in enumerate(values)
+        ]
+        result = self._generate_return_structure(None)
+        return per_column_result(result, values.tolist(), notes, self.metadata)
+
+    def compute(self):
+        # Perform the statistical computation and return a standardized result dictionary
+        reason = self._applicable()
+        if reason is not None:
+            return self._generate_return_structure_error(reason)
+        if per_column_requested(self.params):
+            return self._compute_per_column()
+
+        try:
+            # Flatten 2D data (one column arrives as shape (1, N)) via the shared engine
+            stats = descriptive_stats(self.data)
+            moments = stats.moments()
+            variance = moments["variance"]
+            diagnostics = stats.diagnostics()
+        except Exception as e:
+            return self._generate_return_structure_error(str(e))
 
         results = self._generate_return_structure(variance)
-        results["loss_of_precision"] = precision_note
+        results["loss_of_precision"] = self._precision_note(variance, moments, diagnostics)
         return results
 
     def create_graphic(self, results):
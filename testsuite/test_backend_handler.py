@@ -0,0 +1,701 @@
+# test_backend_handler.py
+# Tests for the method-dispatch paths of seniordesign/backend_handler.py
+# Run from the seniordesign/ root: pytest testsuite/test_backend_handler.py -v
+
+import sys
+import os
+import math
+import threading
+import time
+import numpy as np
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – backend_handler imports methods/ as a package from the root
+# ---------------------------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+from backend_handler import BackendHandler  # noqa: E402
+from class_templates.message_structure import Message  # noqa: E402
+from backend_support.executors import attach_array, share_array, SharedArrayRef  # noqa: E402
+from backend_support.result_cache import ResultCache  # noqa: E402
+from backend_support.cancellation import CancelToken, RunCancelled, check_cancelled  # noqa: E402
+
+
+pytestmark = pytest.mark.usefixtures("package_imports")
+
+
+METHOD_REQUESTS = [
+    ("mean", {}),
+    ("median", {}),
+    ("variance", {}),
+    ("percentile", [25, 75]),
+    ("mean", {}),
+]
+
+
+@pytest.fixture
+def data():
+    return np.array([[2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]])
+
+
+@pytest.fixture(scope="module")
+def process_handler(package_imports):
+    handler = BackendHandler(executor="process", max_workers=2, cache_dir=None)
+    yield handler
+    handler.shutdown()
+
+
+# ===========================================================================
+# Construction
+# ===========================================================================
+
+class TestConstruction:
+    def test_default_is_thread_executor(self):
+        handler = BackendHandler()
+        assert handler.executor == "thread"
+        assert handler.max_workers == 4
+
+    def test_unknown_executor_rejected(self):
+        with pytest.raises(ValueError):
+            BackendHandler(executor="gpu")
+
+    def test_zero_workers_rejected(self):
+        with pytest.raises(ValueError):
+            BackendHandler(max_workers=0)
+
+
+# ===========================================================================
+# Executor backends agree
+# ===========================================================================
+
+class TestExecutors:
+    def _check(self, results, per_method_ms):
+        values = [r["value"] for r in results]
+        assert all(r["ok"] for r in results), results
+        assert math.isclose(values[0], 5.0)
+        assert math.isclose(values[1], 4.5)
+        assert math.isclose(values[2], 32 / 7)
+        assert values[3] == [4.0, 5.5]
+        # The duplicate "mean" gets a #<idx> suffix on whichever finishes second
+        assert len(per_method_ms) == len(METHOD_REQUESTS)
+        assert {"median", "variance", "percentile", "mean"} <= set(per_method_ms)
+
+    def test_inline(self, data):
+        handler = BackendHandler(executor="inline", cache_dir=None)
+        self._check(*handler._compute(METHOD_REQUESTS, data, {}))
+
+    def test_thread(self, data):
+        handler = BackendHandler(executor="thread", max_workers=2, cache_dir=None)
+        self._check(*handler._compute(METHOD_REQUESTS, data, {}))
+
+    def test_process(self, data, process_handler):
+        self._check(*process_handler._compute(METHOD_REQUESTS, data, {}))
+
+    def test_process_with_string_data(self, process_handler):
+        """Object arrays can't live in shared memory; they are pickled instead."""
+        results, _ = process_handler._compute([("mode", {})], np.array([["a", "b", "b"]]), {})
+        assert results[0]["ok"] is True
+        assert results[0]["value"] == "b"
+
+    def test_unknown_method_reports_error(self, data):
+        results, _ = BackendHandler(executor="inline", cache_dir=None)._compute([("nope", {})], data, {})
+        assert results[0]["ok"] is False
+
+
+# ===========================================================================
+# Shared memory helpers
+# ===========================================================================
+
+class TestSharedArray:
+    def test_round_trip(self, data):
+        with share_array(data) as ref:
+            assert isinstance(ref, SharedArrayRef)
+            with attach_array(ref) as view:
+                assert np.array_equal(view, data)
+                assert view.flags.writeable is False
+
+    def test_non_numeric_passes_through(self):
+        raw = np.array(["x", "y"])
+        with share_array(raw) as ref:
+            assert ref is raw
+
+
+# ===========================================================================
+# Result cache
+# ===========================================================================
+
+class TestResultCache:
+    def test_second_run_is_served_from_cache(self, data, tmp_path, monkeypatch):
+        handler = BackendHandler(executor="inline", cache_dir=str(tmp_path))
+        first = handler.worker("mean", data, {}, {})
+
+        # A hit must not instantiate the method again
+        method_class = handler.statistical_methods["mean"]
+        monkeypatch.setattr(method_class, "compute", lambda self: pytest.fail("recomputed"))
+        second = handler.worker("mean", data.copy(), {}, {})
+        assert second == first
+
+    def test_key_depends_on_data_method_and_params(self, data, tmp_path):
+        handler = BackendHandler(executor="inline", cache_dir=str(tmp_path))
+        cache = handler.result_cache
+        pct = handler.statistical_methods["percentile"]
+        base = cache.key(data, "percentile", [25], pct)
+        assert cache.key(data.copy(), "percentile", [25], pct) == base
+        assert cache.key(data, "percentile", [75], pct) != base
+        assert cache.key(data + 1, "percentile", [25], pct) != base
+        assert cache.key(data, "median", [25], pct) != base
+
+    def test_column_names_are_part_of_the_key(self, tmp_path):
+        # Per-column results label themselves from metadata["columns"]
+        data = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        first = BackendHandler(executor="inline", cache_dir=str(tmp_path))
+        result = first.worker("mean", data, {"columns": ["alpha", "beta"]}, {"per_column": True})
+        assert result["columns"] == ["alpha", "beta"]
+        second = BackendHandler(executor="inline", cache_dir=str(tmp_path))
+        result = second.worker("mean", data, {"columns": ["gamma", "delta"]}, {"per_column": True})
+        assert result["columns"] == ["gamma", "delta"]
+
+    def test_matrix_columns_follow_the_metadata(self, tmp_path):
+        data = np.array([[1.0, 2.0, 3.0, 4.0], [2.0, 4.1, 5.9, 8.0], [4.0, 3.0, 2.5, 1.0]])
+        for names in (["alpha", "beta", "gamma"], ["x", "y", "z"]):
+            handler = BackendHandler(executor="inline", cache_dir=str(tmp_path))
+            result = handler.worker("pearson", data, {"columns": names}, {"matrix": True})
+            assert result["value"]["columns"] == names
+
+    def test_regression_labels_follow_the_metadata(self, tmp_path):
+        data = np.array([[1.0, 2.0, 3.0, 4.0, 5.0], [2.0, 4.1, 5.9, 8.0, 10.2],
+                         [4.0, 3.0, 2.5, 1.0, 0.3]])
+        for names in (["a", "b", "c"], ["u", "v", "w"]):
+            handler = BackendHandler(executor="inline", cache_dir=str(tmp_path))
+            result = handler.worker("least_squares_regression", data, {"columns": names},
+                                    {"model": "screen"})
+            assert result["columns"] == names[:2]
+            assert result["value"][0]["equation"].startswith(f"{names[2]} = ")
+
+    def test_failed_results_are_not_cached(self, tmp_path):
+        handler = BackendHandler(executor="inline", cache_dir=str(tmp_path))
+        result = handler.worker("variance", np.array([[1.0]]), {}, {})
+        assert result["ok"] is False
+        assert not any(tmp_path.rglob("*.json"))
+
+    def test_lru_eviction_keeps_recent_entries(self, tmp_path):
+        cache = ResultCache(str(tmp_path), max_bytes=600)
+        payload = {"id": "mean", "ok": True, "value": "x" * 100}
+        for i in range(10):
+            cache.put(f"{i:02d}" + "a" * 38, payload)
+            os.utime(cache._path(f"{i:02d}" + "a" * 38), (i, i))
+        cache.evict()
+        assert cache.get("09" + "a" * 38) is not None
+        assert cache.get("00" + "a" * 38) is None
+        assert sum(p.stat().st_size for p in tmp_path.rglob("*.json")) <= 600
+
+    def test_disabled_cache(self, data):
+        assert BackendHandler(cache_dir=None).result_cache is None
+
+
+# ===========================================================================
+# Streaming results (on_result)
+# ===========================================================================
+
+class TestOnResult:
+    def _collect(self):
+        received = []
+        return received, lambda kind, idx, result: received.append((kind, idx, result))
+
+    @pytest.mark.parametrize("executor", ["inline", "thread"])
+    def test_every_method_reported_once(self, data, executor):
+        received, on_result = self._collect()
+        handler = BackendHandler(executor=executor, max_workers=2, cache_dir=None)
+        results, _ = handler._compute(METHOD_REQUESTS, data, {}, on_result)
+        assert sorted(idx for _, idx, _ in received) == list(range(len(METHOD_REQUESTS)))
+        assert all(kind == "method" for kind, _, _ in received)
+        for _, idx, result in received:
+            assert result is results[idx]
+
+    def test_process_results_reported(self, data, process_handler):
+        received, on_result = self._collect()
+        results, _ = process_handler._compute(METHOD_REQUESTS, data, {}, on_result)
+        assert sorted(idx for _, idx, _ in received) == list(range(len(METHOD_REQUESTS)))
+        by_index = {idx: result for _, idx, result in received}
+        assert [r["value"] for r in results] == [by_index[i]["value"] for i in range(len(results))]
+
+    def test_inline_reports_in_completion_order(self, data):
+        received, on_result = self._collect()
+        BackendHandler(executor="inline", cache_dir=None)._compute(METHOD_REQUESTS, data, {}, on_result)
+        assert [idx for _, idx, _ in received] == list(range(len(METHOD_REQUESTS)))
+
+    def test_failing_callback_does_not_fail_run(self, data):
+        def on_result(kind, idx, result):
+            raise RuntimeError("consumer broke")
+
+        handler = BackendHandler(executor="thread", max_workers=2, cache_dir=None)
+        results, _ = handler._compute(METHOD_REQUESTS, data, {}, on_result)
+        assert all(r["ok"] for r in results)
+
+    def test_charts_reported(self, tmp_path):
+        received, on_result = self._collect()
+        handler = BackendHandler(executor="inline", cache_dir=None)
+        handler._chart_generation_methods = {}  # don't start the renderer pool
+        charts, _ = handler._generate_charts(
+            [{"type": "no_such_chart"}, {"type": "also_missing"}],
+            [[1.0, 2.0]], {}, str(tmp_path), on_result,
+        )
+        assert sorted((kind, idx) for kind, idx, _ in received) == [("chart", 0), ("chart", 1)]
+        assert received[0][2] in charts
+
+
+# ===========================================================================
+# Cancellation and deadlines
+# ===========================================================================
+
+def _cooperative_hang(method_id, data, metadata, params):
+    """Stand-in for a method that never finishes but honours its token."""
+    while True:
+        check_cancelled()
+        time.sleep(0.01)
+
+
+class TestCancellation:
+    @pytest.mark.parametrize("executor", ["inline", "thread"])
+    def test_cancelled_token_skips_methods(self, data, executor):
+        token = CancelToken()
+        token.cancel()
+        handler = BackendHandler(executor=executor, max_workers=2, cache_dir=None)
+        results, _ = handler._compute(METHOD_REQUESTS, data, {}, cancel_token=token)
+        assert not any(r["ok"] for r in results)
+
+    def test_cancel_stops_running_thread_method(self, data):
+        token = CancelToken()
+        handler = BackendHandler(executor="thread", max_workers=2, cache_dir=None)
+        handler.worker = _cooperative_hang
+        threading.Timer(0.2, token.cancel).start()
+        t0 = time.monotonic()
+        results, _ = handler._compute([("mean", {})], data, {}, cancel_token=token)
+        assert time.monotonic() - t0 < 5
+        assert results[0]["ok"] is False
+
+    def test_deadline_turns_hung_method_into_error(self, data, monkeypatch):
+        import backend_handler
+        monkeypatch.setattr(backend_handler, "_WORKER_JOIN_TIMEOUT_SECONDS", 0.3)
+        handler = BackendHandler(executor="thread", max_workers=2, cache_dir=None)
+        handler.worker = _cooperative_hang
+        token = CancelToken()
+        results, _ = handler._compute([("mean", {})], data, {}, cancel_token=token)
+        assert results[0]["ok"] is False
+        # The phase timed out; the run itself was not cancelled
+        assert token.cancelled is False
+
+    def test_kill_stops_running_process_workers(self):
+        handler = BackendHandler(executor="process", max_workers=2, cache_dir=None)
+        pool = handler._get_process_pool()
+        future = pool.submit(time.sleep, 60)
+        deadline = time.monotonic() + 30
+        while not future.running() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        workers = pool.worker_processes()
+        assert workers
+        # Every worker the executor started is tracked without its private map
+        assert set(workers) >= {p for p in getattr(pool, "_processes", {}).values() if p.is_alive()}
+        handler._kill_process_pool()
+        for process in workers:
+            process.join(10)
+            assert not process.is_alive()
+        assert handler._process_pool is None
+
+    def test_process_pool_recovers_after_kill(self, data, process_handler):
+        process_handler._compute(METHOD_REQUESTS, data, {})
+        process_handler._kill_process_pool()
+        results, _ = process_handler._compute(METHOD_REQUESTS, data, {})
+        assert all(r["ok"] for r in results)
+
+    def test_cancelled_run_is_not_persisted(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        token = CancelToken()
+        handler = BackendHandler(executor="inline", cache_dir=None)
+        handler._chart_generation_methods = {}  # don't start the renderer pool
+
+        def on_result(kind, idx, result):
+            if kind == "chart":
+                token.cancel()
+
+        message = Message(
+            dataset_id="ds",
+            dataset_version=1,
+            methods=[{"id": "mean", "params": {}}],
+            graphics=[{"type": "no_such_chart"}],
+            data=[[1.0, 2.0, 3.0]],
+        )
+        with pytest.raises(RunCancelled):
+            handler.handle_request(message, on_result=on_result, cancel_token=token)
+        assert os.listdir(tmp_path / "results_cache") == []
+
+
+# ===========================================================================
+# Batch requests (handle_requests)
+# ===========================================================================
+
+class _FakeChart:
+    """Chart stand-in that writes a tiny file and counts renders."""
+    renders = 0
+
+    def __init__(self, data, metadata, params):
+        self.params = params
+
+    def create_graphic(self):
+        type(self).renders += 1
+        with open(self.params["path"], "wb") as f:
+            f.write(b"png")
+        return {"type": "fake", "ok": True, "path": self.params["path"],
+                "error": None, "params_used": self.params}
+
+
+class TestHandleRequests:
+    def _messages(self, *datasets, graphics=None):
+        return [
+            Message(
+                dataset_id=f"ds{i}",
+                dataset_version=1,
+                methods=[{"id": "mean", "params": {}}, {"id": "percentile", "params": [25, 75]}],
+                graphics=[dict(g) for g in (graphics or [])],
+                data=[list(column) for column in dataset],
+            )
+            for i, dataset in enumerate(datasets)
+        ]
+
+    def _counting_handler(self, monkeypatch, executor="thread"):
+        handler = BackendHandler(executor=executor, max_workers=2, cache_dir=None)
+        handler._chart_generation_methods = {"fake": _FakeChart}
+        calls = []
+        worker = handler.worker
+
+        def counting_worker(method_id, data, metadata, params):
+            calls.append(method_id)
+            return worker(method_id, data, metadata, params)
+
+        monkeypatch.setattr(handler, "worker", counting_worker)
+        return handler, calls
+
+    def test_identical_work_computed_once(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        handler, calls = self._counting_handler(monkeypatch)
+        dataset = [[1.0, 2.0, 3.0, 4.0]]
+        first, second = handler.handle_requests(self._messages(dataset, dataset))
+        assert sorted(calls) == ["mean", "percentile"]
+        assert first.results == second.results
+        assert first.results[0] is not second.results[0]
+        assert first.data is second.data  # one converted array for both
+        assert first.run_folder != second.run_folder
+        assert first.timings["batch_size"] == 2
+
+    def test_matches_single_requests(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        datasets = ([[1.0, 5.0, 9.0]], [[2.0, 4.0, 8.0, 16.0]])
+        batch = BackendHandler(cache_dir=None).handle_requests(self._messages(*datasets))
+        single = [BackendHandler(cache_dir=None).handle_request(m) for m in self._messages(*datasets)]
+        assert [m.results for m in batch] == [m.results for m in single]
+        assert [set(m.timings["per_method_ms"]) for m in batch] == [{"mean", "percentile"}] * 2
+
+    def test_process_executor(self, tmp_path, monkeypatch, process_handler):
+        monkeypatch.chdir(tmp_path)
+        dataset = [[3.0, 1.0, 2.0]]
+        messages = process_handler.handle_requests(self._messages(dataset, dataset, [[7.0, 9.0]]))
+        assert [m.results[0]["value"] for m in messages] == [2.0, 2.0, 8.0]
+
+    def test_every_target_reported(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        handler, _ = self._counting_handler(monkeypatch)
+        received = []
+        dataset = [[1.0, 2.0]]
+        messages = handler.handle_requests(
+            self._messages(dataset, dataset),
+            on_result=lambda m_idx, kind, idx, result: received.append((m_idx, kind, idx, result)),
+        )
+        assert sorted((m, k, i) for m, k, i, _ in received) == [
+            (0, "method", 0), (0, "method", 1), (1, "method", 0), (1, "method", 1),
+        ]
+        for m_idx, _, idx, result in received:
+            assert result is messages[m_idx].results[idx]
+
+    def test_identical_charts_rendered_once(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        handler, _ = self._counting_handler(monkeypatch, executor="inline")
+        _FakeChart.renders = 0
+        dataset = [[1.0, 2.0]]
+        first, second = handler.handle_requests(
+            self._messages(dataset, dataset, graphics=[{"type": "fake"}])
+        )
+        assert _FakeChart.renders == 1
+        for message in (first, second):
+            [chart] = message.graphics
+            assert chart["ok"]
+            assert os.path.dirname(chart["path"]) == message.run_folder
+            assert os.path.isfile(chart["path"])
+
+    def test_cancelled_batch_is_not_persisted(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        handler, _ = self._counting_handler(monkeypatch, executor="inline")
+        token = CancelToken()
+
+        def on_result(m_idx, kind, idx, result):
+            if kind == "chart":
+                token.cancel()
+
+        with pytest.raises(RunCancelled):
+            handler.handle_requests(
+                self._messages([[1.0]], [[2.0]], graphics=[{"type": "fake"}]),
+                on_result=on_result, cancel_token=token,
+            )
+        assert os.listdir(tmp_path / "results_cache") == []
+
+
+class TestBatchPlan:
+    def test_keyed_jobs_merge(self):
+        from backend_support.batch import BatchPlan, job_key
+        plan = BatchPlan()
+        key = job_key("digest", "mean", {})
+        assert plan.add(key, "job", (0, 0)) == plan.add(job_key("digest", "mean", {}), "job", (1, 0))
+        assert plan.add(None, "job", (2, 0)) == 1
+        assert plan.targets == [[(0, 0), (1, 0)], [(2, 0)]]
+
+    def test_unkeyable_work_not_merged(self):
+        from backend_support.batch import job_key
+        assert job_key(None, "mean", {}) is None
+        assert job_key("digest", "mean", {"x": np.array([1])}) is None
+
+
+# ===========================================================================
+# Run-scoped toolbox
+# ===========================================================================
+
+class _ComposedCustom:
+    """Custom method stand-in that calls its toolbox like generated code does."""
+    calls = ()
+
+    def __init__(self, data, metadata, params=None, toolbox=None):
+        self.data = data
+        self.toolbox = toolbox or {}
+
+    def compute(self):
+        try:
+            value = [self.toolbox[mid](self.data) for mid in self.calls]
+        except Exception as exc:
+            return {"id": "custom", "ok": False, "value": None, "error": str(exc),
+                    "loss_of_precision": False, "params_used": {}}
+        return {"id": "custom", "ok": True, "value": value, "error": None,
+                "loss_of_precision": False, "params_used": {}}
+
+
+def _custom(*calls):
+    return type("Custom", (_ComposedCustom,), {"calls": calls})
+
+
+class TestRunToolbox:
+    def _handler(self, monkeypatch, executor="thread", **customs):
+        handler = BackendHandler(executor=executor, max_workers=2, cache_dir=None)
+        handler.statistical_methods.update(customs)
+        computed = []
+        compute_builtin = handler._compute_builtin
+
+        def counting(method_id, *args):
+            computed.append(method_id)
+            return compute_builtin(method_id, *args)
+
+        monkeypatch.setattr(handler, "_compute_builtin", counting)
+        return handler, computed
+
+    @pytest.mark.parametrize("executor", ["inline", "thread"])
+    def test_custom_reuses_builtins_of_the_run(self, data, monkeypatch, executor):
+        handler, computed = self._handler(
+            monkeypatch, executor, custom_spread=_custom("mean", "standard_deviation")
+        )
+        results, _ = handler._compute(
+            [("mean", {}), ("standard_deviation", {}), ("custom_spread", {})], data, {}
+        )
+        assert sorted(computed) == ["mean", "standard_deviation"]
+        assert results[2]["value"] == [results[0]["value"], results[1]["value"]]
+
+    def test_duplicate_builtin_results_are_separate_dicts(self, data, monkeypatch):
+        handler, computed = self._handler(monkeypatch)
+        results, _ = handler._compute([("mean", {}), ("mean", {})], data, {})
+        assert computed == ["mean"]
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+
+    def test_tool_values_are_private_copies(self, data, monkeypatch):
+        class Mutating(_ComposedCustom):
+            def compute(self):
+                self.toolbox["percentile"](self.data, [25, 75])[0] = -999
+                return super().compute()
+
+        handler, computed = self._handler(monkeypatch, custom_mutating=Mutating)
+        results, _ = handler._compute([("percentile", [25, 75]), ("custom_mutating", {})], data, {})
+        assert computed == ["percentile"]
+        assert results[0]["value"] == list(np.percentile(data, [25, 75]))
+
+    def test_different_params_not_shared(self, data, monkeypatch):
+        handler, computed = self._handler(monkeypatch)
+        handler._compute([("percentile", [25]), ("percentile", [75])], data, {})
+        assert computed == ["percentile", "percentile"]
+
+    def test_tools_built_once_per_run(self, monkeypatch):
+        from backend_support.toolbox import RunToolbox
+        handler, _ = self._handler(monkeypatch)
+        run_tools = RunToolbox(handler)
+        first, second = run_tools.for_method("custom_a"), run_tools.for_method("custom_b")
+        assert first["mean"] is second["mean"]
+        assert "custom_a" not in first
+
+    def test_circular_dependency_reported(self, data, monkeypatch):
+        handler, _ = self._handler(
+            monkeypatch, custom_a=_custom("custom_b"), custom_b=_custom("custom_a")
+        )
+        [result] = handler._compute([("custom_a", {})], data, {})[0]
+        assert result["ok"] is False
+        assert "Circular dependency" in result["error"]
+
+    def test_memo_is_single_flight(self):
+        from backend_support.toolbox import ResultMemo
+        memo = ResultMemo()
+        calls = []
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return {"ok": True}
+
+        threads = [
+            threading.Thread(target=memo.get_or_compute, args=("key", None, compute))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        release.set()
+        for t in threads:
+            t.join()
+        assert calls == [1]
+        assert memo.hits == 3
+
+
+# ===========================================================================
+# Sandboxed custom methods
+# ===========================================================================
+
+MEAN_CODE = "result = float(np.mean(np.array(data, dtype=float)))\n"
+SPIN_CODE = "x = 0\nwhile x >= 0:\n    x += 1\nresult = float(x)\n"
+
+
+class TestSandbox:
+
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        import custom_methods_loader as cml
+        from custom_method_support import store
+        custom_dir = tmp_path / "custom_methods"
+        monkeypatch.setattr(cml, "_CUSTOM_METHODS_DIR", str(custom_dir))
+        monkeypatch.setattr(cml, "_CUSTOM_METHODS_JSON", str(custom_dir / "custom_methods.json"))
+        store.clear_caches()
+        cml._ensure_dir()
+        yield cml
+        store.clear_caches()
+
+    @pytest.fixture
+    def pool(self, tmp_path):
+        from backend_support.sandbox import SandboxPool
+        pool = SandboxPool(num_workers=1, cache_dir=str(tmp_path / "cache"), cpu_seconds=1)
+        yield pool
+        pool.shutdown()
+
+    @staticmethod
+    def _save(cml, name, code):
+        ok, message = cml.save_custom_method(
+            name=name,
+            description="Sandbox test.",
+            input_type="one_column",
+            output_type="scalar",
+            user_code=code,
+        )
+        assert ok is True, message
+
+    @staticmethod
+    def _handler(tmp_path, pool):
+        handler = BackendHandler(executor="thread", cache_dir=str(tmp_path / "cache"))
+        handler._sandbox_pool = pool
+        handler.reload_methods()
+        return handler
+
+    def test_stored_method_runs_in_sandbox(self, data, store, pool, tmp_path):
+        self._save(store, "Mean", MEAN_CODE)
+        handler = self._handler(tmp_path, pool)
+        usage = {}
+        [result] = handler._compute([("custom_mean", {})], data, {}, usage=usage)[0]
+        assert result["ok"] is True, result["error"]
+        assert result["value"] == pytest.approx(5.0)
+        assert usage["custom_mean"]["cpu_ms"] >= 0.0
+        assert pool.health()[0]["alive"] is True
+
+    def test_builtins_stay_in_process(self, data, store, pool, tmp_path):
+        handler = self._handler(tmp_path, pool)
+        usage = {}
+        [result] = handler._compute([("mean", {})], data, {}, usage=usage)[0]
+        assert result["value"] == pytest.approx(5.0)
+        assert usage == {}
+        assert all(not w["alive"] for w in pool.health())
+
+    def test_cpu_limit_stops_runaway_method(self, data, store, pool, tmp_path):
+        self._save(store, "Spin", SPIN_CODE)
+        self._save(store, "Mean", MEAN_CODE)
+        handler = self._handler(tmp_path, pool)
+        spin, mean = handler._compute([("custom_spin", {}), ("custom_mean", {})], data, {})[0]
+        assert spin["ok"] is False
+        assert "CPU time limit" in spin["error"]
+        assert mean["value"] == pytest.approx(5.0)
+        assert pool.health()[0]["restarts"] == 1
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="RLIMIT_AS accounting")
+    def test_memory_limit_counts_from_the_attached_data(self, store, tmp_path):
+        from backend_support.sandbox import SandboxPool
+        # ~96 MB of data under a 160 MB allowance: the method's one copy of
+        # it fits, an allocation past the allowance does not
+        self._save(store, "Mean", MEAN_CODE)
+        self._save(store, "Hog", "result = float(np.ones(40_000_000).sum())\n")
+        pool = SandboxPool(num_workers=1, cache_dir=str(tmp_path / "cache"), memory_mb=160)
+        try:
+            handler = self._handler(tmp_path, pool)
+            large = np.full((1, 12_000_000), 2.0)
+            for _ in range(2):
+                mean, hog = handler._compute([("custom_mean", {}), ("custom_hog", {})], large, {})[0]
+                assert mean["ok"] is True, mean["error"]
+                assert mean["value"] == pytest.approx(2.0)
+                assert hog["ok"] is False
+        finally:
+            pool.shutdown()
+
+    def test_cancel_kills_worker(self, data, store, pool, tmp_path):
+        self._save(store, "Sleepy", SPIN_CODE)
+        self._save(store, "Mean", MEAN_CODE)
+        handler = self._handler(tmp_path, pool)
+        # Start the worker first: a cold forkserver start can outlast the waits below
+        handler._compute([("custom_mean", {})], data, {})
+        token = CancelToken()
+        threading.Timer(0.5, token.cancel).start()
+        t0 = time.perf_counter()
+        with pytest.raises(RunCancelled):
+            handler.handle_request(
+                Message(
+                    dataset_id="ds",
+                    dataset_version=1,
+                    methods=[{"id": "custom_sleepy", "params": {}}],
+                    graphics=[],
+                    data=data.tolist(),
+                ),
+                cancel_token=token,
+            )
+        assert time.perf_counter() - t0 < 10
+        # The handler stops waiting at once; the method's thread kills the worker
+        deadline = time.monotonic() + 5
+        while pool.health()[0]["restarts"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool.health()[0] == {"worker": 0, "alive": False, "restarts": 1}
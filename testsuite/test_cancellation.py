@@ -0,0 +1,99 @@
+# test_cancellation.py
+# Tests for the run cancellation tokens located in seniordesign/backend_support/cancellation.py
+# Run from the seniordesign/ root: pytest testsuite/test_cancellation.py -v
+
+import sys
+import os
+import threading
+import time
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – backend_support/ is imported as a package from the root
+# ---------------------------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+from backend_support.cancellation import (  # noqa: E402
+    CancelToken,
+    RunCancelled,
+    bind_token,
+    check_cancelled,
+    current_token,
+)
+
+
+# ===========================================================================
+# CancelToken
+# ===========================================================================
+
+class TestCancelToken:
+
+    def test_starts_live(self):
+        token = CancelToken()
+        assert token.cancelled is False
+        assert token.reason is None
+        token.raise_if_cancelled()
+
+    def test_cancel_records_first_reason(self):
+        token = CancelToken()
+        token.cancel("first")
+        token.cancel("second")
+        assert token.cancelled is True
+        with pytest.raises(RunCancelled, match="first"):
+            token.raise_if_cancelled()
+
+    def test_child_follows_parent(self):
+        parent = CancelToken()
+        child = parent.child()
+        parent.cancel("stop")
+        assert child.cancelled is True
+        assert child.reason == "stop"
+
+    def test_child_cancel_leaves_parent(self):
+        parent = CancelToken()
+        parent.child().cancel()
+        assert parent.cancelled is False
+
+    def test_lease_expires_without_renewal(self):
+        token = CancelToken(lease_seconds=0.05)
+        time.sleep(0.1)
+        assert token.cancelled is True
+        assert "went away" in token.reason
+
+    def test_renew_keeps_lease(self):
+        token = CancelToken(lease_seconds=0.2)
+        for _ in range(5):
+            time.sleep(0.05)
+            token.renew()
+        assert token.cancelled is False
+
+
+# ===========================================================================
+# Thread binding
+# ===========================================================================
+
+class TestBindToken:
+
+    def test_check_without_token_is_noop(self):
+        assert current_token() is None
+        check_cancelled()
+
+    def test_bound_token_checked(self):
+        token = CancelToken()
+        with bind_token(token):
+            assert current_token() is token
+            check_cancelled()
+            token.cancel()
+            with pytest.raises(RunCancelled):
+                check_cancelled()
+        assert current_token() is None
+
+    def test_binding_is_per_thread(self):
+        token = CancelToken()
+        token.cancel()
+        seen = []
+        with bind_token(token):
+            thread = threading.Thread(target=lambda: seen.append(current_token()))
+            thread.start()
+            thread.join()
+        assert seen == [None]
@@ -0,0 +1,116 @@
+# test_csv_ingest.py
+# Tests for the chunked CSV ingestion located in seniordesign/Frontend/logic/csv_ingest.py
+# Run from the seniordesign/ root: pytest testsuite/test_csv_ingest.py -v
+
+import sys
+import os
+import io
+import numpy as np
+import pandas as pd
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – logic/ is imported the way the Frontend imports it
+# ---------------------------------------------------------------------------
+_FRONTEND = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Frontend"))
+sys.path.insert(0, _FRONTEND)
+from logic.csv_ingest import CsvIngest, IngestCancelled, detect_has_headers  # noqa: E402
+
+
+def _csv(df: pd.DataFrame, header: bool = True) -> bytes:
+    return df.to_csv(index=False, header=header).encode()
+
+
+def _frame(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "value": rng.normal(size=n),
+        "label": [f"row{i}" for i in range(n)],
+    })
+
+
+# ===========================================================================
+# detect_has_headers
+# ===========================================================================
+
+class TestDetectHasHeaders:
+
+    def test_text_header_over_numbers(self):
+        assert detect_has_headers(b"a,b\n1,2\n3,4\n") is True
+
+    def test_numeric_first_row_is_data(self):
+        assert detect_has_headers(b"1,2\n3,4\n5,6\n") is False
+
+    def test_single_row_is_data(self):
+        assert detect_has_headers(b"a,b\n") is False
+
+    def test_all_text_assumes_headers(self):
+        assert detect_has_headers(b"name,city\nann,rome\nbob,oslo\n") is True
+
+    def test_unparseable_defaults_to_headers(self):
+        assert detect_has_headers(b"") is True
+
+
+# ===========================================================================
+# CsvIngest
+# ===========================================================================
+
+class TestCsvIngest:
+
+    def test_matches_single_read_csv(self):
+        raw = _csv(_frame(1234))
+        ingest = CsvIngest(raw, chunk_rows=100, preview_rows=250)
+        df = ingest.run()
+        expected = pd.read_csv(io.BytesIO(raw))
+        pd.testing.assert_frame_equal(df, expected)
+        assert ingest.has_headers is True
+        assert ingest.rows_loaded == 1234
+        assert ingest.progress == 1.0
+
+    def test_preview_is_first_rows(self):
+        raw = _csv(_frame(1000))
+        ingest = CsvIngest(raw, chunk_rows=100, preview_rows=250)
+        df = ingest.run()
+        assert len(ingest.preview) == 250
+        pd.testing.assert_frame_equal(ingest.preview, df.iloc[:250])
+
+    def test_small_file_preview_is_whole_frame(self):
+        raw = _csv(_frame(20))
+        ingest = CsvIngest(raw, chunk_rows=100, preview_rows=250)
+        df = ingest.run()
+        assert ingest.preview is df
+
+    def test_dtype_widens_across_chunks(self):
+        # Integers in the first chunk, a float and a missing value later on
+        rows = [f"{i},{i}" for i in range(300)] + ["1.5,0", "2,"]
+        raw = ("x,y\n" + "\n".join(rows) + "\n").encode()
+        df = CsvIngest(raw, chunk_rows=100).run()
+        assert df["x"].dtype == np.float64
+        assert df["y"].dtype == np.float64
+        assert df["x"].iloc[300] == 1.5
+        assert np.isnan(df["y"].iloc[301])
+
+    def test_headerless_columns_named(self):
+        raw = _csv(pd.DataFrame({"a": range(500), "b": range(500)}), header=False)
+        ingest = CsvIngest(raw, chunk_rows=100, preview_rows=150)
+        df = ingest.run()
+        assert ingest.has_headers is False
+        assert list(df.columns) == ["Column 1", "Column 2"]
+        assert list(ingest.preview.columns) == ["Column 1", "Column 2"]
+        assert len(df) == 500
+        assert df.iloc[0, 0] == 0
+
+    def test_single_line_file_is_one_data_row(self):
+        # Same call the homepage always made: one row can't be a header
+        ingest = CsvIngest(b"a,b,c\n")
+        df = ingest.run()
+        assert ingest.has_headers is False
+        assert list(df.columns) == ["Column 1", "Column 2", "Column 3"]
+        assert df.iloc[0].tolist() == ["a", "b", "c"]
+
+    def test_cancel_stops_parse(self):
+        ingest = CsvIngest(_csv(_frame(500)), chunk_rows=100)
+        ingest.cancel()
+        with pytest.raises(IngestCancelled):
+            ingest.run()
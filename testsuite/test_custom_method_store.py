@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+
+import pytest
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import custom_methods_loader as cml  # noqa: E402
+from custom_method_support import store  # noqa: E402
+
+
+MEAN_CODE = """arr = np.array(data, dtype=float)
+result = float(np.mean(arr))
+"""
+
+MAX_CODE = """arr = np.array(data, dtype=float)
+result = float(np.max(arr))
+"""
+
+
+@pytest.fixture
+def isolated_custom_methods_store(tmp_path, monkeypatch):
+    custom_dir = tmp_path / "custom_methods"
+    custom_json = custom_dir / "custom_methods.json"
+
+    monkeypatch.setattr(cml, "_CUSTOM_METHODS_DIR", str(custom_dir))
+    monkeypatch.setattr(cml, "_CUSTOM_METHODS_JSON", str(custom_json))
+    store.clear_caches()
+
+    cml._ensure_dir()
+    yield tmp_path
+
+    store.clear_caches()
+
+
+def _save(name, code=MEAN_CODE):
+    ok, message = cml.save_custom_method(
+        name=name,
+        description="Store cache test.",
+        input_type="one_column",
+        output_type="scalar",
+        user_code=code,
+    )
+    assert ok is True, message
+
+
+def _update(method_id, name, code):
+    ok, message = cml.update_custom_method(
+        method_id=method_id,
+        name=name,
+        description="Store cache test.",
+        input_type="one_column",
+        output_type="scalar",
+        user_code=code,
+    )
+    assert ok is True, message
+
+
+def test_registry_is_read_once_until_the_file_changes(isolated_custom_methods_store, monkeypatch):
+    _save("First")
+    reads = []
+    real_load = json.load
+    monkeypatch.setattr(store.json, "load", lambda handle: reads.append(1) or real_load(handle))
+
+    assert [e["id"] for e in cml.load_custom_methods_registry()] == ["custom_first"]
+    cml.load_custom_methods_registry()
+    assert len(reads) == 1
+
+    _save("Second")
+    assert [e["id"] for e in cml.load_custom_methods_registry()] == ["custom_first", "custom_second"]
+    assert len(reads) == 2
+
+
+def test_registry_copies_are_independent(isolated_custom_methods_store):
+    _save("First")
+    registry = cml.load_custom_methods_registry()
+    registry[0]["display_name"] = "Changed"
+    registry.append({"id": "bogus"})
+    assert [e["display_name"] for e in cml.load_custom_methods_registry()] == ["First"]
+
+
+def test_external_registry_edit_is_seen(isolated_custom_methods_store):
+    _save("First")
+    cml.load_custom_methods_registry()
+    with open(cml._CUSTOM_METHODS_JSON, "w", encoding="utf-8") as handle:
+        json.dump([], handle)
+    assert cml.load_custom_methods_registry() == []
+
+
+def test_only_the_edited_module_is_reloaded(isolated_custom_methods_store):
+    _save("Stays")
+    _save("Edited")
+    before = cml.load_custom_method_classes()
+
+    _update("custom_edited", "Edited", MAX_CODE)
+    after = cml.load_custom_method_classes()
+
+    assert after["custom_stays"] is before["custom_stays"]
+    assert after["custom_edited"] is not before["custom_edited"]
+    assert after["custom_edited"]([[1.0, 5.0, 3.0]], {}).compute()["value"] == 5.0
+
+
+def test_touched_but_unchanged_module_is_reused(isolated_custom_methods_store):
+    _save("Touched")
+    before = cml.load_custom_method_classes()["custom_touched"]
+    path = os.path.join(cml._CUSTOM_METHODS_DIR, "custom_touched.py")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert cml.load_custom_method_classes()["custom_touched"] is before
+
+
+def test_deleted_method_is_dropped(isolated_custom_methods_store):
+    _save("Doomed")
+    assert "custom_doomed" in cml.load_custom_method_classes()
+    ok, _ = cml.delete_custom_method("custom_doomed")
+    assert ok is True
+    assert cml.load_custom_method_classes() == {}
+    assert not any("custom_doomed" in path for path in store._module_cache)
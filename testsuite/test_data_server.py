@@ -0,0 +1,266 @@
+# test_data_server.py
+# Tests for the AG Grid row server located in seniordesign/data_server.py
+# Run from the seniordesign/ root: pytest testsuite/test_data_server.py -v
+
+import sys
+import os
+import gzip
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import numpy as np
+import pandas as pd
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – data_server.py lives at the seniordesign/ root
+# ---------------------------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+import data_server  # noqa: E402
+
+
+def _get(path: str, accept_encoding: str | None = None, if_none_match: str | None = None):
+    """(status, headers, raw body) for a GET against the running server."""
+    request = urllib.request.Request(data_server.server_url() + path)
+    if accept_encoding is not None:
+        request.add_header("Accept-Encoding", accept_encoding)
+    if if_none_match is not None:
+        request.add_header("If-None-Match", if_none_match)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as resp:
+            return resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers, exc.read()
+
+
+@pytest.fixture
+def frame():
+    key = "test_data_server_frame"
+    df = pd.DataFrame({
+        "x": np.arange(2000, dtype=np.int64),
+        "y": np.linspace(0.0, 1.0, 2000),
+        "label": [f"row{i}" if i % 7 else None for i in range(2000)],
+    })
+    data_server.store_dataframe(key, df)
+    yield key, df
+    data_server.clear_dataframe(key)
+
+
+# ===========================================================================
+# /meta and /rows
+# ===========================================================================
+
+class TestJsonEndpoints:
+
+    def test_meta(self, frame):
+        key, df = frame
+        status, _, body = _get(f"/meta?key={key}")
+        assert status == 200
+        assert json.loads(body) == {"totalRows": 2000, "columns": ["x", "y", "label"]}
+
+    def test_rows_inclusive_range(self, frame):
+        key, df = frame
+        status, _, body = _get(f"/rows?key={key}&start=10&end=14")
+        rows = json.loads(body)
+        assert status == 200
+        assert [r["x"] for r in rows] == [10, 11, 12, 13, 14]
+        assert rows[0]["label"] == "row10"
+
+    def test_missing_values_are_null(self, frame):
+        key, _ = frame
+        rows = json.loads(_get(f"/rows?key={key}&start=7&end=7")[2])
+        assert rows[0]["label"] is None
+
+    def test_unknown_key_404(self):
+        assert _get("/rows?key=nope&start=0&end=5")[0] == 404
+        assert _get("/meta?key=nope")[0] == 404
+
+    def test_bad_range_400(self, frame):
+        key, _ = frame
+        assert _get(f"/rows?key={key}&start=a&end=5")[0] == 400
+
+    def test_gzip_when_accepted(self, frame):
+        key, _ = frame
+        status, headers, body = _get(f"/rows?key={key}&start=0&end=499", "gzip, deflate")
+        assert status == 200
+        assert headers["Content-Encoding"] == "gzip"
+        assert len(json.loads(gzip.decompress(body))) == 500
+
+    def test_identity_without_accept_encoding(self, frame):
+        key, _ = frame
+        status, headers, body = _get(f"/rows?key={key}&start=0&end=499", "identity")
+        assert headers["Content-Encoding"] is None
+        assert len(json.loads(body)) == 500
+
+    def test_snapshot_isolated_from_later_edits(self, frame):
+        key, df = frame
+        df.loc[0, "x"] = -1
+        rows = json.loads(_get(f"/rows?key={key}&start=0&end=0")[2])
+        assert rows[0]["x"] == 0
+
+    def test_replaced_frame_served(self, frame):
+        key, _ = frame
+        data_server.store_dataframe(key, pd.DataFrame({"z": [5, 6]}))
+        assert json.loads(_get(f"/meta?key={key}")[2]) == {"totalRows": 2, "columns": ["z"]}
+
+    def test_concurrent_reads_during_store(self, frame):
+        key, df = frame
+        errors = []
+
+        def reader():
+            for _ in range(20):
+                status, _, body = _get(f"/rows?key={key}&start=0&end=99")
+                if status != 200 or len(json.loads(body)) != 100:
+                    errors.append(status)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for _ in range(20):
+            data_server.store_dataframe(key, df)
+        for t in threads:
+            t.join()
+        assert errors == []
+
+
+# ===========================================================================
+# Block cache, ETags and prefetch
+# ===========================================================================
+
+def _wait_for_blocks(key, *block_keys, timeout=10.0):
+    """Prefetch is scheduled after the response is sent, so poll for it."""
+    deadline = time.monotonic() + timeout
+    blocks = data_server._store.get(key).blocks
+    while time.monotonic() < deadline:
+        if all(b in blocks for b in block_keys):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestBlockCache:
+
+    def test_etag_and_cache_control(self, frame):
+        key, _ = frame
+        _, headers, _ = _get(f"/rows?key={key}&start=0&end=99")
+        assert headers["ETag"]
+        assert headers["Cache-Control"] == "no-cache"
+
+    def test_matching_etag_304(self, frame):
+        key, _ = frame
+        etag = _get(f"/rows?key={key}&start=0&end=99")[1]["ETag"]
+        status, headers, body = _get(f"/rows?key={key}&start=0&end=99", if_none_match=etag)
+        assert status == 304
+        assert body == b""
+        assert headers["ETag"] == etag
+
+    def test_etag_differs_per_encoding(self, frame):
+        key, _ = frame
+        plain = _get(f"/rows?key={key}&start=0&end=499", "identity")[1]["ETag"]
+        gz = _get(f"/rows?key={key}&start=0&end=499", "gzip")[1]["ETag"]
+        assert plain != gz
+
+    def test_repeat_request_served_from_cache(self, frame):
+        key, _ = frame
+        _get(f"/rows?key={key}&start=0&end=99")
+        snapshot = data_server._store.get(key)
+        assert ("json", 0, 99, None) in snapshot.blocks
+        snapshot.df = None  # any re-serialization would now fail
+        status, _, body = _get(f"/rows?key={key}&start=0&end=99")
+        assert status == 200
+        assert len(json.loads(body)) == 100
+
+    def test_store_invalidates(self, frame):
+        key, df = frame
+        etag = _get(f"/rows?key={key}&start=0&end=9")[1]["ETag"]
+        edited = df.copy()
+        edited.loc[0, "x"] = 42
+        data_server.store_dataframe(key, edited)
+        status, headers, body = _get(f"/rows?key={key}&start=0&end=9", if_none_match=etag)
+        assert status == 200
+        assert headers["ETag"] != etag
+        assert json.loads(body)[0]["x"] == 42
+
+    def test_prefetches_next_blocks(self, frame):
+        key, _ = frame
+        _get(f"/rows?key={key}&start=0&end=99")
+        assert _wait_for_blocks(key, ("json", 100, 199, None), ("json", 200, 299, None))
+
+    def test_prefetch_follows_scroll_direction(self, frame):
+        key, _ = frame
+        _get(f"/rows?key={key}&start=1500&end=1599")
+        _get(f"/rows?key={key}&start=1000&end=1099")
+        assert _wait_for_blocks(key, ("json", 900, 999, None), ("json", 800, 899, None))
+
+    def test_prefetch_stops_at_end(self, frame):
+        key, _ = frame
+        snapshot = data_server._store.get(key)
+        assert snapshot.prefetch_ranges(1900, 1999) == []
+
+    def test_lru_evicts_by_size(self):
+        cache = data_server._BlockCache(max_bytes=10)
+        cache.put("a", b"12345", None)
+        cache.put("b", b"12345", None)
+        cache.get("a")
+        cache.put("c", b"12345", None)
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+
+
+# ===========================================================================
+# Accept-Encoding negotiation
+# ===========================================================================
+
+class TestNegotiateEncoding:
+
+    def test_gzip(self):
+        assert data_server._negotiate_encoding("gzip, deflate") == "gzip"
+
+    def test_refused_with_q0(self):
+        assert data_server._negotiate_encoding("gzip;q=0") is None
+
+    def test_empty(self):
+        assert data_server._negotiate_encoding("") is None
+
+    def test_br_only_with_brotli(self):
+        expected = "br" if data_server.brotli is not None else "gzip"
+        assert data_server._negotiate_encoding("gzip, br") == expected
+
+
+# ===========================================================================
+# /rows.arrow
+# ===========================================================================
+
+class TestArrowEndpoint:
+
+    def test_501_without_pyarrow(self, frame, monkeypatch):
+        key, _ = frame
+        monkeypatch.setattr(data_server, "_load_pyarrow", lambda: None)
+        assert _get(f"/rows.arrow?key={key}&start=0&end=9")[0] == 501
+
+    def test_block_matches_rows(self, frame):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.ipc  # noqa: F401
+        key, df = frame
+        status, headers, body = _get(f"/rows.arrow?key={key}&start=1990&end=2010", "gzip")
+        assert status == 200
+        assert headers["Content-Type"] == data_server.ARROW_CONTENT_TYPE
+        if headers["Content-Encoding"] == "gzip":
+            body = gzip.decompress(body)
+        table = pa.ipc.open_stream(body).read_all()
+        assert table.num_rows == 10
+        assert table.column("x").to_pylist() == list(range(1990, 2000))
+        assert table.column("label").to_pylist()[1] == "row1991"
+
+    def test_mixed_object_column_sent_as_text(self):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.ipc  # noqa: F401
+        data_server.store_dataframe("mixed", pd.DataFrame({"m": [1, "a", None]}))
+        try:
+            body = _get("/rows.arrow?key=mixed&start=0&end=2")[2]
+        finally:
+            data_server.clear_dataframe("mixed")
+        assert pa.ipc.open_stream(body).read_all().column("m").to_pylist() == ["1", "a", None]
@@ -0,0 +1,328 @@
+# test_descriptive.py
+# Tests for the shared univariate engine located in seniordesign/methods/descriptive.py
+# Run from the seniordesign/ root: pytest testsuite/test_descriptive.py -v
+
+import sys
+import os
+import math
+import numpy as np
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – allows pytest to find the methods package regardless of CWD
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "methods"))
+from descriptive import (  # noqa: E402
+    DescriptiveStats,
+    average_ranks,
+    descriptive_stats,
+    pair_columns,
+    shared_descriptive_stats,
+)
+from mean import Mean  # noqa: E402
+from median import Median  # noqa: E402
+from percentile import Percentile  # noqa: E402
+from mode import Mode  # noqa: E402
+from variance import Variance  # noqa: E402
+from standardDeviation import StandardDeviation  # noqa: E402
+from coefficentVariation import CoefficientVariation  # noqa: E402
+from spearman import SpearmanCoefficient  # noqa: E402
+from pearson import PearsonCoefficient  # noqa: E402
+from least_squares_regression import LeastSquaresRegression  # noqa: E402
+from sketches import k_for_rank_error, kll_rank_error, sketch_store  # noqa: E402
+
+
+def _same(a, b):
+    """Float equality that treats NaN == NaN."""
+    return (math.isnan(a) and math.isnan(b)) or a == b
+
+
+# ===========================================================================
+# Agreement with numpy
+# ===========================================================================
+
+class TestMatchesNumpy:
+    @pytest.mark.parametrize("data", [
+        [1, 2, 3, 4, 5],
+        [10, 20, 30, 40],
+        [[1.5, 2.5, 3.5], [4.5, 5.5, 6.5]],
+        list(np.random.default_rng(0).normal(50, 10, 1001)),
+    ])
+    def test_moments(self, data):
+        stats = DescriptiveStats(data)
+        m = stats.moments()
+        assert m["mean"] == float(np.mean(data))
+        assert m["variance"] == float(np.var(data, ddof=1))
+        assert m["std"] == float(np.std(data, ddof=1))
+        assert math.isclose(m["cv"], m["std"] / m["mean"])
+
+    @pytest.mark.parametrize("data", [
+        [3, 1, 2],
+        [4, 1, 3, 2],
+        [1, np.inf],
+        [-np.inf, np.inf],
+        [1, np.nan, 3],
+    ])
+    def test_median(self, data):
+        assert _same(DescriptiveStats(data).median(), float(np.median(data)))
+
+    @pytest.mark.parametrize("data", [
+        [1, 2, 3, 4, 5],
+        [10, 20, 30, 40],
+        [1, np.inf],
+        [-np.inf, 1, np.inf],
+        [1, np.nan, 3],
+        list(np.random.default_rng(1).exponential(3, 999)),
+    ])
+    def test_percentiles(self, data):
+        pcts = [0, 10, 25, 33.3, 50, 75, 90, 100]
+        got = DescriptiveStats(data).percentiles(pcts)
+        with np.errstate(invalid="ignore"):
+            expected = np.percentile(np.asarray(data, dtype=float), pcts)
+        assert all(_same(g, float(e)) for g, e in zip(got, expected))
+
+    def test_diagnostics(self):
+        d = DescriptiveStats([1.0, -5.0, np.inf]).diagnostics()
+        assert d["has_inf"] is True
+        assert d["has_nan"] is False
+        assert d["all_finite"] is False
+        assert d["max_abs"] == np.inf
+        assert d["min"] == -5.0
+
+    def test_magnitude_ratio(self):
+        assert DescriptiveStats([1e-10, 0, 1e10]).magnitude_ratio() == pytest.approx(1e20)
+        assert DescriptiveStats([0, 0, 5]).magnitude_ratio() is None
+
+    def test_non_numeric_raises(self):
+        with pytest.raises(ValueError):
+            DescriptiveStats(["a", "b"]).values
+
+
+# ===========================================================================
+# Sharing across methods
+# ===========================================================================
+
+class TestSharing:
+    def test_unscoped_calls_are_independent(self):
+        arr = np.array([1.0, 2.0, 3.0])
+        assert descriptive_stats(arr) is not descriptive_stats(arr)
+
+    def test_scope_shares_one_engine(self):
+        arr = np.array([[1.0, 2.0, 3.0, 4.0]])
+        with shared_descriptive_stats(arr) as shared:
+            assert descriptive_stats(arr) is shared
+            Mean(arr, {}).compute()
+            Median(arr, {}).compute()
+            Percentile(arr, {}, [25, 75]).compute()
+            # Conversion and sort happened once, on the shared engine
+            assert shared._values is not None
+            assert shared._sorted is not None
+        assert descriptive_stats(arr) is not shared
+
+    def test_nested_scopes_release_on_last_exit(self):
+        arr = np.array([5.0, 6.0])
+        with shared_descriptive_stats(arr) as outer:
+            with shared_descriptive_stats(arr) as inner:
+                assert inner is outer
+            assert descriptive_stats(arr) is outer
+        assert descriptive_stats(arr) is not outer
+
+    def test_scoped_results_match_unscoped(self):
+        arr = np.random.default_rng(2).normal(0, 1, (1, 500)) + 100
+        plain = [Mean(arr, {}).compute(), Median(arr, {}).compute()]
+        with shared_descriptive_stats(arr):
+            shared = [Mean(arr, {}).compute(), Median(arr, {}).compute()]
+        assert [r["value"] for r in plain] == [r["value"] for r in shared]
+
+
+# ===========================================================================
+# Per-column mode
+# ===========================================================================
+
+PER_COLUMN = {"per_column": True}
+
+
+@pytest.fixture
+def matrix():
+    rows = np.random.default_rng(3).normal(10, 2, (4, 101))
+    rows[2, 7] = np.nan
+    return rows
+
+
+class TestPerColumn:
+    @pytest.mark.parametrize("cls, reference", [
+        (Mean, lambda m: np.mean(m, axis=1)),
+        (Median, lambda m: np.median(m, axis=1)),
+        (Variance, lambda m: np.var(m, axis=1, ddof=1)),
+        (StandardDeviation, lambda m: np.std(m, axis=1, ddof=1)),
+        (CoefficientVariation, lambda m: np.std(m, axis=1, ddof=1) / np.mean(m, axis=1)),
+    ])
+    def test_matches_numpy_axis_1(self, matrix, cls, reference):
+        result = cls(matrix, {}, PER_COLUMN).compute()
+        assert result["ok"] is True
+        assert len(result["value"]) == 4
+        assert all(_same(g, float(e)) for g, e in zip(result["value"], reference(matrix)))
+
+    def test_percentiles_per_column(self, matrix):
+        pcts = [10, 50, 90]
+        result = Percentile(matrix, {}, {"percentiles": pcts, "per_column": True}).compute()
+        expected = np.percentile(matrix, pcts, axis=1).T
+        for got, row in zip(result["value"], expected):
+            assert all(_same(g, float(e)) for g, e in zip(got, row))
+
+    def test_mode_per_column(self):
+        result = Mode(np.array([[1, 1, 2], [3, 4, 4]]), {}, PER_COLUMN).compute()
+        assert result["value"] == [1.0, 4.0]
+
+    def test_columns_named_from_metadata(self, matrix):
+        result = Mean(matrix, {"columns": ["a", "b", "c", "d"]}, PER_COLUMN).compute()
+        assert result["columns"] == ["a", "b", "c", "d"]
+        assert Mean(matrix, {}, PER_COLUMN).compute()["columns"][0] == "Column 1"
+
+    def test_notes_name_only_the_affected_column(self, matrix):
+        result = Mean(matrix, {"columns": ["a", "b", "c", "d"]}, PER_COLUMN).compute()
+        assert result["loss_of_precision"].startswith("c: NaN result")
+        assert "\n" not in result["loss_of_precision"]
+
+    def test_default_still_pools_columns(self, matrix):
+        result = Mean(matrix[[0, 1]], {}).compute()
+        assert result["value"] == float(np.mean(matrix[[0, 1]]))
+        assert "columns" not in result
+
+    def test_one_pass_shared_by_every_method(self, matrix):
+        with shared_descriptive_stats(matrix) as shared:
+            Mean(matrix, {}, PER_COLUMN).compute()
+            Variance(matrix, {}, PER_COLUMN).compute()
+            columns = shared.columns()
+            moments = columns._moments
+            StandardDeviation(matrix, {}, PER_COLUMN).compute()
+            assert shared.columns() is columns
+            assert columns._moments is moments
+
+    def test_magnitude_ratio_computed_once_for_every_column(self, monkeypatch):
+        data = np.random.default_rng(2).normal(size=(200, 50))
+        calls = []
+        real_abs = np.abs
+        monkeypatch.setattr(np, "abs", lambda *a, **k: calls.append(1) or real_abs(*a, **k))
+        with shared_descriptive_stats(data) as shared:
+            result = Mean(data, {}, PER_COLUMN).compute()
+            ratios = shared.columns().magnitude_ratio()
+            assert shared.columns().magnitude_ratio() is ratios
+        # One |values| pass for the diagnostics and one for the ratios, not one per column
+        assert len(calls) <= 2
+        assert result["loss_of_precision"] is False
+
+
+# ===========================================================================
+# Approximate (sketch-based) quantiles
+# ===========================================================================
+
+@pytest.fixture
+def large():
+    return np.random.default_rng(7).normal(100, 15, (2, 50_000))
+
+
+def _rank(column, value):
+    return np.searchsorted(np.sort(column), value) / column.size
+
+
+class TestApproximateQuantiles:
+    def test_small_data_is_exact(self):
+        data = [1, 2, 3, 4, 5, 6]
+        result = Percentile(data, {}, {"percentiles": [25, 50], "approximate": True}).compute()
+        assert result["value"] == list(np.percentile(data, [25, 50]))
+        assert result["rank_error"] == 0.0
+        assert result["loss_of_precision"] is False
+
+    def test_values_within_reported_bound(self, large):
+        pcts = [1, 25, 50, 75, 99]
+        result = Percentile(large, {}, {"percentiles": pcts, "approximate": True}).compute()
+        assert result["rank_error"] == pytest.approx(kll_rank_error(200))
+        assert "within ±" in result["loss_of_precision"]
+        for pct, value in zip(pcts, result["value"]):
+            assert abs(_rank(large.ravel(), value) - pct / 100) <= result["rank_error"]
+
+    def test_rank_error_target_sets_accuracy(self, large):
+        result = Median(large, {}, {"approximate": True, "rank_error": 0.002}).compute()
+        assert 0 < result["rank_error"] <= 0.002
+        assert abs(_rank(large.ravel(), result["value"]) - 0.5) <= result["rank_error"]
+        assert kll_rank_error(k_for_rank_error(0.002)) <= 0.002
+
+    def test_per_column(self, large):
+        params = {"percentiles": [50], "approximate": True, "per_column": True}
+        result = Percentile(large, {"columns": ["a", "b"]}, params).compute()
+        assert result["columns"] == ["a", "b"]
+        for column, [value] in zip(large, result["value"]):
+            assert abs(_rank(column, value) - 0.5) <= result["rank_error"]
+
+    def test_repeat_queries_reuse_stored_sketches(self, large):
+        sketch_store.clear()
+        Median(large, {}, {"approximate": True}).compute()
+        assert sketch_store.hits == 0
+        # A fresh copy of the same columns, different percentiles
+        Percentile(large.copy(), {}, {"percentiles": [90], "approximate": True}).compute()
+        assert sketch_store.hits == 2
+
+    def test_nan_propagates(self):
+        data = np.array([1.0, np.nan, 3.0])
+        result = Median(data, {}, {"approximate": True}).compute()
+        assert math.isnan(result["value"])
+        assert result["loss_of_precision"].startswith("NaN result")
+
+    def test_invalid_rank_error(self):
+        result = Median([1, 2, 3], {}, {"approximate": True, "rank_error": 2}).compute()
+        assert result["ok"] is False
+
+
+# ===========================================================================
+# Rank engine
+# ===========================================================================
+
+class TestRanks:
+    @pytest.mark.parametrize("data", [
+        np.random.default_rng(3).integers(0, 6, (3, 200)).astype(float),
+        np.random.default_rng(4).normal(size=(2, 51)),
+        np.array([4.0, 4.0, 4.0]),
+    ])
+    def test_matches_rankdata(self, data):
+        from scipy.stats import rankdata
+        np.testing.assert_array_equal(average_ranks(data), rankdata(data, axis=-1))
+
+    def test_spearman_reuses_each_columns_ranks(self):
+        from scipy.stats import spearmanr
+        data = np.random.default_rng(5).integers(0, 30, (3, 500)).astype(float)
+        with shared_descriptive_stats(data) as shared:
+            result = SpearmanCoefficient(data, {}).compute()
+            columns = shared.columns()
+            first = columns.ranks_at(0)
+            SpearmanCoefficient(data, {}).compute()
+            assert columns.ranks_at(0) is first
+            # ranks() only ranks the third column, the one not ranked yet
+            columns.ranks()
+            assert columns._ranks[0] is first
+            assert set(columns._ranks) == {0, 1, 2}
+        assert result["value"] == pytest.approx(spearmanr(data[0], data[1])[0], rel=1e-12)
+
+
+class TestCoMoments:
+    def test_pearson_and_regression_share_one_pass(self):
+        rng = np.random.default_rng(6)
+        data = rng.normal(size=(3, 400))
+        data[1] += 2.0 * data[0]
+        with shared_descriptive_stats(data) as shared:
+            pearson = PearsonCoefficient(data, {}).compute()
+            pair = shared.columns().co_moments(0, 1)
+            regression = LeastSquaresRegression(data, {}).compute()
+            assert shared.columns().co_moments(0, 1) is pair
+            assert pair_columns(data) is shared.columns()
+        assert pearson["value"] == pytest.approx(np.corrcoef(data[0], data[1])[0, 1], rel=1e-12)
+        slope, intercept = np.polyfit(data[0], data[1], 1)
+        assert regression["value"]["slope"] == pytest.approx(slope, rel=1e-12)
+        assert regression["value"]["intercept"] == pytest.approx(intercept, rel=1e-9)
+        assert regression["value"]["r_squared"] == pytest.approx(pearson["value"] ** 2, rel=1e-12)
+
+    def test_missing_rows_are_counted(self):
+        columns = pair_columns([[1.0, 2.0, np.nan, 4.0], [2.0, 4.0, 6.0, np.nan]])
+        pair = columns.co_moments(0, 1)
+        assert (pair.n, pair.missing) == (2, 2)
+        assert pair.regression()["slope"] == pytest.approx(2.0)
@@ -0,0 +1,103 @@
+# test_downsample.py
+# Tests for the scatter point reduction located in seniordesign/charts/downsample.py
+# Run from the seniordesign/ root: pytest testsuite/test_downsample.py -v
+
+import sys
+import os
+import numpy as np
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – charts/ is imported as a package from the project root
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from charts.downsample import (  # noqa: E402
+    choose_render_mode,
+    density_grid,
+    lttb_indices,
+    scatter_traces,
+)
+
+MARKER = dict(color="#e4781d", size=7)
+
+
+# ===========================================================================
+# LTTB
+# ===========================================================================
+
+class TestLttb:
+    def test_keeps_threshold_points_and_endpoints(self):
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 100, 10_000)
+        y = rng.normal(0, 1, 10_000)
+        keep = lttb_indices(x, y, 500)
+        assert keep.size == 500
+        assert np.unique(keep).size == 500
+        assert x[keep].min() == x.min()
+        assert x[keep].max() == x.max()
+
+    def test_preserves_spike(self):
+        x = np.arange(10_000, dtype=float)
+        y = np.zeros(10_000)
+        y[4321] = 50.0
+        assert 4321 in lttb_indices(x, y, 100)
+
+    def test_small_input_untouched(self):
+        assert list(lttb_indices([3.0, 1.0, 2.0], [1.0, 2.0, 3.0], 10)) == [0, 1, 2]
+
+
+# ===========================================================================
+# Density raster
+# ===========================================================================
+
+class TestDensityGrid:
+    def test_counts_cover_every_point(self):
+        rng = np.random.default_rng(1)
+        x, y = rng.normal(size=(2, 20_000))
+        counts, x_edges, y_edges, bin_index = density_grid(x, y, bins=50)
+        assert counts.shape == (50, 50)
+        assert counts.sum() == 20_000
+        assert x_edges[0] == x.min() and x_edges[-1] == x.max()
+        assert counts.ravel()[bin_index].min() >= 1
+
+    def test_constant_column(self):
+        counts, *_ = density_grid(np.ones(10), np.arange(10.0), bins=4)
+        assert counts.sum() == 10
+
+
+# ===========================================================================
+# Mode selection / traces
+# ===========================================================================
+
+class TestScatterTraces:
+    @pytest.mark.parametrize("n, expected", [
+        (100, "points"),
+        (20_000, "lttb"),
+        (1_000_000, "density"),
+    ])
+    def test_auto_mode(self, n, expected):
+        assert choose_render_mode(n) == expected
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            choose_render_mode(10, "hexagons")
+
+    def test_marker_count_is_bounded(self):
+        rng = np.random.default_rng(2)
+        x, y = rng.normal(size=(2, 300_000))
+        traces, mode = scatter_traces(x, y, MARKER, "Data Markers")
+        assert mode == "density"
+        assert traces[0].type == "heatmap"
+        assert len(traces[1].x) <= 5_000
+
+    def test_density_keeps_isolated_outlier(self):
+        rng = np.random.default_rng(3)
+        x, y = rng.normal(size=(2, 200_000))
+        x[0], y[0] = 40.0, 40.0
+        traces, _ = scatter_traces(x, y, MARKER, "Data Markers", render_mode="density")
+        assert 40.0 in set(traces[1].x)
+
+    def test_non_finite_pairs_dropped(self):
+        traces, mode = scatter_traces([1.0, np.nan, 3.0], [1.0, 2.0, np.inf], MARKER, "m")
+        assert mode == "points"
+        assert list(traces[0].x) == [1.0]
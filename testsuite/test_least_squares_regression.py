@@ -5,7 +5,6 @@
 import sys
 import os
 import math
-import base64
 import numpy as np
 import pytest
 
@@ -106,15 +105,19 @@ class TestComputeNormal:
         result = make_lsr([PERFECT_X, PERFECT_Y], meta).compute()
         assert result["value"]["equation"].startswith("y =")
 
-    def test_chart_is_base64_string(self, meta):
-        """chart field should be a non-empty base64-decodable string."""
+    def test_chart_is_deferred(self, meta):
+        """compute() draws nothing; chart is a descriptor for a later render."""
         result = make_lsr([PERFECT_X, PERFECT_Y], meta).compute()
-        chart = result["value"]["chart"]
-        assert isinstance(chart, str) and len(chart) > 0
-        # Verify it's valid base64 (will raise if not)
-        decoded = base64.b64decode(chart)
-        # PNG magic bytes: 0x89 50 4E 47
-        assert decoded[:4] == b'\x89PNG'
+        assert result["value"]["chart"] == {"deferred": True, "path": None}
+
+    def test_create_graphic_writes_png(self, meta, tmp_path):
+        lsr = make_lsr([PERFECT_X, PERFECT_Y], meta)
+        result = lsr.compute()
+        result["value"]["chart"]["path"] = str(tmp_path / "lsr.png")
+        path = lsr.create_graphic(result)
+        with open(path, "rb") as f:
+            # PNG magic bytes: 0x89 50 4E 47
+            assert f.read(4) == b'\x89PNG'
 
     def test_slope_negative(self, meta):
         """Negative slope should be computed correctly."""
@@ -167,6 +170,18 @@ class TestComputeEdgeCases:
         # Slope should be close to 3
         assert math.isclose(result["value"]["slope"], 3.0, abs_tol=0.1)
 
+    def test_constant_x_has_no_slope(self, meta):
+        result = make_lsr([[2.0, 2.0, 2.0], [1.0, 3.0, 2.0]], meta).compute()
+        assert result["ok"] is True
+        assert math.isnan(result["value"]["slope"])
+        assert result["loss_of_precision"].startswith("Degenerate x")
+
+    def test_nan_input_propagates(self, meta):
+        result = make_lsr([[1.0, 2.0, np.nan, 4.0], [1.0, 3.0, 2.0, 5.0]], meta).compute()
+        assert result["ok"] is True
+        assert math.isnan(result["value"]["slope"])
+        assert result["loss_of_precision"].startswith("NaN/Inf")
+
     def test_negative_x_values(self, meta):
         x = [-3.0, -2.0, -1.0, 0.0, 1.0]
         y = [-5.0, -3.0, -1.0, 1.0, 3.0]  # y = 2x + 1
@@ -209,3 +224,68 @@ class TestComputeErrors:
     def test_error_result_keys(self, meta):
         result = make_lsr(None, meta).compute()
         assert {"id", "ok", "value", "error", "loss_of_precision", "params_used"} == set(result.keys())
+
+
+# ===========================================================================
+# compute() – polynomial, multiple and batched models
+# ===========================================================================
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(11)
+    x1, x2 = rng.normal(size=(2, 300))
+    y = 1.0 + 2.0 * x1 - 3.0 * x2 + rng.normal(0, 0.5, 300)
+    return np.array([x1, x2, y])
+
+
+class TestModels:
+    def test_polynomial_matches_polyfit(self, columns, meta):
+        result = make_lsr(columns[[0, 2]], meta, {"degree": 3}).compute()
+        assert result["ok"] is True
+        expected = np.polyfit(columns[0], columns[2], 3)[::-1]
+        np.testing.assert_allclose(result["value"]["coefficients"], expected, rtol=1e-9)
+        assert result["value"]["terms"] == ["intercept", "Column 1", "Column 1^2", "Column 1^3"]
+
+    def test_multiple_matches_ols(self, columns, meta):
+        result = make_lsr(columns, meta, {"model": "multiple"}).compute()
+        value = result["value"]
+        X = np.column_stack([np.ones(300), columns[0], columns[1]])
+        coefficients, residual_ss = np.linalg.lstsq(X, columns[2], rcond=None)[:2]
+        std_errors = np.sqrt(np.diag(residual_ss[0] / (300 - 3) * np.linalg.inv(X.T @ X)))
+        np.testing.assert_allclose(value["coefficients"], coefficients, rtol=1e-10)
+        np.testing.assert_allclose(value["std_errors"], std_errors, rtol=1e-8)
+        assert value["r_squared"] == pytest.approx(
+            1 - residual_ss[0] / np.sum((columns[2] - columns[2].mean()) ** 2), rel=1e-12
+        )
+        assert value["condition_number"] >= 1.0
+
+    def test_screen_fits_each_predictor(self, columns, meta):
+        result = make_lsr(columns, {"columns": ["a", "b", "y"]}, {"model": "screen"}).compute()
+        assert result["columns"] == ["a", "b"]
+        for i, value in enumerate(result["value"]):
+            slope, intercept = np.polyfit(columns[i], columns[2], 1)
+            np.testing.assert_allclose(value["coefficients"], [intercept, slope], rtol=1e-9)
+            assert value["equation"].startswith("y = ")
+
+    def test_targets_with_missing_values(self, columns, meta):
+        columns[1, :10] = np.nan
+        result = make_lsr(columns, meta, {"model": "targets"}).compute()
+        assert result["columns"] == ["Column 2", "Column 3"]
+        first, second = result["value"]
+        assert (first["n_obs"], second["n_obs"]) == (290, 300)
+        keep = ~np.isnan(columns[1])
+        slope, intercept = np.polyfit(columns[0][keep], columns[1][keep], 1)
+        np.testing.assert_allclose(first["coefficients"], [intercept, slope], rtol=1e-9)
+        slope, intercept = np.polyfit(columns[0], columns[2], 1)
+        np.testing.assert_allclose(second["coefficients"], [intercept, slope], rtol=1e-9)
+        assert result["loss_of_precision"].startswith("Column 2: Missing values")
+
+    def test_collinear_predictors_are_singular(self, columns, meta):
+        columns[1] = 2.0 * columns[0]
+        result = make_lsr(columns, meta, {"model": "multiple"}).compute()
+        assert all(math.isnan(c) for c in result["value"]["coefficients"])
+        assert result["loss_of_precision"].startswith("Singular design")
+
+    @pytest.mark.parametrize("params", [{"degree": 0}, {"degree": 1.5}, {"model": "lasso"}])
+    def test_invalid_params(self, columns, meta, params):
+        assert make_lsr(columns, meta, params).compute()["ok"] is False
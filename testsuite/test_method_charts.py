@@ -0,0 +1,103 @@
+# test_method_charts.py
+# Tests for the deferred method charts located in seniordesign/backend_support/method_charts.py
+# Run from the seniordesign/ root: pytest testsuite/test_method_charts.py -v
+
+import sys
+import os
+import threading
+import numpy as np
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – backend_support/ is imported as a package from the root; the
+# method classes are imported the way the per-method test files do
+# ---------------------------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+sys.path.insert(0, os.path.join(_ROOT, "methods"))
+from backend_support import method_charts  # noqa: E402
+from backend_support.method_charts import (  # noqa: E402
+    deferred_chart_of,
+    place_method_charts,
+    render_method_chart,
+)
+from least_squares_regression import LeastSquaresRegression  # noqa: E402
+
+DATA = [[1.0, 2.0, 3.0, 4.0], [2.0, 4.1, 5.9, 8.0]]
+METHODS = {"least_squares_regression": LeastSquaresRegression}
+
+
+@pytest.fixture
+def result():
+    return LeastSquaresRegression(DATA, {}).compute()
+
+
+class TestMethodCharts:
+
+    def test_placed_but_not_drawn(self, result, tmp_path):
+        place_method_charts([result, {"id": "mean", "ok": True, "value": 2.5}], str(tmp_path))
+        path = deferred_chart_of(result)["path"]
+        assert path == str(tmp_path / "least_squares_regression_chart.png")
+        assert not os.path.exists(path)
+
+    def test_drawn_once_on_first_request(self, result, tmp_path):
+        place_method_charts([result], str(tmp_path))
+        path = render_method_chart(result, DATA, {}, methods=METHODS)
+        assert os.path.isfile(path)
+        modified = os.path.getmtime(path)
+        assert render_method_chart(result, DATA, {}, methods=METHODS) == path
+        assert os.path.getmtime(path) == modified
+
+    def test_unplaced_chart_is_an_error(self, result):
+        with pytest.raises(ValueError):
+            render_method_chart(result, DATA, {}, methods=METHODS)
+
+    def test_failed_result_has_no_chart(self):
+        assert deferred_chart_of(LeastSquaresRegression(None, {}).compute()) is None
+
+    def test_different_charts_render_concurrently(self, tmp_path, monkeypatch):
+        first, second = (LeastSquaresRegression(DATA, {}).compute() for _ in range(2))
+        place_method_charts([first], str(tmp_path / "a"))
+        place_method_charts([second], str(tmp_path / "b"))
+        started, release = threading.Event(), threading.Event()
+        draw = LeastSquaresRegression.create_graphic
+
+        def slow_first(self, results):
+            if results is first:
+                started.set()
+                release.wait(30)
+            return draw(self, results)
+
+        def render(result):
+            return threading.Thread(target=render_method_chart, args=(result, DATA, {}, METHODS))
+
+        monkeypatch.setattr(LeastSquaresRegression, "create_graphic", slow_first)
+        slow, fast = render(first), render(second)
+        slow.start()
+        assert started.wait(10)
+        fast.start()
+        # Drawn while the other chart's render is still in progress
+        fast.join(5)
+        assert not fast.is_alive()
+        assert os.path.isfile(deferred_chart_of(second)["path"])
+        release.set()
+        slow.join(10)
+        assert os.path.isfile(deferred_chart_of(first)["path"])
+        assert method_charts._path_locks == {}
+
+    def test_large_scatter_is_downsampled(self, tmp_path, monkeypatch):
+        from matplotlib.axes import Axes
+        x = np.random.default_rng(1).normal(size=50_000)
+        data = [x, 2 * x + 1]
+        result = LeastSquaresRegression(data, {}).compute()
+        place_method_charts([result], str(tmp_path))
+        plotted = []
+        scatter = Axes.scatter
+
+        def counting(ax, px, py, **kwargs):
+            plotted.append(len(px))
+            return scatter(ax, px, py, **kwargs)
+
+        monkeypatch.setattr(Axes, "scatter", counting)
+        render_method_chart(result, data, {}, methods=METHODS)
+        assert plotted == [5_000]
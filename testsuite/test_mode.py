@@ -110,7 +110,10 @@ class TestComputeNormal:
         """Result dict must contain the expected keys."""
         m = make_mode([1, 1, 2], dummy_metadata)
         result = m.compute()
-        expected_keys = {"id", "ok", "value", "error", "loss_of_precision", "params_used"}
+        expected_keys = {
+            "id", "ok", "value", "error", "loss_of_precision", "params_used",
+            "modes", "count", "n_modes",
+        }
         assert expected_keys == set(result.keys())
 
     def test_stat_id_in_result(self, dummy_metadata):
@@ -183,19 +186,16 @@ class TestComputeEdgeCases:
         assert result["ok"] is True
         assert math.isclose(result["value"], 9.0)
 
-    def test_multimodal_returns_a_value(self, dummy_metadata):
-        """When data is bimodal, statistics.mode (Python ≥3.8) returns the first
-        encountered mode; we just assert that ok=True and value is one of the modes."""
-        # [1,1,2,2] is bimodal — Python 3.8+ statistics.mode picks the first
-        data = [1, 1, 2, 2]
+    def test_multimodal_reports_every_mode(self, dummy_metadata):
+        """Ties are all reported in order of first appearance; value is the
+        first of them, as statistics.mode (Python >= 3.8) picks."""
+        data = [2, 1, 1, 2, 3]
         m = make_mode(data, dummy_metadata)
         result = m.compute()
-        # Either ok is True with a valid mode, or ok is False with an error
-        # (Python <3.8 raises StatisticsError for multimodal data).
-        if result["ok"]:
-            assert result["value"] in (1.0, 2.0)
-        else:
-            assert result["error"] is not None
+        assert result["ok"] is True
+        assert result["value"] == float(statistics.mode(data)) == 2.0
+        assert result["modes"] == [2.0, 1.0]
+        assert result["count"] == 2
 
     def test_numpy_2d_array_flattened(self, dummy_metadata):
         """Mode class calls flatten() on numpy arrays; a 2-D array should work."""
@@ -270,3 +270,50 @@ class TestStatisticalCorrectness:
         result = m.compute()
         assert result["ok"] is True
         assert math.isclose(result["value"], expected_mode, rel_tol=1e-9, abs_tol=1e-12)
+
+
+# ===========================================================================
+# Counting engine – integer, float and categorical paths
+# ===========================================================================
+
+class TestCountingEngine:
+    @pytest.mark.parametrize("data", [
+        np.random.default_rng(0).integers(-50, 50, 5000),            # bincount path
+        np.array([10**12, 7, 10**12, 7, 3]),                         # sparse range, tie
+        np.round(np.random.default_rng(2).normal(0, 3, 5000), 1),   # hashed floats
+        np.array([True, False, True]),
+    ])
+    def test_matches_statistics_mode(self, data, dummy_metadata):
+        result = make_mode(data, dummy_metadata).compute()
+        assert result["value"] == float(statistics.mode(data.tolist()))
+        assert result["count"] == data.tolist().count(statistics.mode(data.tolist()))
+
+    def test_categorical_values(self, dummy_metadata):
+        result = make_mode(np.array(["b", "a", "a", "b", "c"]), dummy_metadata).compute()
+        assert result["value"] == "b"
+        assert result["modes"] == ["b", "a"]
+        assert result["loss_of_precision"] is False
+
+    def test_nan_is_not_counted(self, dummy_metadata):
+        result = make_mode(np.array([np.nan, np.nan, 1.0, 2.0, 2.0]), dummy_metadata).compute()
+        assert (result["value"], result["count"]) == (2.0, 2)
+        assert result["loss_of_precision"]
+
+    def test_per_column_modes_and_counts(self, dummy_metadata):
+        data = np.array([[1, 1, 2], [3, 4, 5]])
+        result = make_mode(data, dummy_metadata, {"per_column": True}).compute()
+        assert result["value"] == [1.0, 3.0]
+        assert result["modes"] == [[1.0], [3.0, 4.0, 5.0]]
+        assert result["count"] == [2, 1]
+
+    def test_boolean_columns(self, dummy_metadata):
+        data = np.array([[True, True, True], [False, True, False]])
+        result = make_mode(data, dummy_metadata, {"per_column": True}).compute()
+        assert result["value"] == [1.0, 0.0]
+        assert result["count"] == [3, 2]
+
+    def test_all_distinct_lists_first_modes_only(self, dummy_metadata):
+        result = make_mode(np.arange(1000.0)[::-1], dummy_metadata).compute()
+        assert result["value"] == 999.0
+        assert len(result["modes"]) == 100
+        assert (result["count"], result["n_modes"]) == (1, 1000)
@@ -140,6 +140,17 @@ class TestComputeEdgeCases:
         assert result["ok"] is True
         assert math.isclose(abs(result["value"]), 1.0, abs_tol=1e-9)
 
+    def test_nan_input_propagates(self, meta):
+        result = make_pearson([[1.0, np.nan, 3.0, 4.0], [2.0, 1.0, 5.0, 3.0]], meta).compute()
+        assert result["ok"] is True
+        assert math.isnan(result["value"])
+        assert result["loss_of_precision"].startswith("NaN result")
+
+    def test_constant_column_is_undefined(self, meta):
+        result = make_pearson([[3.0, 3.0, 3.0], [1.0, 2.0, 3.0]], meta).compute()
+        assert math.isnan(result["value"])
+        assert "zero variance" in result["loss_of_precision"]
+
     def test_float_inputs(self, meta):
         x = [0.1, 0.2, 0.3]
         y = [0.4, 0.5, 0.6]
@@ -208,3 +219,51 @@ class TestStatisticalCorrectness:
         result = make_pearson([x, y], meta).compute()
         assert result["ok"] is True
         assert math.isclose(result["value"], expected_r, abs_tol=1e-9)
+
+
+# ===========================================================================
+# Matrix mode – every pair of columns (methods/correlation.py)
+# ===========================================================================
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(seed=8)
+    data = rng.normal(0, 1, (4, 200))
+    data[1] += data[0]
+    data[3] = data[2] ** 3
+    return data
+
+
+class TestMatrixMode:
+    def test_matches_pairwise_pearsonr(self, columns, meta):
+        result = make_pearson(columns, meta, {"matrix": True}).compute()
+        assert result["ok"] is True
+        value = result["value"]
+        assert value["columns"] == ["Column 1", "Column 2", "Column 3", "Column 4"]
+        for i in range(4):
+            for j in range(4):
+                r, p = pearsonr(columns[i], columns[j])
+                assert math.isclose(value["matrix"][i][j], r, abs_tol=1e-12)
+                if i != j:
+                    assert math.isclose(value["p_values"][i][j], p, rel_tol=1e-6)
+        assert value["n_obs"][0][1] == 200
+
+    def test_missing_values_are_pairwise_complete(self, columns, meta):
+        columns[0, ::5] = np.nan
+        result = make_pearson(columns, meta, {"matrix": True}).compute()
+        keep = ~np.isnan(columns[0])
+        r, _ = pearsonr(columns[0][keep], columns[1][keep])
+        assert math.isclose(result["value"]["matrix"][0][1], r, abs_tol=1e-12)
+        assert result["value"]["n_obs"][0][1] == 160
+        assert result["value"]["n_obs"][1][2] == 200
+        assert "Missing values" in result["loss_of_precision"]
+
+    def test_constant_column_is_undefined(self, columns, meta):
+        columns[2] = 4.0
+        result = make_pearson(columns, {"columns": list("abcd")}, {"matrix": True}).compute()
+        assert math.isnan(result["value"]["matrix"][0][2])
+        assert result["loss_of_precision"].endswith(": c.")
+
+    def test_needs_two_columns(self, meta):
+        result = make_pearson([[1, 2, 3]], meta, {"matrix": True}).compute()
+        assert result["ok"] is False
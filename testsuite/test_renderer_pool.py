@@ -0,0 +1,65 @@
+# test_renderer_pool.py
+# Tests for the Kaleido renderer pool located in seniordesign/charts/renderer_pool.py
+# Run from the seniordesign/ root: pytest testsuite/test_renderer_pool.py -v
+
+import sys
+import os
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – the renderer workers import charts/ as a package from the root
+# ---------------------------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+pytest.importorskip("kaleido")
+import plotly.graph_objects as go  # noqa: E402
+from charts.renderer_pool import RendererPool, render_png  # noqa: E402
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture(scope="module")
+def pool():
+    saved_path = list(sys.path)
+    sys.path.insert(0, _ROOT)  # spawned workers inherit this order
+    pool = RendererPool(num_workers=1, queue_size=4)
+    pool.start()
+    yield pool
+    pool.shutdown()
+    sys.path[:] = saved_path
+
+
+def _figure():
+    return go.Figure(go.Bar(x=["a", "b", "c"], y=[1, 3, 2]))
+
+
+class TestRendererPool:
+    def test_render_returns_png(self, pool):
+        assert pool.render(_figure(), format="png", width=200, height=100).startswith(PNG_MAGIC)
+
+    def test_concurrent_submissions_all_complete(self, pool):
+        futures = [pool.submit(_figure(), width=100, height=100) for _ in range(3)]
+        assert all(f.result(timeout=60).startswith(PNG_MAGIC) for f in futures)
+
+    def test_dead_worker_is_restarted(self, pool):
+        worker = pool._workers[0]
+        restarts = worker.restarts
+        worker.process.kill()
+        worker.process.join()
+        assert pool.render(_figure(), width=100, height=100).startswith(PNG_MAGIC)
+        assert worker.restarts == restarts + 1
+        assert pool.health()[0]["alive"] is True
+
+    def test_bad_figure_reports_error(self, pool):
+        with pytest.raises(RuntimeError):
+            pool.render(_figure(), format="not-a-format")
+
+    def test_zero_workers_rejected(self):
+        with pytest.raises(ValueError):
+            RendererPool(num_workers=0)
+
+
+class TestRenderPng:
+    def test_falls_back_in_process_without_pool(self):
+        buffer = render_png(_figure(), width=100, height=100)
+        assert buffer.getvalue().startswith(PNG_MAGIC)
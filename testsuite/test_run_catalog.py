@@ -0,0 +1,115 @@
+# test_run_catalog.py
+# Tests for the SQLite run index located in seniordesign/backend_support/run_catalog.py
+# Run from the seniordesign/ root: pytest testsuite/test_run_catalog.py -v
+
+import sys
+import os
+import json
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – backend_support/ is imported as a package from the root
+# ---------------------------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+from backend_support.run_catalog import RunCatalog  # noqa: E402
+
+
+pytestmark = pytest.mark.usefixtures("package_imports")
+
+
+def _write_run(cache_dir, name, payload):
+    folder = cache_dir / name
+    folder.mkdir(parents=True)
+    json_path = folder / "results_20250101_000000.json"
+    json_path.write_text(json.dumps(payload))
+    return folder, json_path
+
+
+PAYLOAD = {
+    "dataset_id": "sales.csv",
+    "dataset_version": 1,
+    "methods": [{"id": "mean", "params": {}}, {"id": "median", "params": {}}],
+    "graphics": [{"type": "vert_bar", "ok": True}],
+    "timings": {"total_ms": 12.5},
+}
+
+
+# ===========================================================================
+# Runs
+# ===========================================================================
+
+class TestRuns:
+    def test_record_and_list(self, tmp_path):
+        folder, json_path = _write_run(tmp_path, "run_a", PAYLOAD)
+        catalog = RunCatalog(str(tmp_path))
+        catalog.record_run(str(folder), str(json_path), PAYLOAD)
+        [run] = catalog.list_runs()
+        assert run["folder_name"] == "run_a"
+        assert run["dataset_id"] == "sales.csv"
+        assert run["dataset_version"] == 1
+        assert run["method_ids"] == ["mean", "median"]
+        assert run["chart_types"] == ["vert_bar"]
+        assert run["timings"] == {"total_ms": 12.5}
+        assert run["size_bytes"] == os.path.getsize(json_path)
+
+    def test_sync_indexes_new_and_forgets_deleted_folders(self, tmp_path):
+        _write_run(tmp_path, "run_a", PAYLOAD)
+        _write_run(tmp_path, "run_b", dict(PAYLOAD, timings=None))
+        (tmp_path / "method_cache").mkdir()
+        catalog = RunCatalog(str(tmp_path))
+        assert catalog.sync_from_disk() == 2
+        assert catalog.sync_from_disk() == 0  # known folders aren't re-read
+
+        import shutil
+        shutil.rmtree(tmp_path / "run_a")
+        catalog.sync_from_disk()
+        runs = catalog.list_runs()
+        assert [r["folder_name"] for r in runs] == ["run_b"]
+        assert runs[0]["timings"] is None
+
+    def test_handle_request_records_run(self, tmp_path, monkeypatch):
+        from backend_handler import BackendHandler
+        from class_templates.message_structure import Message
+
+        monkeypatch.chdir(tmp_path)
+        message = Message(
+            dataset_id="ds",
+            dataset_version=2,
+            methods=[{"id": "mean", "params": {}}],
+            data=[[1.0, 2.0, 3.0]],
+        )
+        result = BackendHandler(cache_dir=None).handle_request(message)
+        [run] = RunCatalog(str(tmp_path / "results_cache")).list_runs()
+        assert run["folder_path"] == os.path.abspath(result.run_folder)
+        assert run["method_ids"] == ["mean"]
+        assert run["timings"]["total_ms"] > 0
+        assert run["data_bytes"] > 0
+
+
+# ===========================================================================
+# Saved runs mirror
+# ===========================================================================
+
+class TestSavedRuns:
+    def test_mirror_follows_file_changes(self, tmp_path):
+        catalog = RunCatalog(str(tmp_path))
+        assert catalog.saved_runs() == []
+
+        manifest = tmp_path / "saved_runs.json"
+        manifest.write_text(json.dumps([{"id": "1", "name": "A", "cache_folder": str(tmp_path / "run_a")}]))
+        assert [e["name"] for e in catalog.saved_runs()] == ["A"]
+
+        entries = [
+            {"id": "2", "name": "B", "cache_folder": str(tmp_path / "run_b")},
+            {"id": "1", "name": "A", "cache_folder": str(tmp_path / "run_a")},
+        ]
+        manifest.write_text(json.dumps(entries))
+        os.utime(manifest, ns=(1, 1))  # force a new stamp even on coarse clocks
+        assert catalog.saved_runs() == entries
+        assert catalog.saved_folders() == {str(tmp_path / "run_a"), str(tmp_path / "run_b")}
+
+    def test_unreadable_manifest_raises(self, tmp_path):
+        (tmp_path / "saved_runs.json").write_text("{not json")
+        with pytest.raises(ValueError):
+            RunCatalog(str(tmp_path)).saved_folders()
@@ -0,0 +1,68 @@
+# test_run_progress.py
+# Tests for the streamed-result collector located in seniordesign/Frontend/logic/run_progress.py
+# Run from the seniordesign/ root: pytest testsuite/test_run_progress.py -v
+
+import sys
+import os
+import threading
+
+# ---------------------------------------------------------------------------
+# Path setup – logic/ is imported the way the Frontend imports it
+# ---------------------------------------------------------------------------
+_FRONTEND = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Frontend"))
+sys.path.insert(0, _FRONTEND)
+from logic.run_progress import RunProgress  # noqa: E402
+
+
+class TestRunProgress:
+
+    def test_empty(self):
+        progress = RunProgress(method_count=2, chart_count=1)
+        assert progress.snapshot() == (0, [], [])
+        assert progress.done_count == 0
+        assert progress.total_count == 3
+
+    def test_results_kept_in_request_order(self):
+        progress = RunProgress(method_count=3)
+        progress.on_result("method", 2, {"id": "c"})
+        progress.on_result("method", 0, {"id": "a"})
+        _, methods, charts = progress.snapshot()
+        assert [m["id"] for m in methods] == ["a", "c"]
+        assert charts == []
+
+    def test_charts_separate_from_methods(self):
+        progress = RunProgress(method_count=1, chart_count=1)
+        progress.on_result("chart", 0, {"type": "pie_chart"})
+        progress.on_result("method", 0, {"id": "mean"})
+        _, methods, charts = progress.snapshot()
+        assert methods == [{"id": "mean"}]
+        assert charts == [{"type": "pie_chart"}]
+        assert progress.done_count == 2
+
+    def test_version_bumps_per_result(self):
+        progress = RunProgress(method_count=2)
+        progress.on_result("method", 0, {})
+        v1 = progress.version
+        progress.on_result("method", 1, {})
+        assert progress.version == v1 + 1
+
+    def test_unknown_kind_ignored(self):
+        progress = RunProgress()
+        progress.on_result("other", 0, {})
+        assert progress.version == 0
+
+    def test_concurrent_writers(self):
+        progress = RunProgress(method_count=400)
+        threads = [
+            threading.Thread(target=lambda base=b: [
+                progress.on_result("method", base + i, {"i": base + i}) for i in range(100)
+            ])
+            for b in (0, 100, 200, 300)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        version, methods, _ = progress.snapshot()
+        assert version == 400
+        assert [m["i"] for m in methods] == list(range(400))
@@ -0,0 +1,140 @@
+# test_run_store.py
+# Tests for the run input storage located in seniordesign/backend_support/run_store.py
+# Run from the seniordesign/ root: pytest testsuite/test_run_store.py -v
+
+import sys
+import os
+import json
+import numpy as np
+import pandas as pd
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – backend_support/ is imported as a package from the root
+# ---------------------------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+from backend_support.run_store import (  # noqa: E402
+    DATA_FILE,
+    load_array,
+    load_table,
+    save_array,
+    save_table,
+)
+
+
+pytestmark = pytest.mark.usefixtures("package_imports")
+
+
+# ===========================================================================
+# Arrays
+# ===========================================================================
+
+class TestArrays:
+    def test_round_trip_is_memory_mapped(self, tmp_path):
+        data = np.arange(12, dtype=float).reshape(2, 6)
+        path = str(tmp_path / DATA_FILE)
+        assert save_array(path, data) is True
+        loaded = load_array(path)
+        assert isinstance(loaded, np.memmap)
+        assert np.array_equal(loaded, data)
+
+    def test_text_array_round_trip(self, tmp_path):
+        data = np.array([["a", "bb", "ccc"]])
+        path = str(tmp_path / DATA_FILE)
+        assert save_array(path, data) is True
+        assert np.array_equal(load_array(path), data)
+
+    @pytest.mark.parametrize("data", [
+        np.array([[1, None, 3]], dtype=object),
+        [[1, 2, 3]],
+    ])
+    def test_unstorable_data_is_skipped(self, tmp_path, data):
+        path = tmp_path / DATA_FILE
+        assert save_array(str(path), data) is False
+        assert not path.exists()
+
+
+# ===========================================================================
+# Tables
+# ===========================================================================
+
+class TestTables:
+    def test_round_trip(self, tmp_path):
+        df = pd.DataFrame({
+            "x": [1.5, np.nan, 3.0],
+            "n": [1, 2, 3],
+            "label": ["a", None, "c"],
+        })
+        save_table(str(tmp_path), df)
+        loaded = load_table(str(tmp_path))
+        assert list(loaded.columns) == ["x", "n", "label"]
+        assert loaded["x"].isna().tolist() == [False, True, False]
+        assert loaded["n"].tolist() == [1, 2, 3]
+        assert loaded["label"].isna().tolist() == [False, True, False]
+        assert loaded["label"][0] == "a"
+
+    def test_duplicate_and_non_string_names(self, tmp_path):
+        df = pd.DataFrame([[1, 2, 3]], columns=["a", "a", 7])
+        save_table(str(tmp_path), df)
+        loaded = load_table(str(tmp_path))
+        assert list(loaded.columns) == ["a", "a", "7"]
+        assert loaded.iloc[0].tolist() == [1, 2, 3]
+
+    def test_long_text_cell_does_not_pad_the_column(self, tmp_path):
+        labels = ["row"] * 20_000
+        labels[7] = "x" * 1000
+        df = pd.DataFrame({"label": labels, "note": ["é", None] * 10_000})
+        table_dir = save_table(str(tmp_path), df)
+        size = sum(f.stat().st_size for f in os.scandir(table_dir))
+        # A fixed-width "<U1000" column alone would be 80 MB
+        assert size < 600_000
+        loaded = load_table(str(tmp_path))
+        assert loaded["label"].tolist() == labels
+        assert loaded["note"][0] == "é" and loaded["note"].isna().sum() == 10_000
+
+    def test_reads_fixed_width_text_tables(self, tmp_path):
+        table_dir = tmp_path / "table"
+        table_dir.mkdir()
+        np.save(table_dir / "col_0000.npy", np.array(["a", "", "ccc"]))
+        np.save(table_dir / "col_0000.nulls.npy", np.array([False, True, False]))
+        (table_dir / "table.json").write_text(json.dumps({
+            "format": 1, "n_rows": 3,
+            "columns": [{"name": "label", "file": "col_0000.npy",
+                         "nulls": "col_0000.nulls.npy", "dtype": "<U3"}],
+        }))
+        label = load_table(str(tmp_path))["label"]
+        assert label.isna().tolist() == [False, True, False]
+        assert label[2] == "ccc"
+
+    def test_missing_table(self, tmp_path):
+        assert load_table(str(tmp_path)) is None
+
+
+# ===========================================================================
+# Run JSON
+# ===========================================================================
+
+class TestRunJson:
+    def test_numeric_data_stored_beside_json(self, tmp_path):
+        from backend_handler import BackendHandler
+        from class_templates.message_structure import Message
+
+        message = Message(dataset_id="ds", data=[[1.0, 2.0], [3.0, 4.0]])
+        json_path = BackendHandler(cache_dir=None)._save_run_json(message, str(tmp_path))
+        with open(json_path) as f:
+            payload = json.load(f)
+        assert payload["data"] is None
+        assert payload["data_file"] == DATA_FILE
+        assert load_array(str(tmp_path / DATA_FILE)).tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_object_data_stays_inline(self, tmp_path):
+        from backend_handler import BackendHandler
+        from class_templates.message_structure import Message
+
+        message = Message(dataset_id="ds", data=[[1.0, None], ["a", 4.0]])
+        json_path = BackendHandler(cache_dir=None)._save_run_json(message, str(tmp_path))
+        with open(json_path) as f:
+            payload = json.load(f)
+        assert payload["data"] == [[1.0, None], ["a", 4.0]]
+        assert "data_file" not in payload
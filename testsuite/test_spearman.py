@@ -11,6 +11,7 @@ from scipy.stats import spearmanr
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "methods"))
 from spearman import SpearmanCoefficient
+from descriptive import shared_descriptive_stats
 
 
 # ---------------------------------------------------------------------------
@@ -209,3 +210,46 @@ class TestComputeErrors:
     def test_error_result_keys(self, meta):
         result = make_spearman(None, meta).compute()
         assert {"id", "ok", "value", "error", "loss_of_precision", "params_used"} == set(result.keys())
+
+
+# ===========================================================================
+# Matrix mode – every pair of columns (methods/correlation.py)
+# ===========================================================================
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(seed=9)
+    data = rng.integers(0, 25, (5, 300)).astype(float)  # plenty of ties
+    data[1] += data[0]
+    return data
+
+
+class TestMatrixMode:
+    def test_matches_spearmanr_matrix(self, columns, meta):
+        expected_r, expected_p = spearmanr(columns.T)
+        result = make_spearman(columns, meta, {"matrix": True}).compute()
+        assert result["ok"] is True
+        np.testing.assert_allclose(result["value"]["matrix"], expected_r, atol=1e-12)
+        off_diagonal = ~np.eye(5, dtype=bool)
+        np.testing.assert_allclose(
+            np.asarray(result["value"]["p_values"])[off_diagonal], expected_p[off_diagonal], rtol=1e-6
+        )
+
+    def test_each_column_ranked_once(self, columns, meta):
+        with shared_descriptive_stats(columns) as shared:
+            make_spearman(columns, meta, {"matrix": True}).compute()
+            ranks = dict(shared.columns()._ranks)
+            make_spearman(columns, meta).compute()
+            assert all(shared.columns()._ranks[i] is ranks[i] for i in range(5))
+        assert len(ranks) == 5
+
+    def test_missing_values_rerank_their_pairs(self, columns, meta):
+        columns[3, :40] = np.nan
+        result = make_spearman(columns, meta, {"matrix": True}).compute()
+        expected = spearmanr(columns[2, 40:], columns[3, 40:])[0]
+        assert math.isclose(result["value"]["matrix"][2][3], expected, abs_tol=1e-12)
+        assert result["value"]["n_obs"][2][3] == 260
+        # Pairs without gaps still use the whole columns
+        assert math.isclose(
+            result["value"]["matrix"][0][1], spearmanr(columns[0], columns[1])[0], abs_tol=1e-12
+        )
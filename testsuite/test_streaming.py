@@ -0,0 +1,206 @@
+# test_streaming.py
+# Tests for the mergeable summaries in seniordesign/methods/sketches.py and the
+# chunked CSV engine in seniordesign/backend_support/streaming.py
+# Run from the seniordesign/ root: pytest testsuite/test_streaming.py -v
+
+import sys
+import os
+import statistics
+import numpy as np
+import pandas as pd
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup – streaming.py imports methods/ as a package from the root; the
+# per-method test files put methods/ itself on sys.path, where
+# methods/methods.py would shadow the package.
+# ---------------------------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+if not hasattr(sys.modules.get("methods"), "__path__"):
+    sys.modules.pop("methods", None)
+from methods.sketches import CoMoments, FrequencySketch, Moments, QuantileSketch, co_moments  # noqa: E402
+from backend_support.streaming import StreamSummary, analyze_csv, summarize_csv  # noqa: E402
+from backend_support.cancellation import CancelToken, RunCancelled  # noqa: E402
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(0).normal(50, 10, 20_001)
+
+
+def _chunks(array, n=7):
+    return np.array_split(array, n)
+
+
+# ===========================================================================
+# Summaries
+# ===========================================================================
+
+class TestMoments:
+    def test_chunked_matches_numpy(self, values):
+        moments = Moments()
+        for chunk in _chunks(values):
+            moments.update(chunk)
+        assert moments.mean == pytest.approx(np.mean(values), rel=1e-13)
+        assert moments.variance == pytest.approx(np.var(values, ddof=1), rel=1e-12)
+
+    def test_merge_equals_single_pass(self, values):
+        whole, left, right = Moments(), Moments(), Moments()
+        whole.update(values)
+        left.update(values[:5000])
+        right.update(values[5000:])
+        left.merge(right)
+        assert left.n == whole.n
+        assert left.mean == pytest.approx(whole.mean, rel=1e-13)
+        assert left.m2 == pytest.approx(whole.m2, rel=1e-12)
+
+    def test_nan_counted_as_missing(self):
+        moments = Moments()
+        moments.update([1.0, np.nan, 3.0])
+        assert (moments.n, moments.missing, moments.mean) == (2, 1, 2.0)
+
+
+class TestCoMoments:
+    def test_matches_corrcoef_and_polyfit(self, values):
+        y = 0.3 * values + np.random.default_rng(1).normal(size=values.size)
+        pair = CoMoments()
+        for xs, ys in zip(_chunks(values), _chunks(y)):
+            pair.update(xs, ys)
+        assert pair.pearson() == pytest.approx(np.corrcoef(values, y)[0, 1], rel=1e-12)
+        slope, intercept = np.polyfit(values, y, 1)
+        fit = pair.regression()
+        assert fit["slope"] == pytest.approx(slope, rel=1e-10)
+        assert fit["intercept"] == pytest.approx(intercept, rel=1e-9)
+
+    def test_chunked_kernel_matches_single_update(self, values):
+        y = values[::-1] * 2.0 + 1.0
+        whole = CoMoments()
+        whole.update(values, y)
+        chunked = co_moments(values, y, chunk_rows=1000)
+        assert chunked.n == whole.n
+        assert chunked.c_xy == pytest.approx(whole.c_xy, rel=1e-12)
+        assert chunked.regression()["slope"] == pytest.approx(whole.regression()["slope"], rel=1e-12)
+
+    def test_constant_column_is_undefined(self):
+        pair = CoMoments()
+        pair.update([1.0, 1.0, 1.0], [1.0, 2.0, 3.0])
+        assert np.isnan(pair.pearson())
+
+
+class TestFrequencySketch:
+    def test_exact_under_capacity_matches_statistics_mode(self):
+        data = [3.0, 1.0, 1.0, 3.0, 2.0]
+        sketch = FrequencySketch(capacity=10)
+        sketch.update(data[:2])
+        sketch.update(data[2:])
+        assert sketch.exact
+        assert sketch.mode() == statistics.mode(data)
+
+    def test_heavy_hitter_survives_past_capacity(self):
+        data = np.random.default_rng(2).integers(0, 5000, 50_000).astype(float)
+        data[::10] = 42.0
+        sketch = FrequencySketch(capacity=20)
+        for chunk in _chunks(data):
+            sketch.update(chunk)
+        assert not sketch.exact
+        assert sketch.mode() == 42.0
+
+
+class TestQuantileSketch:
+    def test_exact_until_first_compaction(self):
+        sketch = QuantileSketch(k=200)
+        sketch.update([4.0, 1.0, 3.0, 2.0])
+        assert sketch.exact and sketch.rank_error() == 0.0
+        assert sketch.quantiles([0.25, 0.5]) == list(np.quantile([1, 2, 3, 4], [0.25, 0.5]))
+
+    def test_rank_error_within_bound(self, values):
+        sketch = QuantileSketch(k=200)
+        for chunk in _chunks(values):
+            sketch.update(chunk)
+        ordered = np.sort(values)
+        fractions = [0.01, 0.1, 0.5, 0.9, 0.99]
+        for fraction, value in zip(fractions, sketch.quantiles(fractions)):
+            rank = np.searchsorted(ordered, value) / values.size
+            assert abs(rank - fraction) <= sketch.rank_error()
+        assert sketch.size() < 4 * 200
+
+    def test_merge_keeps_extremes(self, values):
+        left, right = QuantileSketch(), QuantileSketch()
+        left.update(values[:10_000])
+        right.update(values[10_000:])
+        left.merge(right)
+        assert left.n == values.size
+        assert left.quantiles([0.0, 1.0]) == [values.min(), values.max()]
+
+
+# ===========================================================================
+# CSV engine
+# ===========================================================================
+
+@pytest.fixture
+def csv_path(tmp_path):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "x": rng.normal(10, 2, 5000),
+        "label": ["row"] * 5000,
+        "y": rng.integers(0, 20, 5000).astype(float),
+    })
+    df.loc[7, "x"] = np.nan
+    path = tmp_path / "big.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+class TestAnalyzeCsv:
+    def test_matches_in_memory_results(self, csv_path):
+        path, df = csv_path
+        methods = [{"id": m, "params": {}} for m in ("mean", "variance", "mode", "pearson")]
+        mean, variance, mode, pearson = analyze_csv(path, methods, columns=["y", "x"], chunk_rows=600)
+        pooled = df[["y", "x"]].to_numpy().ravel()
+        pooled = pooled[~np.isnan(pooled)]
+        assert mean["value"] == pytest.approx(pooled.mean(), rel=1e-12)
+        assert variance["value"] == pytest.approx(pooled.var(ddof=1), rel=1e-12)
+        assert mode["value"] == statistics.mode(pooled.tolist())
+        both = df[["y", "x"]].dropna()
+        assert pearson["value"] == pytest.approx(np.corrcoef(both["y"], both["x"])[0, 1])
+        assert "1 blank or non-numeric cell" in mean["loss_of_precision"]
+
+    def test_per_column_results(self, csv_path):
+        path, df = csv_path
+        [result] = analyze_csv(path, [{"id": "mean", "params": {"per_column": True}}],
+                               columns=["y", "x"])
+        assert result["columns"] == ["y", "x"]
+        assert result["value"][0] == pytest.approx(df["y"].mean())
+        assert result["value"][1] == pytest.approx(df["x"].mean())
+
+    def test_approximate_percentiles_state_their_bound(self, csv_path):
+        path, df = csv_path
+        [result] = analyze_csv(path, [{"id": "percentile", "params": [50]}], columns=["x"],
+                               quantile_k=50)
+        assert "within ±" in result["loss_of_precision"]
+        assert result["rank_error"] == pytest.approx(2.296 / 50 ** 0.9723)
+        assert result["value"][0] == pytest.approx(df["x"].median(), rel=0.05)
+
+    def test_unsupported_method_errors(self, csv_path):
+        path, _ = csv_path
+        [result] = analyze_csv(path, ["spearman"], columns=["x", "y"])
+        assert result["ok"] is False
+
+    def test_shards_merge(self, csv_path):
+        path, _ = csv_path
+        whole = summarize_csv(path, columns=["x"], method_ids={"mean"})
+        first = StreamSummary(["x"])
+        second = StreamSummary(["x"])
+        frame = pd.read_csv(path, usecols=["x"])
+        first.update(frame.iloc[:2000].to_numpy())
+        second.update(frame.iloc[2000:].to_numpy())
+        first.merge(second)
+        assert first.moments[0].mean == pytest.approx(whole.moments[0].mean, rel=1e-13)
+
+    def test_cancel_stops_between_chunks(self, csv_path):
+        path, _ = csv_path
+        token = CancelToken()
+        with pytest.raises(RunCancelled):
+            summarize_csv(path, columns=["x"], chunk_rows=500, cancel_token=token,
+                          on_progress=lambda rows: token.cancel())